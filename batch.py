@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Headless command-line batch mode: load, validate and export many Graphol projects.
+
+Usage: python batch.py [--jobs N] [--export owl,csv,pdf] [--output DIR] [--report FILE] PROJECT [PROJECT ...]
+
+A JSON report holding per-project results and timings is written to the given report
+file (or to the standard output). The exit status is 0 if all the projects have been
+processed successfully, 1 if some project failed to load or export, 2 if no project
+failed but some project contains syntax errors.
+"""
+
+import json
+import logging
+import os
+import sys
+
+from argparse import ArgumentParser
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from eddy.core.batch import run
+
+
+def main():
+    """
+    Batch mode entry point.
+    """
+    parser = ArgumentParser(description='Load, validate and export Graphol projects without the graphical interface.')
+    parser.add_argument('projects', nargs='+', help='project directories to process')
+    parser.add_argument('--export', dest='export', default='', help='comma separated list of export formats (owl, pdf, csv, json, xlsx)')
+    parser.add_argument('--output', dest='output', default=os.getcwd(), help='directory where to write exported files')
+    parser.add_argument('--report', dest='report', default=None, help='file where to write the JSON report (default: stdout)')
+    parser.add_argument('--jobs', dest='jobs', type=int, default=None, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--no-validate', dest='validate', action='store_false', help='skip the syntax validation')
+    parser.add_argument('--verbose', dest='verbose', action='store_true', help='log progress information on stderr')
+    parser.add_argument('--perf-log', dest='perf', default=None, help='file where to append performance events (JSON lines)')
+
+    options = parser.parse_args()
+    formats = [x.strip().lower().lstrip('.') for x in options.export.split(',') if x.strip()]
+    for ext in formats:
+        if ext not in ('owl', 'pdf', 'csv', 'json', 'xlsx'):
+            parser.error('unsupported export format: %s' % ext)
+
+    level = logging.INFO if options.verbose else logging.WARNING
+    report = run(options.projects, formats, options.output, options.jobs, options.validate, level, options.perf)
+    content = json.dumps(report, indent=2)
+    if options.report:
+        with open(options.report, 'w', encoding='utf8') as file:
+            file.write(content)
+    else:
+        sys.stdout.write(content + '\n')
+
+    if report['summary']['failed']:
+        sys.exit(1)
+    if report['summary']['invalid']:
+        sys.exit(2)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Shared facilities for the headless benchmarks in this package.
+
+Benchmarks are plain scripts meant to be run from the repository root, e.g:
+
+    python benchmarks/pdf_export.py --nodes 5000
+"""
+
+import argparse
+import math
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+
+parser = argparse.ArgumentParser(add_help=True)
+parser.add_argument('--output', default=tempfile.gettempdir(), help='directory where to write generated files')
+
+
+def peakMemory():
+    """
+    Returns the peak resident set size of the current process in MB (0 if not available).
+    :rtype: float
+    """
+    if resource:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return 0.0
+
+
+class Benchmark(object):
+    """
+    Context manager which reports the elapsed time and the peak memory growth of its block.
+    USAGE:
+        with Benchmark('label'):
+            # do stuff
+    """
+    def __init__(self, label):
+        """
+        Initialize the benchmark.
+        :type label: str
+        """
+        self.label = label
+        self.memory = 0
+        self.start = 0
+
+    def __enter__(self):
+        self.memory = peakMemory()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter() - self.start
+        print('{0:<60} {1:>10.3f}s {2:>+10.1f}MB'.format(self.label, elapsed, peakMemory() - self.memory))
+
+
+def application():
+    """
+    Returns the running QApplication, creating a new one if needed.
+    :rtype: QApplication
+    """
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(['benchmark'])
+
+
+def synthetic_project(diagrams, nodes):
+    """
+    Build a Project with the given number of diagrams, each one having the given number
+    of concept nodes laid out on a grid and connected by inclusion edges.
+    :type diagrams: int
+    :type nodes: int
+    :rtype: Project
+    """
+    application()
+
+    from eddy.core.datatypes.graphol import Item
+    from eddy.core.diagram import Diagram
+    from eddy.core.functions.signals import connect
+    from eddy.core.profiles.owl2 import OWL2Profile
+    from eddy.core.project import Project
+
+    project = Project(name='benchmark', path=tempfile.gettempdir(), prefix='bench',
+                      iri='http://www.dis.uniroma1.it/~graphol/benchmark', profile=OWL2Profile())
+    side = math.ceil(math.sqrt(nodes))
+    for i in range(diagrams):
+        diagram = Diagram.create('diagram_{0}'.format(i), max(Diagram.MinSize, side * 300), project)
+        connect(diagram.sgnItemAdded, project.doAddItem)
+        connect(diagram.sgnItemRemoved, project.doRemoveItem)
+        previous = None
+        for j in range(nodes):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setText('concept_{0}_{1}'.format(i, j))
+            node.setPos(QtCore.QPointF((j % side) * 200 - side * 100, (j // side) * 120 - side * 60))
+            diagram.addItem(node)
+            if previous:
+                edge = diagram.factory.create(Item.InclusionEdge, source=previous, target=node)
+                previous.addEdge(edge)
+                node.addEdge(edge)
+                diagram.addItem(edge)
+                edge.updateEdge()
+            previous = node
+        project.addDiagram(diagram)
+    return project
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of neighbour queries as issued by syntax validation, node identification and the OWL exporter.
+
+Usage: python benchmarks/adjacency.py [--motifs N]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+
+from benchmarks import Benchmark, parser, synthetic_project
+from benchmarks.graph_model import validate
+
+from eddy.core.datatypes.graphol import Identity, Item
+from eddy.core.functions.misc import first
+from eddy.core.model import GraphModel
+
+
+def populate(diagram, motifs):
+    """
+    Populate the given diagram with the given number of motifs, each one made of a concept,
+    a role and an attribute restricted on their domain, an individual instance of the concept
+    and a union of concepts included in the concept. All the concepts are included in a single
+    hub concept, so that the benchmark also covers high degree nodes.
+    :type diagram: Diagram
+    :type motifs: int
+    """
+    def node(item, text, x, y):
+        n = diagram.factory.create(item)
+        n.setText(text)
+        n.setPos(QtCore.QPointF(x, y))
+        diagram.addItem(n)
+        return n
+
+    def edge(item, source, target):
+        e = diagram.factory.create(item, source=source, target=target)
+        source.addEdge(e)
+        target.addEdge(e)
+        diagram.addItem(e)
+        return e
+
+    concepts = []
+    hub = node(Item.ConceptNode, 'thing', -1000, -1000)
+    for i in range(motifs):
+        x, y = (i % 50) * 1000, (i // 50) * 600
+        concept = node(Item.ConceptNode, 'concept_{0}'.format(i), x, y)
+        role = node(Item.RoleNode, 'role_{0}'.format(i), x + 200, y)
+        attribute = node(Item.AttributeNode, 'attribute_{0}'.format(i), x + 400, y)
+        individual = node(Item.IndividualNode, 'individual_{0}'.format(i), x, y + 200)
+        restriction1 = node(Item.DomainRestrictionNode, 'exists', x + 200, y + 200)
+        restriction2 = node(Item.DomainRestrictionNode, 'exists', x + 400, y + 200)
+        edge(Item.InputEdge, role, restriction1)
+        edge(Item.InputEdge, attribute, restriction2)
+        edge(Item.InclusionEdge, restriction1, concept)
+        edge(Item.InclusionEdge, restriction2, concept)
+        edge(Item.MembershipEdge, individual, concept)
+        edge(Item.InclusionEdge, concept, hub)
+        if concepts:
+            union = node(Item.UnionNode, 'or', x + 600, y + 200)
+            edge(Item.InputEdge, concepts[-1], union)
+            edge(Item.InputEdge, concept, union)
+            edge(Item.InclusionEdge, union, concept)
+        concepts.append(concept)
+
+
+def operands(nodes):
+    """
+    Collect the operands of the given nodes as done by the OWL exporter translation methods.
+    :type nodes: list
+    :rtype: int
+    """
+    count = 0
+    for node in nodes:
+        if node.type() is Item.DomainRestrictionNode:
+            count += first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Role, Identity.Attribute}) is not None
+            count += len({x for x in node.outgoingNodesOf(Item.InclusionEdge) if x.identity() is Identity.Concept})
+        elif node.type() is Item.UnionNode:
+            count += len({x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is node.identity()})
+        elif node.type() is Item.ConceptNode:
+            count += len({x for x in node.incomingNodesOf(Item.MembershipEdge) if x.identity() is Identity.Individual})
+    return count
+
+
+def operandsByFilter(nodes):
+    """
+    Collect the operands of the given nodes filtering the attached edges with callables.
+    :type nodes: list
+    :rtype: int
+    """
+    count = 0
+    for node in nodes:
+        if node.type() is Item.DomainRestrictionNode:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
+            f3 = lambda x: x.type() is Item.InclusionEdge
+            f4 = lambda x: x.identity() is Identity.Concept
+            count += first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)) is not None
+            count += len(node.outgoingNodes(filter_on_edges=f3, filter_on_nodes=f4))
+        elif node.type() is Item.UnionNode:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.identity() is node.identity()
+            count += len(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        elif node.type() is Item.ConceptNode:
+            f1 = lambda x: x.type() is Item.MembershipEdge
+            f2 = lambda x: x.identity() is Identity.Individual
+            count += len(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+    return count
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--motifs', type=int, default=1000, help='number of motifs to generate')
+    parser.add_argument('--repeat', type=int, default=5, help='number of passes for each measure')
+    options = parser.parse_args()
+
+    project = synthetic_project(1, 1)
+    diagram = first(project.diagrams())
+    populate(diagram, options.motifs)
+    nodes = [x for x in diagram.items() if x.isNode()]
+    edges = [x for x in diagram.items() if x.isEdge()]
+
+    with Benchmark('identify {0} nodes'.format(len(nodes))):
+        for node in nodes:
+            diagram.doNodeIdentification(node)
+
+    model = GraphModel.fromItems(nodes + edges)
+    with Benchmark('validate items, {0} edges x {1}'.format(len(edges), options.repeat)):
+        for _ in range(options.repeat):
+            validate(project.profile, nodes, edges)
+    with Benchmark('validate model x {0}'.format(options.repeat)):
+        for _ in range(options.repeat):
+            validate(project.profile, model.nodes(), model.edges())
+    with Benchmark('export operands, filter callables x {0}'.format(options.repeat)):
+        for _ in range(options.repeat):
+            operandsByFilter(nodes)
+    with Benchmark('export operands, adjacency index x {0}'.format(options.repeat)):
+        for _ in range(options.repeat):
+            operands(nodes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of copy and paste of large selections through the session clipboard, and
+of the Graphol fragment exchanged with other sessions through the system clipboard.
+
+Usage: python benchmarks/clipboard.py [--nodes N]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.clipboard import Clipboard
+from eddy.core.functions.misc import first
+
+
+class Session(QtCore.QObject):
+    """
+    Minimal session holding the undo stack the clipboard pushes its commands to.
+    """
+    def __init__(self):
+        super().__init__()
+        self.undostack = QtGui.QUndoStack(self)
+
+
+def copyItems(diagram):
+    """
+    Copy the selected items by building item copies (the former clipboard implementation).
+    :type diagram: Diagram
+    :rtype: int
+    """
+    nodes = diagram.selectedNodes()
+    copies = {node.id: node.copy(diagram) for node in nodes}
+    edges = {}
+    for node in nodes:
+        for edge in node.edges:
+            if edge.id not in edges and edge.isSelected() and edge.other(node).isSelected():
+                copy = edge.copy(diagram)
+                copy.source = copies[edge.source.id]
+                copy.source.setAnchor(copy, edge.source.anchor(edge))
+                copy.target = copies[edge.target.id]
+                copy.target.setAnchor(copy, edge.target.anchor(edge))
+                edges[edge.id] = copy
+    return len(copies) + len(edges)
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--nodes', type=int, default=5000, help='number of nodes to copy')
+    options = parser.parse_args()
+
+    project = synthetic_project(1, options.nodes)
+    diagram = first(project.diagrams())
+    for item in diagram.items():
+        item.setSelected(True)
+    session = Session()
+    clipboard = Clipboard(session)
+    size = len(diagram.selectedItems())
+
+    with Benchmark('copy {0} items, item copies'.format(size)):
+        copyItems(diagram)
+    with Benchmark('copy {0} items, descriptors'.format(size)):
+        clipboard.update(diagram)
+    with Benchmark('encode {0} items, Graphol fragment'.format(clipboard.size())):
+        data = clipboard.encode()
+    other = Clipboard(session)
+    with Benchmark('decode {0} bytes, Graphol fragment'.format(len(data))):
+        other.refresh()
+    with Benchmark('paste {0} items'.format(clipboard.size())):
+        clipboard.paste(diagram)
+    with Benchmark('paste {0} items at position'.format(clipboard.size())):
+        clipboard.paste(diagram, QtCore.QPointF(0, 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of profile validation and graph traversal run against diagram items and against the graph model.
+
+Usage: python benchmarks/graph_model.py [--nodes N] [--diagrams D]
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.functions.graph import bfs
+from eddy.core.model import GraphModel
+
+
+def validate(profile, nodes, edges):
+    """
+    Validate the given nodes and edges as done by the syntax validation procedure.
+    :type profile: AbstractProfile
+    :type nodes: list
+    :type edges: list
+    :rtype: int
+    """
+    errors = 0
+    for edge in edges:
+        profile.setPvr(None)
+        errors += not profile.checkEdge(edge.source, edge, edge.target).isValid()
+    for node in nodes:
+        if not node.edges:
+            profile.setPvr(None)
+            errors += not profile.checkNode(node).isValid()
+    return errors
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--nodes', type=int, default=5000, help='number of nodes per diagram')
+    parser.add_argument('--diagrams', type=int, default=1, help='number of diagrams')
+    options = parser.parse_args()
+
+    project = synthetic_project(options.diagrams, options.nodes)
+    nodes = list(project.nodes())
+    edges = list(project.edges())
+
+    with Benchmark('build model, {0} nodes, {1} edges'.format(len(nodes), len(edges))):
+        model = GraphModel.fromProject(project)
+    with Benchmark('pickle round trip'):
+        model = pickle.loads(pickle.dumps(model))
+
+    with Benchmark('validate items'):
+        validate(project.profile, nodes, edges)
+    with Benchmark('validate model'):
+        validate(project.profile, model.nodes(), model.edges())
+
+    source = sorted(nodes, key=lambda x: x.text())[0]
+    with Benchmark('bfs over items'):
+        bfs(source)
+    with Benchmark('bfs over model'):
+        bfs(model.node(source.diagram.name, source.id))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Micro-benchmark of the GUID generator: per-item id generation and update (as done by the
+loaders and by paste before block reservation) against GUID.reserve and GUID.updateAll.
+
+Usage: python benchmarks/guid.py [--sizes 1000,100000]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import Benchmark, parser
+
+from eddy.core.generators import GUID
+from eddy.core.regex import RE_ITEM_PREFIX
+
+
+def legacyUpdate(guid, uid):
+    """
+    Update the given generator as GUID.update used to, parsing the id with a regex.
+    :type guid: GUID
+    :type uid: str
+    """
+    match = RE_ITEM_PREFIX.match(uid)
+    if not match:
+        raise ValueError('invalid id supplied ({0})'.format(uid))
+    prefix, value = match.group('prefix'), int(match.group('value'))
+    guid.ids[prefix] = max(guid.ids.get(prefix, value), value)
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--sizes', default='1000,100000', help='comma separated amounts of ids')
+    options = parser.parse_args()
+
+    for size in map(int, options.sizes.split(',')):
+        uids = ['n{0}'.format(i) for i in range(size)]
+        guid = GUID()
+        with Benchmark('legacy update, {0} ids'.format(size)):
+            for uid in uids:
+                legacyUpdate(guid, uid)
+        guid = GUID()
+        with Benchmark('GUID.update, {0} ids'.format(size)):
+            for uid in uids:
+                guid.update(uid)
+        guid = GUID()
+        with Benchmark('GUID.updateAll, {0} ids'.format(size)):
+            guid.updateAll(uids)
+        guid = GUID()
+        with Benchmark('GUID.next, {0} ids'.format(size)):
+            for _ in range(size):
+                guid.next('n')
+        guid = GUID()
+        with Benchmark('GUID.reserve, {0} ids'.format(size)):
+            ['n{0}'.format(value) for value in guid.reserve('n', size)]
+
+
+if __name__ == '__main__':
+    main()
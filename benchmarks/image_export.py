@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Headless benchmark of the PNG and SVG diagram exporters.
+
+Usage: python benchmarks/image_export.py [--nodes N] [--dpi DPI] [--tile-size PX]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.exporters.png import PngDiagramExporter
+from eddy.core.exporters.svg import SvgDiagramExporter
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--nodes', type=int, default=2000, help='number of nodes in the diagram')
+    parser.add_argument('--dpi', type=int, default=96, help='resolution of the exported images')
+    parser.add_argument('--tile-size', type=int, default=4096, help='size of the tiles in pixels')
+    options = parser.parse_args()
+
+    project = synthetic_project(1, options.nodes)
+    diagram = project.diagram('diagram_0')
+    shape = diagram.visibleRect(margin=20)
+    png = os.path.join(options.output, 'benchmark.png')
+    svg = os.path.join(options.output, 'benchmark.svg')
+
+    # Peak memory never decreases: run tiled exports before the single image ones.
+    with Benchmark('snapshot'):
+        PngDiagramExporter(diagram).snapshot(shape)
+    with Benchmark('png, {0}px tiles @ {1} dpi'.format(options.tile_size, options.dpi)):
+        PngDiagramExporter(diagram, dpi=options.dpi, tileSize=options.tile_size).run(png)
+    with Benchmark('png, single image @ {0} dpi'.format(options.dpi)):
+        PngDiagramExporter(diagram, dpi=options.dpi, tileSize=0).run(png)
+    with Benchmark('svg, single image @ {0} dpi'.format(options.dpi)):
+        SvgDiagramExporter(diagram, dpi=options.dpi, tileSize=0).run(svg)
+
+
+if __name__ == '__main__':
+    main()
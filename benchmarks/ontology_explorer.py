@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of the Ontology Explorer model populated with synthetic predicate occurrences.
+
+Usage: python benchmarks/ontology_explorer.py [--predicates N] [--legacy N]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'eddy', 'plugins', 'ontology-explorer-v0.1')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+from benchmarks import Benchmark, application, parser
+
+from eddy.core.datatypes.graphol import Item, Identity
+
+
+class Diagram(object):
+    """
+    Lightweight diagram stand-in exposing only the attributes used by the model.
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+class Node(object):
+    """
+    Lightweight predicate node stand-in exposing only the attributes used by the model.
+    """
+    def __init__(self, id, item, text):
+        self.id = id
+        self.item = item
+        self.label = text
+
+    def identity(self):
+        return Identity.Individual
+
+    def text(self):
+        return self.label
+
+    def type(self):
+        return self.item
+
+
+def occurrences(n, diagrams=10):
+    """
+    Generate n synthetic predicate occurrences spread across the given amount of diagrams.
+    :type n: int
+    :type diagrams: int
+    :rtype: list
+    """
+    types = (Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode)
+    diagrams = [Diagram('diagram_{0}.graphol'.format(i)) for i in range(diagrams)]
+    return [(diagrams[i % len(diagrams)], Node('n{0}'.format(i), types[i % 4], 'predicate_{0}'.format((i * 7919) % (n // 3 + 1))))
+            for i in range(n)]
+
+
+def legacy(collection):
+    """
+    Populate a QStandardItemModel the way the explorer used to (lookup by findItems, sort after each insert).
+    :type collection: list
+    """
+    model = QtGui.QStandardItemModel()
+    proxy = QtCore.QSortFilterProxyModel()
+    proxy.setDynamicSortFilter(False)
+    proxy.setSourceModel(model)
+    for diagram, node in collection:
+        parents = model.findItems(node.text(), QtCore.Qt.MatchExactly)
+        parent = next((p for p in parents if p.data() is node.type()), None)
+        if not parent:
+            parent = QtGui.QStandardItem(node.text())
+            parent.setData(node.type())
+            model.appendRow(parent)
+        child = QtGui.QStandardItem('{0} ({1} - {2})'.format(node.text(), diagram.name, node.id))
+        child.setData(node)
+        parent.appendRow(child)
+        proxy.sort(0, QtCore.Qt.AscendingOrder)
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--predicates', type=int, default=50000, help='number of predicate occurrences')
+    parser.add_argument('--legacy', type=int, default=2000, help='number of occurrences for the legacy model (0 to skip)')
+    options = parser.parse_args()
+
+    app = application()
+
+    from ontology_explorer import OntologyExplorerModel
+
+    collection = occurrences(options.predicates)
+
+    model = OntologyExplorerModel(None)
+    with Benchmark('batched insert, {0} occurrences'.format(options.predicates)):
+        model.addNodes(collection)
+    with Benchmark('remove, {0} occurrences'.format(options.predicates)):
+        for diagram, node in collection:
+            model.removeNode(diagram, node)
+    with Benchmark('incremental insert, {0} occurrences'.format(options.predicates)):
+        for diagram, node in collection:
+            model.addNode(diagram, node)
+    proxy = QtCore.QSortFilterProxyModel()
+    proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+    proxy.setSourceModel(model)
+    with Benchmark('filter, {0} occurrences'.format(options.predicates)):
+        proxy.setFilterFixedString('predicate_1')
+    print('buckets: {0}, visible: {1}'.format(model.rowCount(), proxy.rowCount()))
+
+    if options.legacy:
+        with Benchmark('legacy insert, {0} occurrences'.format(options.legacy)):
+            legacy(collection[:options.legacy])
+
+    del app
+
+
+if __name__ == '__main__':
+    main()
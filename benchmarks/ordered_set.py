@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Micro-benchmark of OrderedSet against a list checking for duplicates upon every insertion
+(as the previous list based implementation of DistinctList did).
+
+Usage: python benchmarks/ordered_set.py [--sizes 10,1000,100000]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import Benchmark, parser
+
+from eddy.core.datatypes.collections import OrderedSet
+
+
+class ScanList(list):
+    """
+    List which checks for duplicates with a linear scan upon every insertion.
+    """
+    def append(self, p_object):
+        if p_object not in self:
+            super().append(p_object)
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.append(item)
+
+    def remove(self, p_object):
+        try:
+            super().remove(p_object)
+        except ValueError:
+            pass
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--sizes', default='10,1000,100000', help='comma separated collection sizes')
+    parser.add_argument('--limit', type=int, default=20000, help='largest size measured for the list')
+    options = parser.parse_args()
+
+    for size in map(int, options.sizes.split(',')):
+        # Half of the elements are duplicates, as when merging overlapping collections.
+        elements = ['e{0}'.format(i % (size // 2 or 1)) for i in range(size)] + ['e{0}'.format(i) for i in range(size)]
+        lookups = elements[size:size + min(size, 1000)]
+        repeat = max(1, 100000 // size)
+        for cls in (ScanList, OrderedSet):
+            if cls is ScanList and size > options.limit:
+                print('{0:<60} {1:>11}'.format('{0} build, {1} elements'.format(cls.__name__, size), 'skipped'))
+                continue
+            with Benchmark('{0} build, {1} elements x {2}'.format(cls.__name__, size, repeat)):
+                for _ in range(repeat):
+                    collection = cls()
+                    collection.extend(elements)
+            with Benchmark('{0} membership, {1} lookups x {2}'.format(cls.__name__, len(lookups), repeat)):
+                for _ in range(repeat):
+                    for element in lookups:
+                        element in collection
+            with Benchmark('{0} remove, {1} elements'.format(cls.__name__, len(lookups))):
+                for element in lookups:
+                    collection.remove(element)
+
+
+if __name__ == '__main__':
+    main()
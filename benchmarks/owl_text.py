@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Micro-benchmark of the OWLText normalization used by the project index.
+
+Usage: python benchmarks/owl_text.py [--labels N] [--repeat R]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import Benchmark, parser
+
+from eddy.core.functions.owl import OWLText
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--labels', type=int, default=500, help='number of distinct labels')
+    parser.add_argument('--repeat', type=int, default=200, help='number of lookups for each label')
+    options = parser.parse_args()
+
+    labels = ['concept label\n{0} with-invalid:chars'.format(i) for i in range(options.labels)]
+
+    OWLText.cache_clear()
+    with Benchmark('cold, {0} distinct labels'.format(options.labels)):
+        for label in labels:
+            OWLText.__wrapped__(label)
+    with Benchmark('uncached, {0} lookups'.format(options.labels * options.repeat)):
+        for _ in range(options.repeat):
+            for label in labels:
+                OWLText.__wrapped__(label)
+    with Benchmark('cached, {0} lookups'.format(options.labels * options.repeat)):
+        for _ in range(options.repeat):
+            for label in labels:
+                OWLText(label)
+    print(OWLText.cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Headless benchmark of the PDF diagram exporter.
+
+Usage: python benchmarks/pdf_export.py [--nodes N] [--diagrams D]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.datatypes.system import PageSize
+from eddy.core.exporters.pdf import PdfDiagramExporter
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--nodes', type=int, default=2000, help='number of nodes per diagram')
+    parser.add_argument('--diagrams', type=int, default=4, help='number of diagrams')
+    options = parser.parse_args()
+
+    project = synthetic_project(options.diagrams, options.nodes)
+    diagrams = sorted(project.diagrams(), key=lambda x: x.name)
+    path = os.path.join(options.output, 'benchmark.pdf')
+
+    with Benchmark('single page, first diagram'):
+        PdfDiagramExporter(diagrams[0], diagrams=diagrams[:1], pageSize=PageSize.Fit, open=False).run(path)
+    with Benchmark('A4 tiles, first diagram'):
+        PdfDiagramExporter(diagrams[0], diagrams=diagrams[:1], pageSize=PageSize.A4, open=False).run(path)
+    with Benchmark('A4 tiles, 50% scale, 20px overlap, first diagram'):
+        PdfDiagramExporter(diagrams[0], diagrams=diagrams[:1], pageSize=PageSize.A4, scale=0.5, overlap=20, open=False).run(path)
+    with Benchmark('single page, one file per diagram'):
+        for diagram in diagrams:
+            PdfDiagramExporter(diagram, diagrams=[diagram], pageSize=PageSize.Fit, open=False).run(path)
+    with Benchmark('single page, all diagrams in one file'):
+        PdfDiagramExporter(diagrams[0], diagrams=diagrams, pageSize=PageSize.Fit, open=False).run(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Benchmark of the project-wide rename (refactoring) of a predicate with many occurrences.
+
+Usage: python benchmarks/predicate_rename.py [--occurrences N] [--diagrams N]
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+from benchmarks import Benchmark, application, parser
+
+from eddy.core.commands.labels import CommandLabelChange, CommandPredicateRename
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.signals import connect
+from eddy.core.project import K_DESCRIPTION
+
+
+class Session(QtCore.QObject):
+    """
+    Minimal session holding the undo stack the rename commands are pushed to.
+    """
+    def __init__(self):
+        super().__init__()
+        self.undostack = QtGui.QUndoStack(self)
+
+
+def project(diagrams, occurrences):
+    """
+    Build a Project with the given number of occurrences of the same concept spread across the given number of diagrams.
+    :type diagrams: int
+    :type occurrences: int
+    :rtype: Project
+    """
+    from eddy.core.diagram import Diagram
+    from eddy.core.profiles.owl2 import OWL2Profile
+    from eddy.core.project import Project
+
+    application()
+    project = Project(name='benchmark', path=tempfile.gettempdir(), prefix='bench',
+                      iri='http://www.dis.uniroma1.it/~graphol/benchmark', profile=OWL2Profile())
+    size = -(-occurrences // diagrams)
+    for i in range(diagrams):
+        diagram = Diagram.create('diagram_{0}'.format(i), 30000, project)
+        connect(diagram.sgnItemAdded, project.doAddItem)
+        connect(diagram.sgnItemRemoved, project.doRemoveItem)
+        for j in range(i * size, min(occurrences, (i + 1) * size)):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setText('concept')
+            node.setPos(QtCore.QPointF((j % 100) * 200, (j % size // 100) * 120))
+            diagram.addItem(node)
+        project.addDiagram(diagram)
+    project.setMeta(Item.ConceptNode, 'concept', {K_DESCRIPTION: 'A concept'})
+    return project
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--occurrences', type=int, default=1000, help='number of occurrences of the renamed predicate')
+    parser.add_argument('--diagrams', type=int, default=10, help='number of diagrams the occurrences are spread across')
+    options = parser.parse_args()
+
+    session = Session()
+    label = '{0} occurrences'.format(options.occurrences)
+
+    current = project(options.diagrams, options.occurrences)
+    with Benchmark('rename {0}, one command per occurrence'.format(label)):
+        session.undostack.beginMacro('change predicate')
+        for node in current.predicates(Item.ConceptNode, 'concept'):
+            session.undostack.push(CommandLabelChange(node.diagram, node, node.text(), 'renamed', refactor=True))
+        session.undostack.endMacro()
+
+    current = project(options.diagrams, options.occurrences)
+    with Benchmark('rename {0}, bulk command'.format(label)):
+        session.undostack.push(CommandPredicateRename(current, Item.ConceptNode, 'concept', 'renamed'))
+    with Benchmark('undo rename {0}, bulk command'.format(label)):
+        session.undostack.undo()
+    with Benchmark('redo rename {0}, bulk command'.format(label)):
+        session.undostack.redo()
+
+
+if __name__ == '__main__':
+    main()
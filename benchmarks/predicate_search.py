@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of the project-wide predicate search service.
+
+Usage: python benchmarks/predicate_search.py [--diagrams N] [--nodes N] [--labels N]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.search import PrefixTrie, ProjectSearch, TrigramIndex
+from eddy.core.search import tokenize
+
+
+# English letter frequencies (per mille), used to generate words with a realistic trigram distribution.
+LETTERS = 'etaoinshrdlcumwfgypbvkjxqz'
+WEIGHTS = (127, 91, 82, 75, 70, 67, 63, 61, 60, 43, 40, 28, 28, 24, 24, 22, 20, 20, 19, 15, 10, 8, 2, 2, 1, 1)
+
+
+def label(rnd):
+    """
+    Generate a random camel case label.
+    :type rnd: Random
+    :rtype: str
+    """
+    words = [''.join(rnd.choices(LETTERS, WEIGHTS, k=rnd.randint(3, 9))) for _ in range(rnd.randint(1, 3))]
+    return words[0] + ''.join(w.capitalize() for w in words[1:])
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--diagrams', type=int, default=10, help='number of diagrams of the synthetic project')
+    parser.add_argument('--nodes', type=int, default=1000, help='number of nodes for each diagram')
+    parser.add_argument('--labels', type=int, default=300000, help='number of labels for the raw index benchmark')
+    parser.add_argument('--queries', type=int, default=100, help='number of queries to run')
+    options = parser.parse_args()
+
+    rnd = random.Random(42)
+
+    #############################################
+    # RAW INDEX STRUCTURES
+    #################################
+
+    labels = list({label(rnd) for _ in range(options.labels)})
+    trie = PrefixTrie()
+    grams = TrigramIndex()
+    with Benchmark('index {0} labels'.format(len(labels))):
+        for i, text in enumerate(labels):
+            for term in {text.lower()} | set(tokenize(text)):
+                trie.add(term, i)
+                grams.add(term)
+    queries = [rnd.choice(labels).lower() for _ in range(options.queries)]
+    with Benchmark('{0} prefix queries (3 chars, first 1000 terms)'.format(options.queries)):
+        for query in queries:
+            list(trie.find(query[:3], 1000))
+    with Benchmark('{0} fuzzy queries (one typo)'.format(options.queries)):
+        for query in queries:
+            i = rnd.randrange(len(query))
+            grams.candidates(query[:i] + query[i + 1:])
+
+    #############################################
+    # PROJECT SEARCH SERVICE
+    #################################
+
+    with Benchmark('build synthetic project ({0}x{1} nodes)'.format(options.diagrams, options.nodes)):
+        project = synthetic_project(options.diagrams, options.nodes)
+    search = ProjectSearch(project)
+    with Benchmark('build search index ({0} predicates)'.format(options.diagrams * options.nodes)):
+        search.build()
+    with Benchmark('{0} project queries'.format(options.queries)):
+        for _ in range(options.queries):
+            search.query('concept_{0}_{1}'.format(rnd.randrange(options.diagrams), rnd.randrange(options.nodes))[:12])
+    with Benchmark('{0} project fuzzy queries'.format(options.queries)):
+        for _ in range(options.queries):
+            search.query('cnocept_{0}_{1}'.format(rnd.randrange(options.diagrams), rnd.randrange(options.nodes)))
+    print('indexed predicates: {0}, terms: {1}'.format(len(search), len(search.terms)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Benchmark of the merge of two projects sharing all their predicates, half of them with conflicting metadata.
+
+Usage: python benchmarks/project_merge.py [--predicates N] [--diagrams N]
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+from benchmarks import Benchmark, application, parser
+
+from eddy.core.commands.diagram import CommandDiagramAdd
+from eddy.core.commands.nodes import CommandNodeSetMeta
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.signals import connect, disconnect
+from eddy.core.project import K_CURRENT, K_DESCRIPTION, K_FINAL, K_IMPORTING
+from eddy.core.project import ProjectMergeWorker
+
+
+class Session(QtCore.QObject):
+    """
+    Minimal session holding the undo stack the merge commands are pushed to.
+    """
+    def __init__(self):
+        super().__init__()
+        self.undostack = QtGui.QUndoStack(self)
+
+
+class MergeWorker(ProjectMergeWorker):
+    """
+    Merge worker resolving all the conflicts in favour of the importing project, without user interaction.
+    """
+    def resolve(self, conflicts):
+        return (dict(e, **{K_FINAL: e[K_IMPORTING]}) for e in conflicts)
+
+
+def project(name, diagrams, predicates, documentation):
+    """
+    Build a Project with the given number of concept predicates spread across the given number of diagrams.
+    :type name: str
+    :type diagrams: int
+    :type predicates: int
+    :type documentation: callable
+    :rtype: Project
+    """
+    from eddy.core.diagram import Diagram
+    from eddy.core.profiles.owl2 import OWL2Profile
+    from eddy.core.project import Project
+
+    application()
+    project = Project(name=name, path=tempfile.gettempdir(), prefix='bench',
+                      iri='http://www.dis.uniroma1.it/~graphol/benchmark', profile=OWL2Profile())
+    size = -(-predicates // diagrams)
+    for i in range(diagrams):
+        diagram = Diagram.create('diagram_{0}'.format(i), 30000, project)
+        connect(diagram.sgnItemAdded, project.doAddItem)
+        connect(diagram.sgnItemRemoved, project.doRemoveItem)
+        for j in range(i * size, min(predicates, (i + 1) * size)):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setText('concept_{0}'.format(j))
+            node.setPos(QtCore.QPointF((j % 100) * 200, (j % size // 100) * 120))
+            diagram.addItem(node)
+        project.addDiagram(diagram)
+    for j in range(predicates):
+        project.setMeta(Item.ConceptNode, 'concept_{0}'.format(j), {K_DESCRIPTION: documentation(j)})
+    return project
+
+
+def legacyMerge(session, project, other):
+    """
+    Merge the projects looking up each predicate through the index and pushing one command
+    per diagram and per predicate (the former merge implementation, without conflict dialogs).
+    :type session: Session
+    :type project: Project
+    :type other: Project
+    """
+    commands = []
+    for diagram in other.diagrams():
+        occurrence = 1
+        name = diagram.name
+        while project.diagram(diagram.name):
+            diagram.name = '{0}_{1}'.format(name, occurrence)
+            occurrence += 1
+        disconnect(diagram.sgnItemAdded, other.doAddItem)
+        disconnect(diagram.sgnItemRemoved, other.doRemoveItem)
+        connect(diagram.sgnItemAdded, project.doAddItem)
+        connect(diagram.sgnItemRemoved, project.doRemoveItem)
+        commands.append(CommandDiagramAdd(diagram, project))
+    conflicts = {}
+    for item, name in other.metas():
+        if not project.predicates(item, name):
+            commands.append(CommandNodeSetMeta(project, item, name, project.meta(item, name).copy(), other.meta(item, name).copy()))
+        elif project.meta(item, name) != other.meta(item, name):
+            conflicts[(item, name)] = {K_CURRENT: project.meta(item, name).copy(), K_IMPORTING: other.meta(item, name).copy()}
+    for (item, name), conflict in conflicts.items():
+        commands.append(CommandNodeSetMeta(project, item, name, project.meta(item, name), conflict[K_IMPORTING]))
+    session.undostack.beginMacro('import project')
+    for command in commands:
+        session.undostack.push(command)
+    session.undostack.endMacro()
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--predicates', type=int, default=20000, help='number of predicates of each project')
+    parser.add_argument('--diagrams', type=int, default=20, help='number of diagrams of each project')
+    options = parser.parse_args()
+
+    def build():
+        current = project('current', options.diagrams, options.predicates, lambda j: 'predicate {0}'.format(j))
+        importing = project('importing', options.diagrams, options.predicates,
+                            lambda j: 'predicate {0}'.format(j if j % 2 else -j))
+        return current, importing
+
+    session = Session()
+    label = '{0} predicates, {1} diagrams'.format(options.predicates, options.diagrams)
+
+    current, importing = build()
+    with Benchmark('merge {0}, per-predicate commands'.format(label)):
+        legacyMerge(session, current, importing)
+
+    current, importing = build()
+    worker = MergeWorker(current, importing, session)
+    with Benchmark('merge {0}, conflicts computation'.format(label)):
+        worker.mergeDiagrams()
+        worker.mergeMeta()
+    with Benchmark('merge {0}, compound command'.format(label)):
+        worker.mergeFinished()
+    with Benchmark('undo merge {0}'.format(label)):
+        session.undostack.undo()
+    with Benchmark('redo merge {0}'.format(label)):
+        session.undostack.redo()
+
+
+if __name__ == '__main__':
+    main()
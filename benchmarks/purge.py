@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Benchmark of the computation of the items removed by a purge, on a graph model holding
+a chain of nested union nodes each one having many concept inputs.
+
+Usage: python benchmarks/purge.py [--inputs N] [--depth N]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import Benchmark, parser
+
+from eddy.core.datatypes.graphol import Identity, Item
+from eddy.core.dependencies import DependencyGraph
+from eddy.core.model import GraphModel
+
+
+def purgeItems(items):
+    """
+    Collect the items removed by a purge inspecting only the definition of the given
+    items and checking membership on a list (the former Session.doPurge implementation).
+    :type items: T <= list|tuple|set
+    :rtype: list
+    """
+    items = set(items)
+    purge = set()
+    for item in items:
+        if item.isNode():
+            for node in item.definition():
+                if item.isConstructor():
+                    if node not in items:
+                        if any(e.other(node) not in items for e in node.edges):
+                            continue
+                purge.add(node)
+    collection = list(items | purge)
+    collection.extend([x for item in collection if item.isNode() for x in item.edges if x not in collection])
+    return collection
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--inputs', type=int, default=2000, help='number of concept inputs of each union node')
+    parser.add_argument('--depth', type=int, default=5, help='number of nested union nodes')
+    options = parser.parse_args()
+
+    model = GraphModel()
+    model.addNode('d0', 'top', Item.ConceptNode, Identity.Concept, {Identity.Concept}, 'Top')
+    target = ('d0', 'top')
+    for i in range(options.depth):
+        union = ('d0', 'u{0}'.format(i))
+        model.addNode('d0', union[1], Item.UnionNode, Identity.Concept, {Identity.Concept}, 'or')
+        model.addEdge('d0', 'o{0}'.format(i), Item.InclusionEdge if i == 0 else Item.InputEdge, union, target)
+        for j in range(options.inputs):
+            concept = ('d0', 'c{0}_{1}'.format(i, j))
+            model.addNode('d0', concept[1], Item.ConceptNode, Identity.Concept, {Identity.Concept}, concept[1])
+            model.addEdge('d0', 'i{0}_{1}'.format(i, j), Item.InputEdge, concept, union)
+        target = union
+
+    items = [model.node('d0', 'u0')]
+    with Benchmark('purge preview, definition of the selection'):
+        size = len(purgeItems(items))
+    print('{0} items removed'.format(size))
+    with Benchmark('purge preview, dependency graph closure'):
+        size = len(DependencyGraph(items).collection())
+    print('{0} items removed'.format(size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Benchmark of the selection of all the items of a large diagram, selecting items one by one
+(as select all and rubber band selection used to) against Diagram.setItemsSelected.
+
+Usage: python benchmarks/selection.py [--items N]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.functions.misc import first
+from eddy.core.functions.signals import connect
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--items', type=int, default=50000, help='number of items (nodes and edges) to select')
+    options = parser.parse_args()
+
+    project = synthetic_project(1, (options.items + 1) // 2)
+    diagram = first(project.diagrams())
+    items = list(project.items(diagram))
+    notifications = []
+    connect(diagram.selectionChanged, lambda: notifications.append(None))
+
+    with Benchmark('select {0} items, one by one'.format(len(items))):
+        for item in items:
+            item.setSelected(True)
+    print('{0} selection change notifications'.format(len(notifications)))
+    with Benchmark('deselect {0} items, one by one'.format(len(items))):
+        for item in items:
+            item.setSelected(False)
+
+    del notifications[:]
+    with Benchmark('select {0} items, bulk'.format(len(items))):
+        diagram.setItemsSelected(items)
+    print('{0} selection change notifications'.format(len(notifications)))
+    with Benchmark('deselect {0} items, bulk'.format(len(items))):
+        diagram.clearSelection()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of the application cold start, measured as the time elapsed between the interpreter
+starting to import Eddy and the welcome screen being shown. Each run is executed in a fresh process:
+warm runs reuse the compiled bytecode, cold runs use a copy of the package without bytecode.
+
+Usage: python benchmarks/startup.py [--runs N]
+
+Reference numbers (median of 5 runs, Linux, offscreen platform, PySide6 6.6.3):
+
+                                                      warm      cold
+    baseline: images_rc.py/fonts_rc.py modules,
+              Session imported with the application   485 ms    850 ms
+    target                                            < 300 ms  < 500 ms
+    images.rcc, fonts_rc.py, deferred Session         344 ms    669 ms
+    images.rcc, fonts.rcc, deferred Session           283 ms    378 ms
+
+Run 'python run.py --profile-startup' to get the import-time breakdown of a single start.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from benchmarks import parser
+
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from argparse import Namespace
+from eddy.core.application import Eddy
+from eddy.core.resources import registerResources
+from eddy.ui.welcome import Welcome
+registerResources('fonts', 'images')
+app = Eddy(Namespace(nosplash=True, tests=True, open=None), ['startup'])
+welcome = Welcome(app)
+welcome.show()
+app.processEvents()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def measure(root, runs, cold=False):
+    """
+    Returns the median startup time (in ms) of the given number of runs.
+    :type root: str
+    :type runs: int
+    :type cold: bool
+    :rtype: float
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    args = [sys.executable, '-B'] if cold else [sys.executable]
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output(args + ['-c', SNIPPET.format(root=root)], env=env, stderr=subprocess.DEVNULL)
+        samples.append(float(output.decode().split()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--runs', type=int, default=5, help='number of application starts per measure')
+    options = parser.parse_args()
+
+    print('{0:<60} {1:>10.1f}ms'.format('warm start (bytecode available)', measure(ROOT, options.runs)))
+    with tempfile.TemporaryDirectory() as tmp:
+        ignore = shutil.ignore_patterns('__pycache__', '*.pyc')
+        shutil.copytree(os.path.join(ROOT, 'eddy'), os.path.join(tmp, 'eddy'), ignore=ignore)
+        shutil.copytree(os.path.join(ROOT, 'resources'), os.path.join(tmp, 'resources'), ignore=ignore)
+        print('{0:<60} {1:>10.1f}ms'.format('cold start (no bytecode)', measure(tmp, options.runs, cold=True)))
+
+
+if __name__ == '__main__':
+    main()
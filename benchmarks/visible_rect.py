@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Benchmark of Diagram.visibleRect on a diagram holding a large amount of items.
+
+Usage: python benchmarks/visible_rect.py [--items N] [--queries N]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore
+
+from benchmarks import Benchmark, parser, synthetic_project
+
+from eddy.core.datatypes.graphol import Item
+
+
+def scan(diagram, margin=0):
+    """
+    Compute the visible rect of the given diagram scanning all its items (as done before bounds caching).
+    :type diagram: Diagram
+    :type margin: float
+    :rtype: QRectF
+    """
+    x = set()
+    y = set()
+    for item in diagram.items():
+        b = item.mapRectToScene(item.boundingRect())
+        x.update({b.left(), b.right()})
+        y.update({b.top(), b.bottom()})
+    return QtCore.QRectF(QtCore.QPointF(min(x) - margin, min(y) - margin), QtCore.QPointF(max(x) + margin, max(y) + margin))
+
+
+def main():
+    """
+    Run the benchmark.
+    """
+    parser.add_argument('--items', type=int, default=100000, help='number of nodes in the diagram')
+    parser.add_argument('--queries', type=int, default=1000, help='number of queries interleaved with edits')
+    options = parser.parse_args()
+
+    rnd = random.Random(42)
+    project = synthetic_project(1, 0)
+    diagram = project.diagram('diagram_0')
+
+    with Benchmark('add {0} nodes'.format(options.items)):
+        nodes = []
+        for i in range(options.items):
+            node = diagram.factory.create(Item.ConceptNode)
+            node.setPos(QtCore.QPointF(rnd.uniform(-50000, 50000), rnd.uniform(-50000, 50000)))
+            diagram.addItem(node)
+            nodes.append(node)
+    with Benchmark('first query (builds the bounds)'):
+        diagram.visibleRect()
+    with Benchmark('full scan, single query'):
+        scan(diagram)
+    with Benchmark('{0} queries, no edits'.format(options.queries)):
+        for _ in range(options.queries):
+            diagram.visibleRect()
+    with Benchmark('{0} queries, each after moving a random node inwards'.format(options.queries)):
+        for _ in range(options.queries):
+            node = rnd.choice(nodes)
+            node.setPos(node.pos() * 0.99)
+            diagram.visibleRect()
+    with Benchmark('{0} queries, each after moving a random node outwards'.format(options.queries)):
+        for _ in range(options.queries):
+            node = rnd.choice(nodes)
+            node.setPos(node.pos() * 1.01)
+            diagram.visibleRect()
+    extreme = max(nodes, key=lambda x: x.pos().x())
+    with Benchmark('query after removing a border node (recomputes the bounds)'):
+        diagram.removeItem(extreme)
+        diagram.visibleRect()
+    assert diagram.visibleRect() == scan(diagram)
+
+
+if __name__ == '__main__':
+    main()
@@ -41,7 +41,7 @@ from PySide6 import QtNetwork
 from PySide6 import QtWidgets
 
 from eddy import APPID, APPNAME, ORGANIZATION, WORKSPACE
-from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import OrderedSet
 from eddy.core.datatypes.qt import Font
 from eddy.core.datatypes.system import File
 from eddy.core.functions.fsystem import isdir, fexists, fread
@@ -56,7 +56,6 @@ from eddy.core.project import ProjectVersionError
 from eddy.core.project import ProjectStopLoadingError
 
 from eddy.ui.progress import BusyProgressDialog
-from eddy.ui.session import Session
 from eddy.ui.splash import Splash
 from eddy.ui.style import EddyProxyStyle
 from eddy.ui.workspace import WorkspaceDialog
@@ -84,7 +83,7 @@ class Eddy(QtWidgets.QApplication):
         self.socket = QtNetwork.QLocalSocket()
         self.socket.connectToServer(APPID)
         self.running = self.socket.waitForConnected()
-        self.sessions = DistinctList()
+        self.sessions = OrderedSet()
         self.welcome = None
 
         if not self.isRunning() or options.tests:
@@ -134,11 +133,8 @@ class Eddy(QtWidgets.QApplication):
         else:
             # If we have some projects in our recent list, check whether they exists on the
             # filesystem. If they do not exists we remove them from our recent list.
-            projects = []
-            for path in map(expandPath, settings.value('project/recent')):
-                if isdir(path) and path not in projects:
-                    projects.append(path)
-            settings.setValue('project/recent', projects or examples)
+            projects = OrderedSet(filter(isdir, map(expandPath, settings.value('project/recent'))))
+            settings.setValue('project/recent', list(projects) or examples)
             settings.sync()
 
         #############################################
@@ -251,7 +247,11 @@ class Eddy(QtWidgets.QApplication):
         else:
             # If we do not have a session for the given project we'll create one.
             with BusyProgressDialog('Loading project: {0}'.format(os.path.basename(path))):
-    
+
+                # Session pulls in all the exporters, loaders, profiles and dialogs:
+                # import it only when needed so as not to delay the welcome screen.
+                from eddy.ui.session import Session
+
                 try:
                     session = Session(self, path)
                 except ProjectStopLoadingError:
@@ -330,7 +330,7 @@ class Eddy(QtWidgets.QApplication):
             session.save()
             self.sessions.remove(session)
         ## CLEANUP POSSIBLE LEFTOVERS
-        self.sessions = DistinctList(filter(None, self.sessions))
+        self.sessions = OrderedSet(filter(None, self.sessions))
         ## SWITCH TO AN ACTIVE WINDOW OR WELCOME PANEL
         if self.sessions:
             session = self.sessions[-1]
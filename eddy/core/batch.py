@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Headless batch processing of Graphol projects.
+
+Each project is loaded with the Graphol project loader, validated against its ontology
+profile and exported into the requested formats, without creating any Session widget.
+Projects are processed in parallel worker processes, each one running a QApplication on
+the offscreen platform, and a JSON report with results and timings is produced.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtWidgets
+
+from eddy import VERSION
+from eddy.core.common import HasPluginSystem, HasProfileSystem
+from eddy.core.common import HasProjectExportSystem, HasProjectLoadSystem
+from eddy.core.datatypes.owl import OWLAxiom, OWLSyntax
+from eddy.core.datatypes.system import File, PageSize
+from eddy.core.exporters.graphol import GrapholProjectExporter
+from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.pdf import PdfDiagramExporter
+from eddy.core.functions.misc import format_exception
+from eddy.core.functions.path import expandPath
+from eddy.core.functions.signals import connect
+from eddy.core.loaders.graphol import GrapholProjectLoader_v2
+from eddy.core.model import GraphModel
+from eddy.core.output import getLogger, getPerfLogger
+from eddy.core.plugin import PluginManager
+from eddy.core.profiles.owl2 import OWL2Profile
+from eddy.core.profiles.owl2ql import OWL2QLProfile
+from eddy.core.profiles.owl2rl import OWL2RLProfile
+
+
+LOGGER = getLogger()
+PERF = getPerfLogger()
+
+
+class BatchSession(HasPluginSystem, HasProjectExportSystem, HasProjectLoadSystem, HasProfileSystem, QtCore.QObject):
+    """
+    Headless replacement for Session providing what loaders, profiles and exporters need to work.
+    Only project exporters contributed by plugins which declare file type activation triggers are
+    available, since those plugins do not require any Session widget to start.
+    """
+    sgnPluginDisposed = QtCore.Signal(str)
+    sgnPluginStarted = QtCore.Signal(str)
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the batch session.
+        """
+        super().__init__(**kwargs)
+        self.project = None
+        self.undostack = QtGui.QUndoStack(self)
+        self.pmanager = PluginManager(self)
+        self.initExporters()
+        self.initLoaders()
+        self.initProfiles()
+        self.initPlugins()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot()
+    def doUpdateState(self):
+        """
+        Executed when the selection of a diagram changes: there is no state to update when running headless.
+        """
+        pass
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def initExporters(self):
+        """
+        Initialize project exporters.
+        """
+        self.addProjectExporter(GrapholProjectExporter)
+
+    def initLoaders(self):
+        """
+        Initialize project loaders.
+        """
+        self.addProjectLoader(GrapholProjectLoader_v2)
+
+    def initPlugins(self):
+        """
+        Install activation triggers for plugins contributing file formats.
+        """
+        for spec, loader in PluginManager.info:
+            if spec.has_option('activation', 'filetypes') and not spec.has_option('activation', 'dock'):
+                self.pmanager.defer(spec, loader)
+
+    def initProfiles(self):
+        """
+        Initialize the ontology profiles.
+        """
+        self.addProfile(OWL2Profile)
+        self.addProfile(OWL2QLProfile)
+        self.addProfile(OWL2RLProfile)
+
+    def load(self, path):
+        """
+        Load the project stored in the given path, building all its diagrams.
+        :type path: str
+        :rtype: Project
+        """
+        worker = GrapholProjectLoader_v2(path, self)
+        worker.run()
+        self.project.materialize()
+        return self.project
+
+    def export(self, project, filetype, path):
+        """
+        Export the given project in the given file format.
+        :type project: Project
+        :type filetype: File
+        :type path: str
+        """
+        if filetype is File.Owl:
+            errors = []
+            worker = OWLOntologyExporterWorker(project, path, axioms=set(OWLAxiom), syntax=OWLSyntax.Functional)
+            connect(worker.sgnErrored, errors.append)
+            worker.run()
+            if errors:
+                raise errors[0]
+        elif filetype is File.Pdf:
+            diagrams = sorted(project.diagrams(), key=lambda x: x.name)
+            if diagrams:
+                worker = PdfDiagramExporter(diagrams[0], self, diagrams=diagrams, pageSize=PageSize.Fit, open=False)
+                worker.run(path)
+        else:
+            self.pmanager.require(filetype)
+            exporter = self.projectExporter(filetype)
+            if not exporter or exporter is GrapholProjectExporter:
+                raise ValueError('unsupported export format: %s' % os.path.basename(path))
+            worker = exporter(project, self, open=False)
+            worker.run(path)
+
+    def validate(self, project):
+        """
+        Validate the given project against its profile, returning the list of detected syntax errors.
+        All the edges are validated, together with isolated nodes (see SyntaxValidationDialog):
+        validation runs against the graph model mirroring the project rather than on diagram items.
+        :type project: Project
+        :rtype: list
+        """
+        errors = []
+        event = PERF.start('project.validate', project=project.name)
+        model = GraphModel.fromProject(project)
+        event.mark('model')
+        items = model.edges() + [n for n in model.nodes() if not n.edges]
+        for item in items:
+            if item.isEdge():
+                pvr = project.profile.checkEdge(item.source, item, item.target)
+            else:
+                pvr = project.profile.checkNode(item)
+            if not pvr.isValid():
+                errors.append({'diagram': item.diagram, 'item': item.id, 'message': pvr.message()})
+        PERF.finish(event, items=len(items), errors=len(errors))
+        return errors
+
+
+#############################################
+#   WORKER PROCESS
+#################################
+
+
+__session = None
+
+
+def initialize(level=logging.WARNING, perf=None):
+    """
+    Initialize the current process for headless processing (to be run once per worker process).
+    :type level: int
+    :type perf: str
+    """
+    global __session
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    LOGGER.setLevel(level)
+    if perf and not PERF.isEnabled():
+        PERF.enable(perf)
+    if not QtWidgets.QApplication.instance():
+        QtWidgets.QApplication(['eddy-batch'])
+    PluginManager.scan('@plugins/', '@home/plugins/')
+    __session = BatchSession()
+
+
+def process(path, formats, output, validate=True):
+    """
+    Load, validate and export the project stored in the given path, returning the project report.
+    :type path: str
+    :type formats: list
+    :type output: str
+    :type validate: bool
+    :rtype: dict
+    """
+    report = {'path': path, 'name': None, 'status': 'ok', 'errors': [], 'exports': {}, 'timings': {}}
+    start = time.perf_counter()
+    try:
+        project = __session.load(path)
+        report['name'] = project.name
+        report['diagrams'] = len(project.diagrams())
+        report['items'] = len(project.items())
+        report['timings']['load'] = time.perf_counter() - start
+        if validate:
+            mark = time.perf_counter()
+            report['errors'] = __session.validate(project)
+            report['timings']['validate'] = time.perf_counter() - mark
+            if report['errors']:
+                report['status'] = 'invalid'
+        for ext in formats:
+            mark = time.perf_counter()
+            filepath = os.path.join(output, '{0}.{1}'.format(project.name, ext))
+            try:
+                __session.export(project, File.forPath(filepath), filepath)
+            except Exception as e:
+                LOGGER.error('Failed to export project %s in %s format: %s', path, ext, e)
+                report['exports'][ext] = {'status': 'failed', 'error': str(e), 'details': format_exception(e)}
+                report['status'] = 'failed'
+            else:
+                report['exports'][ext] = {'status': 'ok', 'path': filepath}
+            report['timings']['export_{0}'.format(ext)] = time.perf_counter() - mark
+    except Exception as e:
+        LOGGER.error('Failed to process project %s: %s', path, e)
+        report['status'] = 'failed'
+        report['failure'] = format_exception(e)
+    finally:
+        __session.project = None
+        report['timings']['total'] = time.perf_counter() - start
+    return report
+
+
+def run(paths, formats, output, jobs=None, validate=True, level=logging.WARNING, perf=None):
+    """
+    Process the given projects in parallel worker processes, returning the batch report.
+    If a perf log path is given, every worker appends its performance events to it.
+    :type paths: list
+    :type formats: list
+    :type output: str
+    :type jobs: int
+    :type validate: bool
+    :type level: int
+    :type perf: str
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    paths = [expandPath(path) for path in paths]
+    output = expandPath(output)
+    perf = expandPath(perf) if perf else None
+    os.makedirs(output, exist_ok=True)
+    jobs = max(1, min(jobs or multiprocessing.cpu_count(), len(paths) or 1))
+    args = [(path, formats, output, validate) for path in paths]
+    if jobs == 1:
+        initialize(level, perf)
+        reports = [process(*x) for x in args]
+    else:
+        # Spawn fresh interpreters: Qt state must not be shared with forked children.
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(jobs, initializer=initialize, initargs=(level, perf), maxtasksperchild=50) as pool:
+            reports = pool.starmap(process, args, chunksize=1)
+    return {
+        'version': VERSION,
+        'jobs': jobs,
+        'formats': formats,
+        'elapsed': time.perf_counter() - start,
+        'summary': {x: sum(1 for r in reports if r['status'] == x) for x in ('ok', 'invalid', 'failed')},
+        'projects': reports,
+    }
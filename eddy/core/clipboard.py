@@ -33,23 +33,182 @@
 ##########################################################################
 
 
+
 from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtWidgets
 
 from eddy.core.commands.common import CommandItemsAdd
+from eddy.core.commands.nodes import CommandNodeSetMeta
+from eddy.core.datatypes.collections import OrderedSet
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.signals import connect, disconnect
 from eddy.core.output import getLogger
 
 
 LOGGER = getLogger()
 
 
+class NodeDescriptor(object):
+    """
+    Compact description of a node stored in the clipboard.
+    Coordinates are stored relative to the clipboard origin, and the node is only built when pasted.
+    """
+    __slots__ = ('color', 'height', 'id', 'inputs', 'text', 'textPos', 'type', 'width', 'x', 'y')
+
+    def __init__(self, item, id, x, y, width, height, color=None, text=None, textPos=None, inputs=None):
+        """
+        Initialize the node descriptor.
+        :type item: Item
+        :type id: str
+        :type x: float
+        :type y: float
+        :type width: float
+        :type height: float
+        :type color: str
+        :type text: str
+        :type textPos: tuple
+        :type inputs: tuple
+        """
+        self.type = item
+        self.id = id
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = color
+        self.text = text
+        self.textPos = textPos
+        self.inputs = inputs
+
+    @classmethod
+    def fromNode(cls, node, origin):
+        """
+        Build the descriptor of the given node, using the given point as origin.
+        :type node: AbstractNode
+        :type origin: QPointF
+        :rtype: NodeDescriptor
+        """
+        pos = node.pos() - origin
+        color = node.brush().color().name() if node.isPredicate() else None
+        textPos = None
+        if node.label is not None and node.label.isMoved():
+            textPos = node.textPos()
+            textPos = (textPos.x(), textPos.y())
+        inputs = None
+        if node.type() in {Item.PropertyAssertionNode, Item.RoleChainNode}:
+            inputs = tuple(node.inputs)
+        return cls(node.type(), node.id, pos.x(), pos.y(), node.width(), node.height(),
+                   color, node.text(), textPos, inputs)
+
+    def create(self, diagram, x, y, id=None):
+        """
+        Build a node from this descriptor in the given diagram, placing it relative to the given origin.
+        :type diagram: Diagram
+        :type x: float
+        :type y: float
+        :type id: str
+        :rtype: AbstractNode
+        """
+        kwargs = {'id': id or diagram.guid.next('n'), 'height': self.height, 'width': self.width}
+        if self.color:
+            kwargs['brush'] = QtGui.QBrush(QtGui.QColor(self.color))
+        node = diagram.factory.create(self.type, **kwargs)
+        node.setPos(x + self.x, y + self.y)
+        if self.text is not None:
+            node.setText(self.text)
+        if self.textPos is not None:
+            node.setTextPos(QtCore.QPointF(*self.textPos))
+        return node
+
+
+class EdgeDescriptor(object):
+    """
+    Compact description of an edge stored in the clipboard.
+    Coordinates are stored relative to the clipboard origin, and the edge is only built when pasted.
+    """
+    __slots__ = ('breakpoints', 'id', 'source', 'sourceAnchor', 'target', 'targetAnchor', 'type')
+
+    def __init__(self, item, id, source, target, breakpoints=(), sourceAnchor=None, targetAnchor=None):
+        """
+        Initialize the edge descriptor.
+        :type item: Item
+        :type id: str
+        :type source: str
+        :type target: str
+        :type breakpoints: tuple
+        :type sourceAnchor: tuple
+        :type targetAnchor: tuple
+        """
+        self.type = item
+        self.id = id
+        self.source = source
+        self.target = target
+        self.breakpoints = breakpoints
+        self.sourceAnchor = sourceAnchor
+        self.targetAnchor = targetAnchor
+
+    @classmethod
+    def fromEdge(cls, edge, origin):
+        """
+        Build the descriptor of the given edge, using the given point as origin.
+        :type edge: AbstractEdge
+        :type origin: QPointF
+        :rtype: EdgeDescriptor
+        """
+        def relative(point):
+            if point is None:
+                return None
+            point = point - origin
+            return point.x(), point.y()
+
+        return cls(edge.type(), edge.id, edge.source.id, edge.target.id,
+                   tuple(relative(p) for p in edge.breakpoints),
+                   relative(edge.source.anchors.get(edge)),
+                   relative(edge.target.anchors.get(edge)))
+
+    def create(self, diagram, nodes, x, y, id=None):
+        """
+        Build an edge from this descriptor in the given diagram, connecting the given nodes
+        (indexed by the id of the copied nodes) and placing it relative to the given origin.
+        :type diagram: Diagram
+        :type nodes: dict
+        :type x: float
+        :type y: float
+        :type id: str
+        :rtype: AbstractEdge
+        """
+        source = nodes[self.source]
+        target = nodes[self.target]
+        edge = diagram.factory.create(self.type, **{
+            'id': id or diagram.guid.next('e'),
+            'source': source,
+            'target': target,
+            'breakpoints': [QtCore.QPointF(x + px, y + py) for px, py in self.breakpoints],
+        })
+        if self.sourceAnchor is not None:
+            source.setAnchor(edge, QtCore.QPointF(x + self.sourceAnchor[0], y + self.sourceAnchor[1]))
+        if self.targetAnchor is not None:
+            target.setAnchor(edge, QtCore.QPointF(x + self.targetAnchor[0], y + self.targetAnchor[1]))
+        source.addEdge(edge)
+        target.addEdge(edge)
+        return edge
+
+
 class Clipboard(QtCore.QObject):
     """
     Extension of QtCore.QObject which implements the Clipboard.
+    The clipboard stores compact descriptors of the copied items (see NodeDescriptor and
+    EdgeDescriptor) rather than item copies: diagram items are only built when pasting.
+    Copied items are also published on the system clipboard as a Graphol fragment (an XML
+    document using the Clipboard.MimeType MIME type), so that they can be pasted in the
+    diagrams of other sessions and other Eddy processes without merging whole projects.
     Additionally to built-in signals, this class emits:
 
     * sgnCleared: whenever the clipboard is cleared.
     * sgnUpdated: whenever the clipboard is updated with new elements.
     """
+    MimeType = 'application/x-graphol-fragment'
     PasteOffsetX = 20
     PasteOffsetY = 10
 
@@ -62,8 +221,42 @@ class Clipboard(QtCore.QObject):
         :type session: Session
         """
         super().__init__(session)
-        self.edges = {}
-        self.nodes = {}
+        self.anchor = None
+        self.data = None
+        self.edges = []
+        self.meta = {}
+        self.nodes = []
+        self.origin = QtCore.QPointF()
+        self.stale = False
+
+        self.itemToXml = {
+            Item.AttributeNode: 'attribute',
+            Item.ComplementNode: 'complement',
+            Item.ConceptNode: 'concept',
+            Item.DatatypeRestrictionNode: 'datatype-restriction',
+            Item.DisjointUnionNode: 'disjoint-union',
+            Item.DomainRestrictionNode: 'domain-restriction',
+            Item.EnumerationNode: 'enumeration',
+            Item.FacetNode: 'facet',
+            Item.IndividualNode: 'individual',
+            Item.IntersectionNode: 'intersection',
+            Item.PropertyAssertionNode: 'property-assertion',
+            Item.RangeRestrictionNode: 'range-restriction',
+            Item.RoleNode: 'role',
+            Item.RoleChainNode: 'role-chain',
+            Item.RoleInverseNode: 'role-inverse',
+            Item.UnionNode: 'union',
+            Item.ValueDomainNode: 'value-domain',
+            Item.InclusionEdge: 'inclusion',
+            Item.EquivalenceEdge: 'equivalence',
+            Item.InputEdge: 'input',
+            Item.MembershipEdge: 'membership',
+        }
+        self.itemFromXml = {v: k for k, v in self.itemToXml.items()}
+
+        connect(QtWidgets.QApplication.clipboard().dataChanged, self.onDataChanged)
+        connect(QtWidgets.QApplication.instance().aboutToQuit, self.dispose)
+        self.onDataChanged()
 
     #############################################
     #   PROPERTIES
@@ -77,6 +270,20 @@ class Clipboard(QtCore.QObject):
         """
         return self.parent()
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot()
+    def onDataChanged(self):
+        """
+        Executed when the content of the system clipboard changes.
+        A Graphol fragment copied by another session is only decoded when it's needed.
+        """
+        mimeData = QtWidgets.QApplication.clipboard().mimeData()
+        if mimeData and mimeData.hasFormat(self.MimeType) and mimeData.data(self.MimeType) != self.data:
+            self.stale = True
+
     #############################################
     #   INTERFACE
     #################################
@@ -85,104 +292,260 @@ class Clipboard(QtCore.QObject):
         """
         Clear the clipboard.
         """
-        self.edges.clear()
-        self.nodes.clear()
+        self.anchor = None
+        self.edges = []
+        self.meta = {}
+        self.nodes = []
+        self.stale = False
         LOGGER.debug('Clipboard cleared!')
         self.sgnCleared.emit()
 
+    def decode(self, data):
+        """
+        Load the clipboard content from the given Graphol fragment.
+        :type data: QByteArray
+        :raise ValueError: if the given data is not a valid Graphol fragment.
+        """
+        anchor = None
+        edges = []
+        meta = {}
+        nodes = []
+        origin = None
+        node = edge = predicate = None
+        reader = QtCore.QXmlStreamReader(bytes(data).decode('utf-8'))
+        while not reader.atEnd():
+            if reader.readNext() is not QtCore.QXmlStreamReader.TokenType.StartElement:
+                continue
+            name = reader.name()
+            attrs = reader.attributes()
+            if name == 'node':
+                textPos = inputs = None
+                if attrs.hasAttribute('label-x'):
+                    textPos = (float(attrs.value('label-x')), float(attrs.value('label-y')))
+                if attrs.hasAttribute('inputs'):
+                    inputs = tuple(x for x in attrs.value('inputs').split(',') if x)
+                node = NodeDescriptor(self.itemFromXml[attrs.value('type')], attrs.value('id'),
+                                      float(attrs.value('x')), float(attrs.value('y')),
+                                      float(attrs.value('width')), float(attrs.value('height')),
+                                      attrs.value('color') or None, None, textPos, inputs)
+                nodes.append(node)
+                if node.id == anchor:
+                    anchor = node
+            elif name == 'label' and node is not None:
+                node.text = reader.readElementText()
+            elif name == 'edge':
+                node = None
+                sourceAnchor = targetAnchor = None
+                if attrs.hasAttribute('source-x'):
+                    sourceAnchor = (float(attrs.value('source-x')), float(attrs.value('source-y')))
+                if attrs.hasAttribute('target-x'):
+                    targetAnchor = (float(attrs.value('target-x')), float(attrs.value('target-y')))
+                edge = EdgeDescriptor(self.itemFromXml[attrs.value('type')], attrs.value('id'),
+                                      attrs.value('source'), attrs.value('target'), [],
+                                      sourceAnchor, targetAnchor)
+                edges.append(edge)
+            elif name == 'point' and edge is not None:
+                edge.breakpoints.append((float(attrs.value('x')), float(attrs.value('y'))))
+            elif name == 'predicate':
+                predicate = meta.setdefault((self.itemFromXml[attrs.value('type')], attrs.value('name')), {})
+            elif name == 'meta' and predicate is not None:
+                key = attrs.value('key')
+                if attrs.value('type') == 'bool':
+                    predicate[key] = reader.readElementText() == '1'
+                else:
+                    predicate[key] = reader.readElementText()
+            elif name == 'graphol-fragment':
+                if attrs.value('version') != '1':
+                    raise ValueError('unsupported Graphol fragment version: {0}'.format(attrs.value('version')))
+                origin = QtCore.QPointF(float(attrs.value('x')), float(attrs.value('y')))
+                anchor = attrs.value('anchor')
+        if reader.hasError():
+            raise ValueError(reader.errorString())
+        if origin is None or not isinstance(anchor, NodeDescriptor):
+            raise ValueError('missing Graphol fragment anchor')
+        for edge in edges:
+            edge.breakpoints = tuple(edge.breakpoints)
+        self.anchor = anchor
+        self.edges = edges
+        self.meta = meta
+        self.nodes = nodes
+        self.origin = origin
+        LOGGER.debug('Clipboard decoded: nodes=%s, edges=%s', len(self.nodes), len(self.edges))
+
+    @QtCore.Slot()
+    def dispose(self):
+        """
+        Release the system clipboard if it still holds the Graphol fragment published by this clipboard.
+        The system clipboard owns the published QMimeData: leaving it there past the application
+        shutdown makes it outlive the objects it refers to.
+        """
+        disconnect(QtWidgets.QApplication.clipboard().dataChanged, self.onDataChanged)
+        disconnect(QtWidgets.QApplication.instance().aboutToQuit, self.dispose)
+        clipboard = QtWidgets.QApplication.clipboard()
+        mimeData = clipboard.mimeData()
+        if self.data is not None and mimeData and mimeData.data(self.MimeType) == self.data:
+            LOGGER.debug('Releasing system clipboard')
+            clipboard.clear()
+        self.data = None
+
     def empty(self):
         """
         Tells whether the clipboard is empty.
         :rtype: bool
         """
+        self.refresh()
         return not self.edges and not self.nodes
 
+    def encode(self):
+        """
+        Returns the clipboard content as a Graphol fragment.
+        :rtype: QByteArray
+        """
+        def number(value):
+            return '{0:g}'.format(value) if float(value).is_integer() else repr(float(value))
+
+        data = QtCore.QByteArray()
+        writer = QtCore.QXmlStreamWriter(data)
+        writer.writeStartDocument()
+        writer.writeStartElement('graphol-fragment')
+        writer.writeAttribute('version', '1')
+        writer.writeAttribute('x', number(self.origin.x()))
+        writer.writeAttribute('y', number(self.origin.y()))
+        writer.writeAttribute('anchor', self.anchor.id)
+        for (item, name), meta in self.meta.items():
+            writer.writeStartElement('predicate')
+            writer.writeAttribute('type', self.itemToXml[item])
+            writer.writeAttribute('name', name)
+            for key, value in meta.items():
+                writer.writeStartElement('meta')
+                writer.writeAttribute('key', key)
+                if isinstance(value, bool):
+                    writer.writeAttribute('type', 'bool')
+                    value = str(int(value))
+                writer.writeCharacters(str(value))
+                writer.writeEndElement()
+            writer.writeEndElement()
+        for node in self.nodes:
+            writer.writeStartElement('node')
+            writer.writeAttribute('type', self.itemToXml[node.type])
+            writer.writeAttribute('id', node.id)
+            writer.writeAttribute('x', number(node.x))
+            writer.writeAttribute('y', number(node.y))
+            writer.writeAttribute('width', number(node.width))
+            writer.writeAttribute('height', number(node.height))
+            if node.color:
+                writer.writeAttribute('color', node.color)
+            if node.textPos is not None:
+                writer.writeAttribute('label-x', number(node.textPos[0]))
+                writer.writeAttribute('label-y', number(node.textPos[1]))
+            if node.inputs is not None:
+                writer.writeAttribute('inputs', ','.join(node.inputs))
+            if node.text is not None:
+                writer.writeTextElement('label', node.text)
+            writer.writeEndElement()
+        for edge in self.edges:
+            writer.writeStartElement('edge')
+            writer.writeAttribute('type', self.itemToXml[edge.type])
+            writer.writeAttribute('id', edge.id)
+            writer.writeAttribute('source', edge.source)
+            writer.writeAttribute('target', edge.target)
+            if edge.sourceAnchor is not None:
+                writer.writeAttribute('source-x', number(edge.sourceAnchor[0]))
+                writer.writeAttribute('source-y', number(edge.sourceAnchor[1]))
+            if edge.targetAnchor is not None:
+                writer.writeAttribute('target-x', number(edge.targetAnchor[0]))
+                writer.writeAttribute('target-y', number(edge.targetAnchor[1]))
+            for x, y in edge.breakpoints:
+                writer.writeEmptyElement('point')
+                writer.writeAttribute('x', number(x))
+                writer.writeAttribute('y', number(y))
+            writer.writeEndElement()
+        writer.writeEndElement()
+        writer.writeEndDocument()
+        return data
+
     def paste(self, diagram, pos=None):
         """
         Paste currently copied items in the given diagram.
         :type diagram: Diagram
         :type pos: QPointF
         """
-        def ncopy(node):
-            """
-            Create a copy of the given node generating a new id.
-            :type node: AbstractNode
-            """
-            copy = node.copy(diagram)
-            copy.id = diagram.guid.next('n')
-            return copy
-
-        # Create a copy of all the nodes in the clipboard and store them in a dict using the old
-        # node id: this is needed so we can attach copied edges to the copy of the nodes in the
-        # clipboard and to do so we need a mapping between the old node id and the new node id.
-        nodes = {x:ncopy(n) for x, n in self.nodes.items()}
-
-        def ecopy(edge):
-            """
-            Create a copy of the given edge generating a new id and attaching the
-            copied edge to the correspondent previously copied source/target nodes.
-            :type edge: AbstractEdge
-            """
-            copy = edge.copy(diagram)
-            copy.id = diagram.guid.next('e')
-            copy.source = nodes[edge.source.id]
-            copy.target = nodes[edge.target.id]
-            copy.source.setAnchor(copy, edge.source.anchor(edge))
-            copy.target.setAnchor(copy, edge.target.anchor(edge))
-            nodes[edge.source.id].addEdge(copy)
-            nodes[edge.target.id].addEdge(copy)
-            copy.updateEdge()
-            return copy
-
-        # Copy all the needed edges
-        edges = [ecopy(e) for e in self.edges.values()]
-        nodes = [n for n in nodes.values()]
-        items = nodes + edges
-
-        try:
-            zValue = max(diagram.items(), key=lambda x: x.zValue()).zValue()
-        except ValueError:
-            zValue = 0  # Diagram is empty
+        self.refresh()
 
         if pos:
-
-            # Paste position has been given manually => figure out which node to use as anchor item and
-            # adjust the paste position so that the anchor item is pasted right after the given position
-            item = min(nodes, key=lambda x: x.boundingRect().top())
-            offset = pos - item.pos() + QtCore.QPointF(item.width() / 2, item.height() / 2)
-            for item in items:
-                item.moveBy(offset.x(), offset.y())
-                if item.isNode():
-                    item.setZValue(zValue + 0.1)
-                    zValue += 0.1
-                elif item.isEdge():
-                    item.updateEdge()
-
-            # Adjust offsets for a possible next paste using shortcuts.
-            diagram.pasteX = offset.x() + self.PasteOffsetX
-            diagram.pasteY = offset.y() + self.PasteOffsetY
-
+            # Paste position has been given manually => the anchor node is pasted right after the given
+            # position, and the offsets are adjusted for a possible next paste using shortcuts.
+            x = pos.x() + self.anchor.width / 2
+            y = pos.y() + self.anchor.height / 2
+            diagram.pasteX = x - self.origin.x() + self.PasteOffsetX
+            diagram.pasteY = y - self.origin.y() + self.PasteOffsetY
         else:
-
             # No paste position given => use offsets set in the diagram instance.
-            for item in items:
-                item.moveBy(diagram.pasteX, diagram.pasteY)
-                if item.isNode():
-                    item.setZValue(zValue + 0.1)
-                    zValue += 0.1
-                elif item.isEdge():
-                    item.updateEdge()
-
-            # Adjust diagram offsets for a possible next paste using shortcuts.
+            x = self.origin.x() + diagram.pasteX
+            y = self.origin.y() + diagram.pasteY
             diagram.pasteX += self.PasteOffsetX
             diagram.pasteY += self.PasteOffsetY
 
-        self.session.undostack.push(CommandItemsAdd(diagram, items))
+        # Build all the nodes and store them in a dict using the id of the copied node: this is
+        # needed to attach the pasted edges to the pasted nodes. Pasted nodes are stacked on top
+        # of the diagram, using the maximum depth which is tracked by the diagram itself, and pasted
+        # edges are stacked on top of the pasted nodes.
+        # Ids are reserved in blocks, one for the nodes and one for the edges.
+        zValue = diagram.maxZValue
+        nodes = {}
+        for descriptor, value in zip(self.nodes, diagram.guid.reserve('n', len(self.nodes))):
+            node = descriptor.create(diagram, x, y, 'n{0}'.format(value))
+            zValue += 0.1
+            node.setZValue(zValue)
+            nodes[descriptor.id] = node
+
+        edges = {}
+        for descriptor, value in zip(self.edges, diagram.guid.reserve('e', len(self.edges))):
+            edge = descriptor.create(diagram, nodes, x, y, 'e{0}'.format(value))
+            edge.setZValue(zValue + 0.1)
+            edges[descriptor.id] = edge
+
+        # Restore the order of the inputs of operator nodes (role chain, property assertion).
+        for descriptor in self.nodes:
+            if descriptor.inputs is not None:
+                node = nodes[descriptor.id]
+                node.inputs = OrderedSet(edges[eid].id for eid in descriptor.inputs if eid in edges)
+
+        # Predicates metadata are copied along with the items (this is only needed when pasting
+        # items copied from another project), unless the project already defines them.
+        project = diagram.project
+        items = list(nodes.values()) + list(edges.values())
+        metas = [(k, v) for k, v in self.meta.items() if not project.meta(*k)]
+        if metas:
+            self.session.undostack.beginMacro('add {0} items'.format(len(items)))
+            self.session.undostack.push(CommandItemsAdd(diagram, items))
+            for (item, name), meta in metas:
+                self.session.undostack.push(CommandNodeSetMeta(project, item, name, project.meta(item, name), dict(meta)))
+            self.session.undostack.endMacro()
+        else:
+            self.session.undostack.push(CommandItemsAdd(diagram, items))
+
+    def refresh(self):
+        """
+        Load the Graphol fragment copied on the system clipboard by another session, if any.
+        """
+        if self.stale:
+            self.stale = False
+            mimeData = QtWidgets.QApplication.clipboard().mimeData()
+            if mimeData and mimeData.hasFormat(self.MimeType):
+                data = mimeData.data(self.MimeType)
+                try:
+                    self.decode(data)
+                except (KeyError, ValueError) as e:
+                    LOGGER.warning('Could not load Graphol fragment from the system clipboard: %s', e)
+                else:
+                    self.data = data
 
     def size(self):
         """
         Returns the amount of elements in the clipboard.
         """
+        self.refresh()
         return len(self.edges) + len(self.nodes)
 
     def update(self, diagram):
@@ -192,19 +555,31 @@ class Clipboard(QtCore.QObject):
         """
         nodes = diagram.selectedNodes()
         if nodes:
-
-            self.edges = {}
-            self.nodes = {node.id: node.copy(diagram) for node in nodes}
+            # The anchor node is used to position the pasted items when a paste position is given.
+            anchor = min(nodes, key=lambda x: x.boundingRect().top())
+            origin = anchor.pos()
+            edges = {}
+            meta = {}
+            project = diagram.project
             for node in nodes:
                 for edge in node.edges:
-                    if edge.id not in self.edges and edge.isSelected() and edge.other(node).isSelected():
-                        copy = edge.copy(diagram)
-                        copy.source = self.nodes[edge.source.id]
-                        copy.source.setAnchor(copy, edge.source.anchor(edge))
-                        copy.target = self.nodes[edge.target.id]
-                        copy.target.setAnchor(copy, edge.target.anchor(edge))
-                        self.edges[edge.id] = copy
-
+                    if edge.id not in edges and edge.isSelected() and edge.other(node).isSelected():
+                        edges[edge.id] = edge
+                if node.isPredicate():
+                    key = (node.type(), node.text())
+                    if key not in meta:
+                        meta[key] = project.meta(*key)
+            self.nodes = [NodeDescriptor.fromNode(node, origin) for node in nodes]
+            self.edges = [EdgeDescriptor.fromEdge(edge, origin) for edge in edges.values()]
+            self.meta = {k: dict(v) for k, v in meta.items() if v}
+            self.anchor = self.nodes[nodes.index(anchor)]
+            self.origin = origin
+            self.stale = False
+            # Publish the copied items on the system clipboard.
+            mimeData = QtCore.QMimeData()
+            mimeData.setData(self.MimeType, self.encode())
+            self.data = mimeData.data(self.MimeType)
+            QtWidgets.QApplication.clipboard().setMimeData(mimeData)
             LOGGER.debug('Clipboard updated: nodes=%s, edges=%s', len(self.nodes), len(self.edges))
             self.sgnUpdated.emit()
 
@@ -212,4 +587,4 @@ class Clipboard(QtCore.QObject):
         """
         Return repr(self).
         """
-        return 'Clipboard<nodes:{0},edges:{1}>'.format(len(self.nodes), len(self.edges))
\ No newline at end of file
+        return 'Clipboard<nodes:{0},edges:{1}>'.format(len(self.nodes), len(self.edges))
@@ -66,8 +66,11 @@ class CommandItemsAdd(QtGui.QUndoCommand):
         for item in self.items:
             self.diagram.addItem(item)
             self.diagram.sgnItemAdded.emit(self.diagram, item)
-            item.setSelected(True)
-            item.updateEdgeOrNode(selected=True)
+            if item.isSelected():
+                item.updateEdgeOrNode(selected=True)
+            else:
+                # Selecting the item already triggers its update (see itemChange).
+                item.setSelected(True)
         # Emit updated signal.
         self.diagram.sgnUpdated.emit()
 
@@ -56,7 +56,7 @@ class CommandDiagramAdd(QtGui.QUndoCommand):
         """redo the command"""
         self.diagram.setParent(self.parents['redo'])
         self.project.addDiagram(self.diagram)
-        for item in self.project.items():
+        for item in self.project.index.items():
             item.updateEdgeOrNode()
         self.project.sgnUpdated.emit()
 
@@ -87,13 +87,9 @@ class CommandLabelChange(QtGui.QUndoCommand):
 
         # IDENTITFY NEIGHBOURS
         if self.item.type() is Item.IndividualNode:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode}
-            for node in self.item.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+            for node in {x for x in self.item.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode}}:
                 self.diagram.sgnNodeIdentification.emit(node)
-            f3 = lambda x: x.type() is Item.MembershipEdge
-            f4 = lambda x: Identity.Neutral in x.identities()
-            for node in self.item.outgoingNodes(filter_on_edges=f3, filter_on_nodes=f4):
+            for node in {x for x in self.item.outgoingNodesOf(Item.MembershipEdge) if Identity.Neutral in x.identities()}:
                 self.diagram.sgnNodeIdentification.emit(node)
 
         # EMIT UPDATED SIGNAL
@@ -126,13 +122,9 @@ class CommandLabelChange(QtGui.QUndoCommand):
 
         # IDENTITFY NEIGHBOURS
         if self.item.type() is Item.IndividualNode:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode}
-            for node in self.item.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+            for node in {x for x in self.item.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode}}:
                 self.diagram.sgnNodeIdentification.emit(node)
-            f3 = lambda x: x.type() is Item.MembershipEdge
-            f4 = lambda x: Identity.Neutral in x.identities()
-            for node in self.item.outgoingNodes(filter_on_edges=f3, filter_on_nodes=f4):
+            for node in {x for x in self.item.outgoingNodesOf(Item.MembershipEdge) if Identity.Neutral in x.identities()}:
                 self.diagram.sgnNodeIdentification.emit(node)
 
         # EMIT UPDATED SIGNAL
@@ -165,3 +157,89 @@ class CommandLabelMove(QtGui.QUndoCommand):
         """undo the command"""
         self.item.setTextPos(self.data['undo'])
         self.diagram.sgnUpdated.emit()
+
+
+class CommandPredicateRename(QtGui.QUndoCommand):
+    """
+    This command is used to rename all the occurrences of a predicate at once (refactoring).
+    """
+    def __init__(self, project, item, undo, redo, name=None):
+        """
+        Initialize the command.
+        :type project: Project
+        :type item: Item
+        :type undo: str
+        :type redo: str
+        :type name: str
+        """
+        super().__init__(name or 'change predicate "{0}" to "{1}"'.format(undo, redo))
+        self.project = project
+        self.item = item
+        self.data = {'undo': undo, 'redo': redo}
+        self.nodes = list(project.predicates(item, undo))
+        self.texts = [node.text() for node in self.nodes]
+        self.metas = None
+
+    def rename(self, source, target, texts, metas):
+        """
+        Rename all the occurrences of predicate 'source' to 'target'.
+        :type source: str
+        :type target: str
+        :type texts: T <= list|tuple
+        :type metas: tuple
+        """
+        # DETACH METADATA
+        if self.project.meta(self.item, source):
+            self.project.unsetMeta(self.item, source)
+
+        # RE-KEY THE PREDICATE INDEX AND CHANGE THE CONTENT OF THE LABELS
+        self.project.index.renamePredicate(self.item, source, target, self.nodes)
+        for node in self.nodes:
+            self.project.sgnItemRemoved.emit(node.diagram, node)
+        for node, text in zip(self.nodes, texts):
+            node.setText(text)
+        for node in self.nodes:
+            self.project.sgnItemAdded.emit(node.diagram, node)
+
+        # RESTORE METADATA
+        for name, meta in metas:
+            if meta:
+                self.project.setMeta(self.item, name, meta)
+            elif self.project.meta(self.item, name):
+                self.project.unsetMeta(self.item, name)
+
+        # UPDATE PREDICATE NODE STATE TO REFLECT THE CHANGES
+        for name in (source, target):
+            for node in self.project.predicates(self.item, name):
+                node.updateNode()
+
+        # IDENTITFY NEIGHBOURS
+        if self.item is Item.IndividualNode:
+            identify = set()
+            for node in self.nodes:
+                identify.update(x for x in node.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode})
+                identify.update(x for x in node.outgoingNodesOf(Item.MembershipEdge) if Identity.Neutral in x.identities())
+            for node in identify:
+                node.diagram.sgnNodeIdentification.emit(node)
+
+        # EMIT UPDATED SIGNAL
+        for diagram in {node.diagram for node in self.nodes}:
+            diagram.sgnUpdated.emit()
+
+    def redo(self):
+        """redo the command"""
+        if self.metas is None:
+            # Metadata are collected when the command is first executed since they
+            # may be changed by other commands pushed in the same macro.
+            undo = self.project.meta(self.item, self.data['undo']).copy()
+            redo = self.project.meta(self.item, self.data['redo']).copy()
+            # METADATA OF THE RENAMED PREDICATE OVERRIDE THOSE OF THE TARGET ONE
+            self.metas = {
+                'undo': ((self.data['undo'], undo), (self.data['redo'], redo)),
+                'redo': ((self.data['undo'], {}), (self.data['redo'], undo or redo)),
+            }
+        self.rename(self.data['undo'], self.data['redo'], [self.data['redo']] * len(self.nodes), self.metas['redo'])
+
+    def undo(self):
+        """undo the command"""
+        self.rename(self.data['redo'], self.data['undo'], self.texts, self.metas['undo'])
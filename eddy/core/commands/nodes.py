@@ -281,6 +281,7 @@ class CommandNodeSwitchTo(QtGui.QUndoCommand):
         # Clear edge and anchor references from node1.
         self.node['undo'].anchors.clear()
         self.node['undo'].edges.clear()
+        self.node['undo'].adjacency.clear()
 
         # Remove the old node from the diagram.
         self.diagram.removeItem(self.node['undo'])
@@ -317,6 +318,7 @@ class CommandNodeSwitchTo(QtGui.QUndoCommand):
         # Clear edge and anchor references from node2.
         self.node['redo'].anchors.clear()
         self.node['redo'].edges.clear()
+        self.node['redo'].adjacency.clear()
 
         # Remove the new node from the diagram.
         self.diagram.removeItem(self.node['redo'])
@@ -367,7 +369,7 @@ class CommandNodeChangeInputsOrder(QtGui.QUndoCommand):
         Initialize the command.
         :type diagram: Diagram
         :type node: AbstractNode
-        :type inputs: DistinctList
+        :type inputs: OrderedSet
         """
         self.node = node
         self.diagram = diagram
@@ -156,3 +156,53 @@ class CommandProjectSetProfile(QtGui.QUndoCommand):
                 # Emit updated signals.
         self.project.session.sgnUpdateState.emit()
         self.project.sgnUpdated.emit()
+
+
+class CommandProjectMerge(QtGui.QUndoCommand):
+    """
+    This command is used to merge the content of a project (diagrams and predicates metadata) into another one.
+    """
+    def __init__(self, project, other, diagrams, metas):
+        """
+        Initialize the command.
+        :type project: Project
+        :type other: Project
+        :type diagrams: list
+        :type metas: dict
+        """
+        # Metadata are given as a dict mapping (item, name) pairs to (undo, redo)
+        # pairs, where undo is None if the predicate has no metadata to restore.
+        super().__init__('import project "{0}" into "{1}"'.format(other.name, project.name))
+        self.project = project
+        self.diagrams = diagrams
+        self.metas = metas
+        self.parents = [diagram.parent() for diagram in diagrams]
+
+    def redo(self):
+        """redo the command"""
+        for diagram in self.diagrams:
+            diagram.setParent(self.project)
+            self.project.addDiagram(diagram)
+        # Metadata must be set after the diagrams have been added since predicates
+        # being imported are not in the project index until their diagram is.
+        for (item, name), (_, redo) in self.metas.items():
+            self.project.setMeta(item, name, redo)
+        # Refresh all the items of the project only once rather than once per diagram.
+        for item in self.project.index.items():
+            item.updateEdgeOrNode()
+        self.project.sgnUpdated.emit()
+
+    def undo(self):
+        """undo the command"""
+        for (item, name), (undo, _) in self.metas.items():
+            if undo is None:
+                self.project.unsetMeta(item, name)
+            else:
+                self.project.setMeta(item, name, undo)
+        for diagram, parent in zip(self.diagrams, self.parents):
+            diagram.setParent(parent)
+            self.project.removeDiagram(diagram)
+        for item, name in self.metas:
+            for node in self.project.predicates(item, name):
+                node.updateNode(selected=node.isSelected())
+        self.project.sgnUpdated.emit()
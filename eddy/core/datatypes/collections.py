@@ -32,112 +32,176 @@
 #                                                                        #
 ##########################################################################
 
+from collections.abc import Sequence
 
-class DistinctList(list):
+
+class OrderedSet(Sequence):
     """
-    Extends python default list making sure not to have duplicated elements.
+    Sequence of distinct elements preserving their insertion order.
+    Elements are stored as keys of a dict, hence membership tests, append and remove are O(1)
+    and elements must be hashable. Positional access goes through a list which is cached until
+    the next structural change of the collection.
     """
     def __init__(self, collection=None):
         """
-        Initialize the DistinctList.
+        Initialize the OrderedSet.
         :type collection: iterable
         """
-        super(DistinctList, self).__init__()
-        if collection:
-            for item in collection:
-                self.append(item)
+        self.data = dict.fromkeys(collection) if collection else {}
+        self.cache = None
+
+    #############################################
+    #   INTERFACE
+    #################################
 
     def append(self, p_object):
         """
-        Append the given element at the end of the list.
+        Append the given element at the end of the collection (if it's not in the collection already).
         :type p_object: mixed
         """
-        if p_object not in self:
-            super(DistinctList, self).append(p_object)
+        if p_object not in self.data:
+            self.data[p_object] = None
+            if self.cache is not None:
+                self.cache.append(p_object)
+
+    def clear(self):
+        """
+        Remove all the elements from the collection.
+        """
+        self.data.clear()
+        self.cache = None
 
     def extend(self, iterable):
         """
-        Extends the current list by appending items of the given iterable (if they are not in the list already).
+        Extends the current collection by appending items of the given iterable (if they are not in the collection already).
         :type iterable: iterable
         """
         for item in iterable:
             self.append(item)
 
+    def index(self, p_object, start=0, stop=None):
+        """
+        Returns the position of the given element.
+        :raise ValueError: if the given element is not in the collection.
+        :type p_object: mixed
+        :type start: int
+        :type stop: int
+        :rtype: int
+        """
+        if p_object not in self.data:
+            raise ValueError('{0} is not in collection'.format(p_object))
+        return self.items().index(p_object, start, len(self.data) if stop is None else stop)
+
     def insert(self, index, p_object):
         """
-        Insert the given element in the given index.
+        Insert the given element in the given index (moving it if it's in the collection already).
         :type index: int
         :type p_object: mixed
         """
-        if p_object in self:
-            index2 = self.index(p_object)
+        items = self.items()
+        if p_object in self.data:
+            index2 = items.index(p_object)
             if index2 < index:
                 index -= 1
-            self.remove(p_object)
-        super(DistinctList, self).insert(index, p_object)
+            del items[index2]
+        items.insert(index, p_object)
+        self.data = dict.fromkeys(items)
+        self.cache = items
+
+    def items(self):
+        """
+        Returns the list of the elements of the collection (the list must not be modified).
+        :rtype: list
+        """
+        if self.cache is None:
+            self.cache = list(self.data)
+        return self.cache
 
     def remove(self, p_object):
         """
-        Silently remove the given element from the list.
+        Silently remove the given element from the collection.
         :type p_object: mixed
         """
-        try:
-            super(DistinctList, self).remove(p_object)
-        except ValueError:
-            pass
+        if p_object in self.data:
+            del self.data[p_object]
+            self.cache = None
 
     def sanitize(self, f_sanitize):
         """
-        Remove all the elements in this list for which the given callable returns False.
+        Remove all the elements in this collection for which the given callable returns False.
         :type f_sanitize: callable.
         """
-        for p_object in self:
-            if not f_sanitize(p_object):
-                self.remove(p_object)
+        self.data = {k: None for k in self.data if f_sanitize(k)}
+        self.cache = None
+
+    #############################################
+    #   OPERATORS
+    #################################
 
     def __add__(self, p_object):
         """ x.__add__(y) <==> x+y """
-        copy = self[:]
-        if isinstance(p_object, set) or isinstance(p_object, frozenset):
-            p_object = list(p_object)
-        if isinstance(p_object, list) or isinstance(p_object, tuple):
+        copy = OrderedSet(self.data)
+        if isinstance(p_object, (list, tuple, set, frozenset, OrderedSet)):
             copy.extend(p_object)
         else:
             copy.append(p_object)
         return copy
 
-    def __radd__(self, p_object):
-        """ x.__radd__(y) <==> y+x """
-        copy = self[:]
-        if isinstance(p_object, set) or isinstance(p_object, frozenset):
-            p_object = list(p_object)
-        if isinstance(p_object, list) or isinstance(p_object, tuple):
-            for x in range(len(p_object)):
-                copy.insert(x, p_object[x])
-        else:
-            copy.insert(0, p_object)
-        return copy
+    def __contains__(self, p_object):
+        """ x.__contains__(y) <==> y in x """
+        return p_object in self.data
+
+    def __eq__(self, other):
+        """ x.__eq__(y) <==> x==y """
+        if isinstance(other, OrderedSet):
+            return self.items() == other.items()
+        if isinstance(other, (list, tuple)):
+            return self.items() == list(other)
+        return NotImplemented
+
+    def __getitem__(self, p_object):
+        """ x.__getitem__(y) <==> x[y] """
+        if isinstance(p_object, slice):
+            return OrderedSet(self.items()[p_object])
+        return self.items()[p_object]
 
     def __iadd__(self, p_object):
         """ x.__iadd__(y) <==> x+=y """
-        if isinstance(p_object, set) or isinstance(p_object, frozenset):
-            p_object = list(p_object)
-        if isinstance(p_object, list) or isinstance(p_object, tuple):
+        if isinstance(p_object, (list, tuple, set, frozenset, OrderedSet)):
             self.extend(p_object)
         else:
             self.append(p_object)
         return self
 
-    def __getitem__(self, p_object):
-        """ x.__getitem__(y) <==> x[y] """
-        if isinstance(p_object, slice):
-            return DistinctList([super(DistinctList, self).__getitem__(x) for x in range(*p_object.indices(len(self)))])
-        else:
-            return super(DistinctList, self).__getitem__(p_object)
+    def __iter__(self):
+        """ x.__iter__() <==> iter(x) """
+        return iter(self.data)
 
-    def __getslice__(self, i, j):
-        """
-        x.__getslice__(i, j) <==> x[i:j] (built-in CPython types needs this one).
-        Use of negative indices is not supported.
-        """
-        return self[max(0, i):max(0, j):]
\ No newline at end of file
+    def __len__(self):
+        """ x.__len__() <==> len(x) """
+        return len(self.data)
+
+    def __radd__(self, p_object):
+        """ x.__radd__(y) <==> y+x """
+        if isinstance(p_object, (set, frozenset)):
+            p_object = list(p_object)
+        if not isinstance(p_object, (list, tuple)):
+            p_object = [p_object]
+        copy = OrderedSet(p_object)
+        copy.extend(self.data)
+        return copy
+
+    def __repr__(self):
+        """ x.__repr__() <==> repr(x) """
+        return 'OrderedSet({0})'.format(list(self.data))
+
+    def __reversed__(self):
+        """ x.__reversed__() <==> reversed(x) """
+        return reversed(self.items())
+
+    __hash__ = None
+
+
+# Kept for backward compatibility: DistinctList used to extend python default list,
+# checking for duplicates with a linear scan upon every insertion.
+DistinctList = OrderedSet
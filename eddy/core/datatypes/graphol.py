@@ -40,6 +40,15 @@ from eddy.core.functions.misc import rstrip
 from eddy.core.regex import RE_CARDINALITY, RE_CAMEL_SPACE
 
 
+@unique
+class Direction(Enum_):
+    """
+    This class defines the direction of an edge with respect to one of its endpoints.
+    """
+    Incoming = 'incoming'
+    Outgoing = 'outgoing'
+
+
 @unique
 class Identity(Enum_):
     """
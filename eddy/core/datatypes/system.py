@@ -59,12 +59,15 @@ class File(Enum_):
     Graphol = 'Graphol (*.graphol)'
     Html = 'Hyper-Text Markup Language (*.html)'
     Jpeg = 'JPEG (*.jpg)'
+    Json = 'JavaScript Object Notation (*.json)'
     Owl = 'Web Ontology Language (*.owl)'
     Pdf = 'Portable Document Format (*.pdf)'
     Png = 'PNG (*.png)'
     Qss = 'Qt Style Sheet (*.qss)'
     Spec = 'Plugin SPEC (*.spec)'
+    Svg = 'Scalable Vector Graphics (*.svg)'
     Zip = 'ZIP (*.zip)'
+    Xlsx = 'Excel Workbook (*.xlsx)'
     Xml = 'XML (*.xml)'
 
     @classmethod
@@ -104,4 +107,17 @@ class File(Enum_):
         :type other: File
         :rtype: bool
         """
-        return self.value > other.value
\ No newline at end of file
+        return self.value > other.value
+
+
+@unique
+class PageSize(Enum_):
+    """
+    Enum implementation to deal with document page sizes.
+    """
+    Fit = 'Fit to diagram'
+    A2 = 'A2'
+    A3 = 'A3'
+    A4 = 'A4'
+    Legal = 'Legal'
+    Letter = 'Letter'
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from eddy.core.datatypes.graphol import Item
+
+
+class DependencyGraph(object):
+    """
+    This class computes which nodes of a diagram are no longer needed when a set of items is removed.
+    A node which contributes to the definition of a removed constructor node (i.e: one of its inputs) is
+    orphaned when no other node is referencing it, and the nodes defining a removed predicate node (i.e:
+    domain and range restrictions of roles and attributes) are always removed with it. Candidate nodes
+    are given a reference count when they are first visited, which is then decremented as the removal
+    propagates, so that the whole closure of orphaned nodes is computed in linear time.
+    USAGE:
+        graph = DependencyGraph(diagram.selectedItems())
+        graph.orphans()     # nodes which would be removed in addition to the given items
+        graph.collection()  # all the items which would be removed (nodes and edges)
+    """
+    def __init__(self, items):
+        """
+        Initialize the dependency graph.
+        :type items: T <= list|tuple|set
+        """
+        self.items = set(items)
+        self.edges = {x for x in self.items if x.isEdge()}
+        self.removed = {x for x in self.items if x.isNode()}
+        self.references = dict()
+        self.purge = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def collection(self):
+        """
+        Returns the set of items which would be removed (given items, orphaned nodes and all their edges).
+        :rtype: set
+        """
+        collection = self.items | self.orphans()
+        collection.update(edge for node in self.removed for edge in node.edges)
+        return collection
+
+    def isReference(self, node, edge):
+        """
+        Returns True if the given edge is a reference to the given node, False otherwise.
+        The inputs of a constructor node are its definition, hence they do not reference it.
+        :type node: AbstractNode
+        :type edge: AbstractEdge
+        :rtype: bool
+        """
+        if edge in self.edges:
+            return False
+        return not (edge.type() is Item.InputEdge and edge.target is node and node.isConstructor())
+
+    def orphans(self):
+        """
+        Returns the set of nodes which would be removed in addition to the given items.
+        :rtype: set
+        """
+        if self.purge is None:
+            self.purge = set()
+            stack = list(self.removed)
+            while stack:
+                node = stack.pop()
+                constructor = node.isConstructor()
+                for other in node.definition():
+                    if other not in self.removed:
+                        if not constructor or not self.refcount(other):
+                            self.remove(other, stack)
+        return self.purge
+
+    def refcount(self, node):
+        """
+        Returns the number of references to the given node which are not being removed.
+        :type node: AbstractNode
+        :rtype: int
+        """
+        if node not in self.references:
+            self.references[node] = sum(1 for edge in node.edges \
+                if edge.other(node) not in self.removed and self.isReference(node, edge))
+        return self.references[node]
+
+    def remove(self, node, stack):
+        """
+        Mark the given node as removed, releasing the references it holds on the other nodes:
+        candidate nodes which are left with no reference are removed as well.
+        :type node: AbstractNode
+        :type stack: list
+        """
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if node not in self.removed:
+                self.removed.add(node)
+                self.purge.add(node)
+                stack.append(node)
+                for edge in node.edges:
+                    other = edge.other(node)
+                    if other in self.references and other not in self.removed and self.isReference(other, edge):
+                        self.references[other] -= 1
+                        if not self.references[other]:
+                            pending.append(other)
@@ -88,11 +88,16 @@ class Diagram(QtWidgets.QGraphicsScene):
 
         self.factory = ItemFactory(self)
         self.guid = GUID(self)
+        self.maxZValue = 0.0
         self.mode = DiagramMode.Idle
         self.modeParam = Item.Undefined
         self.name = name
         self.pasteX = Clipboard.PasteOffsetX
         self.pasteY = Clipboard.PasteOffsetY
+        self.record = None
+        self.selecting = False
+        self.bounds = DiagramBounds(self)
+        self.selection = DiagramSelection(self)
 
         self.mo_Node = None
         self.mp_Data = None
@@ -106,6 +111,7 @@ class Diagram(QtWidgets.QGraphicsScene):
         connect(self.sgnItemAdded, self.onItemAdded)
         connect(self.sgnItemRemoved, self.onItemRemoved)
         connect(self.sgnNodeIdentification, self.doNodeIdentification)
+        connect(self.sgnUpdated, self.selection.invalidate)
 
     #############################################
     #   FACTORY
@@ -580,10 +586,21 @@ class Diagram(QtWidgets.QGraphicsScene):
         Add an item to the Diagram (will redraw the item to reflect its status).
         :type item: AbstractItem
         """
+        if item.isSelected():
+            self.selection.update(item, True)
         super().addItem(item)
+        if item.isNode() or item.isEdge():
+            self.bounds.invalidate(item)
+            self.maxZValue = max(self.maxZValue, item.zValue())
         if item.isNode():
             item.updateNode()
 
+    def clearSelection(self):
+        """
+        Clear the current selection (see Diagram.setItemsSelected).
+        """
+        self.setItemsSelected(super().selectedItems(), False)
+
     @staticmethod
     def completeMove(moveData, offset=QtCore.QPointF(0, 0)):
         """
@@ -644,6 +661,13 @@ class Diagram(QtWidgets.QGraphicsScene):
            self.mp_NodePos is not None and \
            self.mp_Pos is not None
 
+    def isSelecting(self):
+        """
+        Returns True if a bulk selection change is currently in progress, False otherwise.
+        :rtype: bool
+        """
+        return self.selecting
+
     def isEmpty(self):
         """
         Returns True if this diagram containts no element, False otherwise.
@@ -692,6 +716,15 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.node(self, nid)
 
+    def removeItem(self, item):
+        """
+        Remove an item from the Diagram.
+        :type item: AbstractItem
+        """
+        self.bounds.remove(item)
+        self.selection.update(item, False)
+        super().removeItem(item)
+
     def selectedEdges(self, filter_on_edges=lambda x: True):
         """
         Returns the edges selected in the diagram.
@@ -716,6 +749,34 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return [x for x in super().selectedItems() if x.isNode() and filter_on_nodes(x)]
 
+    def setItemsSelected(self, items, selected=True):
+        """
+        Change the selection state of the given items in bulk. Items do not update themselves
+        upon each selection change: their selection visuals are applied once all the items
+        have been processed, and a single selectionChanged signal is emitted.
+        :type items: T <= list|tuple|set
+        :type selected: bool
+        :rtype: list
+        """
+        changed = []
+        blocked = self.blockSignals(True)
+        self.selecting = True
+        try:
+            for item in items:
+                if item.isSelected() != selected:
+                    item.setSelected(selected)
+                    if item.isSelected() == selected:
+                        changed.append(item)
+        finally:
+            self.selecting = False
+            self.blockSignals(blocked)
+        for item in changed:
+            if item.isNode() or item.isEdge():
+                item.updateSelection(selected)
+        if changed:
+            self.selectionChanged.emit()
+        return changed
+
     def setMode(self, mode, param=None):
         """
         Set the operational mode.
@@ -755,23 +816,232 @@ class Diagram(QtWidgets.QGraphicsScene):
                         moveData['edges'][edge] = edge.breakpoints[:]
         return moveData
 
-    # noinspection PyTypeChecker
     def visibleRect(self, margin=0):
         """
         Returns a rectangle matching the area of visible items.
         :type margin: float
         :rtype: QtCore.QRectF
         """
-        items = self.items()
-        if items:
-            x = set()
-            y = set()
-            for item in items:
-                b = item.mapRectToScene(item.boundingRect())
-                x.update({b.left(), b.right()})
-                y.update({b.top(), b.bottom()})
-            return QtCore.QRectF(QtCore.QPointF(min(x) - margin, min(y) - margin), QtCore.QPointF(max(x) + margin, max(y) + margin))
-        return QtCore.QRectF()
+        rect = self.bounds.rect()
+        if rect.isNull():
+            return rect
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+
+class DiagramBounds(object):
+    """
+    This class maintains the bounding box of the nodes and edges of a diagram.
+    Items notify geometry and position changes through invalidate(): their scene rect is
+    recomputed lazily when the bounding box is requested, and the bounding box is expanded
+    in place. Only when an item lying on the border of the box shrinks, moves inwards or is
+    removed, the box is recomputed, using the cached item rects.
+    The old and new rects of the invalidated items are also collected as damaged areas,
+    which observers of the diagram can retrieve through takeDamage().
+    """
+    MaxDamage = 256
+
+    def __init__(self, diagram):
+        """
+        Initialize the diagram bounds.
+        :type diagram: Diagram
+        """
+        self.box = None
+        self.damage = []
+        self.diagram = diagram
+        self.dirty = set()
+        self.rects = {}
+        self.stale = False
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def damaged(self, r):
+        """
+        Add the given item rect to the damaged areas.
+        :type r: tuple
+        """
+        # PAST THE LIMIT THE WHOLE DIAGRAM IS CONSIDERED DAMAGED
+        damage = self.damage
+        if r and damage is not None:
+            if len(damage) < DiagramBounds.MaxDamage:
+                damage.append(r)
+            else:
+                self.damage = None
+
+    def flush(self):
+        """
+        Update the cached rects of the items invalidated since the last flush.
+        """
+        rects = self.rects
+        for item in self.dirty:
+            if item.scene() is self.diagram and (item.isNode() or item.isEdge()):
+                r = item.mapRectToScene(item.boundingRect())
+                r = (r.left(), r.top(), r.right(), r.bottom())
+                self.shrink(rects.get(item))
+                self.damaged(r)
+                rects[item] = r
+                if not self.stale:
+                    box = self.box
+                    if box is None:
+                        self.box = r
+                    else:
+                        self.box = (min(box[0], r[0]), min(box[1], r[1]), max(box[2], r[2]), max(box[3], r[3]))
+            else:
+                r = rects.pop(item, None)
+                self.shrink(r)
+                self.damaged(r)
+        self.dirty.clear()
+        if self.stale:
+            self.stale = False
+            self.box = None
+            if rects:
+                values = rects.values()
+                self.box = (min(r[0] for r in values), min(r[1] for r in values),
+                            max(r[2] for r in values), max(r[3] for r in values))
+
+    def invalidate(self, item):
+        """
+        Invalidate the area of the given item.
+        :type item: AbstractItem
+        """
+        if item not in self.dirty:
+            self.dirty.add(item)
+            self.damaged(self.rects.get(item))
+
+    def rect(self):
+        """
+        Returns the bounding box of the diagram items.
+        :rtype: QtCore.QRectF
+        """
+        if self.dirty or self.stale:
+            self.flush()
+        if self.box is None:
+            return QtCore.QRectF()
+        return QtCore.QRectF(QtCore.QPointF(self.box[0], self.box[1]), QtCore.QPointF(self.box[2], self.box[3]))
+
+    def remove(self, item):
+        """
+        Remove the given item from the bounds.
+        :type item: AbstractItem
+        """
+        self.dirty.discard(item)
+        r = self.rects.pop(item, None)
+        self.shrink(r)
+        self.damaged(r)
+
+    def shrink(self, r):
+        """
+        Mark the bounding box for recomputation if the given (old) item rect lies on its border.
+        :type r: tuple
+        """
+        box = self.box
+        if r and box and not self.stale:
+            if r[0] <= box[0] or r[1] <= box[1] or r[2] >= box[2] or r[3] >= box[3]:
+                self.stale = True
+
+    def takeDamage(self):
+        """
+        Returns the areas damaged since the last call as a list of scene rects, and reset them.
+        None is returned if there are too many damaged areas to be tracked one by one.
+        :rtype: list
+        """
+        self.flush()
+        damage, self.damage = self.damage, []
+        if damage is None:
+            return None
+        return [QtCore.QRectF(QtCore.QPointF(r[0], r[1]), QtCore.QPointF(r[2], r[3])) for r in damage]
+
+
+class DiagramSelection(object):
+    """
+    This class maintains a summary of the nodes and edges selected in a diagram.
+    Items notify selection changes through update(), so that the amount of selected
+    items (by type) can be retrieved without scanning the diagram selection. Whether
+    selected edges can be swapped is computed lazily and cached until the diagram is
+    updated or the project profile changes.
+    """
+    def __init__(self, diagram):
+        """
+        Initialize the diagram selection summary.
+        :type diagram: Diagram
+        """
+        self.counts = {}
+        self.diagram = diagram
+        self.edges = {}
+        self.nodes = set()
+        self.pending = set()
+        self.profile = None
+        self.swappable = 0
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def count(self, *types):
+        """
+        Returns the amount of selected nodes matching the given types (all the selected nodes if no type is given).
+        :type types: Item
+        :rtype: int
+        """
+        if not types:
+            return len(self.nodes)
+        return sum(self.counts.get(x, 0) for x in types)
+
+    def edgeCount(self):
+        """
+        Returns the amount of selected edges.
+        :rtype: int
+        """
+        return len(self.edges)
+
+    def invalidate(self):
+        """
+        Invalidate the cached swap eligibility of the selected edges.
+        """
+        self.pending.update(self.edges)
+        self.swappable = 0
+
+    def swapCount(self):
+        """
+        Returns the amount of selected edges which can be swapped.
+        :rtype: int
+        """
+        profile = self.diagram.project.profile
+        if profile is not self.profile:
+            self.profile = profile
+            self.invalidate()
+        if self.pending:
+            for edge in self.pending:
+                allowed = edge.isSwapAllowed()
+                self.edges[edge] = allowed
+                self.swappable += allowed
+            self.pending.clear()
+        return self.swappable
+
+    def update(self, item, selected):
+        """
+        Update the summary according to the selection state of the given item.
+        :type item: AbstractItem
+        :type selected: bool
+        """
+        if item.isNode():
+            if selected and item not in self.nodes:
+                self.nodes.add(item)
+                self.counts[item.type()] = self.counts.get(item.type(), 0) + 1
+            elif not selected and item in self.nodes:
+                self.nodes.remove(item)
+                self.counts[item.type()] -= 1
+        elif item.isEdge():
+            if selected and item not in self.edges:
+                self.edges[item] = False
+                self.pending.add(item)
+            elif not selected and item in self.edges:
+                if item in self.pending:
+                    self.pending.remove(item)
+                    del self.edges[item]
+                else:
+                    self.swappable -= self.edges.pop(item)
 
 
 class DiagramMalformedError(RuntimeError):
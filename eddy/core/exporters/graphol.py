@@ -42,7 +42,7 @@ from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractProjectExporter
 from eddy.core.functions.misc import postfix
 from eddy.core.functions.fsystem import fwrite, mkdir
-from eddy.core.output import getLogger
+from eddy.core.output import getLogger, getPerfLogger
 from eddy.core.project import Project
 from eddy.core.project import K_DESCRIPTION, K_URL
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
@@ -51,6 +51,7 @@ from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
 
 
 LOGGER = getLogger()
+PERF = getPerfLogger()
 
 
 class GrapholProjectExporter(AbstractProjectExporter):
@@ -454,6 +455,12 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         section = self.document.createElement('diagrams')
         for diagram in self.project.diagrams():
+            if diagram.record:
+                # Diagram not materialized yet => copy the element it has been loaded from.
+                subsection = self.document.importNode(diagram.record.element, True).toElement()
+                subsection.setAttribute('name', diagram.name)
+                section.appendChild(subsection)
+                continue
             subsection = self.document.createElement('diagram')
             subsection.setAttribute('name', diagram.name)
             subsection.setAttribute('width', diagram.width())
@@ -541,8 +548,11 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         Perform Project export to disk.
         """
-        self.createDomDocument()
-        self.createOntology()
-        self.createPredicatesMeta()
-        self.createDiagrams()
-        self.createProjectFile()
\ No newline at end of file
+        with PERF.measure('project.save', path=self.project.path) as event:
+            self.createDomDocument()
+            self.createOntology()
+            self.createPredicatesMeta()
+            self.createDiagrams()
+            event.mark('document')
+            self.createProjectFile()
+            event.mark('write')
\ No newline at end of file
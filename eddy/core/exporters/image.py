@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import math
+import os
+
+from abc import abstractmethod
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+from eddy import ORGANIZATION, APPNAME
+from eddy.core.common import HasThreadingSystem
+from eddy.core.exporters.common import AbstractDiagramExporter
+from eddy.core.functions.signals import connect
+from eddy.core.items.common import AbstractItem
+from eddy.core.output import getLogger
+from eddy.core.worker import AbstractWorker
+
+
+LOGGER = getLogger()
+
+
+class AbstractImageDiagramExporter(AbstractDiagramExporter, HasThreadingSystem):
+    """
+    Extends AbstractDiagramExporter with facilities to export diagrams as images.
+    The diagram is recorded into a QPicture snapshot on the calling thread, and
+    the snapshot is then rendered into image files by a worker thread.
+    """
+    def __init__(self, diagram, session=None, **kwargs):
+        """
+        Initialize the image exporter.
+        :type diagram: Diagram
+        :type session: Session
+        :type kwargs: dict
+        """
+        super().__init__(diagram, session)
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        self.dpi = kwargs.get('dpi', settings.value('export/image/dpi', 96, int))
+        self.threaded = kwargs.get('threaded', session is not None)
+        self.tileSize = kwargs.get('tileSize', settings.value('export/image/tile_size', 0, int))
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot(list)
+    def onExportCompleted(self, paths):
+        """
+        Executed when the image export is completed.
+        :type paths: list
+        """
+        LOGGER.info('Exported diagram %s to %s file(s)', self.diagram.name, len(paths))
+
+    @QtCore.Slot(Exception)
+    def onExportErrored(self, exception):
+        """
+        Executed when the image export fails.
+        :type exception: Exception
+        """
+        LOGGER.error('Failed to export diagram %s: %s', self.diagram.name, exception)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @abstractmethod
+    def createWorker(self, picture, shape, path):
+        """
+        Returns the worker which renders the given diagram snapshot.
+        :type picture: QPicture
+        :type shape: QRectF
+        :type path: str
+        :rtype: AbstractImageDiagramExporterWorker
+        """
+        pass
+
+    def run(self, path):
+        """
+        Perform the image export.
+        :type path: str
+        """
+        self.diagram.project.materialize(self.diagram)
+        shape = self.diagram.visibleRect(margin=20)
+        if shape:
+            LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
+            worker = self.createWorker(self.snapshot(shape), shape, path)
+            connect(worker.sgnCompleted, self.onExportCompleted)
+            connect(worker.sgnErrored, self.onExportErrored)
+            if self.threaded:
+                self.startThread('{0}:{1}'.format(self.filetype().extension, path), worker)
+            else:
+                worker.run()
+
+    def snapshot(self, shape):
+        """
+        Record the given area of the diagram into a QPicture, using diagram coordinates shifted to the origin.
+        :type shape: QRectF
+        :rtype: QPicture
+        """
+        picture = QtGui.QPicture()
+        painter = QtGui.QPainter()
+        if painter.begin(picture):
+            # TURN CACHING OFF
+            for item in self.diagram.items():
+                if item.isNode() or item.isEdge():
+                    item.setCacheMode(AbstractItem.NoCache)
+            # RECORD THE DIAGRAM IN THE PICTURE
+            self.diagram.render(painter, QtCore.QRectF(0, 0, shape.width(), shape.height()), shape)
+            # TURN CACHING ON
+            for item in self.diagram.items():
+                if item.isNode() or item.isEdge():
+                    item.setCacheMode(AbstractItem.DeviceCoordinateCache)
+            painter.end()
+        return picture
+
+
+class AbstractImageDiagramExporterWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing the base class for the image export worker threads.
+    """
+    sgnCompleted = QtCore.Signal(list)
+    sgnErrored = QtCore.Signal(Exception)
+
+    def __init__(self, picture, shape, path, dpi=96, tileSize=0):
+        """
+        Initialize the image export worker.
+        :type picture: QPicture
+        :type shape: QRectF
+        :type path: str
+        :type dpi: int
+        :type tileSize: int
+        """
+        super().__init__()
+        self.dpi = dpi
+        self.path = path
+        self.picture = picture
+        self.scale = dpi / 96
+        self.shape = shape
+        self.tileSize = tileSize
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def paint(self, painter, tile):
+        """
+        Paint the portion of the snapshot matching the given tile using the given painter.
+        :type painter: QPainter
+        :type tile: QRect
+        """
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
+        painter.translate(-tile.x(), -tile.y())
+        painter.scale(self.scale, self.scale)
+        painter.drawPicture(0, 0, self.picture)
+
+    def tiles(self):
+        """
+        Returns a list of (QRect, path) pairs covering the snapshot in output pixels.
+        :rtype: list
+        """
+        width = math.ceil(self.shape.width() * self.scale)
+        height = math.ceil(self.shape.height() * self.scale)
+        if not self.tileSize or (width <= self.tileSize and height <= self.tileSize):
+            return [(QtCore.QRect(0, 0, width, height), self.path)]
+        root, ext = os.path.splitext(self.path)
+        tiles = []
+        for row in range(math.ceil(height / self.tileSize)):
+            for col in range(math.ceil(width / self.tileSize)):
+                x = col * self.tileSize
+                y = row * self.tileSize
+                rect = QtCore.QRect(x, y, min(self.tileSize, width - x), min(self.tileSize, height - y))
+                tiles.append((rect, '{0}_{1}_{2}{3}'.format(root, row, col, ext)))
+        return tiles
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @abstractmethod
+    def render(self, tile, path):
+        """
+        Render the given tile of the snapshot in the given path.
+        :type tile: QRect
+        :type path: str
+        """
+        pass
+
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            paths = []
+            for tile, path in self.tiles():
+                self.render(tile, path)
+                paths.append(path)
+        except Exception as e:
+            self.sgnErrored.emit(e)
+        else:
+            self.sgnCompleted.emit(paths)
+        finally:
+            self.finished.emit()
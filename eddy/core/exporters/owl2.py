@@ -56,7 +56,7 @@ from eddy.core.functions.owl import OWLShortIRI, OWLAnnotationText
 from eddy.core.functions.owl import OWLFunctionalDocumentFilter
 from eddy.core.functions.path import expandPath, openPath
 from eddy.core.functions.signals import connect
-from eddy.core.output import getLogger
+from eddy.core.output import getLogger, getPerfLogger
 from eddy.core.project import K_DESCRIPTION
 from eddy.core.worker import AbstractWorker
 
@@ -66,6 +66,7 @@ from eddy.ui.syntax import SyntaxValidationWorker
 
 
 LOGGER = getLogger()
+PERF = getPerfLogger()
 
         
 class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
@@ -79,7 +80,7 @@ class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
         :type session: Session
         """
         super().__init__(project, session)
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+        self.items = list(project.edges()) + [n for n in project.nodes() if not n.edges]
         self.path = None
         self.progress = None
 
@@ -724,9 +725,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() in {Identity.Attribute, Identity.Concept, Identity.ValueDomain, Identity.Role}
-        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        incoming = {x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Attribute, Identity.Concept, Identity.ValueDomain, Identity.Role}}
         if not incoming:
             raise DiagramMalformedError(node, 'missing operand(s)')
         if len(incoming) > 1:
@@ -762,15 +761,12 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DatatypeRestrictionNode
         :rtype: OWLDatatypeRestriction
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.ValueDomainNode
-        f3 = lambda x: x.type() is Item.FacetNode
 
         #############################################
         # BUILD DATATYPE
         #################################
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.type() is Item.ValueDomainNode)
         if not operand:
             raise DiagramMalformedError(node, 'missing value domain node')
 
@@ -780,7 +776,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # BUILD FACETS
         #################################
 
-        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3)
+        incoming = {x for x in node.incomingNodesOf(Item.InputEdge) if x.type() is Item.FacetNode}
         if not incoming:
             raise DiagramMalformedError(node, 'missing facet node(s)')
 
@@ -801,12 +797,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DomainRestrictionNode
         :rtype: OWLClassExpression
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
-        f3 = lambda x: x.identity() is Identity.ValueDomain
-        f4 = lambda x: x.identity() is Identity.Concept
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Role, Identity.Attribute})
         if not operand:
             raise DiagramMalformedError(node, 'missing operand(s)')
 
@@ -822,7 +814,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            filler = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.ValueDomain)
             if not filler:
                 dre = self.df.getTopDatatype()
             else:
@@ -859,7 +851,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f4))
+            filler = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept)
             if not filler:
                 ce = self.df.getOWLThing()
             else:
@@ -894,10 +886,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.IndividualNode
         individuals = self.HashSet()
-        for individual in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for individual in {x for x in node.incomingNodesOf(Item.InputEdge) if x.type() is Item.IndividualNode}:
             conversion = self.convert(individual)
             individuals.add(conversion)
         if individuals.isEmpty():
@@ -938,9 +928,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
         collection = self.HashSet()
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for operand in {x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is node.identity()}:
             conversion = self.convert(operand)
             collection.add(conversion)
         if collection.isEmpty():
@@ -975,9 +963,6 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: DomainRestrictionNode
         :rtype: T <= OWLClassExpression|OWLDataProperty
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
-        f3 = lambda x: x.identity() is Identity.Concept
 
         # We discard Attribute's range restriction. The idea is that the
         # range restriction node whose input is an Attribute, can only serve
@@ -987,7 +972,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         # we'll see an AttributeError added in the application log which will
         # highlight an expression composition problem.
 
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Role, Identity.Attribute})
         if not operand:
             raise DiagramMalformedError(node, 'missing operand(s)')
 
@@ -1003,7 +988,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             # BUILD FILLER
             #################################
 
-            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            filler = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept)
             if not filler:
                 ce = self.df.getOWLThing()
             else:
@@ -1066,9 +1051,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: RoleInverseNode
         :rtype: OWLObjectPropertyExpression
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.RoleNode
-        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        operand = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.type() is Item.RoleNode)
         if not operand:
             raise DiagramMalformedError(node, 'missing operand')
         return self.convert(operand).getInverseProperty()
@@ -1082,9 +1065,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if node.identity() is Identity.Unknown:
             raise DiagramMalformedError(node, 'unsupported operand(s)')
         collection = self.HashSet()
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() is node.identity()
-        for operand in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+        for operand in {x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is node.identity()}:
             conversion = self.convert(operand)
             collection.add(conversion)
         if collection.isEmpty():
@@ -1168,14 +1149,14 @@ class OWLOntologyExporterWorker(AbstractWorker):
         if OWLAxiom.DisjointClasses in self.axiomsList:
             if node.type() is Item.DisjointUnionNode:
                 collection = self.HashSet()
-                for operand in node.incomingNodes(lambda x: x.type() is Item.InputEdge):
+                for operand in node.incomingNodesOf(Item.InputEdge):
                     conversion = self.convert(operand)
                     collection.add(conversion)
                 self.addAxiom(self.df.getOWLDisjointClassesAxiom(cast(self.Set, collection)))
             elif node.type() is Item.ComplementNode:
-                operand = first(node.incomingNodes(lambda x: x.type() is Item.InputEdge))
+                operand = first(node.incomingNodesOf(Item.InputEdge))
                 conversionA = self.convert(operand)
-                for included in node.adjacentNodes(lambda x: x.type() in {Item.InclusionEdge, Item.EquivalenceEdge}):
+                for included in node.adjacentNodesOf(Item.InclusionEdge) | node.adjacentNodesOf(Item.EquivalenceEdge):
                     conversionB = self.convert(included)
                     collection = self.HashSet()
                     collection.add(conversionA)
@@ -1226,17 +1207,13 @@ class OWLOntologyExporterWorker(AbstractWorker):
                             continue
                     if source.type() in {Item.DisjointUnionNode, Item.UnionNode}:
                         # (A OR B) ISA C needs to be normalized to (A ISA C) && (B ISA C)
-                        f1 = lambda x: x.type() is Item.InputEdge
-                        f2 = lambda x: x.identity() is Identity.Concept
-                        for operand in source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        for operand in {x for x in source.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept}:
                             conversionA = self.convert(operand)
                             conversionB = self.convert(target)
                             self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
                     elif edge.target.type() is Item.IntersectionNode:
                         # A ISA (B AND C) needs to be normalized to A ISA B && A ISA C
-                        f1 = lambda x: x.type() is Item.InputEdge
-                        f2 = lambda x: x.identity() is Identity.Concept
-                        for operand in target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        for operand in {x for x in target.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept}:
                             conversionA = self.convert(source)
                             conversionB = self.convert(operand)
                             self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
@@ -1296,14 +1273,12 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: InclusionEdge
         """
         if OWLAxiom.InverseObjectProperties in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.type() is Item.RoleNode
             if edge.source.type() is Item.RoleInverseNode:
                 forward = edge.target
-                inverse = first(edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                inverse = first(x for x in edge.source.incomingNodesOf(Item.InputEdge) if x.type() is Item.RoleNode)
             else:
                 forward = edge.source
-                inverse = first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                inverse = first(x for x in edge.target.incomingNodesOf(Item.InputEdge) if x.type() is Item.RoleNode)
             conversionA = self.convert(forward)
             conversionB = self.convert(inverse)
             self.addAxiom(self.df.getOWLInverseObjectPropertiesAxiom(conversionA, conversionB))
@@ -1314,9 +1289,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: MembershipEdge
         """
         if OWLAxiom.NegativeDataPropertyAssertion in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.identity() is Identity.Attribute
-            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            conversionA = self.convert(first(x for x in edge.target.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Attribute))
             conversionB = self.convert(edge.source)[0]
             conversionC = self.convert(edge.source)[1]
             self.addAxiom(self.df.getOWLNegativeDataPropertyAssertionAxiom(conversionA, conversionB, conversionC))
@@ -1327,9 +1300,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type edge: MembershipEdge
         """
         if OWLAxiom.NegativeObjectPropertyAssertion in self.axiomsList:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.identity() is Identity.Role
-            conversionA = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            conversionA = self.convert(first(x for x in edge.target.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Role))
             conversionB = self.convert(edge.source)[0]
             conversionC = self.convert(edge.source)[1]
             self.addAxiom(self.df.getOWLNegativeObjectPropertyAssertionAxiom(conversionA, conversionB, conversionC))
@@ -1386,27 +1357,17 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if OWLAxiom.ObjectPropertyDomain in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Role
-                role = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                role = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Role)
                 if role:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
-                    f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    for concept in {x for x in node.outgoingNodesOf(Item.InclusionEdge) | node.adjacentNodesOf(Item.EquivalenceEdge) if x.identity() is Identity.Concept}:
                         conversionA = self.convert(role)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLObjectPropertyDomainAxiom(conversionA, conversionB))
         if OWLAxiom.DataPropertyDomain in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Attribute
-                attribute = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                attribute = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Attribute)
                 if attribute:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
-                    f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    for concept in {x for x in node.outgoingNodesOf(Item.InclusionEdge) | node.adjacentNodesOf(Item.EquivalenceEdge) if x.identity() is Identity.Concept}:
                         conversionA = self.convert(attribute)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLDataPropertyDomainAxiom(conversionA, conversionB))
@@ -1418,27 +1379,17 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         if OWLAxiom.ObjectPropertyRange in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Role
-                role = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                role = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Role)
                 if role:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
-                    f5 = lambda x: x.identity() is Identity.Concept
-                    for concept in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    for concept in {x for x in node.outgoingNodesOf(Item.InclusionEdge) | node.adjacentNodesOf(Item.EquivalenceEdge) if x.identity() is Identity.Concept}:
                         conversionA = self.convert(role)
                         conversionB = self.convert(concept)
                         self.addAxiom(self.df.getOWLObjectPropertyRangeAxiom(conversionA, conversionB))
         if OWLAxiom.DataPropertyRange in self.axiomsList:
             if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Attribute
-                attribute = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                attribute = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Attribute)
                 if attribute:
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.EquivalenceEdge
-                    f5 = lambda x: x.identity() is Identity.ValueDomain
-                    for datatype in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                    for datatype in {x for x in node.outgoingNodesOf(Item.InclusionEdge) | node.adjacentNodesOf(Item.EquivalenceEdge) if x.identity() is Identity.ValueDomain}:
                         conversionA = self.convert(attribute)
                         conversionB = self.convert(datatype)
                         self.addAxiom(self.df.getOWLDataPropertyRangeAxiom(conversionA, conversionB))
@@ -1468,17 +1419,13 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
             if edge.source.type() in {Item.DisjointUnionNode, Item.UnionNode} and self.normalize:
                 # (A OR B) ISA C needs to be normalized to (A ISA C) && (B ISA C)
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Concept
-                for operand in edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                for operand in {x for x in edge.source.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept}:
                     conversionA = self.convert(operand)
                     conversionB = self.convert(edge.target)
                     self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
             elif edge.target.type() is Item.IntersectionNode and self.normalize:
                 # A ISA (B AND C) needs to be normalized to A ISA B && A ISA C
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.identity() is Identity.Concept
-                for operand in edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                for operand in {x for x in edge.target.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Concept}:
                     conversionA = self.convert(edge.source)
                     conversionB = self.convert(operand)
                     self.addAxiom(self.df.getOWLSubClassOfAxiom(conversionA, conversionB))
@@ -1526,6 +1473,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         Main worker.
         """
+        event = PERF.start('owl.export', syntax=self.syntax.value)
+
         try:
 
             self.sgnStarted.emit()
@@ -1556,6 +1505,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions', len(self.converted()))
+            event.mark('convert')
 
             #############################################
             # AXIOMS FROM NODES
@@ -1585,6 +1535,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from nodes (axioms = %s)', len(self.axioms()))
+            event.mark('nodes')
 
             #############################################
             # AXIOMS FROM EDGES
@@ -1672,6 +1623,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
+            event.mark('edges')
 
             #############################################
             # APPLY GENERATED AXIOMS
@@ -1682,6 +1634,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
             for axiom in self.axioms():
                 self.man.addAxiom(self.ontology, axiom)
 
+            event.mark('apply')
+
             #############################################
             # SERIALIZE THE ONTOLOGY
             #################################
@@ -1717,6 +1671,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             fwrite(string, self.path)
             # REMOVE RANDOM FILES GENERATED BY OWL API
             fremove(os.path.join(os.path.dirname(self.path), 'catalog-v001.xml'))
+            event.mark('serialize')
 
         except DiagramMalformedError as e:
             LOGGER.warning('Malformed expression detected on {0}: {1} ... aborting!'.format(e.item, e))
@@ -1725,6 +1680,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             LOGGER.exception('OWL 2 export could not be completed')
             self.sgnErrored.emit(e)
         else:
+            PERF.finish(event, axioms=len(self.axioms()))
             self.sgnCompleted.emit()
         finally:
             detach()
@@ -33,30 +33,77 @@
 ##########################################################################
 
 
+import math
+
 from PySide6 import QtCore
 from PySide6 import QtGui
 from PySide6 import QtPrintSupport
 
-from eddy.core.datatypes.system import File
+from eddy import ORGANIZATION, APPNAME
+from eddy.core.datatypes.system import File, PageSize
 from eddy.core.exporters.common import AbstractDiagramExporter
 from eddy.core.items.common import AbstractItem
 from eddy.core.functions.path import openPath
-from eddy.core.output import getLogger
+from eddy.core.output import getLogger, getPerfLogger
 
 
 LOGGER = getLogger()
+PERF = getPerfLogger()
 
 
 class PdfDiagramExporter(AbstractDiagramExporter):
     """
     Extends AbstractDiagramExporter with facilities to export the structure of Graphol diagrams in PDF format.
     """
-    def __init__(self, diagram, session=None):
+    def __init__(self, diagram, session=None, **kwargs):
         """
         Initialize the Pdf Exporter.
+        :type diagram: Diagram
         :type session: Session
+        :type kwargs: dict
         """
         super().__init__(diagram, session)
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        self.diagrams = kwargs.get('diagrams', None)
+        if self.diagrams is None:
+            self.diagrams = [diagram]
+            if settings.value('export/pdf/all_diagrams', False, bool) and diagram.project:
+                self.diagrams = sorted(diagram.project.diagrams(), key=lambda x: x.name)
+        self.open = kwargs.get('open', True)
+        self.overlap = kwargs.get('overlap', settings.value('export/pdf/overlap', 0, int))
+        self.pageSize = PageSize.valueOf(kwargs.get('pageSize', settings.value('export/pdf/page_size', PageSize.Fit.value, str)))
+        self.pageSize = self.pageSize or PageSize.Fit
+        self.scale = kwargs.get('scale', settings.value('export/pdf/scale', 100, int) / 100)
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def pages(self, shape):
+        """
+        Returns a generator of (QPageLayout, QRectF) pairs covering the given scene rectangle.
+        When the page size is PageSize.Fit a single page matching the rectangle is generated,
+        otherwise the rectangle is split in landscape tiles of the configured page size.
+        :type shape: QRectF
+        :rtype: generator
+        """
+        margins = QtCore.QMarginsF(0, 0, 0, 0)
+        if self.pageSize is PageSize.Fit:
+            size = QtCore.QSizeF(shape.width() * self.scale, shape.height() * self.scale)
+            yield QtGui.QPageLayout(QtGui.QPageSize(size, QtGui.QPageSize.Point), QtGui.QPageLayout.Portrait, margins), shape
+        else:
+            pageSize = QtGui.QPageSize(getattr(QtGui.QPageSize.PageSizeId, self.pageSize.name))
+            layout = QtGui.QPageLayout(pageSize, QtGui.QPageLayout.Landscape, margins)
+            paint = layout.fullRect(QtGui.QPageLayout.Point)
+            w = paint.width() / self.scale
+            h = paint.height() / self.scale
+            stepX = max(w - self.overlap, 1)
+            stepY = max(h - self.overlap, 1)
+            cols = max(math.ceil((shape.width() - self.overlap) / stepX), 1)
+            rows = max(math.ceil((shape.height() - self.overlap) / stepY), 1)
+            for row in range(rows):
+                for col in range(cols):
+                    yield layout, QtCore.QRectF(shape.left() + col * stepX, shape.top() + row * stepY, w, h)
 
     #############################################
     #   INTERFACE
@@ -75,27 +122,41 @@ class PdfDiagramExporter(AbstractDiagramExporter):
         Perform PDF document generation.
         :type path: str
         """
-        shape = self.diagram.visibleRect(margin=20)
-        if shape:
-            LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
-            printer = QtPrintSupport.QPrinter(QtPrintSupport.QPrinter.HighResolution)
-            printer.setOutputFormat(QtPrintSupport.QPrinter.PdfFormat)
-            printer.setOutputFileName(path)
-            printer.setPaperSize(QtPrintSupport.QPrinter.Custom)
-            printer.setPageSize(QtGui.QPageSize(QtCore.QSizeF(shape.width(), shape.height()), QtGui.QPageSize.Point))
-            painter = QtGui.QPainter()
-            if painter.begin(printer):
+        printer = QtPrintSupport.QPrinter(QtPrintSupport.QPrinter.HighResolution)
+        printer.setOutputFormat(QtPrintSupport.QPrinter.PdfFormat)
+        printer.setOutputFileName(path)
+        printer.setFullPage(True)
+        painter = QtGui.QPainter()
+        event = PERF.start('pdf.export', diagrams=len(self.diagrams))
+        count = 0
+        for diagram in self.diagrams:
+            diagram.project.materialize(diagram)
+            shape = diagram.visibleRect(margin=20)
+            if shape:
+                LOGGER.info('Exporting diagram %s to %s', diagram.name, path)
                 # TURN CACHING OFF
-                for item in self.diagram.items():
+                for item in diagram.items():
                     if item.isNode() or item.isEdge():
                         item.setCacheMode(AbstractItem.NoCache)
-                # RENDER THE DIAGRAM IN THE PAINTER
-                self.diagram.render(painter, source=shape)
+                # RENDER THE DIAGRAM ONE PAGE AT A TIME
+                for layout, source in self.pages(shape):
+                    printer.setPageLayout(layout)
+                    if not count:
+                        if not painter.begin(printer):
+                            break
+                    else:
+                        printer.newPage()
+                    diagram.render(painter, source=source)
+                    count += 1
                 # TURN CACHING ON
-                for item in self.diagram.items():
+                for item in diagram.items():
                     if item.isNode() or item.isEdge():
                         item.setCacheMode(AbstractItem.DeviceCoordinateCache)
-                # COMPLETE THE EXPORT
-                painter.end()
-                # OPEN THE DOCUMENT
-                openPath(path)
\ No newline at end of file
+        if count:
+            # COMPLETE THE EXPORT
+            painter.end()
+            LOGGER.debug('Exported %s page(s) to %s', count, path)
+            PERF.finish(event, pages=count)
+            # OPEN THE DOCUMENT
+            if self.open:
+                openPath(path)
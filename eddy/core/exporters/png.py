@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtGui
+
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.image import AbstractImageDiagramExporter
+from eddy.core.exporters.image import AbstractImageDiagramExporterWorker
+
+
+class PngDiagramExporter(AbstractImageDiagramExporter):
+    """
+    Extends AbstractImageDiagramExporter with facilities to export Graphol diagrams in PNG format.
+    """
+    def __init__(self, diagram, session=None, **kwargs):
+        """
+        Initialize the PNG exporter.
+        :type diagram: Diagram
+        :type session: Session
+        :type kwargs: dict
+        """
+        super().__init__(diagram, session, **kwargs)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def createWorker(self, picture, shape, path):
+        """
+        Returns the worker which renders the given diagram snapshot.
+        :type picture: QPicture
+        :type shape: QRectF
+        :type path: str
+        :rtype: PngDiagramExporterWorker
+        """
+        return PngDiagramExporterWorker(picture, shape, path, self.dpi, self.tileSize)
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Png
+
+
+class PngDiagramExporterWorker(AbstractImageDiagramExporterWorker):
+    """
+    Extends AbstractImageDiagramExporterWorker rendering diagram snapshots in PNG files.
+    """
+    def render(self, tile, path):
+        """
+        Render the given tile of the snapshot in the given path.
+        :type tile: QRect
+        :type path: str
+        """
+        image = QtGui.QImage(tile.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.setDotsPerMeterX(round(self.dpi / 0.0254))
+        image.setDotsPerMeterY(round(self.dpi / 0.0254))
+        image.fill(QtGui.QColor(255, 255, 255))
+        painter = QtGui.QPainter(image)
+        self.paint(painter, tile)
+        painter.end()
+        if not image.save(path, 'PNG'):
+            raise IOError('failed to write image: %s' % path)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtSvg
+
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.image import AbstractImageDiagramExporter
+from eddy.core.exporters.image import AbstractImageDiagramExporterWorker
+
+
+class SvgDiagramExporter(AbstractImageDiagramExporter):
+    """
+    Extends AbstractImageDiagramExporter with facilities to export Graphol diagrams in SVG format.
+    """
+    def __init__(self, diagram, session=None, **kwargs):
+        """
+        Initialize the SVG exporter.
+        :type diagram: Diagram
+        :type session: Session
+        :type kwargs: dict
+        """
+        super().__init__(diagram, session, **kwargs)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def createWorker(self, picture, shape, path):
+        """
+        Returns the worker which renders the given diagram snapshot.
+        :type picture: QPicture
+        :type shape: QRectF
+        :type path: str
+        :rtype: SvgDiagramExporterWorker
+        """
+        return SvgDiagramExporterWorker(picture, shape, path, self.dpi, self.tileSize, self.diagram.name)
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Svg
+
+
+class SvgDiagramExporterWorker(AbstractImageDiagramExporterWorker):
+    """
+    Extends AbstractImageDiagramExporterWorker rendering diagram snapshots in SVG files.
+    """
+    def __init__(self, picture, shape, path, dpi=96, tileSize=0, title=''):
+        """
+        Initialize the SVG export worker.
+        :type picture: QPicture
+        :type shape: QRectF
+        :type path: str
+        :type dpi: int
+        :type tileSize: int
+        :type title: str
+        """
+        super().__init__(picture, shape, path, dpi, tileSize)
+        self.title = title
+
+    def render(self, tile, path):
+        """
+        Render the given tile of the snapshot in the given path.
+        :type tile: QRect
+        :type path: str
+        """
+        generator = QtSvg.QSvgGenerator()
+        generator.setFileName(path)
+        generator.setResolution(self.dpi)
+        generator.setSize(tile.size())
+        generator.setTitle(self.title)
+        generator.setViewBox(QtCore.QRect(QtCore.QPoint(0, 0), tile.size()))
+        painter = QtGui.QPainter()
+        if not painter.begin(generator):
+            raise IOError('failed to write image: %s' % path)
+        self.paint(painter, tile)
+        painter.end()
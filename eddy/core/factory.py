@@ -255,7 +255,7 @@ class MenuFactory(QtCore.QObject):
                 switch.add(Item.UnionNode)
             elif node.identity() is Identity.Role:
                 switch.add(Item.RoleInverseNode)
-                if not node.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InclusionEdge):
+                if not node.incomingNodesOf(Item.InclusionEdge):
                     switch.add(Item.RoleChainNode)
             elif node.identity() is Identity.Neutral:
                 switch.add(Item.DisjointUnionNode)
@@ -321,10 +321,8 @@ class MenuFactory(QtCore.QObject):
             action.setChecked(node.type() is action.data())
             action.setVisible(True)
         menu.insertMenu(self.session.action('node_properties'), self.session.menu('property_restriction'))
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() is Identity.Attribute
         qualified = node.isRestrictionQualified()
-        attribute = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        attribute = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Attribute)
         for action in self.session.action('restriction').actions():
             action.setChecked(node.restriction() is action.data())
             action.setVisible(action.data() is not Restriction.Self or not qualified and not attribute)
@@ -342,13 +340,13 @@ class MenuFactory(QtCore.QObject):
         """
         menu = self.buildOperatorNodeMenu(diagram, node)
         if node.edges:
-            if node.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge):
+            if node.incomingNodesOf(Item.InputEdge):
                 # If we have input edges targeting the node keep only the Enumeration
                 # action active: individuals can be connected only to Enumeration nodes
                 # and Property Assertion ones, so switching to another operator is an error.
                 for action in self.session.action('switch_operator').actions():
                     action.setVisible(action.isVisible() and action.data() is Item.EnumerationNode)
-            elif node.outgoingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge):
+            elif node.outgoingNodesOf(Item.InputEdge):
                 # We have inclusion edges attached to this edge but no input => allow
                 # switching to operators whose identities set intersects the one of this node.
                 switch = {Item.DisjointUnionNode, Item.EnumerationNode, Item.IntersectionNode, Item.UnionNode}
@@ -371,14 +369,11 @@ class MenuFactory(QtCore.QObject):
         # BEGIN CONSTRAIN FACET SWITCH
         #################################
 
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.DatatypeRestrictionNode
-        f3 = lambda x: x.type() is Item.ValueDomainNode
         facet = node.facet
         admissible = [x for x in Facet]
-        restriction = first(node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        restriction = first(x for x in node.outgoingNodesOf(Item.InputEdge) if x.type() is Item.DatatypeRestrictionNode)
         if restriction:
-            valuedomain = first(restriction.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            valuedomain = first(x for x in restriction.incomingNodesOf(Item.InputEdge) if x.type() is Item.ValueDomainNode)
             if valuedomain:
                 admissible = Facet.forDatatype(valuedomain.datatype)
         for action in self.session.action('facet').actions():
@@ -412,27 +407,21 @@ class MenuFactory(QtCore.QObject):
         instance = True
         value = True
 
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.EnumerationNode
-        f3 = lambda x: x.type() is Item.IndividualNode
-        f4 = lambda x: x.type() is Item.PropertyAssertionNode
-        f5 = lambda x: x.type() is Item.MembershipEdge
-        f6 = lambda x: x.identity() in {Identity.Attribute, Identity.Role}
 
-        enumeration = first(node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        enumeration = first(x for x in node.outgoingNodesOf(Item.InputEdge) if x.type() is Item.EnumerationNode)
         if enumeration:
-            num = len(enumeration.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            num = len({x for x in enumeration.incomingNodesOf(Item.InputEdge) if x.type() is Item.IndividualNode})
             instance = enumeration.identity() is Identity.Concept or num < 2
             value = enumeration.identity() is Identity.ValueDomain or num < 2
 
-        assertion = first(node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f4))
+        assertion = first(x for x in node.outgoingNodesOf(Item.InputEdge) if x.type() is Item.PropertyAssertionNode)
         if assertion:
-            operand = first(assertion.outgoingNodes(filter_on_edges=f5, filter_on_nodes=f6))
+            operand = first(x for x in assertion.outgoingNodesOf(Item.MembershipEdge) if x.identity() in {Identity.Attribute, Identity.Role})
             if operand:
                 if operand.identity() is Identity.Role:
                     value = False
                 elif operand.identity() is Identity.Attribute:
-                    num = len(assertion.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+                    num = len({x for x in assertion.incomingNodesOf(Item.InputEdge) if x.type() is Item.IndividualNode})
                     instance = instance and (node.identity() is Identity.Individual or num < 2)
                     value = value and (node.identity() is Identity.Value or num < 2)
 
@@ -503,12 +492,8 @@ class MenuFactory(QtCore.QObject):
         :type node: RangeRestrictionNode
         :rtype: QMenu
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() is Identity.Attribute
-        f3 = lambda x: x.type() is Item.InclusionEdge
-        f4 = lambda x: x.identity() is Identity.ValueDomain
-        attribute_in_input = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
-        valuedomain_in_isa = first(node.outgoingNodes(filter_on_edges=f3, filter_on_nodes=f4))
+        attribute_in_input = first(x for x in node.incomingNodesOf(Item.InputEdge) if x.identity() is Identity.Attribute)
+        valuedomain_in_isa = first(x for x in node.outgoingNodesOf(Item.InclusionEdge) if x.identity() is Identity.ValueDomain)
         menu = self.buildGenericNodeMenu(diagram, node)
         menu.addSeparator()
         menu.insertMenu(self.session.action('node_properties'), self.session.menu('switch_restriction'))
@@ -554,13 +539,10 @@ class MenuFactory(QtCore.QObject):
         """
         menu = self.buildOperatorNodeMenu(diagram, node)
         if node.edges:
-            f1 = lambda x: x.type() is Item.InputEdge
-            f2 = lambda x: x.type() is Item.InclusionEdge
-            f3 = lambda x: x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
             switch = {Item.RoleInverseNode}
-            if not node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f3):
+            if not {x for x in node.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}}:
                 switch.add(Item.ComplementNode)
-            if not node.outgoingNodes(filter_on_edges=f1) and not node.incomingNodes(filter_on_edges=f2):
+            if not node.outgoingNodesOf(Item.InputEdge) and not node.incomingNodesOf(Item.InclusionEdge):
                 switch.add(Item.RoleChainNode)
             for action in self.session.action('switch_operator').actions():
                 action.setVisible(action.isVisible() and action.data() in switch)
@@ -576,7 +558,7 @@ class MenuFactory(QtCore.QObject):
         menu = self.buildOperatorNodeMenu(diagram, node)
         if node.edges:
             switch = {Item.RoleChainNode}
-            if len(node.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge)) <= 1:
+            if len(node.incomingNodesOf(Item.InputEdge)) <= 1:
                 switch.add(Item.ComplementNode)
                 switch.add(Item.RoleInverseNode)
             for action in self.session.action('switch_operator').actions():
@@ -33,7 +33,8 @@
 ##########################################################################
 
 
-import re
+from functools import lru_cache
+from sys import intern
 
 from eddy.core.functions.misc import isEmpty
 from eddy.core.regex import RE_OWL_INVALID_CHAR
@@ -68,28 +69,38 @@ def OWLFunctionalDocumentFilter(content):
     return ''.join(result).rstrip('\n')
 
 
+@lru_cache(maxsize=8192)
 def OWLShortIRI(prefix, resource):
     """
     Construct an abbreviated IRI, which is of the form PREFIX_NAME:RC by joining the given values with a colon.
     This function will also take care of removing invalid characters from the given resource.
+    Results are cached: use OWLShortIRI.cache_info() to retrieve cache statistics.
     :type prefix: str
     :type resource: str
     :rtype: str
     """
-    return '{0}:{1}'.format(prefix, OWLText(resource))
+    return intern('{0}:{1}'.format(prefix, OWLText(resource)))
 
 
+@lru_cache(maxsize=8192)
 def OWLText(resource):
     """
     Construct OWL compatible text using the given resource.
-    :param resource:
-    :return:
+    Every invalid character is replaced by an underscore, unless the text already has one there.
+    Results are interned and cached: use OWLText.cache_info() to retrieve cache statistics.
+    :type resource: str
+    :rtype: str
     """
-    sp = re.split(RE_OWL_INVALID_CHAR, str(resource))
-    resource = sp[0]
+    sp = RE_OWL_INVALID_CHAR.split(str(resource))
+    if len(sp) == 1:
+        return intern(sp[0])
+    tokens = [sp[0]]
+    underscore = sp[0].endswith('_')
     for entry in sp[1:]:
-        sep = ''
-        if not entry.startswith('_') and not resource.endswith('_'):
-            sep = '_'
-        resource = '{0}{1}{2}'.format(resource, sep, entry)
-    return resource
\ No newline at end of file
+        if not underscore and not entry.startswith('_'):
+            tokens.append('_')
+            underscore = True
+        if entry:
+            tokens.append(entry)
+            underscore = entry.endswith('_')
+    return intern(''.join(tokens))
@@ -33,14 +33,19 @@
 ##########################################################################
 
 
+import threading
+
 from PySide6 import QtCore
 
-from eddy.core.regex import RE_DIGIT, RE_ITEM_PREFIX
+from eddy.core.regex import RE_DIGIT
 
 
 class GUID(QtCore.QObject):
     """
     Class used to generate sequential ids for diagram elements.
+    The generator can be safely used from multiple threads: ids can be generated one at a time
+    using GUID.next, or reserved in blocks using GUID.reserve so that bulk operations (i.e: paste)
+    and parallel loaders only need to acquire the generator lock once.
     """
     def __init__(self, parent=None):
         """
@@ -49,6 +54,12 @@ class GUID(QtCore.QObject):
         """
         super().__init__(parent)
         self.ids = dict()
+        self.lock = threading.Lock()
+        self.prefixes = set()
+
+    #############################################
+    #   INTERFACE
+    #################################
 
     def next(self, prefix):
         """
@@ -57,15 +68,7 @@ class GUID(QtCore.QObject):
         :type prefix: str
         :rtype: str
         """
-        if RE_DIGIT.search(prefix):
-            raise ValueError('invalid prefix supplied ({0}): id prefix MUST not contain any digit'.format(prefix))
-        try:
-            uid = self.ids[prefix]
-        except KeyError:
-            self.ids[prefix] = 0
-        else:
-            self.ids[prefix] = uid + 1
-        return '{}{}'.format(prefix, self.ids[prefix])
+        return '{}{}'.format(prefix, self.reserve(prefix, 1).start)
 
     @staticmethod
     def parse(uid):
@@ -74,10 +77,28 @@ class GUID(QtCore.QObject):
         :type uid: str
         :rtype: tuple
         """
-        match = RE_ITEM_PREFIX.match(uid)
-        if not match:
+        prefix, value = uid[:1], uid[1:]
+        if not prefix or prefix.isdigit() or not value.isdigit() or not value.isascii():
             raise ValueError('invalid id supplied ({0})'.format(uid))
-        return match.group('prefix'), int(match.group('value'))
+        return prefix, int(value)
+
+    def reserve(self, prefix, n):
+        """
+        Reserve a block of n sequential ids for the given prefix, returning the range of their values.
+        :raise ValueError: if the given prefix contains digits.
+        :type prefix: str
+        :type n: int
+        :rtype: range
+        """
+        if prefix not in self.prefixes:
+            if RE_DIGIT.search(prefix):
+                raise ValueError('invalid prefix supplied ({0}): id prefix MUST not contain any digit'.format(prefix))
+            self.prefixes.add(prefix)
+        with self.lock:
+            start = self.ids.get(prefix, -1) + 1
+            if n > 0:
+                self.ids[prefix] = start + n - 1
+        return range(start, start + n)
 
     def update(self, uid):
         """
@@ -85,15 +106,35 @@ class GUID(QtCore.QObject):
         :type uid: str
         """
         prefix, value = self.parse(uid)
-        try:
-            uid = self.ids[prefix]
-        except KeyError:
-            self.ids[prefix] = value
-        else:
-            self.ids[prefix] = max(uid, value)
+        with self.lock:
+            self.ids[prefix] = max(self.ids.get(prefix, value), value)
+
+    def updateAll(self, uids):
+        """
+        Update the last incremental values according to the given collection of ids.
+        :type uids: T <= list|tuple|set
+        """
+        values = dict()
+        for uid in uids:
+            prefix, value = self.parse(uid)
+            if value > values.get(prefix, -1):
+                values[prefix] = value
+        for prefix, value in values.items():
+            self.updateValues(prefix, value)
+
+    def updateValues(self, prefix, *values):
+        """
+        Update the last incremental value of the given prefix according to the given id values.
+        :type prefix: str
+        :type values: int
+        """
+        if values:
+            value = max(values)
+            with self.lock:
+                self.ids[prefix] = max(self.ids.get(prefix, value), value)
 
     def __repr__(self):
         """
         Return repr(self).
         """
-        return 'GUID<{0}>'.format(','.join(['{0}:{1}'.format(k, v) for k, v in self.ids.items()]))
\ No newline at end of file
+        return 'GUID<{0}>'.format(','.join(['{0}:{1}'.format(k, v) for k, v in self.ids.items()]))
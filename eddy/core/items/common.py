@@ -129,6 +129,7 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         """
         super().__init__(**kwargs)
         self.id = id or diagram.guid.next(self.Prefix)
+        self.setFlag(AbstractItem.ItemSendsGeometryChanges, True)
 
     #############################################
     #   PROPERTIES
@@ -154,6 +155,32 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         item = self.type()
         return item.shortName
 
+    #############################################
+    #   EVENTS
+    #################################
+
+    def itemChange(self, change, value):
+        """
+        Executed whenever the item change state.
+        :type change: GraphicsItemChange
+        :type value: QVariant
+        :rtype: QVariant
+        """
+        if change == AbstractItem.ItemPositionHasChanged:
+            diagram = self.diagram
+            if diagram:
+                diagram.bounds.invalidate(self)
+        elif change == AbstractItem.ItemZValueHasChanged:
+            diagram = self.diagram
+            if diagram and value > diagram.maxZValue:
+                diagram.maxZValue = value
+        elif change == AbstractItem.ItemSelectedChange:
+            # THE SUMMARY IS UPDATED BEFORE THE SCENE EMITS selectionChanged
+            diagram = self.diagram
+            if diagram:
+                diagram.selection.update(self, value)
+        return super().itemChange(change, value)
+
     #############################################
     #   INTERFACE
     #################################
@@ -174,6 +201,15 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         """
         pass
 
+    def prepareGeometryChange(self):
+        """
+        Prepare the item for a geometry change, invalidating its area in the diagram bounds.
+        """
+        super().prepareGeometryChange()
+        diagram = self.diagram
+        if diagram:
+            diagram.bounds.invalidate(self)
+
     @abstractmethod
     def setText(self, text):
         """
@@ -234,6 +270,13 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         elif self.isEdge():
             self.updateEdge(*args, **kwargs)
 
+    def updateSelection(self, selected):
+        """
+        Update the selection visuals of the item (used when items are selected in bulk).
+        :type selected: bool
+        """
+        pass
+
     def __repr__(self):
         """
         Returns repr(self).
@@ -56,6 +56,11 @@ class AbstractEdge(AbstractItem):
     __metaclass__ = ABCMeta
 
     Prefix = 'e'
+    HandleBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
+    HandlePen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    SelectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+    UnselectedBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+    UnselectedPen = QtGui.QPen(QtCore.Qt.NoPen)
 
     def __init__(self, source, target=None, breakpoints=None, **kwargs):
         """
@@ -70,6 +75,7 @@ class AbstractEdge(AbstractItem):
         self.target = target
 
         self.anchors = {} # {AbstractNode: Polygon}
+        self.boundingBox = None # CACHED BOUNDING RECT
         self.breakpoints = breakpoints or [] # [QtCore.QPointF]
         self.handles = [] # [Polygon]
         self.head = Polygon(QtGui.QPolygonF())
@@ -263,13 +269,15 @@ class AbstractEdge(AbstractItem):
             return self.source
         raise AttributeError('node {0} is not attached to edge {1}'.format(node, self))
 
-    def updateEdge(self, selected=None, visible=None, breakpoint=None, anchor=None, **kwargs):
+    def updateEdge(self, selected=None, visible=None, breakpoint=None, anchor=None, depth=True, **kwargs):
         """
         Update the current edge.
+        If depth is False the z-value of the edge is left untouched (used for selection changes).
         :type selected: bool
         :type visible: bool
         :type breakpoint: int
         :type anchor: AbstractNode
+        :type depth: bool
         """
         if selected is None:
             selected = self.isSelected()
@@ -288,6 +296,7 @@ class AbstractEdge(AbstractItem):
 
         ## BREAKPOINTS (GEOMETRY)
         self.handles = [Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8)) for p in self.breakpoints]
+        self.boundingBox = None
 
         ## ANCHORS + BREAKPOINTS + SELECTION (BRUSH + PEN)
         if visible and selected:
@@ -311,22 +320,51 @@ class AbstractEdge(AbstractItem):
         self.selection.setBrush(selectionBrush)
 
         ## Z-VALUE (DEPTH)
-        try:
-            zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
-        except TypeError:
-            zValue = source.zValue() + 0.1
-            if source.label:
-                zValue = max(zValue, source.label.zValue())
-            if target:
-                zValue = max(zValue, target.zValue())
-                if target.label:
-                    zValue = max(zValue, target.label.zValue())
-        self.setZValue(zValue)
+        # Items are looked up in the diagram index by bounding rect rather than by shape: items whose
+        # shape doesn't overlap the edge one are not painted over anyway, and the shape test is slow.
+        if depth:
+            diagram = self.diagram
+            items = []
+            if diagram:
+                items = diagram.items(self.sceneBoundingRect(), mode=QtCore.Qt.IntersectsItemBoundingRect, labels=True, skip={self})
+            try:
+                zValue = max(*(x.zValue() for x in items)) + 0.1
+            except TypeError:
+                zValue = source.zValue() + 0.1
+                if source.label:
+                    zValue = max(zValue, source.label.zValue())
+                if target:
+                    zValue = max(zValue, target.zValue())
+                    if target.label:
+                        zValue = max(zValue, target.label.zValue())
+            self.setZValue(zValue)
 
         ## FORCE CACHE REGENERATION
         self.setCacheMode(AbstractItem.NoCache)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
 
+    def updateSelection(self, selected):
+        """
+        Update the selection visuals of the edge, leaving its geometry untouched.
+        :type selected: bool
+        """
+        if selected and self.canDraw():
+            brush = AbstractEdge.HandleBrush
+            pen = AbstractEdge.HandlePen
+            selectionBrush = AbstractEdge.SelectionBrush
+        else:
+            brush = AbstractEdge.UnselectedBrush
+            pen = AbstractEdge.UnselectedPen
+            selectionBrush = AbstractEdge.UnselectedBrush
+        for polygon in self.anchors.values():
+            polygon.setBrush(brush)
+            polygon.setPen(pen)
+        for polygon in self.handles:
+            polygon.setBrush(brush)
+            polygon.setPen(pen)
+        self.selection.setBrush(selectionBrush)
+        self.update()
+
     #############################################
     #   EVENTS
     #################################
@@ -363,7 +401,8 @@ class AbstractEdge(AbstractItem):
         :rtype: QVariant
         """
         if change == AbstractEdge.ItemSelectedHasChanged:
-            self.updateEdge(selected=value)
+            if not self.diagram or not self.diagram.isSelecting():
+                self.updateEdge(selected=value, depth=False)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
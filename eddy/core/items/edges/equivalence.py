@@ -66,15 +66,17 @@ class EquivalenceEdge(AbstractEdge):
         Returns the shape bounding rect.
         :rtype: QRectF
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        path.addPolygon(self.tail.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
+        if self.boundingBox is None:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            path.addPolygon(self.head.geometry())
+            path.addPolygon(self.tail.geometry())
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+            self.boundingBox = path.controlPointRect()
+        return QtCore.QRectF(self.boundingBox)
 
     def copy(self, diagram):
         """
@@ -42,9 +42,10 @@ from eddy.core.commands.nodes import CommandNodeRezize
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.items.common import AbstractItem, Polygon
+from eddy.core.model import AdjacencyIndex
 
 
-class AbstractNode(AbstractItem):
+class AbstractNode(AbstractItem, AdjacencyIndex):
     """
     Base class for all the diagram nodes.
     """
@@ -52,6 +53,9 @@ class AbstractNode(AbstractItem):
 
     Identities = {}
     Prefix = 'n'
+    SelectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+    UnselectedBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+    UnselectedPen = QtGui.QPen(QtCore.Qt.NoPen)
 
     def __init__(self, **kwargs):
         """
@@ -63,6 +67,7 @@ class AbstractNode(AbstractItem):
 
         self.anchors = dict()
         self.edges = set()
+        self.adjacency = dict()
 
         self.background = None # BACKGROUND POLYGON
         self.selection = None # SELECTION POLYGON
@@ -90,22 +95,6 @@ class AbstractNode(AbstractItem):
     #   INTERFACE
     #################################
 
-    def addEdge(self, edge):
-        """
-        Add the given edge to the current node.
-        :type edge: AbstractEdge
-        """
-        self.edges.add(edge)
-
-    def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
-        """
-        Returns the set of adjacent nodes.
-        :type filter_on_edges: callable
-        :type filter_on_nodes: callable
-        :rtype: set
-        """
-        return {x for x in [e.other(self) for e in self.edges if filter_on_edges(e)] if filter_on_nodes(x)}
-
     def anchor(self, edge):
         """
         Returns the anchor point of the given edge in scene coordinates.
@@ -197,17 +186,6 @@ class AbstractNode(AbstractItem):
         """
         return self._identity
 
-    def incomingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
-        """
-        Returns the set of incoming nodes.
-        :type filter_on_edges: callable
-        :type filter_on_nodes: callable
-        :rtype: set
-        """
-        return {x for x in [e.other(self) for e in self.edges \
-                    if (e.target is self or e.type() is Item.EquivalenceEdge) \
-                        and filter_on_edges(e)] if filter_on_nodes(x)}
-
     def intersection(self, line):
         """
         Returns the intersection of the shape with the given line (in scene coordinates).
@@ -263,17 +241,6 @@ class AbstractNode(AbstractItem):
         self.setPos(self.pos() + move)
         self.anchors = {edge: pos + move for edge, pos in self.anchors.items()}
 
-    def outgoingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
-        """
-        Returns the set of outgoing nodes.
-        :type filter_on_edges: callable
-        :type filter_on_nodes: callable
-        :rtype: set
-        """
-        return {x for x in [e.other(self) for e in self.edges \
-                    if (e.source is self or e.type() is Item.EquivalenceEdge) \
-                        and filter_on_edges(e)] if filter_on_nodes(x)}
-
     @abstractmethod
     def painterPath(self):
         """
@@ -296,13 +263,6 @@ class AbstractNode(AbstractItem):
         """
         return self.mapToScene(self.center())
 
-    def removeEdge(self, edge):
-        """
-        Remove the given edge from the current node.
-        :type edge: AbstractEdge
-        """
-        self.edges.discard(edge)
-
     def setAnchor(self, edge, pos):
         """
         Set the given position as anchor for the given edge.
@@ -389,6 +349,15 @@ class AbstractNode(AbstractItem):
         # SCHEDULE REPAINT
         self.update(self.boundingRect())
 
+    def updateSelection(self, selected):
+        """
+        Update the selection visuals of the node, leaving its geometry untouched.
+        :type selected: bool
+        """
+        self.selection.setBrush(AbstractNode.SelectionBrush if selected else AbstractNode.UnselectedBrush)
+        self.background.setBrush(AbstractNode.UnselectedBrush)
+        self.update(self.boundingRect())
+
     @abstractmethod
     def updateTextPos(self, *args, **kwargs):
         """
@@ -416,7 +385,8 @@ class AbstractNode(AbstractItem):
         :rtype: QVariant
         """
         if change == AbstractNode.ItemSelectedHasChanged:
-            self.updateNode(selected=value)
+            if not self.diagram or not self.diagram.isSelecting():
+                self.updateNode(selected=value)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, mouseEvent):
@@ -447,6 +417,8 @@ class AbstractResizableNode(AbstractNode):
     """
     __metaclass__ = ABCMeta
 
+    HandleBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
+    HandlePen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
     HandleTL = 0
     HandleTM = 1
     HandleTR = 2
@@ -584,6 +556,21 @@ class AbstractResizableNode(AbstractNode):
         # SCHEDULE REPAINT
         self.update(self.boundingRect())
 
+    def updateSelection(self, selected):
+        """
+        Update the selection visuals of the node, leaving its geometry untouched.
+        :type selected: bool
+        """
+        brush = AbstractNode.UnselectedBrush
+        pen = AbstractNode.UnselectedPen
+        if selected:
+            brush = AbstractResizableNode.HandleBrush
+            pen = AbstractResizableNode.HandlePen
+        for handle in self.handles:
+            handle.setBrush(brush)
+            handle.setPen(pen)
+        super().updateSelection(selected)
+
     #############################################
     #   EVENTS
     #################################
@@ -614,7 +601,7 @@ class AbstractResizableNode(AbstractNode):
         :rtype: QVariant
         """
         if change == AbstractNode.ItemSelectedHasChanged:
-            if self.diagram.mode is not DiagramMode.NodeResize:
+            if self.diagram.mode is not DiagramMode.NodeResize and not self.diagram.isSelecting():
                 self.updateNode(selected=value)
         return super(AbstractNode, self).itemChange(change, value)
 
@@ -109,7 +109,7 @@ class OperatorNode(AbstractNode):
         Returns the list of nodes which contribute to the definition of this very node.
         :rtype: set
         """
-        return set(self.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge))
+        return set(self.incomingNodesOf(Item.InputEdge))
 
     def height(self):
         """
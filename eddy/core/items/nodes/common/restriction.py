@@ -128,19 +128,16 @@ class RestrictionNode(AbstractNode):
         Returna True if this node expresses a qualified restriction (exists R.C), False otherwise.
         :rtype: bool
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() in {Identity.Concept, Identity.Role}
-        f3 = lambda x: x.identity() in {Identity.Attribute, Identity.ValueDomain}
         f4 = lambda x: x.identity() is Identity.Concept
         if self.restriction() in {Restriction.Cardinality, Restriction.Exists, Restriction.Forall}:
             # CHECK FOR ROLE QUALIFIED RESTRICTION
-            collection = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+            collection = {x for x in self.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Concept, Identity.Role}}
             if len(collection) >= 2:
                 node = first(collection, filter_on_item=f4)
                 if node and Special.valueOf(node.text()) is not Special.Top:
                     return True
             # CHECK FOR ATTRIBUTE QUALIFIED RESTRICTION
-            return len(self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3)) >= 2
+            return len({x for x in self.incomingNodesOf(Item.InputEdge) if x.identity() in {Identity.Attribute, Identity.ValueDomain}}) >= 2
         return False
 
     def paint(self, painter, option, widget=None):
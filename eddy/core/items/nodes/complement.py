@@ -88,11 +88,8 @@ class ComplementNode(OperatorNode):
         we do the same if the node is targeted by a RoleInstance or an AttributeInstance
         :rtype: tuple
         """
-        f1 = lambda x: x.type() is Item.MembershipEdge
-        f2 = lambda x: x.identity() is Identity.Individual
-        f3 = lambda x: x.identity() in {Identity.RoleInstance, Identity.AttributeInstance}
         f4 = lambda x: Identity.Role if x.identity() is Identity.RoleInstance else Identity.Attribute
-        incoming = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        incoming = {x for x in self.incomingNodesOf(Item.MembershipEdge) if x.identity() is Identity.Individual}
         if incoming:
             computed = Identity.Unknown
             identities = set(x.identity() for x in incoming)
@@ -100,7 +97,7 @@ class ComplementNode(OperatorNode):
                 computed = Identity.Concept
             self.setIdentity(computed)
             return {self}, incoming, set()
-        incoming = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3)
+        incoming = {x for x in self.incomingNodesOf(Item.MembershipEdge) if x.identity() in {Identity.RoleInstance, Identity.AttributeInstance}}
         if incoming:
             computed = Identity.Unknown
             identities = set(map(f4, incoming))
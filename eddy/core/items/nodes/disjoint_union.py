@@ -83,9 +83,7 @@ class DisjointUnionNode(OperatorNode):
         WEAK nodes being examined during the identification process.
         :rtype: tuple
         """
-        f1 = lambda x: x.type() is Item.MembershipEdge
-        f2 = lambda x: x.identity() is Identity.Individual
-        incoming = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        incoming = {x for x in self.incomingNodesOf(Item.MembershipEdge) if x.identity() is Identity.Individual}
         if incoming:
             computed = Identity.Unknown
             identities = set(x.identity() for x in incoming)
@@ -90,10 +90,8 @@ class EnumerationNode(OperatorNode):
         WEAK nodes being examined during the identification process.
         :rtype: tuple
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.IndividualNode
         f3 = lambda x: Identity.Concept if x.identity() is Identity.Individual else Identity.ValueDomain
-        inputs = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        inputs = {x for x in self.incomingNodesOf(Item.InputEdge) if x.type() is Item.IndividualNode}
         identities = set(map(f3, inputs))
         computed = Identity.Neutral
         if identities:
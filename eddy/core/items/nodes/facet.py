@@ -90,12 +90,9 @@ class FacetNode(AbstractNode):
         Returns the datatype this facet is restricting, or None if the node is isolated.
         :rtype: Datatype
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.DatatypeRestrictionNode
-        f3 = lambda x: x.type() is Item.ValueDomainNode
-        outgoing = first(self.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        outgoing = first(x for x in self.outgoingNodesOf(Item.InputEdge) if x.type() is Item.DatatypeRestrictionNode)
         if outgoing:
-            incoming = first(outgoing.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            incoming = first(x for x in outgoing.incomingNodesOf(Item.InputEdge) if x.type() is Item.ValueDomainNode)
             if incoming:
                 return incoming.datatype
         return None
@@ -188,7 +185,7 @@ class FacetNode(AbstractNode):
         Returns the list of nodes which contribute to the definition of this very node.
         :rtype: set
         """
-        return set(self.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge))
+        return set(self.incomingNodesOf(Item.InputEdge))
 
     @staticmethod
     def createPolygon(w, h):
@@ -36,7 +36,7 @@
 from PySide6 import QtCore
 from PySide6 import QtGui
 
-from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import OrderedSet
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.functions.misc import first
 from eddy.core.items.common import Polygon
@@ -58,12 +58,12 @@ class PropertyAssertionNode(AbstractNode):
         :type width: int
         :type height: int
         :type brush: QBrush
-        :type inputs: DistinctList
+        :type inputs: OrderedSet
         """
         super().__init__(**kwargs)
         brush = PropertyAssertionNode.DefaultBrush
         pen = PropertyAssertionNode.DefaultPen
-        self.inputs = inputs or DistinctList()
+        self.inputs = inputs or OrderedSet()
         self.background = Polygon(QtCore.QRectF(-34, -19, 68, 38))
         self.selection = Polygon(QtCore.QRectF(-34, -19, 68, 38))
         self.polygon = Polygon(QtCore.QRectF(-26, -15, 52, 30), brush, pen)
@@ -104,7 +104,7 @@ class PropertyAssertionNode(AbstractNode):
         Returns the list of nodes which contribute to the definition of this very node.
         :rtype: set
         """
-        return set(self.incomingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge))
+        return set(self.incomingNodesOf(Item.InputEdge))
 
     def height(self):
         """
@@ -135,14 +135,10 @@ class PropertyAssertionNode(AbstractNode):
         for all the WEAK nodes being examined during the identification process.
         :rtype: tuple
         """
-        f1 = lambda x: x.type() is Item.MembershipEdge
-        f2 = lambda x: x.type() in {Item.RoleNode, Item.RoleInverseNode, Item.AttributeNode}
-        f3 = lambda x: x.type() is Item.InputEdge
-        f4 = lambda x: x.type() is Item.IndividualNode
         f5 = lambda x: Identity.RoleInstance if x.identity() is Identity.Role else Identity.AttributeInstance
         f6 = lambda x: x.identity() is Identity.Value
-        outgoing = self.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2)
-        incoming = self.incomingNodes(filter_on_edges=f3, filter_on_nodes=f4)
+        outgoing = {x for x in self.outgoingNodesOf(Item.MembershipEdge) if x.type() in {Item.RoleNode, Item.RoleInverseNode, Item.AttributeNode}}
+        incoming = {x for x in self.incomingNodesOf(Item.InputEdge) if x.type() is Item.IndividualNode}
         computed = Identity.Neutral
         # 1) USE MEMBERSHIP EDGE
         identities = set(map(f5, outgoing))
@@ -74,10 +74,8 @@ class RangeRestrictionNode(RestrictionNode):
         :rtype: tuple
         """
         supported = {Identity.Role, Identity.Attribute, Identity.Concept}
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.identity() in supported and Identity.Neutral not in x.identities()
         f3 = lambda x: Identity.Concept if x.identity() in {Identity.Role, Identity.Concept} else Identity.ValueDomain
-        inputs = self.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        inputs = {x for x in self.incomingNodesOf(Item.InputEdge) if x.identity() in supported and Identity.Neutral not in x.identities()}
         identities = set(map(f3, inputs))
         computed = Identity.Neutral
         if identities:
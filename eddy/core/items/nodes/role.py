@@ -128,9 +128,7 @@ class RoleNode(AbstractResizableNode):
         Returns the list of nodes which contribute to the definition of this very node.
         :rtype: set
         """
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
-        return self.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        return {x for x in self.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}}
 
     def height(self):
         """
@@ -35,7 +35,7 @@
 
 from PySide6 import QtGui
 
-from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import OrderedSet
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.items.nodes.common.operator import OperatorNode
 from eddy.core.items.nodes.common.label import NodeLabel
@@ -52,10 +52,10 @@ class RoleChainNode(OperatorNode):
         """
         Initialize the node.
         :type brush: QBrush
-        :type inputs: DistinctList
+        :type inputs: OrderedSet
         """
         super().__init__(brush=QtGui.QBrush(QtGui.QColor(252, 252, 252, 255)), **kwargs)
-        self.inputs = inputs or DistinctList()
+        self.inputs = inputs or OrderedSet()
         self.label = NodeLabel('chain', pos=self.center, editable=False, movable=False, parent=self)
 
     #############################################
@@ -662,11 +662,11 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
                 LOGGER.exception('Failed to create node %s', e.attribute('id'))
             else:
                 self.diagram.addItem(node)
-                self.diagram.guid.update(node.id)
                 self.nodes[node.id] = node
             finally:
                 e = e.nextSiblingElement('node')
 
+        self.diagram.guid.updateAll(self.nodes)
         LOGGER.debug('Loaded nodes: %s', len(self.nodes))
 
         e = graph.firstChildElement('edge')
@@ -686,11 +686,11 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
                 LOGGER.exception('Failed to create edge %s', e.attribute('id'))
             else:
                 self.diagram.addItem(edge)
-                self.diagram.guid.update(edge.id)
                 self.edges[edge.id] = edge
             finally:
                 e = e.nextSiblingElement('edge')
 
+        self.diagram.guid.updateAll(self.edges)
         LOGGER.debug('Loaded edges: %s', len(self.edges))
 
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
@@ -41,8 +41,8 @@ from PySide6 import QtGui
 from PySide6 import QtWidgets
 from PySide6 import QtXml
 
-from eddy import APPNAME
-from eddy.core.datatypes.collections import DistinctList
+from eddy import APPNAME, ORGANIZATION
+from eddy.core.datatypes.collections import OrderedSet
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.system import File
 from eddy.core.diagram import Diagram
@@ -51,12 +51,13 @@ from eddy.core.diagram import DiagramNotValidError
 from eddy.core.exporters.graphol import GrapholProjectExporter
 from eddy.core.functions.fsystem import fread, fexists, isdir, rmdir
 from eddy.core.functions.misc import rstrip, postfix
+from eddy.core.functions.owl import OWLText
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect
 from eddy.core.loaders.common import AbstractDiagramLoader
 from eddy.core.loaders.common import AbstractOntologyLoader
 from eddy.core.loaders.common import AbstractProjectLoader
-from eddy.core.output import getLogger
+from eddy.core.output import getLogger, getPerfLogger
 from eddy.core.project import Project
 from eddy.core.project import ProjectMergeWorker
 from eddy.core.project import ProjectNotFoundError
@@ -70,6 +71,7 @@ from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
 
 
 LOGGER = getLogger()
+PERF = getPerfLogger()
 
 
 class GrapholDiagramLoader_v1(AbstractDiagramLoader):
@@ -253,7 +255,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         """
         inputs = e.attribute('inputs', '').strip()
         node = self.importGenericNode(Item.PropertyAssertionNode, e)
-        node.inputs = DistinctList(inputs.split(',') if inputs else [])
+        node.inputs = OrderedSet(inputs.split(',') if inputs else [])
         return node
 
     def importRangeRestrictionNode(self, e):
@@ -289,7 +291,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         """
         inputs = e.attribute('inputs', '').strip()
         node = self.importGenericNode(Item.RoleChainNode, e)
-        node.inputs = DistinctList(inputs.split(',') if inputs else [])
+        node.inputs = OrderedSet(inputs.split(',') if inputs else [])
         return node
 
     def importRoleInverseNode(self, e):
@@ -534,11 +536,11 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
                 LOGGER.exception('Failed to create node %s', element.attribute('id'))
             else:
                 self.diagram.addItem(node)
-                self.diagram.guid.update(node.id)
                 self.nodes[node.id] = node
             finally:
                 element = element.nextSiblingElement('node')
 
+        self.diagram.guid.updateAll(self.nodes)
         LOGGER.debug('Loaded nodes: %s', len(self.nodes))
 
         #############################################
@@ -555,12 +557,13 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
                 LOGGER.exception('Failed to create edge %s', element.attribute('id'))
             else:
                 self.diagram.addItem(edge)
-                self.diagram.guid.update(edge.id)
                 self.edges[edge.id] = edge
                 edge.updateEdge()
             finally:
                 element = element.nextSiblingElement('edge')
 
+        self.diagram.guid.updateAll(self.edges)
+
         LOGGER.debug('Loaded edges: %s', len(self.edges))
 
         #############################################
@@ -1113,7 +1116,7 @@ class GrapholLoaderMixin_v2(object):
         """
         inputs = e.attribute('inputs', '').strip()
         n = self.importGenericNode(d, Item.PropertyAssertionNode, e)
-        n.inputs = DistinctList(inputs.split(',') if inputs else [])
+        n.inputs = OrderedSet(inputs.split(',') if inputs else [])
         return n
 
     def importRangeRestrictionNode(self, d, e):
@@ -1152,7 +1155,7 @@ class GrapholLoaderMixin_v2(object):
         """
         inputs = e.attribute('inputs', '').strip()
         n = self.importGenericNode(d, Item.RoleChainNode, e)
-        n.inputs = DistinctList(inputs.split(',') if inputs else [])
+        n.inputs = OrderedSet(inputs.split(',') if inputs else [])
         return n
 
     def importRoleInverseNode(self, d, e):
@@ -1300,7 +1303,22 @@ class GrapholLoaderMixin_v2(object):
         ## CREATE NEW DIAGRAM
         LOGGER.info('Loading diagram: %s', name)
         diagram = Diagram.create(name, size, self.nproject)
-        self.buffer[diagram.name] = dict()
+        ## LOAD DIAGRAM ITEMS
+        self.importDiagramItems(diagram, e)
+        ## CONFIGURE DIAGRAM SIGNALS
+        connect(diagram.sgnItemAdded, self.nproject.doAddItem)
+        connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
+        connect(diagram.selectionChanged, self.session.doUpdateState)
+        ## RETURN GENERATED DIAGRAM
+        return diagram
+
+    def importDiagramItems(self, d, e):
+        """
+        Create the items of the given diagram from the given QDomElement.
+        :type d: Diagram
+        :type e: QDomElement
+        """
+        self.buffer[d.name] = dict()
         ## LOAD DIAGRAM NODES
         sube = e.firstChildElement('node')
         while not sube.isNull():
@@ -1308,15 +1326,15 @@ class GrapholLoaderMixin_v2(object):
                 QtWidgets.QApplication.processEvents()
                 item = self.itemFromXmlNode(sube)
                 func = self.importFuncForItem[item]
-                node = func(diagram, sube)
+                node = func(d, sube)
             except Exception:
                 LOGGER.exception('Failed to create node %s', sube.attribute('id'))
             else:
-                diagram.addItem(node)
-                diagram.guid.update(node.id)
-                self.buffer[diagram.name][node.id] = node
+                d.addItem(node)
+                self.buffer[d.name][node.id] = node
             finally:
                 sube = sube.nextSiblingElement('node')
+        d.guid.updateAll(self.buffer[d.name])
         ## LOAD DIAGRAM EDGES
         sube = e.firstChildElement('edge')
         while not sube.isNull():
@@ -1324,21 +1342,39 @@ class GrapholLoaderMixin_v2(object):
                 QtWidgets.QApplication.processEvents()
                 item = self.itemFromXmlNode(sube)
                 func = self.importFuncForItem[item]
-                edge = func(diagram, sube)
+                edge = func(d, sube)
             except Exception:
                 LOGGER.exception('Failed to create edge %s', sube.attribute('id'))
             else:
-                diagram.addItem(edge)
-                diagram.guid.update(edge.id)
-                self.buffer[diagram.name][edge.id] = edge
+                d.addItem(edge)
+                self.buffer[d.name][edge.id] = edge
             finally:
                 sube = sube.nextSiblingElement('edge')
+        d.guid.updateAll(self.buffer[d.name])
         ## IDENTIFY NEUTRAL NODES
-        nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
+        nodes = [x for x in d.items(edges=False) if Identity.Neutral in x.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
             for node in nodes:
-                diagram.sgnNodeIdentification.emit(node)
+                d.sgnNodeIdentification.emit(node)
+        ## RELEASE THE ITEM BUFFER
+        del self.buffer[d.name]
+
+    def importDiagramRecord(self, e, i):
+        """
+        Create an empty diagram from the given QDomElement, whose items will be built on demand.
+        :type e: QDomElement
+        :type i: int
+        :rtype: Diagram
+        """
+        QtWidgets.QApplication.processEvents()
+        ## PARSE DIAGRAM INFORMATION
+        name = e.attribute('name', 'diagram_{0}'.format(i))
+        size = max(int(e.attribute('width', '10000')), int(e.attribute('height', '10000')))
+        ## CREATE NEW DIAGRAM
+        LOGGER.info('Loading diagram record: %s', name)
+        diagram = Diagram.create(name, size, self.nproject)
+        diagram.record = GrapholDiagramRecord(self, e)
         ## CONFIGURE DIAGRAM SIGNALS
         connect(diagram.sgnItemAdded, self.nproject.doAddItem)
         connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
@@ -1382,15 +1418,20 @@ class GrapholLoaderMixin_v2(object):
     #   MAIN IMPORT
     #################################
 
-    def createDiagrams(self):
+    def createDiagrams(self, lazy=False):
         """
         Create ontology diagrams by parsing the 'diagrams' section of the QDomDocument.
+        If lazy is True, diagrams are created empty and their items are built on demand.
+        :type lazy: bool
         """
         counter = 1
         section = self.document.documentElement().firstChildElement('diagrams')
         element = section.firstChildElement('diagram')
         while not element.isNull():
-            self.nproject.addDiagram(self.importDiagram(element, counter))
+            if lazy:
+                self.nproject.addDiagram(self.importDiagramRecord(element, counter))
+            else:
+                self.nproject.addDiagram(self.importDiagram(element, counter))
             element = element.nextSiblingElement('diagram')
             counter += 1
 
@@ -1461,10 +1502,76 @@ class GrapholLoaderMixin_v2(object):
         """
         Render all the elements in the Project ontology.
         """
-        for item in self.nproject.items():
+        for item in self.nproject.index.items():
             item.updateEdgeOrNode()
 
 
+class GrapholDiagramRecord(object):
+    """
+    Lightweight record of a Graphol diagram whose items have not been built yet.
+    """
+    def __init__(self, loader, element):
+        """
+        Initialize the diagram record.
+        :type loader: GrapholLoaderMixin_v2
+        :type element: QDomElement
+        """
+        self.counts = dict()
+        self.element = element
+        self.loader = loader
+        self.predicates = []
+        sube = element.firstChildElement('node')
+        while not sube.isNull():
+            item = loader.itemFromXmlNode(sube)
+            if item:
+                self.counts[item] = self.counts.get(item, 0) + 1
+                if Item.ConceptNode <= item <= Item.IndividualNode:
+                    name = sube.firstChildElement('label').text().strip()
+                    self.predicates.append((item, OWLText(name)))
+            sube = sube.nextSiblingElement('node')
+        sube = element.firstChildElement('edge')
+        while not sube.isNull():
+            item = loader.itemFromXmlNode(sube)
+            if item:
+                self.counts[item] = self.counts.get(item, 0) + 1
+            sube = sube.nextSiblingElement('edge')
+
+    def contains(self, item=None, name=None):
+        """
+        Returns True if the record holds a predicate matching the given type and name, False otherwise.
+        :type item: Item
+        :type name: str
+        :rtype: bool
+        """
+        name = OWLText(name) if name else None
+        for i, k in self.predicates:
+            if (not item or i is item) and (not name or k == name):
+                return True
+        return False
+
+    def isEmpty(self):
+        """
+        Returns True if the record holds no item, False otherwise.
+        :rtype: bool
+        """
+        return not self.counts
+
+    def itemNum(self, item):
+        """
+        Returns the number of items of the given type held by the record.
+        :type item: Item
+        :rtype: int
+        """
+        return self.counts.get(item, 0)
+
+    def materialize(self, diagram):
+        """
+        Build the items of the given diagram out of this record.
+        :type diagram: Diagram
+        """
+        self.loader.importDiagramItems(diagram, self.element)
+
+
 class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
     """
     Extends AbstractOntologyLoader with facilities to load ontologies from Graphol file format.
@@ -1555,13 +1662,22 @@ class GrapholProjectLoader_v2(AbstractProjectLoader, GrapholLoaderMixin_v2):
         """
         Perform project import.
         """
+        event = PERF.start('project.load', path=self.path)
         try:
             self.createDomDocument()
         except (ProjectNotFoundError, ProjectVersionError):
             self.createLegacyProject()
+            PERF.finish(event, legacy=True)
         else:
+            event.mark('document')
+            settings = QtCore.QSettings(ORGANIZATION, APPNAME)
             self.createProject()
-            self.createDiagrams()
+            event.mark('project')
+            self.createDiagrams(lazy=settings.value('diagram/lazy', False, bool))
+            event.mark('diagrams')
             self.createPredicatesMeta()
+            event.mark('meta')
             self.projectRender()
+            event.mark('render')
             self.projectLoaded()
+            PERF.finish(event, diagrams=len(self.nproject.diagrams()))
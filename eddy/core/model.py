@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+"""
+Compact graph model mirroring the ontology semantics held by diagram items.
+
+The model stores, for each node, its type, identity, label and adjacency and, for each edge,
+its type and endpoints, without any reference to QGraphicsItem instances or to a live scene.
+Model nodes and edges expose the same query interface of diagram items used by the profile
+validation rules and by graph traversals (see eddy.core.functions.graph), hence they can be
+validated and visited directly. The model can be pickled, so it can be shipped to worker processes.
+
+A model built from diagram items is a snapshot: it is not connected to the project signals, so
+changes made to the diagrams after it has been built are not reflected in it. Consumers are meant
+to build a fresh model for each run (e.g. a validation pass or an export), and must not keep it
+around across edits.
+"""
+
+from eddy.core.datatypes.graphol import Direction, Item, Restriction
+from eddy.core.regex import RE_CARDINALITY
+
+
+EMPTY = frozenset()
+
+
+class AdjacencyIndex(object):
+    """
+    Mixin providing neighbour queries to graph nodes (both model nodes and diagram nodes).
+
+    Next to the set of attached edges, nodes keep an index of the same edges keyed by
+    (edge type, direction) which is updated in addEdge/removeEdge, so that typed queries
+    only visit the edges of the requested type. Equivalence edges are symmetric, hence they
+    are indexed in both directions. Classes using this mixin must initialize the 'edges'
+    set and the 'adjacency' dict.
+    """
+    __slots__ = ()
+
+    def addEdge(self, edge):
+        """
+        Add the given edge to the current node.
+        :type edge: T <= AbstractEdge|GraphEdge
+        """
+        self.edges.add(edge)
+        self.indexEdge(edge)
+
+    def adjacentEdges(self, edgeType, direction):
+        """
+        Returns the set of edges of the given type attached to this node in the given direction.
+        The returned set is the one stored in the adjacency index and must not be modified.
+        :type edgeType: Item
+        :type direction: Direction
+        :rtype: T <= set|frozenset
+        """
+        return self.adjacency.get((edgeType, direction), EMPTY)
+
+    def adjacentNodes(self, filter_on_edges=None, filter_on_nodes=None):
+        """
+        Returns the set of adjacent nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        nodes = {e.other(self) for e in self.edges if not filter_on_edges or filter_on_edges(e)}
+        return {x for x in nodes if filter_on_nodes(x)} if filter_on_nodes else nodes
+
+    def adjacentNodesOf(self, edgeType, skip=None):
+        """
+        Returns the set of nodes connected to this node through edges of the given type.
+        :type edgeType: Item
+        :type skip: T <= AbstractEdge|GraphEdge
+        :rtype: set
+        """
+        adjacency = self.adjacency
+        edges = adjacency.get((edgeType, Direction.Incoming), EMPTY) | adjacency.get((edgeType, Direction.Outgoing), EMPTY)
+        return {e.other(self) for e in edges if e is not skip}
+
+    def incomingNodes(self, filter_on_edges=None, filter_on_nodes=None):
+        """
+        Returns the set of incoming nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        nodes = {e.other(self) for e in self.edges \
+                    if (e.target is self or e.type() is Item.EquivalenceEdge) \
+                        and (not filter_on_edges or filter_on_edges(e))}
+        return {x for x in nodes if filter_on_nodes(x)} if filter_on_nodes else nodes
+
+    def incomingNodesOf(self, edgeType, skip=None):
+        """
+        Returns the set of nodes connected to this node through incoming edges of the given type.
+        :type edgeType: Item
+        :type skip: T <= AbstractEdge|GraphEdge
+        :rtype: set
+        """
+        return {e.other(self) for e in self.adjacency.get((edgeType, Direction.Incoming), EMPTY) if e is not skip}
+
+    def indexEdge(self, edge):
+        """
+        Store the given edge in the adjacency index according to its current endpoints.
+        Must be called again whenever the endpoints of an already attached edge are swapped.
+        :type edge: T <= AbstractEdge|GraphEdge
+        """
+        self.unindexEdge(edge)
+        edgeType = edge.type()
+        if edge.target is self or edgeType is Item.EquivalenceEdge:
+            self.adjacency.setdefault((edgeType, Direction.Incoming), set()).add(edge)
+        if edge.source is self or edgeType is Item.EquivalenceEdge:
+            self.adjacency.setdefault((edgeType, Direction.Outgoing), set()).add(edge)
+
+    def outgoingNodes(self, filter_on_edges=None, filter_on_nodes=None):
+        """
+        Returns the set of outgoing nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        nodes = {e.other(self) for e in self.edges \
+                    if (e.source is self or e.type() is Item.EquivalenceEdge) \
+                        and (not filter_on_edges or filter_on_edges(e))}
+        return {x for x in nodes if filter_on_nodes(x)} if filter_on_nodes else nodes
+
+    def outgoingNodesOf(self, edgeType, skip=None):
+        """
+        Returns the set of nodes connected to this node through outgoing edges of the given type.
+        :type edgeType: Item
+        :type skip: T <= AbstractEdge|GraphEdge
+        :rtype: set
+        """
+        return {e.other(self) for e in self.adjacency.get((edgeType, Direction.Outgoing), EMPTY) if e is not skip}
+
+    def removeEdge(self, edge):
+        """
+        Remove the given edge from the current node.
+        :type edge: T <= AbstractEdge|GraphEdge
+        """
+        self.edges.discard(edge)
+        self.unindexEdge(edge)
+
+    def unindexEdge(self, edge):
+        """
+        Remove the given edge from the adjacency index.
+        :type edge: T <= AbstractEdge|GraphEdge
+        """
+        edgeType = edge.type()
+        for direction in (Direction.Incoming, Direction.Outgoing):
+            edges = self.adjacency.get((edgeType, direction))
+            if edges is not None:
+                edges.discard(edge)
+
+
+class GraphElement(object):
+    """
+    Base class for the elements of the graph model.
+    """
+    __slots__ = ('diagram', 'id', '_type')
+
+    def __init__(self, diagram, id, item):
+        """
+        Initialize the element.
+        :type diagram: str
+        :type id: str
+        :type item: Item
+        """
+        self.diagram = diagram
+        self.id = id
+        self._type = item
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def key(self):
+        """
+        Returns the key identifying this element in the graph model.
+        :rtype: tuple
+        """
+        return self.diagram, self.id
+
+    @property
+    def name(self):
+        """
+        Returns the element readable name.
+        :rtype: str
+        """
+        return self._type.realName
+
+    @property
+    def shortName(self):
+        """
+        Returns the element readable short name.
+        :rtype: str
+        """
+        return self._type.shortName
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def isEdge(self):
+        """
+        Returns True if this element is an edge, False otherwise.
+        :rtype: bool
+        """
+        return Item.InclusionEdge <= self._type <= Item.MembershipEdge
+
+    def isNode(self):
+        """
+        Returns True if this element is a node, False otherwise.
+        :rtype: bool
+        """
+        return Item.ConceptNode <= self._type < Item.InclusionEdge
+
+    def type(self):
+        """
+        Returns the type of this element.
+        :rtype: Item
+        """
+        return self._type
+
+    def __repr__(self):
+        """
+        Returns repr(self).
+        """
+        return '{0}:{1}:{2}'.format(self._type.shortName, self.diagram, self.id)
+
+
+class GraphNode(AdjacencyIndex, GraphElement):
+    """
+    Node of the graph model.
+    """
+    __slots__ = ('edges', 'adjacency', 'attrs', '_identities', '_identity', '_text')
+
+    def __init__(self, diagram, id, item, identity, identities, text, attrs=None):
+        """
+        Initialize the node.
+        :type diagram: str
+        :type id: str
+        :type item: Item
+        :type identity: Identity
+        :type identities: set
+        :type text: str
+        :type attrs: dict
+        """
+        super().__init__(diagram, id, item)
+        self.attrs = attrs
+        self.edges = set()
+        self.adjacency = {}
+        self._identities = identities
+        self._identity = identity
+        self._text = text
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def datatype(self):
+        """
+        Returns the datatype associated with this node (if any).
+        :rtype: Datatype
+        """
+        return self.attrs.get('datatype') if self.attrs else None
+
+    @property
+    def facet(self):
+        """
+        Returns the facet associated with this node (if any).
+        :rtype: Facet
+        """
+        return self.attrs.get('facet') if self.attrs else None
+
+    @property
+    def identityName(self):
+        """
+        Returns the name of the identity of this node (i.e: Concept, Role, ...).
+        :rtype: str
+        """
+        return self._identity.value
+
+    @property
+    def value(self):
+        """
+        Returns the value associated with this node (if any).
+        :rtype: str
+        """
+        return self.attrs.get('value') if self.attrs else None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def cardinality(self, *args):
+        """
+        Returns the cardinality of the node (restriction nodes only).
+        :rtype: T <= int|dict
+        """
+        cardinality = {'min': None, 'max': None}
+        match = RE_CARDINALITY.match(self._text)
+        if match:
+            if match.group('min') != '-':
+                cardinality['min'] = int(match.group('min'))
+            if match.group('max') != '-':
+                cardinality['max'] = int(match.group('max'))
+        if args:
+            cardinality = {k: v for k, v in cardinality.items() if k in args}
+            if len(cardinality) == 1:
+                cardinality = next(iter(cardinality.values()))
+        return cardinality
+
+    def definition(self):
+        """
+        Returns the set of nodes which contribute to the definition of this node.
+        :rtype: set
+        """
+        if self.isConstructor() and self._type not in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
+            return set(self.incomingNodesOf(Item.InputEdge))
+        if self._type in {Item.RoleNode, Item.AttributeNode}:
+            return {x for x in self.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}}
+        return set()
+
+    def identities(self):
+        """
+        Returns the set of identities supported by this node.
+        :rtype: set
+        """
+        return self._identities
+
+    def identity(self):
+        """
+        Returns the identity of the current node.
+        :rtype: Identity
+        """
+        return self._identity
+
+    def isConstructor(self):
+        """
+        Returns True if this node is a contructor node, False otherwise.
+        :rtype: bool
+        """
+        return Item.DomainRestrictionNode <= self._type <= Item.FacetNode
+
+    def isPredicate(self):
+        """
+        Returns True if this node is a predicate node, False otherwise.
+        :rtype: bool
+        """
+        return Item.ConceptNode <= self._type <= Item.IndividualNode
+
+    def isRestrictionQualified(self):
+        """
+        Returns True if this node expresses a qualified restriction (exists R.C), False otherwise.
+        :rtype: bool
+        """
+        return self.attrs.get('qualified', False) if self.attrs else False
+
+    def restriction(self):
+        """
+        Returns the restriction type of the node (restriction nodes only).
+        :rtype: Restriction
+        """
+        return Restriction.forLabel(self._text)
+
+    def text(self):
+        """
+        Returns the label text.
+        :rtype: str
+        """
+        return self._text
+
+
+class GraphEdge(GraphElement):
+    """
+    Edge of the graph model.
+    """
+    __slots__ = ('source', 'target')
+
+    def __init__(self, diagram, id, item, source, target):
+        """
+        Initialize the edge.
+        :type diagram: str
+        :type id: str
+        :type item: Item
+        :type source: GraphNode
+        :type target: GraphNode
+        """
+        super().__init__(diagram, id, item)
+        self.source = source
+        self.target = target
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def other(self, node):
+        """
+        Returns the opposite endpoint of the given node.
+        :raise AttributeError: if the given node is not an endpoint of this edge.
+        :type node: GraphNode
+        :rtype: GraphNode
+        """
+        if node is self.source:
+            return self.target
+        elif node is self.target:
+            return self.source
+        raise AttributeError('node {0} is not attached to edge {1}'.format(node, self))
+
+
+class GraphModel(object):
+    """
+    Graph model of a project: nodes and edges are indexed by (diagram name, item id).
+    The model is not kept in sync with the diagram items it has been built from.
+    """
+    def __init__(self):
+        """
+        Initialize the graph model.
+        """
+        self._nodes = {}
+        self._edges = {}
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addEdge(self, diagram, id, item, source, target):
+        """
+        Add an edge connecting the given endpoints (given as node keys) to the model.
+        :type diagram: str
+        :type id: str
+        :type item: Item
+        :type source: tuple
+        :type target: tuple
+        :rtype: GraphEdge
+        """
+        source = self._nodes[source]
+        target = self._nodes[target]
+        edge = GraphEdge(diagram, id, item, source, target)
+        source.addEdge(edge)
+        target.addEdge(edge)
+        self._edges[edge.key] = edge
+        return edge
+
+    def addItem(self, item):
+        """
+        Mirror the given diagram item (node or edge) into the model.
+        Nodes must be added before the edges connecting them.
+        :type item: AbstractItem
+        :rtype: GraphElement
+        """
+        diagram = item.diagram.name
+        if item.isNode():
+            attrs = {}
+            for attr in ('datatype', 'facet', 'value'):
+                value = getattr(item, attr, None)
+                if value is not None:
+                    attrs[attr] = value
+            if hasattr(item, 'isRestrictionQualified'):
+                attrs['qualified'] = item.isRestrictionQualified()
+            return self.addNode(diagram, item.id, item.type(), item.identity(), item.identities(), item.text(), attrs or None)
+        if item.isEdge() and item.source and item.target:
+            return self.addEdge(diagram, item.id, item.type(), (diagram, item.source.id), (diagram, item.target.id))
+        return None
+
+    def addNode(self, diagram, id, item, identity, identities, text, attrs=None):
+        """
+        Add a node to the model.
+        :type diagram: str
+        :type id: str
+        :type item: Item
+        :type identity: Identity
+        :type identities: set
+        :type text: str
+        :type attrs: dict
+        :rtype: GraphNode
+        """
+        node = GraphNode(diagram, id, item, identity, identities, text, attrs)
+        self._nodes[node.key] = node
+        return node
+
+    def edge(self, diagram, id):
+        """
+        Returns the edge matching the given diagram name and id, or None if no edge is found.
+        :type diagram: str
+        :type id: str
+        :rtype: GraphEdge
+        """
+        return self._edges.get((diagram, id))
+
+    def edges(self):
+        """
+        Returns a collection with all the edges in the model.
+        :rtype: list
+        """
+        return list(self._edges.values())
+
+    @classmethod
+    def fromItems(cls, items):
+        """
+        Build a snapshot of the given collection of diagram items.
+        :type items: T <= list|set|tuple
+        :rtype: GraphModel
+        """
+        model = cls()
+        items = list(items)
+        for item in items:
+            if item.isNode():
+                model.addItem(item)
+        for item in items:
+            if item.isEdge():
+                model.addItem(item)
+        return model
+
+    @classmethod
+    def fromProject(cls, project):
+        """
+        Build a snapshot of all the items of the given project: later edits are not reflected in it.
+        Diagrams which have not been materialized yet are materialized first.
+        :type project: Project
+        :rtype: GraphModel
+        """
+        project.materialize()
+        return cls.fromItems(project.items())
+
+    def node(self, diagram, id):
+        """
+        Returns the node matching the given diagram name and id, or None if no node is found.
+        :type diagram: str
+        :type id: str
+        :rtype: GraphNode
+        """
+        return self._nodes.get((diagram, id))
+
+    def nodes(self):
+        """
+        Returns a collection with all the nodes in the model.
+        :rtype: list
+        """
+        return list(self._nodes.values())
+
+    def removeEdge(self, edge):
+        """
+        Remove the given edge from the model.
+        :type edge: GraphEdge
+        """
+        edge.source.removeEdge(edge)
+        edge.target.removeEdge(edge)
+        self._edges.pop(edge.key, None)
+
+    def removeNode(self, node):
+        """
+        Remove the given node, and all the edges attached to it, from the model.
+        :type node: GraphNode
+        """
+        for edge in list(node.edges):
+            self.removeEdge(edge)
+        self._nodes.pop(node.key, None)
+
+    def __getstate__(self):
+        """
+        Returns a flat representation of the model, to avoid deep recursion while pickling.
+        :rtype: dict
+        """
+        return {
+            'nodes': [(n.diagram, n.id, n._type, n._identity, n._identities, n._text, n.attrs) for n in self._nodes.values()],
+            'edges': [(e.diagram, e.id, e._type, e.source.key, e.target.key) for e in self._edges.values()],
+        }
+
+    def __len__(self):
+        """
+        Returns the number of elements (nodes and edges) in the model.
+        :rtype: int
+        """
+        return len(self._nodes) + len(self._edges)
+
+    def __setstate__(self, state):
+        """
+        Rebuild the model from its flat representation.
+        :type state: dict
+        """
+        self._nodes = {}
+        self._edges = {}
+        for args in state['nodes']:
+            self.addNode(*args)
+        for args in state['edges']:
+            self.addEdge(*args)
@@ -33,20 +33,113 @@
 ##########################################################################
 
 
-import io
-import sys
+import json
 import logging
+import logging.handlers
+import sys
+import time
 
+from collections import deque
+from contextlib import contextmanager
 from math import ceil, floor
 from eddy import APPNAME
 
 
+class LogBuffer(logging.Handler):
+    """
+    Logging handler keeping the most recent formatted records in a fixed-capacity ring buffer.
+    When a rotation file is configured, records evicted from the buffer are written to it, and
+    the file is in turn rotated when it grows over the given size (see RotatingFileHandler).
+    """
+    def __init__(self, capacity=5000):
+        """
+        Initialize the buffer.
+        :type capacity: int
+        """
+        super().__init__()
+        self.buffer = deque(maxlen=capacity)
+        self.rotation = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def capacity(self):
+        """
+        Returns the maximum number of records kept in memory.
+        :rtype: int
+        """
+        return self.buffer.maxlen
+
+    def clear(self):
+        """
+        Discard all the records currently kept in memory.
+        """
+        self.acquire()
+        try:
+            self.buffer.clear()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Flush the buffer to the rotation file (if any) and release its resources.
+        """
+        self.acquire()
+        try:
+            if self.rotation:
+                for line in self.buffer:
+                    self.rotation.emit(logging.makeLogRecord({'msg': line}))
+                self.rotation.close()
+                self.rotation = None
+        finally:
+            self.release()
+        super().close()
+
+    def emit(self, record):
+        """
+        Store the given record in the buffer, evicting the oldest one if the buffer is full.
+        :type record: LogRecord
+        """
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+        else:
+            if self.rotation and len(self.buffer) == self.buffer.maxlen:
+                self.rotation.emit(logging.makeLogRecord({'msg': self.buffer[0]}))
+            self.buffer.append(line)
+
+    def getvalue(self):
+        """
+        Returns the content of the buffer (mimics StringIO so that it can be used as default stream).
+        :rtype: str
+        """
+        return ''.join('{0}\n'.format(line) for line in list(self.buffer))
+
+    def setRotation(self, path, maxBytes=1048576, backupCount=3):
+        """
+        Set the file where records evicted from the buffer are written.
+        :type path: str
+        :type maxBytes: int
+        :type backupCount: int
+        """
+        self.acquire()
+        try:
+            if self.rotation:
+                self.rotation.close()
+            self.rotation = logging.handlers.RotatingFileHandler(path, maxBytes=maxBytes, backupCount=backupCount, encoding='utf-8', delay=True)
+            self.rotation.setFormatter(logging.Formatter('%(message)s'))
+        finally:
+            self.release()
+
+
 class OutputHandler(logging.Logger):
     """
     Custom logging output handler class.
     """
     HeadLength = 92
-    Stream = io.StringIO()
+    Stream = LogBuffer()
 
     #############################################
     #   AUXILIARY METHODS
@@ -56,7 +149,7 @@ class OutputHandler(logging.Logger):
     def getDefaultStream(cls):
         """
         Returns the default stream for this logger class.
-        :rtype: StringIO
+        :rtype: LogBuffer
         """
         return OutputHandler.Stream
 
@@ -118,8 +211,8 @@ def getLogger(name=APPNAME):
     if not name in __output:
         # CREATE A FORMATTER
         formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s', '%Y/%m/%d %H:%M:%S')
-        # IN-MEMORY STREAM HANDLER
-        handler = logging.StreamHandler(OutputHandler.getDefaultStream())
+        # IN-MEMORY RING BUFFER
+        handler = OutputHandler.getDefaultStream()
         handler.setFormatter(formatter)
         logger = logging.getLogger(name)
         logger.setLevel(logging.DEBUG)
@@ -133,4 +226,181 @@ def getLogger(name=APPNAME):
         # STORE THE LOGGER INSTANCE
         __output[name] = logger
 
-    return __output.get(name)
\ No newline at end of file
+    return __output.get(name)
+
+
+class PerfFormatter(logging.Formatter):
+    """
+    Formats performance records as JSON objects (one per line).
+    """
+    def format(self, record):
+        """
+        Format the given record.
+        :type record: LogRecord
+        :rtype: str
+        """
+        event = {'time': round(record.created, 3), 'event': record.msg, 'pid': record.process}
+        event.update(record.perf)
+        return json.dumps(event, default=str)
+
+
+class PerfEvent(object):
+    """
+    Performance event being measured (see PerfChannel.measure).
+    """
+    __slots__ = ('fields', 'last', 'name', 'phases', 'start')
+
+    def __init__(self, name, fields):
+        """
+        Initialize the event.
+        :type name: str
+        :type fields: dict
+        """
+        self.name = name
+        self.fields = fields
+        self.phases = {}
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Record the time elapsed since the previous mark (or the start of the event) as the given phase.
+        :type phase: str
+        """
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self.last) * 1000, 3)
+        self.last = now
+
+    def set(self, **kwargs):
+        """
+        Add the given fields to the event.
+        """
+        self.fields.update(kwargs)
+
+
+class NullEvent(object):
+    """
+    Performance event used when the channel is disabled: it does not measure anything.
+    """
+    __slots__ = ()
+
+    name = None
+
+    def mark(self, phase):
+        pass
+
+    def set(self, **kwargs):
+        pass
+
+
+class PerfChannel(object):
+    """
+    Structured, machine-readable channel for performance events (load and save durations,
+    validation times, export phases). Events are written as JSON lines to the configured
+    handlers, separately from the application log. The channel is disabled by default, in
+    which case recording an event only costs a flag check (no timing, no formatting).
+    """
+    def __init__(self, name):
+        """
+        Initialize the channel.
+        :type name: str
+        """
+        self.logger = logging.Logger(name, logging.INFO)
+        self.logger.propagate = False
+        self.enabled = False
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def disable(self):
+        """
+        Disable the channel, closing all its handlers.
+        """
+        self.enabled = False
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def enable(self, path=None, stream=None):
+        """
+        Enable the channel, writing events to the given file (appending) or stream.
+        :type path: str
+        :type stream: file
+        """
+        handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(PerfFormatter())
+        self.logger.addHandler(handler)
+        self.enabled = True
+
+    def event(self, name, **kwargs):
+        """
+        Record the given event with the given fields.
+        :type name: str
+        """
+        if self.enabled:
+            self.logger.info(name, extra={'perf': kwargs})
+
+    def finish(self, event, **kwargs):
+        """
+        Record the given event (see PerfChannel.start) adding the given fields and its duration.
+        :type event: T <= PerfEvent|NullEvent
+        """
+        if self.enabled and event.name:
+            elapsed = round((time.perf_counter() - event.start) * 1000, 3)
+            event.fields.update(kwargs)
+            if event.phases:
+                event.fields['phases'] = event.phases
+            self.event(event.name, elapsed=elapsed, **event.fields)
+
+    def isEnabled(self):
+        """
+        Returns True if the channel is enabled, False otherwise.
+        :rtype: bool
+        """
+        return self.enabled
+
+    @contextmanager
+    def measure(self, name, **kwargs):
+        """
+        Measure the duration of the wrapped block and record it as the given event.
+        The yielded event can be used to mark phases and to add fields to the event.
+        If the wrapped block raises, the event is recorded anyway with the name of the exception
+        class in its 'error' field, and the exception is propagated.
+        USAGE:
+            with PERF.measure('project.load', path=path) as event:
+                # do stuff
+                event.mark('phase')
+        :type name: str
+        """
+        event = self.start(name, **kwargs)
+        try:
+            yield event
+        except Exception as e:
+            event.set(error=e.__class__.__name__)
+            raise
+        finally:
+            self.finish(event)
+
+    def start(self, name, **kwargs):
+        """
+        Start measuring the given event: the event is recorded when passed to PerfChannel.finish.
+        :type name: str
+        :rtype: T <= PerfEvent|NullEvent
+        """
+        if self.enabled:
+            return PerfEvent(name, kwargs)
+        return NULL_EVENT
+
+
+NULL_EVENT = NullEvent()
+
+
+__perf = PerfChannel('{0}.perf'.format(APPNAME))
+
+
+def getPerfLogger():
+    """
+    Returns the channel for structured performance events.
+    :rtype: PerfChannel
+    """
+    return __perf
@@ -36,6 +36,7 @@
 import inspect
 import os
 import re
+import time
 
 from abc import ABCMeta
 from configparser import ConfigParser, NoOptionError
@@ -45,6 +46,8 @@ from zipimport import zipimporter
 from verlib import NormalizedVersion
 
 from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtWidgets
 
 from eddy.core.common import HasActionSystem, HasMenuSystem, HasWidgetSystem
 from eddy.core.datatypes.system import File
@@ -52,6 +55,7 @@ from eddy.core.functions.misc import first, lstrip, rstrip
 from eddy.core.functions.fsystem import fcopy, fexists, fread, fremove
 from eddy.core.functions.fsystem import isdir, mkdir, rmdir
 from eddy.core.functions.path import expandPath, isSubPath
+from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
 
 
@@ -261,6 +265,46 @@ class PluginSpec(ConfigParser):
         """
         return expandPath(self.get(section, option))
 
+    def isDeferred(self):
+        """
+        Returns True if the plugin declares at least one activation trigger, False otherwise.
+        Plugins without an [activation] section are imported and started at startup.
+        :rtype: bool
+        """
+        return any(self.has_option('activation', x) for x in ('dock', 'filetypes'))
+
+
+class PluginLoader(object):
+    """
+    Deferred import of a plugin module: the module is imported only when the plugin class is first requested.
+    """
+    def __init__(self, name, path, archive=None):
+        """
+        Initialize the plugin loader.
+        :type name: str
+        :type path: str
+        :type archive: str
+        """
+        self.name = name
+        self.path = path
+        self.archive = archive
+        self.clazz = None
+
+    def load(self):
+        """
+        Import the plugin module (if not already imported) and returns the class implementing the plugin.
+        :rtype: class
+        """
+        if not self.clazz:
+            start = time.perf_counter()
+            if self.archive:
+                module = zipimporter(self.path).load_module(self.name)
+            else:
+                module = SourceFileLoader(self.name, self.path).load_module()
+            self.clazz = PluginManager.find_class(module, self.name)
+            LOGGER.info('Imported plugin module: %s (%.1f ms)', self.name, (time.perf_counter() - start) * 1000)
+        return self.clazz
+
 
 class PluginManager(QtCore.QObject):
     """
@@ -274,6 +318,9 @@ class PluginManager(QtCore.QObject):
         :type session: Session
         """
         super().__init__(session)
+        self.deferred = {}
+        self.docks = {}
+        self.filetypes = {}
 
     #############################################
     #   PROPERTIES
@@ -287,14 +334,59 @@ class PluginManager(QtCore.QObject):
         """
         return self.parent()
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot(bool)
+    def onDockActionTriggered(self, _=False):
+        """
+        Executed when the placeholder toggle of a deferred plugin dock is triggered.
+        :type _: bool
+        """
+        action = self.sender()
+        plugin = self.activate(action.data())
+        if plugin:
+            for widget in plugin.widgets():
+                if isinstance(widget, QtWidgets.QDockWidget):
+                    widget.show()
+                    widget.raise_()
+
     #############################################
     #   INTERFACE
     #################################
 
+    def activate(self, plugin_id):
+        """
+        Import, create and start the deferred plugin matching the given id.
+        Will return the started plugin, or None if the plugin could not be started.
+        :type plugin_id: str
+        :rtype: AbstractPlugin
+        """
+        if plugin_id not in self.deferred:
+            return self.session.plugin(plugin_id)
+        spec, loader = self.deferred.pop(plugin_id)
+        self.undefer(plugin_id)
+        plugin_name = spec.get('plugin', 'name')
+        plugin_version = spec.get('plugin', 'version')
+        try:
+            LOGGER.info('Activating plugin: %s v%s', plugin_name, plugin_version)
+            plugin = self.create(loader.load(), spec)
+        except Exception:
+            LOGGER.exception('Failed to load plugin: %s v%s', plugin_name, plugin_version)
+            return None
+        if not self.start(plugin):
+            return None
+        self.session.addPlugin(plugin)
+        return plugin
+
     def clear(self):
         """
         Remove all the plugins from the active Session.
         """
+        for plugin_id in list(self.deferred):
+            self.undefer(plugin_id)
+        self.deferred.clear()
         self.session.clearPlugins()
 
     def create(self, clazz, spec):
@@ -306,6 +398,35 @@ class PluginManager(QtCore.QObject):
         """
         return clazz(spec, self.session)
 
+    def defer(self, spec, loader):
+        """
+        Install the activation triggers declared in the given plugin .spec, postponing the plugin import.
+        :type spec: PluginSpec
+        :type loader: PluginLoader
+        """
+        plugin_id = spec.get('plugin', 'id')
+        self.deferred[plugin_id] = (spec, loader)
+        if spec.has_option('activation', 'dock'):
+            action = QtGui.QAction(spec.get('activation', 'dock'), self.session)
+            action.setCheckable(True)
+            action.setData(plugin_id)
+            connect(action.triggered, self.onDockActionTriggered)
+            self.session.menu('view').addAction(action)
+            self.docks[plugin_id] = action
+        if spec.has_option('activation', 'filetypes'):
+            extensions = {x.extension: x for x in File}
+            for ext in spec.getList('activation', 'filetypes'):
+                filetype = extensions.get('.%s' % ext.lower().lstrip('.'))
+                if filetype:
+                    self.filetypes.setdefault(filetype, []).append(plugin_id)
+
+    def deferredFiletypes(self):
+        """
+        Returns the set of file types handled by plugins which have not been activated yet.
+        :rtype: set
+        """
+        return {x for x in self.filetypes if self.filetypes[x]}
+
     def dispose(self, plugin):
         """
         Dispose the given plugin.
@@ -339,8 +460,7 @@ class PluginManager(QtCore.QObject):
         Import a plugin from the given directory:
         * Lookup for the plugin .spec configuration file.
         * Search for the module where the plugin is implemented.
-        * Search for the class implementing the plugin.
-        * Import the plugin module.
+        * Prepare a loader which will import the plugin module on first use.
         :type directory: str
         :rtype: tuple
         """
@@ -355,9 +475,7 @@ class PluginManager(QtCore.QObject):
                         plugin_path = os.path.join(directory, '%s%s' % (plugin_name, extension))
                         if fexists(plugin_path):
                             #LOGGER.debug('Found plugin module: %s', plugin_path)
-                            plugin_module = SourceFileLoader(plugin_name, plugin_path).load_module()
-                            plugin_class = PluginManager.find_class(plugin_module, plugin_name)
-                            return plugin_spec, plugin_class
+                            return plugin_spec, PluginLoader(plugin_name, plugin_path)
                     else:
                         raise PluginError('missing plugin module: %s.py(c|o)' % os.path.join(directory, plugin_name))
                 except Exception as e:
@@ -369,8 +487,7 @@ class PluginManager(QtCore.QObject):
         Import a plugin from the given zip archive:
         * Lookup for the plugin .spec configuration file.
         * Search for the module where the plugin is implemented.
-        * Search for the class implementing the plugin.
-        * Import the plugin module.
+        * Prepare a loader which will import the plugin module on first use.
         :type archive: str
         :rtype: tuple
         """
@@ -392,9 +509,7 @@ class PluginManager(QtCore.QObject):
                             plugin_zip_module_path = '%s%s' % (plugin_zip_module_base_path, extension)
                             if plugin_zip_module_path in zf_name_list:
                                 #LOGGER.debug('Found plugin module: %s', os.path.join(archive, plugin_zip_module_path))
-                                plugin_module = zipimporter(plugin_abs_base_path).load_module(plugin_name)
-                                plugin_class = PluginManager.find_class(plugin_module, plugin_name)
-                                return plugin_spec, plugin_class
+                                return plugin_spec, PluginLoader(plugin_name, plugin_abs_base_path, archive)
                         else:
                             raise PluginError('missing plugin module: %s.py(c|o)' % plugin_abs_module_base_path)
                     except Exception as e:
@@ -403,6 +518,8 @@ class PluginManager(QtCore.QObject):
     def init(self):
         """
         Initialize previously looked up plugins returning the list of successfully initialized plugins.
+        Plugins declaring activation triggers in their .spec are not imported here: they will be
+        activated the first time one of their triggers fires (see PluginManager.activate).
         :rtype: list
         """
         if not PluginManager.info:
@@ -424,9 +541,14 @@ class PluginManager(QtCore.QObject):
             plugin_name = entry[0].get('plugin', 'name')
             plugin_version = entry[0].get('plugin', 'version')
             if plugin_id not in pluginsLoadedSet:
+                if entry[0].isDeferred():
+                    LOGGER.info('Deferring plugin: %s v%s', plugin_name, plugin_version)
+                    self.defer(entry[0], entry[1])
+                    pluginsLoadedSet.add(plugin_id)
+                    continue
                 try:
                     LOGGER.info('Loading plugin: %s v%s', plugin_name, plugin_version)
-                    plugin = self.create(entry[1], entry[0])
+                    plugin = self.create(entry[1].load(), entry[0])
                 except Exception:
                     LOGGER.exception('Failed to load plugin: %s v%s', plugin_name, plugin_version)
                 else:
@@ -521,6 +643,14 @@ class PluginManager(QtCore.QObject):
                     info.append(PluginManager.import_plugin_from_zip(file_or_directory_path))
         PluginManager.info = list(filter(None, info))
 
+    def require(self, filetype):
+        """
+        Activate all the deferred plugins handling the given file type.
+        :type filetype: File
+        """
+        for plugin_id in list(self.filetypes.get(filetype, ())):
+            self.activate(plugin_id)
+
     @classmethod
     def spec(cls, content):
         """
@@ -543,12 +673,14 @@ class PluginManager(QtCore.QObject):
         :rtype: bool
         """
         LOGGER.info('Starting plugin: %s v%s', plugin.name(), plugin.version())
+        start = time.perf_counter()
         try:
             plugin.start()
         except Exception:
             LOGGER.exception('An error occurred while starting plugin: %s v%s', plugin.name(), plugin.version())
             return False
         else:
+            LOGGER.info('Started plugin: %s v%s (%.1f ms)', plugin.name(), plugin.version(), (time.perf_counter() - start) * 1000)
             self.session.sgnPluginStarted.emit(plugin.id())
             return True
 
@@ -565,6 +697,19 @@ class PluginManager(QtCore.QObject):
             elif fexists(path):
                 fremove(path)
 
+    def undefer(self, plugin_id):
+        """
+        Remove the activation triggers installed for the given deferred plugin.
+        :type plugin_id: str
+        """
+        action = self.docks.pop(plugin_id, None)
+        if action:
+            self.session.menu('view').removeAction(action)
+            action.deleteLater()
+        for filetype in self.filetypes:
+            if plugin_id in self.filetypes[filetype]:
+                self.filetypes[filetype].remove(plugin_id)
+
 
 class PluginError(RuntimeError):
     """
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import builtins
+import importlib.util
+import sys
+import time
+
+
+class ImportProfiler(object):
+    """
+    Measure the time spent importing modules by wrapping the builtin import function.
+    Only modules which are actually loaded while the profiler is installed are recorded.
+    USAGE:
+        profiler = ImportProfiler()
+        profiler.install()
+        # import stuff
+        profiler.uninstall()
+        profiler.report()
+    """
+    def __init__(self):
+        """
+        Initialize the profiler.
+        """
+        self.original = builtins.__import__
+        self.records = {}
+        self.stack = []
+        self.start = time.perf_counter()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def install(self):
+        """
+        Install the profiler.
+        """
+        self.start = time.perf_counter()
+        builtins.__import__ = self.profile
+
+    def profile(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        Replacement for the builtin import function recording the time spent loading new modules.
+        :type name: str
+        :type globals: dict
+        :type locals: dict
+        :type fromlist: tuple
+        :type level: int
+        :rtype: module
+        """
+        key = name
+        if level > 0:
+            try:
+                key = importlib.util.resolve_name('.' * level + name, (globals or {}).get('__package__'))
+            except (ImportError, ValueError):
+                pass
+        module = sys.modules.get(key)
+        if module:
+            missing = [x for x in fromlist or () if x != '*' and not hasattr(module, x)]
+            if not missing:
+                return self.original(name, globals, locals, fromlist, level)
+            key = '{0}.{1}'.format(key, ','.join(missing))
+        self.stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            own, cumulative = self.records.get(key, (0.0, 0.0))
+            self.records[key] = (own + elapsed - children, cumulative + elapsed)
+
+    def report(self, limit=25, stream=None):
+        """
+        Print the import-time breakdown, sorted by cumulative time.
+        :type limit: int
+        :type stream: file
+        """
+        stream = stream or sys.stderr
+        elapsed = (time.perf_counter() - self.start) * 1000
+        total = sum(x[0] for x in self.records.values()) * 1000
+        stream.write('Startup completed in {0:.1f} ms ({1:.1f} ms importing {2} modules)\n'.format(elapsed, total, len(self.records)))
+        stream.write('{0:>10} {1:>10}  {2}\n'.format('self [ms]', 'cumul [ms]', 'module'))
+        for name, (own, cumulative) in sorted(self.records.items(), key=lambda x: x[1][1], reverse=True)[:limit]:
+            stream.write('{0:>10.1f} {1:>10.1f}  {2}\n'.format(own * 1000, cumulative * 1000, name))
+        stream.flush()
+
+    def uninstall(self):
+        """
+        Restore the builtin import function.
+        """
+        builtins.__import__ = self.original
@@ -198,7 +198,7 @@ class InclusionBetweenRoleExpressionAndComplementNodeRule(ProfileEdgeRule):
 
                     if target.type() is Item.ComplementNode:
 
-                        if target.adjacentNodes(filter_on_edges=lambda x: x is not edge):
+                        if target.edges - {edge}:
                             # Here we target a Complement node which is still Neutral, but it may be connected
                             # to many other Neutral nodes (operators), therefore we must inspect all the nodes
                             # attached to this target node and see if they admits the Role identity.
@@ -228,7 +228,7 @@ class InclusionBetweenAttributeExpressionAndComplementNodeRule(ProfileEdgeRule):
 
                     if target.type() is Item.ComplementNode:
 
-                        if target.adjacentNodes(filter_on_edges=lambda x: x is not edge):
+                        if target.edges - {edge}:
                             # Here we target a Complement node which is still Neutral, but it may be connected
                             # to many other Neutral nodes (operators), therefore we must inspect all the nodes
                             # attached to this target node and see if they admits the Attribute identity.
@@ -288,7 +288,7 @@ class InputToComplementNodeRule(ProfileEdgeRule):
                     # Source node identity is not supported by the target node.
                     raise ProfileError('Invalid input to {}: {}'.format(target.name, source.identityName))
                 
-                if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) > 0:
+                if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) > 0:
                     # The Complement operator may have at most one node connected to it.
                     raise ProfileError('Too many inputs to {}'.format(target.name))
                 
@@ -299,7 +299,7 @@ class InputToComplementNodeRule(ProfileEdgeRule):
                     # and NegativeDataPropertyAssertion. This prevents the connection of Role
                     # expressions to Complement nodes that are given as inputs to Enumeration,
                     # Union and Disjoint Union operator nodes.
-                    if len(target.outgoingNodes(lambda x: x.type() in {Item.InputEdge, Item.InclusionEdge})) > 0:
+                    if target.outgoingNodesOf(Item.InputEdge) or target.outgoingNodesOf(Item.InclusionEdge):
                         raise ProfileError('Invalid negative {} expression'.format(source.identityName))
                     
                 if source.identity() is Identity.ValueDomain and target.identity() is Identity.Neutral:
@@ -314,10 +314,9 @@ class InputToComplementNodeRule(ProfileEdgeRule):
                     # DataPropertyRange axiom.
                     f1 = lambda x: x.type() is Item.InputEdge and x is not edge
                     f2 = lambda x: x.identity() is Identity.Neutral
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
                     for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
-                        if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
+                        if node.outgoingNodesOf(Item.InclusionEdge) or \
+                            any(x.type() is not Item.RangeRestrictionNode for x in node.incomingNodesOf(Item.InclusionEdge)):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
 
@@ -362,10 +361,9 @@ class InputToIntersectionOrUnionNodeRule(ProfileEdgeRule):
                     # DataPropertyRange axiom.
                     f1 = lambda x: x.type() is Item.InputEdge and x is not edge
                     f2 = lambda x: x.identity() is Identity.Neutral
-                    f3 = lambda x: x.type() is Item.InclusionEdge
-                    f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
                     for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
-                        if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
+                        if node.outgoingNodesOf(Item.InclusionEdge) or \
+                            any(x.type() is not Item.RangeRestrictionNode for x in node.incomingNodesOf(Item.InclusionEdge)):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
 
@@ -393,14 +391,12 @@ class InputToEnumerationNodeRule(ProfileEdgeRule):
                     if source.identity() is Identity.Value and target.identity() is Identity.Concept:
                         raise ProfileError('Invalid input to {}: {}'.format(target.name, source.identityName))
 
-                f1 = lambda x: x.type() is Item.InputEdge
-                f2 = lambda x: x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
-                f3 = lambda x: x.type() is Item.InputEdge and x is not edge
-                node = first(target.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                restrictions = {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
+                node = first(x for x in target.outgoingNodesOf(Item.InputEdge) if x.type() in restrictions)
                 if node:
                     # If this Enumeration node is acting as filler for a domain/range restriction
                     # we need to check for the Enumeration node to have at most one input.
-                    if len(target.incomingNodes(filter_on_edges=f3)) > 0:
+                    if target.incomingNodesOf(Item.InputEdge, skip=edge):
                         raise ProfileError('Enumeration acting as filler for qualified {} can have at most one input'.format(node.shortName))
 
 
@@ -421,7 +417,7 @@ class InputToRoleInverseNodeRule(ProfileEdgeRule):
                     # node will construct a new Role whose instances are {(o2,o1), (o3,o1), (o5,o4)}.
                     raise ProfileError('Invalid input to {}: {}'.format(target.name, source.name))
 
-                if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) > 0:
+                if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) > 0:
                     # The Role Inverse operator may have at most one Role node connected to it: if we need to
                     # define multiple Role inverse we would need to use multiple Role Inverse operator nodes.
                     raise ProfileError('Too many inputs to {}'.format(target.name))
@@ -466,18 +462,14 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
 
                 if source.type() is Item.ValueDomainNode:
 
-                    f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                    f2 = lambda x: x.type() is Item.ValueDomainNode
-                    if len(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)) > 0:
+                    if any(x.type() is Item.ValueDomainNode for x in target.incomingNodesOf(Item.InputEdge, skip=edge)):
                         # The value-domain has already been attached to the DatatypeRestriction.
                         raise ProfileError('Too many value-domain nodes in input to datatype restriction node')
 
                     # Check if a Facet node is already connected to this node: if
                     # so we need to check whether the datatype in input and the
                     # already connected Facet are compatible.
-                    f1 = lambda x: x.type() is Item.InputEdge
-                    f2 = lambda x: x.type() is Item.FacetNode
-                    node = first(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    node = first(x for x in target.incomingNodesOf(Item.InputEdge) if x.type() is Item.FacetNode)
                     if node:
                         if node.facet not in Facet.forDatatype(source.datatype):
                             nA = source.datatype.value
@@ -489,9 +481,7 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
                     # We need to check if the DatatypeRestriction node has already datatype
                     # connected: if that's the case we need to check whether the Facet we
                     # want to attach to the datatype restriction node supports it.
-                    f1 = lambda x: x.type() is Item.InputEdge
-                    f2 = lambda x: x.type() is Item.ValueDomainNode
-                    node = first(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    node = first(x for x in target.incomingNodesOf(Item.InputEdge) if x.type() is Item.ValueDomainNode)
                     if node:
                         if source.facet not in Facet.forDatatype(node.datatype):
                             nA = source.facet.value
@@ -514,7 +504,7 @@ class InputToPropertyAssertionNodeRule(ProfileEdgeRule):
                     # used to construct ObjectPropertyAssertion and DataPropertyAssertion axioms.
                     raise ProfileError('Invalid input to {}: {}'.format(target.name, source.name))
 
-                if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) >= 2:
+                if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) >= 2:
                     # At most 2 Individual nodes can be connected to a PropertyAssertion node. As an example
                     # we can construct ObjectPropertyAssertion(presiede M.Draghi BCE) where the individuals
                     # are identified by M.Draghi and BCE, or DataPropertyAssertion(nome M.Draghi "Mario") where
@@ -531,17 +521,13 @@ class InputToPropertyAssertionNodeRule(ProfileEdgeRule):
 
                     if source.identity() is Identity.Individual:
 
-                        f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                        f2 = lambda x: x.identity() is Identity.Individual
-                        if len(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)) > 0:
+                        if any(x.identity() is Identity.Individual for x in target.incomingNodesOf(Item.InputEdge, skip=edge)):
                             # We are constructing a DataPropertyAssertion and so we can't have more than 1 instance.
                             raise ProfileError('Too many individuals in input to {}'.format(target.identityName))
 
                     if source.identity() is Identity.Value:
 
-                        f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                        f2 = lambda x: x.identity() is Identity.Value
-                        if len(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)) > 0:
+                        if any(x.identity() is Identity.Value for x in target.incomingNodesOf(Item.InputEdge, skip=edge)):
                             # At most one value can be given as input (2 instance | 1 instance + 1 value)
                             raise ProfileError('Too many values in input to {}'.format(target.identityName))
 
@@ -556,7 +542,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
 
             if target.type() is Item.DomainRestrictionNode:
 
-                if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) >= 2:
+                if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) >= 2:
                     # Domain Restriction node can have at most 2 inputs.
                     raise ProfileError('Too many inputs to {}'.format(target.name))
 
@@ -583,7 +569,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                         # identity among the declared ones: Concept || Attribute || Role || ValueDomain.
                         raise ProfileError('Invalid input to {}: {}'.format(target.name, source.name))
 
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node:
                         if node.identity() is Identity.Role and Identity.Concept not in source.identities():
                             # If the target node has a Role in input, we can connect the source
@@ -612,7 +598,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                         raise ProfileError('Invalid restriction type for qualified {}: {}'.format(target.shortName, name))
 
                     # A Concept can be given as input only if there is no input or if the other input is a Role.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and node.identity() is not Identity.Role:
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -624,7 +610,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                     # a ObjectSomeValuesFrom(ObjectPropertyExpression ObjectOneOf(A)) which is the extended
                     # version of ObjectHasValue(ObjectPropertyExpression A), where A is an individual.
                     if source.type() is Item.EnumerationNode:
-                        if len(source.incomingNodes(lambda x: x.type() is Item.InputEdge)) > 1:
+                        if len(source.incomingNodesOf(Item.InputEdge)) > 1:
                             raise ProfileError('Enumeration acting as filler for qualified {} can have at most one input'.format(target.shortName))
 
                 # SOURCE => ROLE EXPRESSION
@@ -632,7 +618,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                 elif source.identity() is Identity.Role:
 
                     # We can connect a Role only if there is no other input or if the other input is a Concept.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and node.identity() is not Identity.Concept:
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -648,7 +634,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                         raise ProfileError('Attributes do not have self')
 
                     # We can connect an Attribute only if there is no other input or if the other input is a ValueDomain.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and node.identity() is not Identity.ValueDomain:
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -665,7 +651,7 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
                         raise ProfileError('Invalid restriction type for qualified {}: {}'.format(target.shortName, name))
 
                     # We can connect a ValueDomain only if there is no other input or if the other input is an Attribute.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and node.identity() is not Identity.Attribute:
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -683,13 +669,11 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
 
             if target.type() is Item.RangeRestrictionNode:
 
-                if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) >= 2:
+                if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) >= 2:
                     # Range Restriction node can have at most 2 inputs.
                     raise ProfileError('Too many inputs to {}'.format(target.name))
 
-                f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                f2 = lambda x: x.type() is Item.AttributeNode
-                if len(target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)) >= 1:
+                if any(x.type() is Item.AttributeNode for x in target.incomingNodesOf(Item.InputEdge, skip=edge)):
                     # Range restriction node having an attribute as input can receive no other input.
                     raise ProfileError('Too many inputs to attribute {}'.format(target.shortName))
 
@@ -714,7 +698,7 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
                         # supported identity among the declared ones: Concept || Attribute || Role.
                         raise ProfileError('Invalid input to {}: {}'.format(target.name, source.name))
 
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node:
                         if node.identity() is Identity.Role and Identity.Concept not in source.identities():
                             # If the target node has a Role in input, we can connect the source
@@ -736,7 +720,7 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
 
                     # We can connect a Concept in input iff there is no other input or if the other
                     # input is either a Role or a Neutral node that can assume the Role identity.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and Identity.Role not in node.identities():
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -748,7 +732,7 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
                     # a ObjectSomeValuesFrom(ObjectPropertyExpression ObjectOneOf(A)) which is the extended
                     # version of ObjectHasValue(ObjectPropertyExpression A), where A is an individual.
                     if source.type() is Item.EnumerationNode:
-                        if len(source.incomingNodes(lambda x: x.type() is Item.InputEdge)) > 1:
+                        if len(source.incomingNodesOf(Item.InputEdge)) > 1:
                             raise ProfileError('Enumeration acting as filler for qualified {} can have at most one input'.format(target.shortName))
 
                 # SOURCE => ROLE EXPRESSION
@@ -762,7 +746,7 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
 
                     # We can connect a Role in input only if there is no other input or if the other
                     # input is either a Concept or a Neutral node that can assume the Concept identity.
-                    node = first(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge))
+                    node = first(target.incomingNodesOf(Item.InputEdge, skip=edge))
                     if node and Identity.Concept not in node.identities():
                         # Not a Qualified Restriction.
                         idA = source.identityName
@@ -783,7 +767,7 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
                         raise ProfileError('Invalid input to {}: {}'.format(target.name, source.name))
 
                     # We can connect an Attribute in input only if there is no other input.
-                    if len(target.incomingNodes(lambda x: x.type() is Item.InputEdge and x is not edge)) >= 1:
+                    if len(target.incomingNodesOf(Item.InputEdge, skip=edge)) >= 1:
                         # Something else is connected to this range restriction node (either a Concept
                         # or a Role) so we cannot attach the Attribute node (no DataPropertyRange).
                         raise ProfileError('Too many inputs to attribute {}'.format(target.shortName))
@@ -855,7 +839,7 @@ class MembershipFromRoleInstanceRule(ProfileEdgeRule):
                         # Here we target an incompatible node (i.e. a node which cannot express a Role).
                         raise ProfileError('Invalid target for Role assertion: {}'.format(target.name))
 
-                    if target.adjacentNodes(filter_on_edges=lambda x: x is not edge):
+                    if target.edges - {edge}:
                         # Here we target a Neutral node which is attached to something (either with
                         # inputs or outputs), therefore we must inspect all the nodes attached to this
                         # target node which are still Neutral and see if they admits the Role identity.
@@ -887,7 +871,7 @@ class MembershipFromAttributeInstanceRule(ProfileEdgeRule):
                         # Here we target an incompatible node (i.e. a node which cannot express an Attribute).
                         raise ProfileError('Invalid target for Attribute assertion: {}'.format(target.name))
 
-                    if target.adjacentNodes(filter_on_edges=lambda x: x is not edge):
+                    if target.edges - {edge}:
                         # Here we target a Neutral node which is attached to something (either with
                         # inputs or outputs), therefore we must inspect all the nodes attached to this
                         # target node which are still Neutral and see if they admits the Attribute identity.
@@ -925,7 +909,7 @@ class MembershipFromNeutralPropertyAssertionRule(ProfileEdgeRule):
                             # Here we target an incompatible node (i.e. a node which cannot express an Attribute or a Role).
                             raise ProfileError('Invalid target for property assertion node: {}'.format(target.name))
 
-                        if target.adjacentNodes(filter_on_edges=lambda x: x is not edge):
+                        if target.edges - {edge}:
                             # Here we target a Neutral node which is attached to something (either with
                             # inputs or outputs), therefore we must inspect all the nodes attached to this
                             # target node which are still Neutral and see if they all share an identity among
@@ -121,10 +121,10 @@ class InputConceptToRestrictionNodeRule(ProfileEdgeRule):
                     # restrictions (we need to skip TOP though, since it won't be qualified then).
                     if Special.valueOf(source.text()) is not Special.Top:
                         # We found an outgoing inclusion edge and our restriction filler is not TOP.
-                        if target.outgoingNodes(filter_on_edges=lambda x: x.type() is Item.InclusionEdge):
+                        if target.outgoingNodesOf(Item.InclusionEdge):
                             raise ProfileError('Inclusion with a qualified {} as source is forbidden in OWL 2 QL'.format(target.shortName))
                         # Similarly we block the input in case of equivalence edges attached to the restriction node.
-                        if target.adjacentNodes(filter_on_edges=lambda x: x.type() is Item.EquivalenceEdge):
+                        if target.adjacentNodesOf(Item.EquivalenceEdge):
                             raise ProfileError('Equivalence in presence of qualified {} is forbidden in OWL 2 QL'.format(target.shortName))
 
 
@@ -96,9 +96,7 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
                         raise ProfileError('Equivalence in presence of a union of concept expressions is forbidden in OWL 2 RL')
                     # Domain/range restriction cannot be part of concept equivalence in OWL 2 RL.
                     elif node.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
-                        f1 = lambda x: x.type() is Item.InputEdge
-                        f2 = lambda x: x.type() is Item.EnumerationNode
-                        if not node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        if not any(x.type() is Item.EnumerationNode for x in node.incomingNodesOf(Item.InputEdge)):
                             raise ProfileError('Existential {} must specify an Enumeration as filler when involved '
                                                'in an equivalence between concept expressions in OWL 2 RL'.format(target.shortName))
 
@@ -152,9 +150,7 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
                 elif target.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
                     if target.restriction() is Restriction.Exists:
                         # We need to check for the restriction to have a an Enumeration as filler.
-                        f1 = lambda x: x.type() is Item.InputEdge
-                        f2 = lambda x: x.type() is Item.EnumerationNode
-                        if not target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                        if not any(x.type() is Item.EnumerationNode for x in target.incomingNodesOf(Item.InputEdge)):
                             raise ProfileError('Existential {} must specify an Enumeration as filler when acting as '
                                                'target for a concept expression inclusion in OWL 2 RL'.format(target.shortName))
                     elif target.restriction() is Restriction.Cardinality:
@@ -35,16 +35,14 @@
 
 from PySide6 import QtCore
 
-from eddy.core.commands.diagram import CommandDiagramAdd
-from eddy.core.commands.nodes import CommandNodeSetMeta
+from eddy.core.commands.project import CommandProjectMerge
 from eddy.core.datatypes.graphol import Item
 from eddy.core.functions.owl import OWLText
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect, disconnect
 from eddy.core.output import getLogger
 
-from eddy.ui.resolvers import PredicateBooleanConflictResolver
-from eddy.ui.resolvers import PredicateDocumentationConflictResolver
+from eddy.ui.resolvers import PredicateConflictResolver
 
 
 LOGGER = getLogger()
@@ -57,6 +55,7 @@ K_ITEMS = 'items'
 K_META = 'meta'
 K_NODE = 'nodes'
 K_PREDICATE = 'predicates'
+K_RECORD = 'records'
 K_TYPE = 'types'
 
 # PROJECT MERGE
@@ -166,6 +165,8 @@ class Project(QtCore.QObject):
         :type eid: str
         :rtype: AbstractEdge
         """
+        if diagram:
+            self.materialize(diagram)
         return self.index.edge(diagram, eid)
 
     def edges(self, diagram=None):
@@ -175,6 +176,7 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         :rtype: set
         """
+        self.materialize(diagram)
         return self.index.edges(diagram)
 
     def isEmpty(self):
@@ -182,7 +184,9 @@ class Project(QtCore.QObject):
         Returns True if the Project contains no element, False otherwise.
         :rtype: bool
         """
-        return self.index.isEmpty()
+        if not self.index.isEmpty():
+            return False
+        return all(not d.record or d.record.isEmpty() for d in self.diagrams())
 
     def item(self, diagram, iid):
         """
@@ -191,6 +195,8 @@ class Project(QtCore.QObject):
         :type iid: str
         :rtype: AbstractItem
         """
+        if diagram:
+            self.materialize(diagram)
         return self.index.item(diagram, iid)
 
     def itemNum(self, item, diagram=None):
@@ -201,7 +207,12 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         :rtype: int
         """
-        return self.index.itemNum(item, diagram)
+        # ITEMS OF UNMATERIALIZED DIAGRAMS ARE COUNTED FROM THEIR RECORDS
+        count = self.index.itemNum(item, diagram)
+        for d in ([diagram] if diagram else self.diagrams()):
+            if d.record:
+                count += d.record.itemNum(item)
+        return count
 
     def items(self, diagram=None):
         """
@@ -210,8 +221,29 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         :rtype: set
         """
+        self.materialize(diagram)
         return self.index.items(diagram)
 
+    def materialize(self, diagram=None):
+        """
+        Build the items of the given diagram if it has been loaded as a lightweight record.
+        If no diagram is supplied, all the diagrams in the Project will be materialized.
+        :type diagram: Diagram
+        """
+        for d in ([diagram] if diagram else self.diagrams()):
+            if d.record:
+                LOGGER.debug('Materializing diagram: %s', d.name)
+                record, d.record = d.record, None
+                record.materialize(d)
+                for item in d.items():
+                    if item.isNode() or item.isEdge():
+                        d.sgnItemAdded.emit(d, item)
+                # Remove the record only after all the items have been indexed,
+                # so that predicates metadata are not dropped from the index.
+                self.index.removeRecord(d, record)
+                for item in self.index.items(d):
+                    item.updateEdgeOrNode()
+
     def meta(self, item, name):
         """
         Returns metadata for the given predicate, expressed as pair (item, name).
@@ -236,6 +268,8 @@ class Project(QtCore.QObject):
         :type nid: str
         :rtype: AbstractNode
         """
+        if diagram:
+            self.materialize(diagram)
         return self.index.node(diagram, nid)
 
     def nodes(self, diagram=None):
@@ -245,8 +279,26 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         :rtype: set
         """
+        self.materialize(diagram)
         return self.index.nodes(diagram)
 
+    def predicateDiagrams(self, item, name):
+        """
+        Returns the names of the diagrams in which the given predicate appears, without materializing diagrams.
+        :type item: Item
+        :type name: str
+        :rtype: set
+        """
+        return self.index.predicateDiagrams(item, name)
+
+    def predicateNames(self, *types):
+        """
+        Returns a collection of pairs 'item', 'name' for all the distinct predicates in the Project.
+        :type types: list
+        :rtype: list
+        """
+        return self.index.predicateNames(*types)
+
     def predicateNum(self, item, diagram=None):
         """
         Returns the number of predicates of the given type which are defined in the given diagram.
@@ -266,6 +318,9 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         :rtype: set
         """
+        for d in self.diagrams():
+            if d.record and (not diagram or d is diagram) and d.record.contains(item, name):
+                self.materialize(d)
         return self.index.predicates(item, name, diagram)
 
     def removeDiagram(self, diagram):
@@ -274,7 +329,7 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         """
         if self.index.removeDiagram(diagram):
-            for item in self.items(diagram):
+            for item in self.index.items(diagram):
                 diagram.sgnItemRemoved.emit(diagram, item)
             self.sgnDiagramRemoved.emit(diagram)
 
@@ -347,6 +402,8 @@ class ProjectIndex(dict):
         """
         if diagram.name not in self[K_DIAGRAM]:
             self[K_DIAGRAM][diagram.name] = diagram
+            if diagram.record:
+                self.addRecord(diagram, diagram.record)
             return True
         return False
 
@@ -376,7 +433,7 @@ class ProjectIndex(dict):
                     if i not in self[K_PREDICATE]:
                         self[K_PREDICATE][i] = dict()
                     if k not in self[K_PREDICATE][i]:
-                        self[K_PREDICATE][i][k] = {K_NODE: dict()}
+                        self[K_PREDICATE][i][k] = {K_NODE: dict(), K_RECORD: dict()}
                     if diagram.name not in self[K_PREDICATE][i][k][K_NODE]:
                         self[K_PREDICATE][i][k][K_NODE][diagram.name] = set()
                     self[K_PREDICATE][i][k][K_NODE][diagram.name] |= {item}
@@ -387,6 +444,22 @@ class ProjectIndex(dict):
             return True
         return False
 
+    def addRecord(self, diagram, record):
+        """
+        Add the predicates of the given unmaterialized diagram record to the Project index.
+        :type diagram: Diagram
+        :type record: DiagramRecord
+        :rtype: bool
+        """
+        for i, k in record.predicates:
+            if i not in self[K_PREDICATE]:
+                self[K_PREDICATE][i] = dict()
+            if k not in self[K_PREDICATE][i]:
+                self[K_PREDICATE][i][k] = {K_NODE: dict(), K_RECORD: dict()}
+            records = self[K_PREDICATE][i][k][K_RECORD]
+            records[diagram.name] = records.get(diagram.name, 0) + 1
+        return True
+
     def diagram(self, did):
         """
         Retrieves a diagram given its id.
@@ -464,7 +537,8 @@ class ProjectIndex(dict):
         try:
             subdict = self[K_TYPE]
             if not diagram:
-                return len(set.union(*(subdict[i][item] for i in subdict if item in subdict[i])))
+                # Items belong to a single diagram: no need to build the union of the sets.
+                return sum(len(subdict[i][item]) for i in subdict if item in subdict[i])
             return len(subdict[diagram.name][item])
         except (KeyError, TypeError):
             return 0
@@ -515,7 +589,7 @@ class ProjectIndex(dict):
         :rtype: AbstractNode
         """
         try:
-            return self[K_EDGE][diagram.name][nid]
+            return self[K_NODE][diagram.name][nid]
         except KeyError:
             return None
 
@@ -533,6 +607,28 @@ class ProjectIndex(dict):
         except (KeyError, TypeError):
             return set()
 
+    def predicateDiagrams(self, item, name):
+        """
+        Retrieves the names of the diagrams in which the given predicate appears.
+        :type item: Item
+        :type name: str
+        :rtype: set
+        """
+        try:
+            entry = self[K_PREDICATE][item][OWLText(name)]
+            return set(entry[K_NODE]) | set(entry[K_RECORD])
+        except KeyError:
+            return set()
+
+    def predicateNames(self, *types):
+        """
+        Retrieves a collection of pairs 'item', 'name' for all the distinct predicates in the Project Index.
+        :type types: list
+        :rtype: list
+        """
+        filter_ = lambda x: not types or x in types
+        return [(k1, k2) for k1 in self[K_PREDICATE] if filter_(k1) for k2 in self[K_PREDICATE][k1]]
+
     def predicateNum(self, item, diagram=None):
         """
         Count the number of predicates of the given type which are defined in the given diagram.
@@ -545,7 +641,8 @@ class ProjectIndex(dict):
             subdict = self[K_PREDICATE]
             if not diagram:
                 return len(subdict[item])
-            return len({i for i in subdict[item] if diagram.name in subdict[item][i][K_NODE]})
+            return len({i for i in subdict[item] if diagram.name in subdict[item][i][K_NODE] or
+                                                    diagram.name in subdict[item][i][K_RECORD]})
         except (KeyError, TypeError):
             return 0
     
@@ -599,7 +696,7 @@ class ProjectIndex(dict):
                     return set.union(*self[K_PREDICATE][item][name][K_NODE].values())
                 return self[K_PREDICATE][item][name][K_NODE][diagram.name]
 
-        except KeyError:
+        except (KeyError, TypeError):
             return set()
         
     def removeDiagram(self, diagram):
@@ -610,6 +707,8 @@ class ProjectIndex(dict):
         """
         if diagram.name in self[K_DIAGRAM]:
             del self[K_DIAGRAM][diagram.name]
+            if diagram.record:
+                self.removeRecord(diagram, diagram.record)
             return True
         return False
 
@@ -647,7 +746,8 @@ class ProjectIndex(dict):
                                 self[K_PREDICATE][i][k][K_NODE][diagram.name] -= {item}
                                 if not self[K_PREDICATE][i][k][K_NODE][diagram.name]:
                                     del self[K_PREDICATE][i][k][K_NODE][diagram.name]
-                                    if not self[K_PREDICATE][i][k][K_NODE]:
+                                    if not self[K_PREDICATE][i][k][K_NODE] and \
+                                        not self[K_PREDICATE][i][k][K_RECORD]:
                                         del self[K_PREDICATE][i][k]
                                         if not self[K_PREDICATE][i]:
                                             del self[K_PREDICATE][i]
@@ -660,6 +760,61 @@ class ProjectIndex(dict):
             return True
         return False
                 
+    def removeRecord(self, diagram, record):
+        """
+        Remove the predicates of the given unmaterialized diagram record from the Project index.
+        :type diagram: Diagram
+        :type record: DiagramRecord
+        :rtype: bool
+        """
+        for i, k in record.predicates:
+            if i in self[K_PREDICATE]:
+                if k in self[K_PREDICATE][i]:
+                    records = self[K_PREDICATE][i][k][K_RECORD]
+                    if diagram.name in records:
+                        records[diagram.name] -= 1
+                        if not records[diagram.name]:
+                            del records[diagram.name]
+                            if not records and not self[K_PREDICATE][i][k][K_NODE]:
+                                del self[K_PREDICATE][i][k]
+                                if not self[K_PREDICATE][i]:
+                                    del self[K_PREDICATE][i]
+        return True
+
+    def renamePredicate(self, item, old, new, nodes):
+        """
+        Move the given nodes from the index entry of predicate 'old' to the one of predicate 'new'.
+        The text of the nodes is not changed and metadata are not moved.
+        :type item: Item
+        :type old: str
+        :type new: str
+        :type nodes: T <= list|tuple|set
+        :rtype: bool
+        """
+        old = OWLText(old)
+        new = OWLText(new)
+        predicates = self[K_PREDICATE].get(item, {})
+        if old not in predicates or old == new:
+            return False
+        entry = predicates[old]
+        groups = dict()
+        for node in nodes:
+            groups.setdefault(node.diagram.name, set()).add(node)
+        if new not in predicates and K_META not in entry and not entry[K_RECORD] and groups == entry[K_NODE]:
+            # ALL THE OCCURRENCES ARE BEING RENAMED => RE-KEY THE ENTRY
+            predicates[new] = predicates.pop(old)
+            return True
+        target = predicates.setdefault(new, {K_NODE: dict(), K_RECORD: dict()})
+        for name, group in groups.items():
+            if name in entry[K_NODE]:
+                entry[K_NODE][name] -= group
+                if not entry[K_NODE][name]:
+                    del entry[K_NODE][name]
+            target[K_NODE].setdefault(name, set()).update(group)
+        if not entry[K_NODE] and not entry[K_RECORD]:
+            del predicates[old]
+        return True
+
     def setMeta(self, item, name, meta):
         """
         Set metadata for the given predicate type/name combination.
@@ -695,6 +850,9 @@ class ProjectIndex(dict):
 class ProjectMergeWorker(QtCore.QObject):
     """
     Extends QObject with facilities to merge the content of 2 distinct projects.
+    The predicates tables of both projects are scanned once to compute all the metadata conflicts,
+    which are then presented to the user in a single resolver, and the whole merge is performed
+    by a single undo command.
     """
     def __init__(self, project, other, session):
         """
@@ -704,7 +862,9 @@ class ProjectMergeWorker(QtCore.QObject):
         :type session: Session
         """
         super().__init__(session)
-        self.commands = list()
+        self.conflicts = list()
+        self.diagrams = list()
+        self.metas = dict()
         self.project = project
         self.other = other
 
@@ -728,113 +888,104 @@ class ProjectMergeWorker(QtCore.QObject):
         """
         Perform the merge of the diagrams by importing all the diagrams in the 'other' project in the loaded one.
         """
+        names = {diagram.name for diagram in self.project.diagrams()}
+        occurrences = dict()
         for diagram in self.other.diagrams():
             # We may be in the situation in which we are importing a diagram with name 'X'
             # even though we already have a diagram 'X' in our project. Because we do not
             # want to overwrite diagrams, we perform a rename of the diagram being imported,
             # to be sure to have a unique diagram name, in the current project namespace.
-            occurrence = 1
+            # The last occurrence used for each name is remembered so that we do not need
+            # to probe the same names over and over when importing many diagrams.
             name = diagram.name
-            while self.project.diagram(diagram.name):
-                diagram.name = '{0}_{1}'.format(name, occurrence)
-                occurrence += 1
+            while diagram.name in names:
+                occurrences[name] = occurrences.get(name, 0) + 1
+                diagram.name = '{0}_{1}'.format(name, occurrences[name])
+            names.add(diagram.name)
             ## SWITCH SIGNAL SLOTS
             disconnect(diagram.sgnItemAdded, self.other.doAddItem)
             disconnect(diagram.sgnItemRemoved, self.other.doRemoveItem)
             connect(diagram.sgnItemAdded, self.project.doAddItem)
             connect(diagram.sgnItemRemoved, self.project.doRemoveItem)
             ## MERGE THE DIAGRAM IN THE CURRENT PROJECT
-            self.commands.append(CommandDiagramAdd(diagram, self.project))
+            self.diagrams.append(diagram)
 
     def mergeMeta(self):
         """
         Perform the merge of predicates metadata.
         """
-        conflicts = dict()
-        resolutions = dict()
-
-        for item, name in self.other.metas():
-            if not self.project.predicates(item, name):
-                ## NO PREDICATE => NO CONFLICT
-                undo = self.project.meta(item, name).copy()
-                redo = self.other.meta(item, name).copy()
-                self.commands.append(CommandNodeSetMeta(self.project, item, name, undo, redo))
-            else:
+        # Both predicates tables are keyed by normalized predicate names, so we can
+        # match them directly instead of looking up each predicate through the index.
+        current = self.project.index[K_PREDICATE]
+        for item, predicates in self.other.index[K_PREDICATE].items():
+            currentPredicates = current.get(item, {})
+            for name, entry in predicates.items():
+                if K_META not in entry:
+                    continue
+                metai = entry[K_META]
+                centry = currentPredicates.get(name, {})
+                undo = centry[K_META].copy() if K_META in centry else None
+                if not any(centry.get(K_NODE, {}).values()) and not centry.get(K_RECORD):
+                    ## NO PREDICATE => NO CONFLICT
+                    self.metas[(item, name)] = (undo, metai.copy())
+                    continue
                 ## CHECK FOR POSSIBLE CONFLICTS
-                metac = self.project.meta(item, name)
-                metai = self.other.meta(item, name)
-                if metac != metai:
-                    if item not in conflicts:
-                        conflicts[item] = dict()
-                    conflicts[item][name] = {K_CURRENT: metac.copy(), K_IMPORTING: metai.copy()}
-                    if item not in resolutions:
-                        resolutions[item] = dict()
-                    resolutions[item][name] = metac.copy()
-
-        ## RESOLVE CONFLICTS
-        aconflicts = []
-        for item in conflicts:
-            for name in conflicts[item]:
-                metac = conflicts[item][name][K_CURRENT]
-                metai = conflicts[item][name][K_IMPORTING]
-                ## RESOLVE DOCUMENTATION CONFLICTS
+                metac = centry.get(K_META, {})
+                if metac == metai:
+                    continue
+                self.metas[(item, name)] = (undo, metac.copy())
+                ## COLLECT DOCUMENTATION CONFLICTS
                 docc = metac.get(K_DESCRIPTION, '')
                 doci = metai.get(K_DESCRIPTION, '')
                 if docc != doci:
-                    resolver = PredicateDocumentationConflictResolver(item, name, docc, doci)
-                    if resolver.exec_() == PredicateDocumentationConflictResolver.Rejected:
-                        raise ProjectStopImportingError
-                    resolutions[item][name][K_DESCRIPTION] = resolver.result()
-                ## COLLECT ASSERTIONS CONFLICTS FOR ATTRIBUTES
+                    self.conflicts.append({
+                        K_ITEM: item,
+                        K_NAME: name,
+                        K_PROPERTY: K_DESCRIPTION,
+                        K_CURRENT: docc,
+                        K_IMPORTING: doci
+                    })
+                ## COLLECT ASSERTIONS CONFLICTS FOR ATTRIBUTES AND ROLES
+                keys = ()
                 if item is Item.AttributeNode:
-                    vc = metac.get(K_FUNCTIONAL, False)
-                    vi = metai.get(K_FUNCTIONAL, False)
+                    keys = (K_FUNCTIONAL,)
+                elif item is Item.RoleNode:
+                    keys = (K_ASYMMETRIC, K_INVERSE_FUNCTIONAL, K_IRREFLEXIVE, K_REFLEXIVE, K_SYMMETRIC, K_TRANSITIVE)
+                for k in keys:
+                    vc = metac.get(k, False)
+                    vi = metai.get(k, False)
                     if vc != vi:
-                        aconflicts.append({
+                        self.conflicts.append({
                             K_ITEM: item,
                             K_NAME: name,
-                            K_PROPERTY: K_FUNCTIONAL,
+                            K_PROPERTY: k,
                             K_CURRENT: vc,
                             K_IMPORTING: vi
                         })
-                ## COLLECT ASSERTIONS CONFLICTS FOR ROLES
-                if item is Item.RoleNode:
-                    for k in (K_ASYMMETRIC, K_INVERSE_FUNCTIONAL, K_IRREFLEXIVE, K_REFLEXIVE, K_SYMMETRIC, K_TRANSITIVE):
-                        vc = metac.get(k, False)
-                        vi = metai.get(k, False)
-                        if vc != vi:
-                            aconflicts.append({
-                                K_ITEM: item,
-                                K_NAME: name,
-                                K_PROPERTY: k,
-                                K_CURRENT: vc,
-                                K_IMPORTING: vi
-                            })
-
-        ## RESOLVE BOOLEAN PROPERTIES CONFLICTS
-        if aconflicts:
-            resolver = PredicateBooleanConflictResolver(aconflicts)
-            if resolver.exec_() == PredicateBooleanConflictResolver.Rejected:
-                raise ProjectStopImportingError
-            for e in resolver.results():
-                resolutions[e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]] = e[K_FINAL]
-
-        ## GENERATE UNDOCOMMANDS FOR RESOLUTIONS
-        for item in resolutions:
-            for name in resolutions[item]:
-                undo = self.project.meta(item, name)
-                redo = resolutions[item][name]
-                self.commands.append(CommandNodeSetMeta(self.project, item, name, undo, redo))
+
+        ## RESOLVE CONFLICTS
+        if self.conflicts:
+            for e in self.resolve(self.conflicts):
+                self.metas[(e[K_ITEM], e[K_NAME])][1][e[K_PROPERTY]] = e[K_FINAL]
 
     def mergeFinished(self):
         """
-        Completes the merge by executing the commands in the buffer on the undostack.
+        Completes the merge by pushing a single command performing the whole merge on the undostack.
+        """
+        if self.diagrams or self.metas:
+            self.session.undostack.push(CommandProjectMerge(self.project, self.other, self.diagrams, self.metas))
+
+    def resolve(self, conflicts):
+        """
+        Ask the user to resolve the given predicates metadata conflicts.
+        Returns the conflict resolutions as produced by PredicateConflictResolver.results().
+        :type conflicts: list
+        :rtype: T <= list | tuple | generator
         """
-        if self.commands:
-            self.session.undostack.beginMacro('import project "{0}" into "{1}"'.format(self.other.name, self.project.name))
-            for command in self.commands:
-                self.session.undostack.push(command)
-            self.session.undostack.endMacro()
+        resolver = PredicateConflictResolver(conflicts)
+        if resolver.exec_() == PredicateConflictResolver.Rejected:
+            raise ProjectStopImportingError
+        return resolver.results()
 
     def run(self):
         """
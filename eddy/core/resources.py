@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import importlib
+
+from PySide6 import QtCore
+
+from eddy.core.functions.fsystem import fexists
+from eddy.core.functions.path import expandPath
+from eddy.core.output import getLogger
+
+
+LOGGER = getLogger()
+
+
+def registerResources(*names):
+    """
+    Register the Qt resource bundles matching the given names (i.e: 'fonts', 'images').
+    For each name the compiled binary bundle '@resources/<name>.rcc' is registered if available:
+    Qt memory-maps the bundle, so resources are read from disk only when first accessed.
+    If the binary bundle is missing we fall back to the generated 'eddy.ui.<name>_rc' module,
+    which embeds the resource data and registers it at import time.
+    :type names: str
+    :rtype: bool
+    """
+    success = True
+    for name in names:
+        path = expandPath('@resources/{0}.rcc'.format(name))
+        if fexists(path) and QtCore.QResource.registerResource(path):
+            continue
+        try:
+            importlib.import_module('eddy.ui.{0}_rc'.format(name))
+        except ImportError:
+            LOGGER.error('Failed to register resource bundle: %s', name)
+            success = False
+    return success
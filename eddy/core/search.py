@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import math
+import re
+
+from collections import Counter, deque
+from heapq import nsmallest
+
+from PySide6 import QtCore
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.owl import OWLText
+from eddy.core.functions.signals import connect, disconnect
+from eddy.core.output import getLogger
+from eddy.core.project import K_DESCRIPTION, K_URL
+
+
+LOGGER = getLogger()
+
+
+RE_TAG = re.compile(r'<[^>]*>|&\w+;')
+RE_WORD = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+')
+
+# TERM WEIGHTS
+W_LABEL = 3
+W_WORD = 2
+W_TEXT = 1
+
+
+def tokenize(text):
+    """
+    Split the given text into lowercase words, breaking on punctuation and camel case.
+    :type text: str
+    :rtype: list
+    """
+    return [x.lower() for x in RE_WORD.findall(text)]
+
+
+def trigrams(term):
+    """
+    Returns the set of trigrams of the given term (padded so that short terms still produce trigrams).
+    :type term: str
+    :rtype: set
+    """
+    term = ' {0} '.format(term)
+    return {term[i:i + 3] for i in range(len(term) - 2)}
+
+
+class PrefixTrie(object):
+    """
+    Character trie mapping terms to the set of keys they have been indexed with.
+    Each node is a dict keyed by character: the empty string holds the payload of the term ending there.
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self):
+        """
+        Initialize the trie.
+        """
+        self.root = {}
+        self.size = 0
+
+    def add(self, term, key):
+        """
+        Index the given key under the given term.
+        :type term: str
+        :type key: tuple
+        """
+        node = self.root
+        for char in term:
+            node = node.setdefault(char, {})
+        if '' not in node:
+            node[''] = set()
+            self.size += 1
+        node[''].add(key)
+
+    def find(self, prefix, limit=None):
+        """
+        Generate (term, keys) pairs for all the terms starting with the given prefix, shortest terms first.
+        :type prefix: str
+        :type limit: int
+        :rtype: generator
+        """
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return
+        queue = deque([(prefix, node)])
+        count = 0
+        while queue:
+            term, node = queue.popleft()
+            for char, child in node.items():
+                if char:
+                    queue.append((term + char, child))
+                else:
+                    yield term, child
+                    count += 1
+                    if limit and count >= limit:
+                        return
+
+    def remove(self, term, key):
+        """
+        Remove the given key from the given term, pruning branches left empty.
+        :type term: str
+        :type key: tuple
+        """
+        path = [self.root]
+        for char in term:
+            node = path[-1].get(char)
+            if node is None:
+                return
+            path.append(node)
+        keys = path[-1].get('')
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del path[-1]['']
+                self.size -= 1
+                for i in range(len(term), 0, -1):
+                    if path[i]:
+                        break
+                    del path[i - 1][term[i - 1]]
+
+    def __len__(self):
+        """
+        Returns the number of terms in the trie.
+        :rtype: int
+        """
+        return self.size
+
+
+class TrigramIndex(dict):
+    """
+    Inverted index mapping trigrams to the set of terms containing them.
+    """
+    def add(self, term):
+        """
+        Index the given term.
+        :type term: str
+        """
+        for gram in trigrams(term):
+            self.setdefault(gram, set()).add(term)
+
+    def candidates(self, query, threshold=0.3):
+        """
+        Returns a list of (similarity, term) pairs for all the terms similar to the given query.
+        Similarity is the Jaccard coefficient of the trigram sets, and the returned list is sorted by it.
+        :type query: str
+        :type threshold: float
+        :rtype: list
+        """
+        grams = trigrams(query)
+        count = Counter()
+        for gram in grams:
+            count.update(self.get(gram, ()))
+        # A term reaching the threshold shares at least threshold * n of the n query trigrams.
+        size = len(grams)
+        least = max(1, math.ceil(threshold * size))
+        results = []
+        for term, shared in count.items():
+            if shared >= least:
+                # A term of length L has (at most) L trigrams due to the padding.
+                score = shared / (size + len(term) - shared)
+                if score >= threshold:
+                    results.append((score, term))
+        results.sort(key=lambda x: (-x[0], x[1]))
+        return results
+
+    def remove(self, term):
+        """
+        Remove the given term from the index.
+        :type term: str
+        """
+        for gram in trigrams(term):
+            terms = self.get(gram)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self[gram]
+
+
+class ProjectSearch(QtCore.QObject):
+    """
+    Extension of QtCore.QObject which implements a project-wide predicate search service.
+    Predicates are indexed by label (and label words), metadata description and IRI: the index is
+    built on first use and then kept in sync with the project index through the project signals.
+    """
+    Types = (Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode)
+
+    def __init__(self, project):
+        """
+        Initialize the search service.
+        :type project: Project
+        """
+        super().__init__(project)
+        self.built = False
+        self.entries = {}
+        self.terms = {}
+        self.tries = {W_LABEL: PrefixTrie(), W_WORD: PrefixTrie(), W_TEXT: PrefixTrie()}
+        self.trigrams = TrigramIndex()
+        connect(project.sgnItemAdded, self.onItemAdded)
+        connect(project.sgnItemRemoved, self.onItemRemoved)
+        connect(project.sgnMetaAdded, self.onMetaChanged)
+        connect(project.sgnMetaRemoved, self.onMetaChanged)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the reference to the project (alias for ProjectSearch.parent()).
+        :rtype: Project
+        """
+        return self.parent()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot('QGraphicsScene', 'QGraphicsItem')
+    def onItemAdded(self, _, item):
+        """
+        Executed whenever an item is added to the project.
+        :type _: Diagram
+        :type item: AbstractItem
+        """
+        if self.built and item.type() in self.Types:
+            key = (item.type(), OWLText(item.text()))
+            if key not in self.entries:
+                self.add(*key)
+
+    @QtCore.Slot('QGraphicsScene', 'QGraphicsItem')
+    def onItemRemoved(self, _, item):
+        """
+        Executed whenever an item is removed from the project.
+        :type _: Diagram
+        :type item: AbstractItem
+        """
+        if self.built and item.type() in self.Types:
+            key = (item.type(), OWLText(item.text()))
+            if key in self.entries and not self.project.predicateDiagrams(*key):
+                self.remove(*key)
+
+    @QtCore.Slot(Item, str)
+    def onMetaChanged(self, item, name):
+        """
+        Executed whenever predicate metadata are added or removed.
+        :type item: Item
+        :type name: str
+        """
+        if self.built:
+            key = (item, OWLText(name))
+            if key in self.entries:
+                self.remove(*key)
+                self.add(*key)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def add(self, item, name):
+        """
+        Index the given predicate.
+        :type item: Item
+        :type name: str
+        """
+        key = (item, name)
+        terms = {name.lower(): W_LABEL}
+        for word in tokenize(name):
+            terms.setdefault(word, W_WORD)
+        meta = self.project.meta(item, name)
+        for word in tokenize(RE_TAG.sub(' ', meta.get(K_DESCRIPTION, ''))):
+            terms.setdefault(word, W_TEXT)
+        terms.setdefault('{0}:{1}'.format(self.project.prefix, name).lower(), W_TEXT)
+        terms.setdefault('{0}#{1}'.format(self.project.iri, name).lower(), W_TEXT)
+        if meta.get(K_URL):
+            terms.setdefault(meta[K_URL].lower(), W_TEXT)
+        for term, weight in terms.items():
+            self.tries[weight].add(term, key)
+            if term not in self.terms:
+                self.terms[term] = {}
+                if term.isalnum() or weight == W_LABEL:
+                    self.trigrams.add(term)
+            self.terms[term][key] = weight
+        self.entries[key] = terms
+
+    def build(self):
+        """
+        Build the search index from scratch using the project index.
+        """
+        self.clear()
+        for item, name in self.project.predicateNames(*self.Types):
+            self.add(item, name)
+        self.built = True
+        LOGGER.debug('Search index built: predicates=%s, terms=%s', len(self.entries), len(self.terms))
+
+    def clear(self):
+        """
+        Clear the search index.
+        """
+        self.built = False
+        self.entries = {}
+        self.terms = {}
+        self.tries = {W_LABEL: PrefixTrie(), W_WORD: PrefixTrie(), W_TEXT: PrefixTrie()}
+        self.trigrams = TrigramIndex()
+
+    def dispose(self):
+        """
+        Disconnect the search service from the project.
+        """
+        disconnect(self.project.sgnItemAdded, self.onItemAdded)
+        disconnect(self.project.sgnItemRemoved, self.onItemRemoved)
+        disconnect(self.project.sgnMetaAdded, self.onMetaChanged)
+        disconnect(self.project.sgnMetaRemoved, self.onMetaChanged)
+        self.clear()
+
+    def query(self, text, limit=50, fuzzy=True):
+        """
+        Returns a ranked list of (item, name) predicates matching the given text.
+        Prefix matches are ranked first (labels, then label words, then descriptions and IRIs; shorter
+        terms first), followed by fuzzy matches if there is still room in the result list.
+        :type text: str
+        :type limit: int
+        :type fuzzy: bool
+        :rtype: list
+        """
+        if not self.built:
+            self.build()
+        text = text.strip().lower()
+        if not text:
+            return []
+
+        results = {}
+        for weight in (W_LABEL, W_WORD, W_TEXT):
+            # Each term yields at least one predicate, which is new unless all the predicates of the
+            # term have already been collected: this can happen at most once for each term of the
+            # collected predicates, so the trie lookup can be bounded without losing results.
+            seen = sum(1 for k in results for w in self.entries[k].values() if w == weight)
+            bound = limit - len(results) + seen
+            for _, keys in self.tries[weight].find(text, bound):
+                for key in nsmallest(limit - len(results), keys, key=lambda x: (x[1], x[0].value)):
+                    results.setdefault(key, None)
+                    if len(results) >= limit:
+                        return list(results)
+
+        if fuzzy:
+            for _, term in self.trigrams.candidates(text):
+                keys = self.terms[term]
+                for key in nsmallest(limit - len(results), keys, key=lambda x: (-keys[x], x[1], x[0].value)):
+                    results.setdefault(key, None)
+                    if len(results) >= limit:
+                        return list(results)
+
+        return list(results)
+
+    def remove(self, item, name):
+        """
+        Remove the given predicate from the search index.
+        :type item: Item
+        :type name: str
+        """
+        key = (item, name)
+        for term, weight in self.entries.pop(key, {}).items():
+            self.tries[weight].remove(term, key)
+            keys = self.terms.get(term)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self.terms[term]
+                    self.trigrams.remove(term)
+
+    def __len__(self):
+        """
+        Returns the number of indexed predicates.
+        :rtype: int
+        """
+        return len(self.entries)
@@ -103,4 +103,32 @@ class PausableTimer(QtCore.QTimer):
         """
         Start the timer.
         """
-        super().start(*args, **kwargs)
\ No newline at end of file
+        super().start(*args, **kwargs)
+
+
+class CoalescingTimer(QtCore.QTimer):
+    """
+    Extends QtCore.QTimer providing a single shot timer which coalesces multiple requests:
+    no matter how many times schedule() is called, timeout is emitted only once, when control
+    returns to the event loop (or when the given interval expires).
+    """
+    def __init__(self, parent=None, interval=0):
+        """
+        Initialize the timer.
+        :type parent: QObject
+        :type interval: int
+        """
+        super().__init__(parent)
+        self.setInterval(interval)
+        self.setSingleShot(True)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def schedule(self):
+        """
+        Schedule a timeout, unless one is already pending.
+        """
+        if not self.isActive():
+            self.start()
@@ -35,16 +35,14 @@
 
 import csv
 import io
+import json
+import zipfile
 
-from operator import itemgetter
+from xml.sax.saxutils import escape
 
-from eddy.core.datatypes.collections import DistinctList
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractProjectExporter
-from eddy.core.functions.misc import lstrip
-from eddy.core.functions.fsystem import fwrite
-from eddy.core.functions.owl import OWLShortIRI
 from eddy.core.functions.path import openPath
 from eddy.core.output import getLogger
 from eddy.core.plugin import AbstractPlugin
@@ -56,7 +54,7 @@ LOGGER = getLogger()
 
 class CsvExporterPlugin(AbstractPlugin):
     """
-    Extends AbstractPlugin providing a Csv file format project exporter.
+    Extends AbstractPlugin providing CSV, JSON and XLSX file format project exporters.
     """
     #############################################
     #   HOOKS
@@ -66,17 +64,21 @@ class CsvExporterPlugin(AbstractPlugin):
         """
         Executed whenever the plugin is going to be destroyed.
         """
-        # UNINSTALL THE EXPORTER
-        self.debug('Uninstalling CSV file format exporter')
+        # UNINSTALL THE EXPORTERS
+        self.debug('Uninstalling CSV, JSON and XLSX file format exporters')
         self.session.removeProjectExporter(CsvExporter)
+        self.session.removeProjectExporter(JsonExporter)
+        self.session.removeProjectExporter(XlsxExporter)
 
     def start(self):
         """
         Perform initialization tasks for the plugin.
         """
-        # INSTALL THE EXPORTER
-        self.debug('Installing CSV file format exporter')
+        # INSTALL THE EXPORTERS
+        self.debug('Installing CSV, JSON and XLSX file format exporters')
         self.session.addProjectExporter(CsvExporter)
+        self.session.addProjectExporter(JsonExporter)
+        self.session.addProjectExporter(XlsxExporter)
 
 
 class CsvExporter(AbstractProjectExporter):
@@ -87,62 +89,173 @@ class CsvExporter(AbstractProjectExporter):
     KeyType = 'TYPE'
     KeyDescription = 'DESCRIPTION'
     KeyDiagrams = 'DIAGRAMS'
+    Keys = (KeyName, KeyType, KeyDescription, KeyDiagrams)
     Types = [
         Item.AttributeNode,
         Item.ConceptNode,
         Item.RoleNode,
     ]
 
-    def __init__(self, project, session=None):
+    def __init__(self, project, session=None, **kwargs):
         """
         Initialize the CSV exporter.
         :type project: Project
         :type session: Session
         """
         super().__init__(project, session)
+        self.open = kwargs.get('open', True)
 
     #############################################
     #   INTERFACE
     #################################
 
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Csv
+
+    def rows(self):
+        """
+        Returns a generator of (name, type, description, diagrams) tuples, one for each
+        distinct predicate in the project, sorted by predicate name.
+        :rtype: generator
+        """
+        for name, item in sorted((k, i) for i, k in self.project.predicateNames(*self.Types)):
+            meta = self.project.meta(item, name)
+            yield (
+                name,
+                item.shortName,
+                meta.get(K_DESCRIPTION, ''),
+                sorted(self.project.predicateDiagrams(item, name)),
+            )
+
     def run(self, path):
         """
-        Perform CSV file generation.
+        Perform the project export.
         :type path: str
         """
-        LOGGER.info('Exporting project %s in CSV format: %s', self.project.name, path)
-        collection = {x: {} for x in self.Types}
-
-        for node in self.project.predicates():
-            if node.type() in collection:
-                if not node.text() in collection[node.type()]:
-                    meta = self.project.meta(node.type(), node.text())
-                    collection[node.type()][node.text()] = {
-                        CsvExporter.KeyName: lstrip(OWLShortIRI('', node.text()), ':'),
-                        CsvExporter.KeyType: node.shortName,
-                        CsvExporter.KeyDescription: meta.get(K_DESCRIPTION, ''),
-                        CsvExporter.KeyDiagrams: DistinctList()}
-                collection[node.type()][node.text()][self.KeyDiagrams] += [node.diagram.name]
-
-        buffer = io.StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow((self.KeyName, self.KeyType, self.KeyDescription, self.KeyDiagrams))
-        for i, j in sorted(((v, k) for k in collection for v in collection[k]), key=itemgetter(0)):
-            writer.writerow((
-                collection[j][i][self.KeyName],
-                collection[j][i][self.KeyType],
-                collection[j][i][self.KeyDescription],
-                sorted(collection[j][i][self.KeyDiagrams]),
-            ))
-
-        fwrite(buffer.getvalue(), path)
-
-        openPath(path)
+        LOGGER.info('Exporting project %s in %s format: %s', self.project.name, self.filetype().name.upper(), path)
+        self.write(path, self.rows())
+        if self.open:
+            openPath(path)
 
+    def write(self, path, rows):
+        """
+        Write the given rows in the given path.
+        :type path: str
+        :type rows: T <= list|tuple|generator
+        """
+        with io.open(path, 'w', encoding='utf8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.Keys)
+            for row in rows:
+                writer.writerow(row)
+
+
+class JsonExporter(CsvExporter):
+    """
+    This class can be used to export Graphol projects into JSON format.
+    """
     @classmethod
     def filetype(cls):
         """
         Returns the type of the file that will be used for the export.
         :return: File
         """
-        return File.Csv
\ No newline at end of file
+        return File.Json
+
+    def write(self, path, rows):
+        """
+        Write the given rows in the given path.
+        :type path: str
+        :type rows: T <= list|tuple|generator
+        """
+        with io.open(path, 'w', encoding='utf8') as file:
+            file.write('[')
+            for i, row in enumerate(rows):
+                file.write(',\n  ' if i else '\n  ')
+                file.write(json.dumps(dict(zip(self.Keys, row)), ensure_ascii=False))
+            file.write('\n]\n')
+
+
+class XlsxExporter(CsvExporter):
+    """
+    This class can be used to export Graphol projects into XLSX (Office Open XML) format.
+    """
+    ContentTypes = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>')
+    PackageRels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>')
+    Workbook = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="{0}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>')
+    WorkbookRels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>')
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Xlsx
+
+    @staticmethod
+    def cell(column, row, value):
+        """
+        Returns the XML representation of a worksheet cell containing the given string value.
+        :type column: int
+        :type row: int
+        :type value: str
+        :rtype: str
+        """
+        return '<c r="{0}{1}" t="inlineStr"><is><t xml:space="preserve">{2}</t></is></c>'.format(
+            chr(ord('A') + column), row, escape(value))
+
+    def write(self, path, rows):
+        """
+        Write the given rows in the given path.
+        :type path: str
+        :type rows: T <= list|tuple|generator
+        """
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', self.ContentTypes)
+            archive.writestr('_rels/.rels', self.PackageRels)
+            archive.writestr('xl/workbook.xml', self.Workbook.format(escape(self.project.name[:31], {'"': '&quot;'})))
+            archive.writestr('xl/_rels/workbook.xml.rels', self.WorkbookRels)
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as raw:
+                sheet = io.TextIOWrapper(raw, encoding='utf8')
+                sheet.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+                sheet.write('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+                sheet.write('<row r="1">{0}</row>'.format(''.join(self.cell(j, 1, v) for j, v in enumerate(self.Keys))))
+                for i, row in enumerate(rows, start=2):
+                    name, shortName, description, diagrams = row
+                    values = (name, shortName, description, ', '.join(diagrams))
+                    sheet.write('<row r="{0}">{1}</row>'.format(i, ''.join(self.cell(j, i, v) for j, v in enumerate(values))))
+                sheet.write('</sheetData></worksheet>')
+                sheet.flush()
+                sheet.detach()
@@ -35,4 +35,7 @@ author: Daniele Pantaleone
 contact: pantaleone@dis.uniroma1.it
 id: csv_exporter
 name: CSV Exporter
-version: 0.2
\ No newline at end of file
+version: 0.2
+
+[activation]
+filetypes: csv, json, xlsx
\ No newline at end of file
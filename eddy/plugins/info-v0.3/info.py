@@ -41,6 +41,7 @@ from PySide6 import QtGui
 from PySide6 import QtWidgets
 
 from eddy.core.commands.labels import CommandLabelChange
+from eddy.core.commands.labels import CommandPredicateRename
 from eddy.core.commands.nodes import CommandNodeSetMeta
 from eddy.core.commands.project import CommandProjectSetIRI
 from eddy.core.commands.project import CommandProjectSetPrefix
@@ -56,6 +57,7 @@ from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
 from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
 from eddy.core.regex import RE_CAMEL_SPACE
+from eddy.core.timer import CoalescingTimer
 
 from eddy.ui.dock import DockWidget
 from eddy.ui.fields import IntegerField, StringField
@@ -91,49 +93,49 @@ class InfoPlugin(AbstractPlugin):
         """
         Executed whenever a diagram is added to the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot('QGraphicsScene')
     def onDiagramRemoved(self, diagram):
         """
         Executed whenever a diagram is removed from the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot()
     def onDiagramSelectionChanged(self):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot()
     def onDiagramUpdated(self):
         """
         Executed whenever the active diagram is updated.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemAdded(self, diagram, item):
         """
         Executed whenever a new element is added to the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemRemoved(self, diagram, item):
         """
         Executed whenever a new element is removed from the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot()
     def onProjectUpdated(self):
         """
         Executed whenever the current project is updated.
         """
-        self.widget('info').stack()
+        self.widget('info').schedule()
 
     @QtCore.Slot()
     def onSessionReady(self):
@@ -260,7 +262,9 @@ class InfoWidget(QtWidgets.QScrollArea):
         super().__init__(plugin.session)
 
         self.diagram = None
+        self.dirty = False
         self.plugin = plugin
+        self.timer = CoalescingTimer(self)
 
         self.stacked = QtWidgets.QStackedWidget(self)
         self.stacked.setContentsMargins(0, 0, 0, 0)
@@ -351,6 +355,8 @@ class InfoWidget(QtWidgets.QScrollArea):
         scrollbar = self.verticalScrollBar()
         scrollbar.installEventFilter(self)
 
+        connect(self.timer.timeout, self.stack)
+
     #############################################
     #   PROPERTIES
     #################################
@@ -386,6 +392,15 @@ class InfoWidget(QtWidgets.QScrollArea):
                 self.redraw()
         return super().eventFilter(source, event)
 
+    def showEvent(self, showEvent):
+        """
+        Executed when the widget is shown: refresh the content if an update was skipped while hidden.
+        :type showEvent: QShowEvent
+        """
+        super().showEvent(showEvent)
+        if self.dirty:
+            self.stack()
+
     #############################################
     #   INTERFACE
     #################################
@@ -405,6 +420,13 @@ class InfoWidget(QtWidgets.QScrollArea):
         self.stacked.setFixedWidth(width)
         self.stacked.setFixedHeight(clamp(height, 0))
 
+    def schedule(self):
+        """
+        Schedule a refresh of the widget: multiple requests are coalesced into a single
+        refresh performed when control returns to the event loop (i.e. once per bulk operation).
+        """
+        self.timer.schedule()
+
     def setDiagram(self, diagram):
         """
         Sets the widget to inspect the given diagram.
@@ -416,6 +438,13 @@ class InfoWidget(QtWidgets.QScrollArea):
         """
         Set the current stacked widget.
         """
+        self.timer.stop()
+        if not self.isVisible():
+            # Do not bother updating a hidden widget: the refresh will be performed when the widget is shown.
+            self.dirty = True
+            return
+        self.dirty = False
+
         if self.diagram:
             selected = self.diagram.selectedItems()
             if not selected or len(selected) > 1:
@@ -715,6 +744,8 @@ class ProjectInfo(AbstractInfo):
         self.mainLayout.addWidget(self.assertionsHeader)
         self.mainLayout.addLayout(self.assertionsLayout)
 
+        self.values = {}
+
     #############################################
     #   SLOTS
     #################################
@@ -766,33 +797,38 @@ class ProjectInfo(AbstractInfo):
     def updateData(self, project):
         """
         Fetch new information and fill the widget with data.
+        Only the fields whose value changed since the previous update are touched.
         :type project: Project
         """
-        self.prefixField.setValue(project.prefix)
-        self.prefixField.home(True)
-        self.prefixField.clearFocus()
-        self.prefixField.deselect()
-
-        self.iriField.setValue(project.iri)
-        self.iriField.home(True)
-        self.iriField.clearFocus()
-        self.iriField.deselect()
-
-        self.versionField.setValue(project.version)
-        self.versionField.home(True)
-        self.versionField.clearFocus()
-        self.versionField.deselect()
+        values = {
+            self.prefixField: project.prefix,
+            self.iriField: project.iri,
+            self.versionField: project.version,
+            self.profileField: project.profile.name(),
+            self.attributesField: project.predicateNum(Item.AttributeNode),
+            self.conceptsField: project.predicateNum(Item.ConceptNode),
+            self.rolesField: project.predicateNum(Item.RoleNode),
+            self.inclusionsField: project.itemNum(Item.InclusionEdge),
+            self.membershipField: project.itemNum(Item.MembershipEdge),
+        }
 
-        for i in range(self.profileField.count()):
-            if self.profileField.itemText(i) == self.project.profile.name():
-                self.profileField.setCurrentIndex(i)
-                break
+        for field, value in values.items():
+            if field in self.values and self.values[field] == value:
+                continue
+            if field is self.profileField:
+                for i in range(field.count()):
+                    if field.itemText(i) == value:
+                        field.setCurrentIndex(i)
+                        break
+            elif isinstance(field, String):
+                field.setValue(value)
+                field.home(True)
+                field.clearFocus()
+                field.deselect()
+            else:
+                field.setValue(value)
 
-        self.attributesField.setValue(project.predicateNum(Item.AttributeNode))
-        self.conceptsField.setValue(project.predicateNum(Item.ConceptNode))
-        self.rolesField.setValue(project.predicateNum(Item.RoleNode))
-        self.inclusionsField.setValue(project.itemNum(Item.InclusionEdge))
-        self.membershipField.setValue(project.itemNum(Item.MembershipEdge))
+        self.values = values
 
 
 class EdgeInfo(AbstractInfo):
@@ -977,10 +1013,7 @@ class PredicateNodeInfo(NodeInfo):
                     diagram = node.diagram
                     project = node.project
                     if sender is self.nameField:
-                        self.session.undostack.beginMacro('change predicate "{0}" to "{1}"'.format(node.text(), data))
-                        for n in project.predicates(node.type(), node.text()):
-                            self.session.undostack.push(CommandLabelChange(n.diagram, n, n.text(), data, refactor=True))
-                        self.session.undostack.endMacro()
+                        self.session.undostack.push(CommandPredicateRename(project, node.type(), node.text(), data))
                     else:
                         self.session.undostack.push(CommandLabelChange(diagram, node, node.text(), data))
             except RuntimeError:
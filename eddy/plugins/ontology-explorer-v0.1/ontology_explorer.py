@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from bisect import bisect_left
+
 from PySide6 import QtCore
 from PySide6 import QtGui
 from PySide6 import QtWidgets
@@ -52,8 +54,6 @@ class OntologyExplorerPlugin(AbstractPlugin):
     """
     This plugin provides the Ontology Explorer widget.
     """
-    sgnFakeItemAdded = QtCore.Signal('QGraphicsScene', 'QGraphicsItem')
-
     #############################################
     #   SLOTS
     #################################
@@ -69,10 +69,9 @@ class OntologyExplorerPlugin(AbstractPlugin):
         connect(self.project.sgnItemAdded, widget.doAddNode)
         connect(self.project.sgnItemRemoved, widget.doRemoveNode)
         # FILL IN ONTOLOGY EXPLORER WITH DATA
-        connect(self.sgnFakeItemAdded, widget.doAddNode)
-        for node in self.project.nodes():
-            self.sgnFakeItemAdded.emit(node.diagram, node)
-        disconnect(self.sgnFakeItemAdded, widget.doAddNode)
+        # Diagrams loaded on demand will be added upon materialization.
+        widget.doAddNodes([(diagram, node) for diagram in self.project.diagrams() \
+                            if not diagram.record for node in self.project.nodes(diagram)])
 
     #############################################
     #   HOOKS
@@ -150,22 +149,15 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
 
         self.plugin = plugin
 
-        self.iconAttribute = QtGui.QIcon(':/icons/18/ic_treeview_attribute')
-        self.iconConcept = QtGui.QIcon(':/icons/18/ic_treeview_concept')
-        self.iconInstance = QtGui.QIcon(':/icons/18/ic_treeview_instance')
-        self.iconRole = QtGui.QIcon(':/icons/18/ic_treeview_role')
-        self.iconValue = QtGui.QIcon(':/icons/18/ic_treeview_value')
-
         self.search = StringField(self)
         self.search.setAcceptDrops(False)
         self.search.setClearButtonEnabled(True)
         self.search.setPlaceholderText('Search...')
         self.search.setFixedHeight(30)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = OntologyExplorerModel(self)
         self.proxy = QtCore.QSortFilterProxyModel(self)
         self.proxy.setDynamicSortFilter(False)
         self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.proxy.setSortCaseSensitivity(QtCore.Qt.CaseSensitive)
         self.proxy.setSourceModel(self.model)
         self.ontoview = OntologyExplorerView(self)
         self.ontoview.setModel(self.proxy)
@@ -248,16 +240,15 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractItem
         """
         if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if not parent:
-                parent = QtGui.QStandardItem(self.parentKey(node))
-                parent.setIcon(self.iconFor(node))
-                self.model.appendRow(parent)
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
-            child = QtGui.QStandardItem(self.childKey(diagram, node))
-            child.setData(node)
-            parent.appendRow(child)
-            self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+            self.model.addNode(diagram, node)
+
+    def doAddNodes(self, collection):
+        """
+        Add a collection of (diagram, node) pairs in the tree view.
+        :type collection: T <= list|tuple
+        """
+        types = {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}
+        self.model.addNodes([(d, n) for d, n in collection if n.type() in types])
 
     @QtCore.Slot(str)
     def doFilterItem(self, key):
@@ -266,7 +257,6 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type key: str
         """
         self.proxy.setFilterFixedString(key)
-        self.proxy.sort(QtCore.Qt.AscendingOrder)
 
     @QtCore.Slot('QGraphicsScene', 'QGraphicsItem')
     def doRemoveNode(self, diagram, node):
@@ -276,13 +266,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractItem
         """
         if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if parent:
-                child = self.childFor(parent, diagram, node)
-                if child:
-                    parent.removeRow(child.index().row())
-                if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+            self.model.removeNode(diagram, node)
 
     @QtCore.Slot('QModelIndex')
     def onItemDoubleClicked(self, index):
@@ -292,9 +276,9 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         """
         # noinspection PyArgumentList
         if QtWidgets.QApplication.mouseButtons() & QtCore.Qt.LeftButton:
-            item = self.model.itemFromIndex(self.proxy.mapToSource(index))
-            if item and item.data():
-                self.sgnItemDoubleClicked.emit(item.data())
+            node = self.model.nodeForIndex(self.proxy.mapToSource(index))
+            if node:
+                self.sgnItemDoubleClicked.emit(node)
 
     @QtCore.Slot('QModelIndex')
     def onItemPressed(self, index):
@@ -304,78 +288,14 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         """
         # noinspection PyArgumentList
         if QtWidgets.QApplication.mouseButtons() & QtCore.Qt.LeftButton:
-            item = self.model.itemFromIndex(self.proxy.mapToSource(index))
-            if item and item.data():
-                self.sgnItemClicked.emit(item.data())
+            node = self.model.nodeForIndex(self.proxy.mapToSource(index))
+            if node:
+                self.sgnItemClicked.emit(node)
 
     #############################################
     #   INTERFACE
     #################################
 
-    def childFor(self, parent, diagram, node):
-        """
-        Search the item representing this node among parent children.
-        :type parent: QtGui.QStandardItem
-        :type diagram: Diagram
-        :type node: AbstractNode
-        """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
-        return None
-
-    @staticmethod
-    def childKey(diagram, node):
-        """
-        Returns the child key (text) used to place the given node in the treeview.
-        :type diagram: Diagram
-        :type node: AbstractNode
-        :rtype: str
-        """
-        predicate = node.text().replace('\n', '')
-        diagram = rstrip(diagram.name, File.Graphol.extension)
-        return '{0} ({1} - {2})'.format(predicate, diagram, node.id)
-
-    def iconFor(self, node):
-        """
-        Returns the icon for the given node.
-        :type node:
-        """
-        if node.type() is Item.AttributeNode:
-            return self.iconAttribute
-        if node.type() is Item.ConceptNode:
-            return self.iconConcept
-        if node.type() is Item.IndividualNode:
-            if node.identity() is Identity.Individual:
-                return self.iconInstance
-            if node.identity() is Identity.Value:
-                return self.iconValue
-        if node.type() is Item.RoleNode:
-            return self.iconRole
-
-    def parentFor(self, node):
-        """
-        Search the parent element of the given node.
-        :type node: AbstractNode
-        :rtype: QtGui.QStandardItem
-        """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            n = i.child(0).data()
-            if node.type() is n.type():
-                return i
-        return None
-
-    @staticmethod
-    def parentKey(node):
-        """
-        Returns the parent key (text) used to place the given node in the treeview.
-        :type node: AbstractNode
-        :rtype: str
-        """
-        return node.text().replace('\n', '')
-
     def sizeHint(self):
         """
         Returns the recommended size for this widget.
@@ -402,7 +322,7 @@ class OntologyExplorerView(QtWidgets.QTreeView):
         self.setHorizontalScrollMode(QtWidgets.QTreeView.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setSortingEnabled(True)
+        self.setSortingEnabled(False)
         self.setWordWrap(True)
 
     #############################################
@@ -447,8 +367,7 @@ class OntologyExplorerView(QtWidgets.QTreeView):
             if index:
                 model = self.model().sourceModel()
                 index = self.model().mapToSource(index)
-                item = model.itemFromIndex(index)
-                node = item.data()
+                node = model.nodeForIndex(index)
                 if node:
                     self.widget.sgnItemRightClicked.emit(node)
                     menu = self.session.mf.create(node.diagram, [node])
@@ -467,4 +386,265 @@ class OntologyExplorerView(QtWidgets.QTreeView):
         :type column: int
         :rtype: int
         """
-        return max(super().sizeHintForColumn(column), self.viewport().width())
\ No newline at end of file
+        return max(super().sizeHintForColumn(column), self.viewport().width())
+
+
+class OntologyExplorerModel(QtCore.QAbstractItemModel):
+    """
+    This class implements the model used by the ontology explorer to list ontology predicates.
+    Predicates are stored in buckets indexed by (name, type): both buckets and bucket children
+    are kept sorted, so that insertions and removals only require a binary search.
+    """
+    NodeRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, widget):
+        """
+        Initialize the ontology explorer model.
+        :type widget: OntologyExplorerWidget
+        """
+        super().__init__(widget)
+        self.buckets = {}
+        self.bucketsById = {}
+        self.keys = []
+        self.uid = 0
+
+        self.iconAttribute = QtGui.QIcon(':/icons/18/ic_treeview_attribute')
+        self.iconConcept = QtGui.QIcon(':/icons/18/ic_treeview_concept')
+        self.iconInstance = QtGui.QIcon(':/icons/18/ic_treeview_instance')
+        self.iconRole = QtGui.QIcon(':/icons/18/ic_treeview_role')
+        self.iconValue = QtGui.QIcon(':/icons/18/ic_treeview_value')
+
+    #############################################
+    #   MODEL INTERFACE
+    #################################
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of columns for the children of the given parent.
+        :type parent: QModelIndex
+        :rtype: int
+        """
+        return 1
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+        :type index: QModelIndex
+        :type role: int
+        :rtype: object
+        """
+        if index.isValid():
+            bucket = self.bucketsById.get(index.internalId())
+            if bucket:
+                if role == QtCore.Qt.DisplayRole:
+                    return bucket.children[index.row()]
+                if role == OntologyExplorerModel.NodeRole:
+                    return bucket.nodes[bucket.children[index.row()]]
+            else:
+                bucket = self.buckets[self.keys[index.row()]]
+                if role == QtCore.Qt.DisplayRole:
+                    return bucket.text
+                if role == QtCore.Qt.DecorationRole:
+                    return bucket.icon
+        return None
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """
+        Returns the index of the item in the model specified by the given row, column and parent index.
+        :type row: int
+        :type column: int
+        :type parent: QModelIndex
+        :rtype: QModelIndex
+        """
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, self.buckets[self.keys[parent.row()]].id)
+
+    def parent(self, index=None):
+        """
+        Returns the parent of the model item with the given index.
+        :type index: QModelIndex
+        :rtype: QModelIndex
+        """
+        if index is None:
+            return super().parent()
+        if index.isValid():
+            bucket = self.bucketsById.get(index.internalId())
+            if bucket:
+                return self.createIndex(bisect_left(self.keys, bucket.key), 0, 0)
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of rows under the given parent.
+        :type parent: QModelIndex
+        :rtype: int
+        """
+        if not parent.isValid():
+            return len(self.keys)
+        if parent.column() == 0 and not parent.internalId():
+            return len(self.buckets[self.keys[parent.row()]].children)
+        return 0
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addNode(self, diagram, node):
+        """
+        Add the given predicate node, keeping the model sorted.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        """
+        key = self.parentKey(node)
+        bucket = self.buckets.get(key)
+        if not bucket:
+            row = bisect_left(self.keys, key)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row)
+            bucket = self.createBucket(key, node)
+            self.keys.insert(row, key)
+            self.endInsertRows()
+        child = self.childKey(diagram, node)
+        if child not in bucket.nodes:
+            row = bisect_left(bucket.children, child)
+            self.beginInsertRows(self.createIndex(bisect_left(self.keys, key), 0, 0), row, row)
+            bucket.children.insert(row, child)
+            bucket.nodes[child] = node
+            self.endInsertRows()
+
+    def addNodes(self, collection):
+        """
+        Add the given collection of (diagram, node) pairs in a single batch.
+        :type collection: T <= list|tuple
+        """
+        if collection:
+            self.beginResetModel()
+            touched = set()
+            for diagram, node in collection:
+                key = self.parentKey(node)
+                bucket = self.buckets.get(key)
+                if not bucket:
+                    bucket = self.createBucket(key, node)
+                    self.keys.append(key)
+                child = self.childKey(diagram, node)
+                if child not in bucket.nodes:
+                    bucket.children.append(child)
+                    bucket.nodes[child] = node
+                    touched.add(bucket)
+            for bucket in touched:
+                bucket.children.sort()
+            self.keys.sort()
+            self.endResetModel()
+
+    def createBucket(self, key, node):
+        """
+        Create and store a new bucket for the given key.
+        :type key: tuple
+        :type node: AbstractNode
+        :rtype: OntologyExplorerBucket
+        """
+        self.uid += 1
+        bucket = OntologyExplorerBucket(self.uid, key, self.iconFor(node))
+        self.buckets[key] = bucket
+        self.bucketsById[bucket.id] = bucket
+        return bucket
+
+    @staticmethod
+    def childKey(diagram, node):
+        """
+        Returns the child key (text) used to place the given node in the treeview.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        :rtype: str
+        """
+        predicate = node.text().replace('\n', '')
+        diagram = rstrip(diagram.name, File.Graphol.extension)
+        return '{0} ({1} - {2})'.format(predicate, diagram, node.id)
+
+    def iconFor(self, node):
+        """
+        Returns the icon for the given node.
+        :type node:
+        """
+        if node.type() is Item.AttributeNode:
+            return self.iconAttribute
+        if node.type() is Item.ConceptNode:
+            return self.iconConcept
+        if node.type() is Item.IndividualNode:
+            if node.identity() is Identity.Individual:
+                return self.iconInstance
+            if node.identity() is Identity.Value:
+                return self.iconValue
+        if node.type() is Item.RoleNode:
+            return self.iconRole
+
+    def nodeForIndex(self, index):
+        """
+        Returns the node matching the given index, or None if the index does not refer to a node.
+        :type index: QModelIndex
+        :rtype: AbstractNode
+        """
+        return self.data(index, OntologyExplorerModel.NodeRole)
+
+    @staticmethod
+    def parentKey(node):
+        """
+        Returns the parent key used to place the given node in the treeview.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        return node.text().replace('\n', ''), node.type()
+
+    def removeNode(self, diagram, node):
+        """
+        Remove the given predicate node.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        """
+        key = self.parentKey(node)
+        bucket = self.buckets.get(key)
+        if bucket:
+            parent = bisect_left(self.keys, key)
+            child = self.childKey(diagram, node)
+            if child in bucket.nodes:
+                row = bisect_left(bucket.children, child)
+                self.beginRemoveRows(self.createIndex(parent, 0, 0), row, row)
+                del bucket.children[row]
+                del bucket.nodes[child]
+                self.endRemoveRows()
+            if not bucket.children:
+                self.beginRemoveRows(QtCore.QModelIndex(), parent, parent)
+                del self.keys[parent]
+                del self.buckets[key]
+                del self.bucketsById[bucket.id]
+                self.endRemoveRows()
+
+
+class OntologyExplorerBucket(object):
+    """
+    This class holds the occurrences of a single predicate in the ontology explorer model.
+    """
+    __slots__ = ('children', 'icon', 'id', 'key', 'nodes')
+
+    def __init__(self, uid, key, icon):
+        """
+        Initialize the bucket.
+        :type uid: int
+        :type key: tuple
+        :type icon: QIcon
+        """
+        self.children = []
+        self.icon = icon
+        self.id = uid
+        self.key = key
+        self.nodes = {}
+
+    @property
+    def text(self):
+        """
+        Returns the text of the predicate.
+        :rtype: str
+        """
+        return self.key[0]
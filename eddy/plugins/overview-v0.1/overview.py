@@ -39,6 +39,7 @@ from PySide6 import QtWidgets
 
 from eddy.core.functions.signals import connect, disconnect
 from eddy.core.plugin import AbstractPlugin
+from eddy.core.timer import CoalescingTimer
 
 from eddy.ui.dock import DockWidget
 
@@ -72,14 +73,16 @@ class OverviewPlugin(AbstractPlugin):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('overview').redraw()
+        self.widget('overview').invalidateSelection()
 
     @QtCore.Slot()
     def onDiagramUpdated(self):
         """
-        Executed whenever the active diagram is updated.
+        Executed whenever the content of the active diagram changes.
         """
-        self.widget('overview').redraw()
+        # CHANGES NOT AFFECTING THE GEOMETRY OF THE ITEMS (E.G. BRUSH) LEAVE NO DAMAGE
+        widget = self.widget('overview')
+        widget.invalidate(widget.diagram.bounds.takeDamage() or None)
 
     @QtCore.Slot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
@@ -102,7 +105,6 @@ class OverviewPlugin(AbstractPlugin):
             self.debug('** Connecting to diagram: %s', subwindow.diagram.name)
             connect(subwindow.diagram.selectionChanged, self.onDiagramSelectionChanged)
             connect(subwindow.diagram.sgnUpdated, self.onDiagramUpdated)
-            widget.setScene(subwindow.diagram)
             widget.setView(subwindow.view)
             widget.redraw()
         else:
@@ -115,7 +117,6 @@ class OverviewPlugin(AbstractPlugin):
                     self.debug('Disconnecting from diagram: %s', widget.diagram.name)
                     disconnect(widget.diagram.selectionChanged, self.onDiagramSelectionChanged)
                     disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
-                widget.setScene(None)
                 widget.setView(None)
                 widget.redraw()
 
@@ -179,11 +180,22 @@ class OverviewPlugin(AbstractPlugin):
         self.debug('Installing docking area widget')
         self.session.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.widget('overview_dock'))
 
+        # ATTACH TO THE ACTIVE DIAGRAM (THE PLUGIN IS ACTIVATED ON DEMAND, AFTER THE SESSION STARTUP)
+        self.onSubWindowActivated(self.session.mdi.activeSubWindow())
+
 
-class OverviewWidget(QtWidgets.QGraphicsView):
+class OverviewWidget(QtWidgets.QWidget):
     """
     This class is used to display the active diagram overview.
+    The overview is painted from a cached low-resolution thumbnail of the diagram: the areas
+    damaged by the diagram items (see DiagramBounds.takeDamage) are accumulated as dirty
+    regions, and only those regions are re-rendered into the thumbnail, at most once every
+    OverviewWidget.RefreshInterval msec.
     """
+    Margin = 10
+    MaxDirty = 256
+    RefreshInterval = 250
+
     def __init__(self, plugin):
         """
         Initialize the Overview.
@@ -192,13 +204,16 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         super().__init__(plugin.parent())
         self.setContextMenuPolicy(QtCore.Qt.PreventContextMenu)
         self.setMinimumSize(QtCore.QSize(216, 216))
-        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontAdjustForAntialiasing)
-        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState)
-        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.NoViewportUpdate)
+        self._bounds = QtCore.QRectF()
+        self._dirty = []
         self._mousePressed = False
+        self._pixmap = None
+        self._selection = set()
+        self._selectionChanged = False
+        self._timer = CoalescingTimer(self, OverviewWidget.RefreshInterval)
+        self._transform = QtGui.QTransform()
         self._view = None
+        connect(self._timer.timeout, self.renderThumbnail)
         #self.setStyleSheet("OverviewWidget {background: #ffffff ; }")   #GSCOLOR
 
     #############################################
@@ -222,14 +237,14 @@ class OverviewWidget(QtWidgets.QGraphicsView):
     def mouseDoubleClickEvent(self, mouseEvent):
         """
         Executed when the mouse is double clicked on the view.
-        :type mouseEvent: QGraphicsSceneMouseEvent
+        :type mouseEvent: QMouseEvent
         """
         pass
 
     def mousePressEvent(self, mouseEvent):
         """
         Executed when the mouse is pressed on the view.
-        :type mouseEvent: QGraphicsSceneMouseEvent
+        :type mouseEvent: QMouseEvent
         """
         if mouseEvent.buttons() & QtCore.Qt.LeftButton:
             if self._view:
@@ -239,7 +254,7 @@ class OverviewWidget(QtWidgets.QGraphicsView):
     def mouseMoveEvent(self, mouseEvent):
         """
         Executed when the mouse is moved on the view.
-        :type mouseEvent: QGraphicsSceneMouseEvent
+        :type mouseEvent: QMouseEvent
         """
         if mouseEvent.buttons() & QtCore.Qt.LeftButton:
             if self._view and self._mousePressed:
@@ -248,16 +263,43 @@ class OverviewWidget(QtWidgets.QGraphicsView):
     def mouseReleaseEvent(self, mouseEvent):
         """
         Executed when the mouse is released from the view.
-        :type mouseEvent: QGraphicsSceneMouseEvent
+        :type mouseEvent: QMouseEvent
         """
         if mouseEvent.buttons() & QtCore.Qt.LeftButton:
             if self._view:
                 self._mousePressed = False
 
+    def paintEvent(self, paintEvent):
+        """
+        Paint the cached thumbnail.
+        :type paintEvent: QPaintEvent
+        """
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtCore.Qt.white)
+        if self._pixmap:
+            painter.drawPixmap(0, 0, self._pixmap)
+
+    def resizeEvent(self, resizeEvent):
+        """
+        Executed when the widget is resized.
+        :type resizeEvent: QResizeEvent
+        """
+        super().resizeEvent(resizeEvent)
+        self.redraw()
+
+    def showEvent(self, showEvent):
+        """
+        Executed when the widget is shown: render changes collected while hidden.
+        :type showEvent: QShowEvent
+        """
+        super().showEvent(showEvent)
+        if self._dirty or self._selectionChanged:
+            self._timer.schedule()
+
     def wheelEvent(self, wheelEvent):
         """
         Turn off wheel event since we don't need to scroll anything.
-        :type wheelEvent: QGraphicsSceneWheelEvent
+        :type wheelEvent: QWheelEvent
         """
         pass
 
@@ -265,23 +307,116 @@ class OverviewWidget(QtWidgets.QGraphicsView):
     #   INTERFACE
     #################################
 
+    def invalidate(self, region=None):
+        """
+        Mark the given region of the diagram (expressed as a list of scene rectangles) as
+        dirty and schedule a refresh of the thumbnail. If no region is given, the whole
+        thumbnail will be re-rendered.
+        :type region: list
+        """
+        if region is None or len(self._dirty) + len(region) > OverviewWidget.MaxDirty:
+            # PAST THE LIMIT A FULL RENDER IS CHEAPER THAN MANY PARTIAL ONES
+            self._dirty = [None]
+        elif region and None not in self._dirty:
+            self._dirty.extend(region)
+        if self._dirty:
+            self._timer.schedule()
+
+    def invalidateSelection(self):
+        """
+        Schedule a refresh of the items whose selection state changed.
+        """
+        self._selectionChanged = True
+        self._timer.schedule()
+
+    def mapToScene(self, pos):
+        """
+        Map the given widget position to diagram coordinates.
+        :type pos: QPoint
+        :rtype: QPointF
+        """
+        transform, _ = self._transform.inverted()
+        return transform.map(QtCore.QPointF(pos))
+
     def redraw(self):
         """
-        Redraw the diagram within the overview.
+        Schedule a full redraw of the diagram within the overview.
         """
-        if self._view:
-            polygon = self.diagram.visibleRect(margin=10)
-            if polygon:
-                self.fitInView(polygon, QtCore.Qt.KeepAspectRatio)
-        viewport = self.viewport()
-        viewport.update()
+        self.invalidate(None)
+
+    @QtCore.Slot()
+    def renderThumbnail(self):
+        """
+        Render the dirty regions of the diagram into the cached thumbnail.
+        """
+        if not self.isVisible():
+            # Keep the dirty regions around: they will be rendered when the widget is shown.
+            return
+
+        dirty, self._dirty = self._dirty, []
+        diagram = self.diagram
+        if not diagram:
+            self._bounds = QtCore.QRectF()
+            self._pixmap = None
+            self._selection = set()
+            self._selectionChanged = False
+            self.update()
+            return
+
+        if self._selectionChanged:
+            # Only the items whose selection state changed since the last render are repainted.
+            self._selectionChanged = False
+            selection = diagram.selection.nodes | diagram.selection.edges.keys()
+            if None not in dirty:
+                dirty.extend(x.sceneBoundingRect() for x in selection ^ self._selection if x.scene() is diagram)
+            self._selection = selection
+
+        ratio = self.devicePixelRatioF()
+        size = self.size()
+        bounds = diagram.visibleRect(margin=OverviewWidget.Margin)
+        if None in dirty or bounds != self._bounds or not self._pixmap or \
+            self._pixmap.size() != size * ratio:
+            # Full render: (re)compute the diagram to thumbnail transformation.
+            self._bounds = bounds
+            self._pixmap = QtGui.QPixmap(size * ratio)
+            self._pixmap.setDevicePixelRatio(ratio)
+            self._pixmap.fill(QtCore.Qt.white)
+            self._transform = QtGui.QTransform()
+            dirty = []
+            if bounds.isValid():
+                scale = min(size.width() / bounds.width(), size.height() / bounds.height())
+                self._transform.translate((size.width() - bounds.width() * scale) / 2,
+                                          (size.height() - bounds.height() * scale) / 2)
+                self._transform.scale(scale, scale)
+                self._transform.translate(-bounds.left(), -bounds.top())
+                dirty = [bounds]
+
+        if dirty:
+            inverse, _ = self._transform.inverted()
+            painter = QtGui.QPainter(self._pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            for rect in dirty:
+                rect = rect.intersected(self._bounds)
+                if not rect.isEmpty():
+                    # Align the target area to thumbnail pixels to avoid seams between partial renders.
+                    target = QtCore.QRectF(self._transform.mapRect(rect).toAlignedRect().adjusted(-1, -1, 1, 1))
+                    painter.fillRect(target, QtCore.Qt.white)
+                    diagram.render(painter, target, inverse.mapRect(target), QtCore.Qt.IgnoreAspectRatio)
+            painter.end()
+
+        self.update()
 
     def setView(self, view):
         """
         Sets the widget to inspect the given Diagram view.
         :type: view: DiagramView
         """
+        self._selection = set()
+        self._selectionChanged = view is not None
         self._view = view
+        if view:
+            # DISCARD THE DAMAGE COLLECTED BEFORE THE FULL REDRAW
+            view.scene().bounds.takeDamage()
 
     def sizeHint(self):
         """
@@ -35,4 +35,7 @@ author: Daniele Pantaleone
 contact: pantaleone@dis.uniroma1.it
 id: overview
 name: Overview
-version: 0.1
\ No newline at end of file
+version: 0.1
+
+[activation]
+dock: Overview
\ No newline at end of file
@@ -41,6 +41,7 @@ from PySide6 import QtGui
 from PySide6 import QtWidgets
 
 from eddy.core.commands.labels import CommandLabelChange
+from eddy.core.commands.labels import CommandPredicateRename
 from eddy.core.datatypes.graphol import Identity
 from eddy.core.datatypes.owl import Datatype
 from eddy.core.datatypes.qt import Font
@@ -260,11 +261,7 @@ class RefactorNameForm(QtWidgets.QDialog):
         Accepts the rename form and perform refactoring.
         """
         name = self.renameField.value()
-        self.session.undostack.beginMacro('change predicate "{0}" to "{1}"'.format(self.node.text(), name))
-        for node in self.project.predicates(self.node.type(), self.node.text()):
-            command = CommandLabelChange(node.diagram, node, node.text(), name, refactor=True)
-            self.session.undostack.push(command)
-        self.session.undostack.endMacro()
+        self.session.undostack.push(CommandPredicateRename(self.project, self.node.type(), self.node.text(), name))
         super().accept()
 
     @QtCore.Slot()
@@ -43,7 +43,7 @@ from eddy import ORGANIZATION, APPNAME
 from eddy.core.common import HasWidgetSystem
 from eddy.core.datatypes.owl import OWLAxiom
 from eddy.core.datatypes.qt import Font
-from eddy.core.datatypes.system import Channel
+from eddy.core.datatypes.system import Channel, PageSize
 from eddy.core.diagram import Diagram
 from eddy.core.functions.signals import connect
 
@@ -84,12 +84,122 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         spinbox.setValue(settings.value('diagram/size', 5000, int))
         self.addWidget(spinbox)
 
+        prefix = QtWidgets.QLabel(self, objectName='diagram_lazy_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Load diagrams on demand')
+        self.addWidget(prefix)
+
+        checkbox = CheckBox(self, objectName='diagram_lazy_checkbox')
+        checkbox.setChecked(settings.value('diagram/lazy', False, bool))
+        checkbox.setFont(Font('Roboto', 12))
+        checkbox.setToolTip('Whether or not diagram items are built only when the diagram is first needed')
+        self.addWidget(checkbox)
+
         formlayout = QtWidgets.QFormLayout()
         formlayout.addRow(self.widget('diagram_size_prefix'), self.widget('diagram_size_field'))
+        formlayout.addRow(self.widget('diagram_lazy_prefix'), self.widget('diagram_lazy_checkbox'))
         groupbox = QtWidgets.QGroupBox('Editor', self, objectName='editor_widget')
         groupbox.setLayout(formlayout)
         self.addWidget(groupbox)
 
+        ## PDF EXPORT GROUP
+
+        prefix = QtWidgets.QLabel(self, objectName='pdf_page_size_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Page size')
+        self.addWidget(prefix)
+
+        combobox = ComboBox(objectName='pdf_page_size_switch')
+        combobox.setEditable(False)
+        combobox.setFont(Font('Roboto', 12))
+        combobox.setFocusPolicy(QtCore.Qt.StrongFocus)
+        combobox.setScrollEnabled(False)
+        combobox.setToolTip('Size of the pages in which exported diagrams are tiled')
+        combobox.addItems([x.value for x in PageSize])
+        combobox.setCurrentText(settings.value('export/pdf/page_size', PageSize.Fit.value, str))
+        self.addWidget(combobox)
+
+        prefix = QtWidgets.QLabel(self, objectName='pdf_overlap_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Page overlap')
+        self.addWidget(prefix)
+
+        spinbox = SpinBox(self, objectName='pdf_overlap_field')
+        spinbox.setFont(Font('Roboto', 12))
+        spinbox.setRange(0, 500)
+        spinbox.setSingleStep(10)
+        spinbox.setToolTip('Amount of diagram area repeated on adjacent tiled pages')
+        spinbox.setValue(settings.value('export/pdf/overlap', 0, int))
+        self.addWidget(spinbox)
+
+        prefix = QtWidgets.QLabel(self, objectName='pdf_scale_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Scale (%)')
+        self.addWidget(prefix)
+
+        spinbox = SpinBox(self, objectName='pdf_scale_field')
+        spinbox.setFont(Font('Roboto', 12))
+        spinbox.setRange(10, 400)
+        spinbox.setSingleStep(10)
+        spinbox.setToolTip('Scale factor applied to exported diagrams')
+        spinbox.setValue(settings.value('export/pdf/scale', 100, int))
+        self.addWidget(spinbox)
+
+        prefix = QtWidgets.QLabel(self, objectName='pdf_all_diagrams_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Export all diagrams')
+        self.addWidget(prefix)
+
+        checkbox = CheckBox(self, objectName='pdf_all_diagrams_checkbox')
+        checkbox.setChecked(settings.value('export/pdf/all_diagrams', False, bool))
+        checkbox.setFont(Font('Roboto', 12))
+        checkbox.setToolTip('Whether or not all the diagrams of the project are exported in a single document')
+        self.addWidget(checkbox)
+
+        formlayout = QtWidgets.QFormLayout()
+        formlayout.addRow(self.widget('pdf_page_size_prefix'), self.widget('pdf_page_size_switch'))
+        formlayout.addRow(self.widget('pdf_overlap_prefix'), self.widget('pdf_overlap_field'))
+        formlayout.addRow(self.widget('pdf_scale_prefix'), self.widget('pdf_scale_field'))
+        formlayout.addRow(self.widget('pdf_all_diagrams_prefix'), self.widget('pdf_all_diagrams_checkbox'))
+        groupbox = QtWidgets.QGroupBox('PDF Export', self, objectName='pdf_widget')
+        groupbox.setLayout(formlayout)
+        self.addWidget(groupbox)
+
+        ## IMAGE EXPORT GROUP
+
+        prefix = QtWidgets.QLabel(self, objectName='image_dpi_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Resolution (DPI)')
+        self.addWidget(prefix)
+
+        spinbox = SpinBox(self, objectName='image_dpi_field')
+        spinbox.setFont(Font('Roboto', 12))
+        spinbox.setRange(24, 1200)
+        spinbox.setSingleStep(24)
+        spinbox.setToolTip('Resolution of diagrams exported as PNG or SVG images')
+        spinbox.setValue(settings.value('export/image/dpi', 96, int))
+        self.addWidget(spinbox)
+
+        prefix = QtWidgets.QLabel(self, objectName='image_tile_size_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Tile size (px)')
+        self.addWidget(prefix)
+
+        spinbox = SpinBox(self, objectName='image_tile_size_field')
+        spinbox.setFont(Font('Roboto', 12))
+        spinbox.setRange(0, 65536)
+        spinbox.setSingleStep(512)
+        spinbox.setToolTip('Maximum size of each exported image file (0 = export a single image)')
+        spinbox.setValue(settings.value('export/image/tile_size', 0, int))
+        self.addWidget(spinbox)
+
+        formlayout = QtWidgets.QFormLayout()
+        formlayout.addRow(self.widget('image_dpi_prefix'), self.widget('image_dpi_field'))
+        formlayout.addRow(self.widget('image_tile_size_prefix'), self.widget('image_tile_size_field'))
+        groupbox = QtWidgets.QGroupBox('Image Export', self, objectName='image_widget')
+        groupbox.setLayout(formlayout)
+        self.addWidget(groupbox)
+
         ## UPDATE GROUP
 
         prefix = QtWidgets.QLabel(self, objectName='update_startup_prefix')
@@ -130,6 +240,8 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         layout = QtWidgets.QVBoxLayout()
         layout.setAlignment(QtCore.Qt.AlignTop)
         layout.addWidget(self.widget('editor_widget'), 0, QtCore.Qt.AlignTop)
+        layout.addWidget(self.widget('pdf_widget'), 0, QtCore.Qt.AlignTop)
+        layout.addWidget(self.widget('image_widget'), 0, QtCore.Qt.AlignTop)
         layout.addWidget(self.widget('update_widget'), 0, QtCore.Qt.AlignTop)
         widget = QtWidgets.QWidget()
         widget.setLayout(layout)
@@ -380,7 +492,14 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         # GENERAL TAB
         #################################
 
+        settings.setValue('diagram/lazy', self.widget('diagram_lazy_checkbox').isChecked())
         settings.setValue('diagram/size', self.widget('diagram_size_field').value())
+        settings.setValue('export/image/dpi', self.widget('image_dpi_field').value())
+        settings.setValue('export/image/tile_size', self.widget('image_tile_size_field').value())
+        settings.setValue('export/pdf/all_diagrams', self.widget('pdf_all_diagrams_checkbox').isChecked())
+        settings.setValue('export/pdf/overlap', self.widget('pdf_overlap_field').value())
+        settings.setValue('export/pdf/page_size', self.widget('pdf_page_size_switch').currentText())
+        settings.setValue('export/pdf/scale', self.widget('pdf_scale_field').value())
         settings.setValue('update/channel', self.widget('update_channel_switch').currentText())
         settings.setValue('update/check_on_startup', self.widget('update_startup_checkbox').isChecked())
 
@@ -41,10 +41,11 @@ from PySide6 import QtWidgets
 
 from eddy.core.commands.diagram import CommandDiagramResize
 from eddy.core.commands.labels import CommandLabelChange
+from eddy.core.commands.labels import CommandPredicateRename
 from eddy.core.commands.nodes import CommandNodeChangeInputsOrder
 from eddy.core.commands.nodes import CommandNodeSetMeta
 from eddy.core.commands.nodes import CommandNodeMove
-from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import OrderedSet
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.owl import Facet, Datatype
 from eddy.core.datatypes.qt import Font
@@ -527,7 +528,7 @@ class PredicateNodeProperty(NodeProperty):
                 item = self.node.type()
                 name = self.node.text()
                 project = self.diagram.project
-                return [CommandLabelChange(n.diagram, n, n.text(), data) for n in project.predicates(item, name)]
+                return [CommandPredicateRename(project, item, name, data)]
             return [CommandLabelChange(self.diagram, self.node, self.node.text(), data)]
         return [None]
 
@@ -638,7 +639,7 @@ class OrderedInputNodeProperty(NodeProperty):
         :rtype: QUndoCommand
         """
         if self.node.inputs:
-            inputs = DistinctList()
+            inputs = OrderedSet()
             for i in range(0, self.list.count()):
                 item = self.list.item(i)
                 inputs.append(item.data(QtCore.Qt.UserRole))
@@ -664,13 +665,10 @@ class FacetNodeProperty(NodeProperty):
         # FACET TAB
         #################################
 
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() is Item.DatatypeRestrictionNode
-        f3 = lambda x: x.type() is Item.ValueDomainNode
         admissible = [x for x in Facet]
-        restriction = first(self.node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        restriction = first(x for x in self.node.outgoingNodesOf(Item.InputEdge) if x.type() is Item.DatatypeRestrictionNode)
         if restriction:
-            valuedomain = first(restriction.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            valuedomain = first(x for x in restriction.incomingNodesOf(Item.InputEdge) if x.type() is Item.ValueDomainNode)
             if valuedomain:
                 admissible = Facet.forDatatype(valuedomain.datatype)
 
@@ -45,7 +45,7 @@ from eddy.core.functions.misc import isEmpty
 from eddy.core.functions.signals import connect
 from eddy.core.regex import RE_CAMEL_SPACE
 
-from eddy.ui.fields import CheckBox, TextField
+from eddy.ui.fields import TextField
 
 
 K_CURRENT = 'current'
@@ -56,117 +56,132 @@ K_NAME = 'name'
 K_PROPERTY = 'property'
 
 
-class PredicateDocumentationConflictResolver(QtWidgets.QDialog, HasWidgetSystem):
+class PredicateConflictResolver(QtWidgets.QDialog, HasWidgetSystem):
     """
-    This class is used to resolve conflicts generated by the different documentation of the same predicate.
+    This class is used to resolve, in a single dialog, all the conflicts generated by the different
+    metadata of the same predicates: conflicts on boolean properties are resolved by checking the
+    final value in the table, while documentation conflicts are resolved in the editor below it.
     """
-    def __init__(self, item, name, current, importing, parent=None):
+    ColumnType = 0
+    ColumnName = 1
+    ColumnProperty = 2
+    ColumnCurrent = 3
+    ColumnFinal = 4
+    ColumnImporting = 5
+
+    def __init__(self, collection, parent=None):
         """
         Initialize the project dialog.
-        :type item: Item
-        :type name: str
-        :type current: str
-        :type importing: str
+        :type collection: T <= list | tuple
         :type parent: QWidget
         """
         super().__init__(parent)
 
-        self.item = item
-        self.name = name
+        self.collection = sorted(collection, key=itemgetter(K_ITEM, K_NAME, K_PROPERTY))
+        self.finals = [None] * len(self.collection)
 
         #############################################
-        # LEFT SIDE
+        # CONFLICTS TABLE
         #################################
 
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('current_title')
-        widget.setText('Current')
-        self.addWidget(widget)
+        table = QtWidgets.QTableWidget(len(self.collection), 6, self, objectName='conflicts_table')
+        table.setHorizontalHeaderLabels(['Type', 'Name', 'Property', 'Current', 'Final', 'Importing'])
+        table.setFont(Font('Roboto', 12))
+        table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table.setMinimumSize(780, 300)
+        self.addWidget(table)
+
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        header.setSectionResizeMode(self.ColumnName, QtWidgets.QHeaderView.Stretch)
+        header.setSectionsMovable(False)
+        header = table.verticalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+
+        for row, e in enumerate(self.collection):
+            boolean = isinstance(e[K_CURRENT], bool)
+            item = QtWidgets.QTableWidgetItem(e[K_ITEM].shortName.title())
+            table.setItem(row, self.ColumnType, item)
+            item = QtWidgets.QTableWidgetItem(e[K_NAME])
+            table.setItem(row, self.ColumnName, item)
+            item = QtWidgets.QTableWidgetItem(RE_CAMEL_SPACE.sub('\g<1> \g<2>', e[K_PROPERTY]).lower())
+            table.setItem(row, self.ColumnProperty, item)
+            for column, key in ((self.ColumnCurrent, K_CURRENT), (self.ColumnImporting, K_IMPORTING)):
+                item = QtWidgets.QTableWidgetItem()
+                if boolean:
+                    item.setCheckState(QtCore.Qt.Checked if e[key] else QtCore.Qt.Unchecked)
+                    item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
+                else:
+                    item.setText(e[key].partition('\n')[0])
+                    item.setToolTip(e[key])
+                table.setItem(row, column, item)
+            item = QtWidgets.QTableWidgetItem()
+            if boolean:
+                item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable)
+                item.setCheckState(QtCore.Qt.PartiallyChecked)
+            table.setItem(row, self.ColumnFinal, item)
+
+        table.resizeColumnsToContents()
+        connect(table.itemChanged, self.onItemChanged)
+        connect(table.currentCellChanged, self.onCurrentCellChanged)
+
+        #############################################
+        # DOCUMENTATION EDITOR
+        #################################
 
         widget = TextField(self)
-        widget.setFixedSize(300, 200)
+        widget.setFixedHeight(120)
         widget.setFocusPolicy(QtCore.Qt.NoFocus)
         widget.setFont(Font('Roboto', 12))
         widget.setObjectName('current_documentation')
         widget.setReadOnly(True)
-        widget.setValue(current)
-        self.addWidget(widget)
-
-        widget = PHCQPushButton(self)
-        widget.setAutoDefault(False)
-        widget.setDefault(False)
-        widget.setProperty('class', 'flat blue')
-        widget.setFixedWidth(32)
-        widget.setIcon(QtGui.QIcon(':/icons/24/ic_keyboard_arrow_right_black'))
-        widget.setIconSize(QtCore.QSize(24, 24))
-        widget.setObjectName('pick_current_button')
-        widget.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
-        connect(widget.clicked, self.doPickDocumentation)
-        self.addWidget(widget)
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setFixedSize(QtCore.QSize(24, 24))
-        # widget.setPixmap(QtGui.QIcon(':/icons/24/ic_compare_arrows_black').pixmap(24))
-        # widget.setObjectName('compare_arrows_current_icon')
-        # self.addWidget(widget)
-
-        #############################################
-        # MIDDLE SIDE
-        #################################
-
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('final_title')
-        widget.setText('Final')
         self.addWidget(widget)
 
         widget = TextField(self)
-        widget.setFixedSize(300, 200)
+        widget.setFixedHeight(120)
+        widget.setEnabled(False)
         widget.setFont(Font('Roboto', 12))
         widget.setObjectName('final_documentation')
-        self.addWidget(widget)
-
-        #############################################
-        # RIGHT SIDE
-        #################################
-
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('importing_title')
-        widget.setText('Importing')
+        connect(widget.textChanged, self.onDocumentationChanged)
         self.addWidget(widget)
 
         widget = TextField(self)
-        widget.setFixedSize(300, 200)
+        widget.setFixedHeight(120)
         widget.setFocusPolicy(QtCore.Qt.NoFocus)
         widget.setFont(Font('Roboto', 12))
         widget.setObjectName('importing_documentation')
         widget.setReadOnly(True)
-        widget.setValue(importing)
+        self.addWidget(widget)
+
+        #############################################
+        # BUTTONS
+        #################################
+
+        widget = PHCQPushButton(self)
+        widget.setAutoDefault(False)
+        widget.setDefault(False)
+        widget.setProperty('class', 'flat blue')
+        widget.setIcon(QtGui.QIcon(':/icons/24/ic_keyboard_arrow_right_black'))
+        widget.setIconSize(QtCore.QSize(24, 24))
+        widget.setObjectName('pick_current_button')
+        widget.setText('Keep current')
+        widget.setToolTip('Keep the current value of the selected conflicts (all conflicts if none is selected)')
+        connect(widget.clicked, self.doPickValues)
         self.addWidget(widget)
 
         widget = PHCQPushButton(self)
         widget.setAutoDefault(False)
         widget.setDefault(False)
         widget.setProperty('class', 'flat blue')
-        widget.setFixedWidth(32)
         widget.setIcon(QtGui.QIcon(':/icons/24/ic_keyboard_arrow_left_black'))
         widget.setIconSize(QtCore.QSize(24, 24))
         widget.setObjectName('pick_importing_button')
-        widget.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
-        connect(widget.clicked, self.doPickDocumentation)
+        widget.setText('Keep importing')
+        widget.setToolTip('Keep the importing value of the selected conflicts (all conflicts if none is selected)')
+        connect(widget.clicked, self.doPickValues)
         self.addWidget(widget)
 
-        # widget = QtWidgets.QLabel(self)
-        # widget.setFixedSize(QtCore.QSize(24, 24))
-        # widget.setPixmap(QtGui.QIcon(':/icons/24/ic_compare_arrows_black').pixmap(24))
-        # widget.setObjectName('compare_arrows_importing_icon')
-        # self.addWidget(widget)
-
         #############################################
         # CONFIRMATION AREA
         #################################
@@ -177,6 +192,7 @@ class PredicateDocumentationConflictResolver(QtWidgets.QDialog, HasWidgetSystem)
         widget.setContentsMargins(0, 4, 0, 0)
         widget.setFont(Font('Roboto', 12))
         widget.setObjectName('confirmation_box')
+        widget.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
         connect(widget.accepted, self.accept)
         connect(widget.rejected, self.reject)
         self.addWidget(widget)
@@ -185,41 +201,77 @@ class PredicateDocumentationConflictResolver(QtWidgets.QDialog, HasWidgetSystem)
         # SETUP DIALOG LAYOUT
         #################################
 
-        gridWidget = QtWidgets.QWidget(self)
-        gridLayout = QtWidgets.QGridLayout(gridWidget)
-        gridLayout.setContentsMargins(0, 0, 0, 0)
-        gridLayout.addWidget(self.widget('current_title'), 0, 0)
-        gridLayout.addWidget(self.widget('current_documentation'), 1, 0)
-        gridLayout.addWidget(self.widget('final_title'), 0, 2)
-        gridLayout.addWidget(self.widget('final_documentation'), 1, 2)
-        gridLayout.addWidget(self.widget('importing_title'), 0, 4)
-        gridLayout.addWidget(self.widget('importing_documentation'), 1, 4)
-        # gridLayout.addWidget(self.widget('compare_arrows_current_icon'), 0, 1, QtCore.Qt.AlignCenter)
-        # gridLayout.addWidget(self.widget('compare_arrows_importing_icon'), 0, 3, QtCore.Qt.AlignCenter)
-        gridLayout.addWidget(self.widget('pick_current_button'), 1, 1)
-        gridLayout.addWidget(self.widget('pick_importing_button'), 1, 3)
+        buttonLayout = QtWidgets.QHBoxLayout()
+        buttonLayout.setContentsMargins(0, 0, 0, 0)
+        buttonLayout.addWidget(self.widget('pick_current_button'))
+        buttonLayout.addStretch(1)
+        buttonLayout.addWidget(self.widget('pick_importing_button'))
+
+        editorLayout = QtWidgets.QHBoxLayout()
+        editorLayout.setContentsMargins(0, 0, 0, 0)
+        editorLayout.addWidget(self.widget('current_documentation'))
+        editorLayout.addWidget(self.widget('final_documentation'))
+        editorLayout.addWidget(self.widget('importing_documentation'))
 
         mainLayout = QtWidgets.QVBoxLayout()
-        mainLayout.addWidget(gridWidget)
+        mainLayout.addWidget(self.widget('conflicts_table'), 1)
+        mainLayout.addLayout(buttonLayout)
+        mainLayout.addLayout(editorLayout)
         mainLayout.addWidget(self.widget('confirmation_box'))
         mainLayout.setContentsMargins(10, 10, 10, 10)
 
         self.setLayout(mainLayout)
-        self.setFixedSize(self.sizeHint())
         self.setFont(Font('Roboto', 12))
         self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
-        self.setWindowTitle("Resolve documentation conflict for {0} '{1}'...".format(self.item.shortName, self.name))
+        self.setWindowTitle('Resolve {0} conflicts...'.format(len(self.collection)))
 
     #############################################
     #   INTERFACE
     #################################
 
-    def result(self):
+    def isBoolean(self, row):
+        """
+        Returns True if the conflict in the given row involves a boolean property, False otherwise.
+        :type row: int
+        :rtype: bool
+        """
+        return isinstance(self.collection[row][K_CURRENT], bool)
+
+    def results(self):
+        """
+        Returns the conflict resolution.
+        :rtype: tuple
+        """
+        return ({
+            K_ITEM: e[K_ITEM],
+            K_NAME: e[K_NAME],
+            K_PROPERTY: e[K_PROPERTY],
+            K_FINAL: self.finals[row]
+        } for row, e in enumerate(self.collection))
+
+    def setFinal(self, row, value):
+        """
+        Set the final value of the conflict in the given row.
+        :type row: int
+        :type value: T <= bool | str
+        """
+        self.finals[row] = value
+        table = self.widget('conflicts_table')
+        item = table.item(row, self.ColumnFinal)
+        table.blockSignals(True)
+        if self.isBoolean(row):
+            item.setCheckState(QtCore.Qt.Checked if value else QtCore.Qt.Unchecked)
+        else:
+            item.setText(value.partition('\n')[0])
+            item.setToolTip(value)
+        table.blockSignals(False)
+
+    def refreshState(self):
         """
-        Returns the chosen documentation string.
-        :rtype: str
+        Enable the confirmation button only if all the conflicts have been resolved.
         """
-        return self.widget('final_documentation').value()
+        widget = self.widget('confirmation_box')
+        widget.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(None not in self.finals)
 
     #############################################
     #   SLOTS
@@ -230,13 +282,13 @@ class PredicateDocumentationConflictResolver(QtWidgets.QDialog, HasWidgetSystem)
         """
         Accepts the conflict resolution form.
         """
-        source = self.widget('final_documentation')
-        if isEmpty(source.value()):
+        missing = sum(1 for row, value in enumerate(self.finals) if not self.isBoolean(row) and isEmpty(value))
+        if missing:
             msgbox = QtWidgets.QMessageBox(self)
             msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_warning_black').pixmap(48))
             msgbox.setStandardButtons(QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Yes)
-            msgbox.setText("No documentation specified for {0} '{1}'. "
-                           "Do you want to continue?".format(self.item.shortName, self.name))
+            msgbox.setText('No documentation specified for {0} predicate(s). '
+                           'Do you want to continue?'.format(missing))
             msgbox.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
             msgbox.setWindowTitle('No documentation specified!')
             msgbox.exec_()
@@ -244,262 +296,67 @@ class PredicateDocumentationConflictResolver(QtWidgets.QDialog, HasWidgetSystem)
                 return
         super().accept()
 
-    @QtCore.Slot()
-    def doPickDocumentation(self):
+    @QtCore.Slot(int, int, int, int)
+    def onCurrentCellChanged(self, row, *_):
         """
-        Executed when a pick button is clicked.
-        """
-        source = self.widget('current_documentation')
-        if self.sender() is self.widget('pick_importing_button'):
-            source = self.widget('importing_documentation')
-        target = self.widget('final_documentation')
-        target.setValue(source.value())
-
-
-class PredicateBooleanConflictResolver(QtWidgets.QDialog, HasWidgetSystem):
-    """
-    This class is used to resolve conflicts generated by the different boolean properties of predicates.
-    """
-    def __init__(self, collection, parent=None):
+        Executed when the current row of the conflicts table changes.
+        :type row: int
         """
-        Initialize the project dialog.
-        :type collection: T <= list | tuple
-        :type parent: QWidget
-        """
-        super().__init__(parent)
-
-        self.collection = sorted(collection, key=itemgetter(K_ITEM, K_NAME))
-
-        #############################################
-        # CHECKBOX WIDGETS
-        #################################
+        current = self.widget('current_documentation')
+        final = self.widget('final_documentation')
+        importing = self.widget('importing_documentation')
+        if row >= 0 and not self.isBoolean(row):
+            e = self.collection[row]
+            current.setValue(e[K_CURRENT])
+            importing.setValue(e[K_IMPORTING])
+            final.blockSignals(True)
+            final.setValue(self.finals[row] or '')
+            final.blockSignals(False)
+            final.setEnabled(True)
+        else:
+            current.setValue('')
+            importing.setValue('')
+            final.blockSignals(True)
+            final.setValue('')
+            final.blockSignals(False)
+            final.setEnabled(False)
 
-        self.marks = {K_CURRENT: {}, K_IMPORTING: {}, K_FINAL: {}}
-
-        for e in self.collection:
-            ## CREATE CURRENT CHECKBOX
-            mark = CheckBox(self)
-            mark.setEnabled(False)
-            mark.setChecked(e[K_CURRENT])
-            if e[K_ITEM] not in self.marks[K_CURRENT]:
-                self.marks[K_CURRENT][e[K_ITEM]] = {}
-            if e[K_NAME] not in self.marks[K_CURRENT][e[K_ITEM]]:
-                self.marks[K_CURRENT][e[K_ITEM]][e[K_NAME]] = {}
-            self.marks[K_CURRENT][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]] = mark
-            ## CREATE IMPORTING CHECKBOX
-            mark = CheckBox(self)
-            mark.setEnabled(False)
-            mark.setChecked(e[K_IMPORTING])
-            if e[K_ITEM] not in self.marks[K_IMPORTING]:
-                self.marks[K_IMPORTING][e[K_ITEM]] = {}
-            if e[K_NAME] not in self.marks[K_IMPORTING][e[K_ITEM]]:
-                self.marks[K_IMPORTING][e[K_ITEM]][e[K_NAME]] = {}
-            self.marks[K_IMPORTING][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]] = mark
-            ## CREATE FINAL CHECKBOX
-            mark = CheckBox(self)
-            mark.setEnabled(True)
-            mark.setTristate(True)
-            mark.setCheckState(QtCore.Qt.PartiallyChecked)
-            connect(mark.stateChanged, self.onMarkStateChanged)
-            if e[K_ITEM] not in self.marks[K_FINAL]:
-                self.marks[K_FINAL][e[K_ITEM]] = {}
-            if e[K_NAME] not in self.marks[K_FINAL][e[K_ITEM]]:
-                self.marks[K_FINAL][e[K_ITEM]][e[K_NAME]] = {}
-            self.marks[K_FINAL][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]] = mark
-
-        #############################################
-        # BUTTONS & PLACEHOLDERS
-        #################################
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        # widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        # widget.setObjectName('title_type')
-        # widget.setText('Type')
-        # self.addWidget(widget)
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        # widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        # widget.setObjectName('title_name')
-        # widget.setText('Name')
-        # self.addWidget(widget)
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        # widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        # widget.setObjectName('title_property')
-        # widget.setText('Property')
-        # self.addWidget(widget)
-
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('title_current')
-        widget.setText('Current')
-        self.addWidget(widget)
-
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('title_final')
-        widget.setText('Final')
-        self.addWidget(widget)
-
-        widget = QtWidgets.QLabel(self)
-        widget.setAlignment(QtCore.Qt.AlignCenter)
-        widget.setFont(Font('Roboto', 14, bold=True, capitalization=Font.AllUppercase))
-        widget.setObjectName('title_importing')
-        widget.setText('Importing')
-        self.addWidget(widget)
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setFixedSize(QtCore.QSize(24, 24))
-        # widget.setPixmap(QtGui.QIcon(':/icons/24/ic_compare_arrows_black').pixmap(24))
-        # widget.setObjectName('compare_arrows_current_icon')
-        # self.addWidget(widget)
-
-        # widget = QtWidgets.QLabel(self)
-        # widget.setFixedSize(QtCore.QSize(24, 24))
-        # widget.setPixmap(QtGui.QIcon(':/icons/24/ic_compare_arrows_black').pixmap(24))
-        # widget.setObjectName('compare_arrows_importing_icon')
-        # self.addWidget(widget)
-
-        widget = PHCQPushButton(self)
-        widget.setAutoDefault(False)
-        widget.setDefault(False)
-        widget.setProperty('class', 'flat blue')
-        widget.setFixedWidth(32)
-        widget.setIcon(QtGui.QIcon(':/icons/24/ic_keyboard_arrow_right_black'))
-        widget.setIconSize(QtCore.QSize(24, 24))
-        widget.setObjectName('pick_current_button')
-        widget.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
-        connect(widget.clicked, self.doPickBooleanSet)
-        self.addWidget(widget)
-
-        widget = PHCQPushButton(self)
-        widget.setAutoDefault(False)
-        widget.setDefault(False)
-        widget.setProperty('class', 'flat blue')
-        widget.setFixedWidth(32)
-        widget.setIcon(QtGui.QIcon(':/icons/24/ic_keyboard_arrow_left_black'))
-        widget.setIconSize(QtCore.QSize(24, 24))
-        widget.setObjectName('pick_importing_button')
-        widget.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
-        connect(widget.clicked, self.doPickBooleanSet)
-        self.addWidget(widget)
-
-        #############################################
-        # CONFIRMATION AREA
-        #################################
-
-        widget = QtWidgets.QDialogButtonBox(QtCore.Qt.Horizontal, self)
-        widget.addButton(QtWidgets.QDialogButtonBox.Ok)
-        widget.addButton(QtWidgets.QDialogButtonBox.Abort)
-        widget.setContentsMargins(0, 4, 0, 0)
-        widget.setFont(Font('Roboto', 12))
-        widget.setObjectName('confirmation_box')
-        widget.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
-        connect(widget.accepted, self.accept)
-        connect(widget.rejected, self.reject)
-        self.addWidget(widget)
-
-        #############################################
-        # SETUP DIALOG LAYOUT
-        #################################
-
-        gridWidget = QtWidgets.QWidget(self)
-        gridLayout = QtWidgets.QGridLayout(gridWidget)
-        gridLayout.setContentsMargins(0, 0, 0, 0)
-        #gridLayout.addWidget(self.widget('title_type'), 0, 0)
-        #gridLayout.addWidget(self.widget('title_name'), 0, 1)
-        #gridLayout.addWidget(self.widget('title_property'), 0, 2)
-        gridLayout.addWidget(self.widget('title_current'), 0, 3)
-        gridLayout.addWidget(self.widget('title_final'), 0, 5)
-        gridLayout.addWidget(self.widget('title_importing'), 0, 7)
-        #gridLayout.addWidget(self.widget('compare_arrows_current_icon'), 0, 4, QtCore.Qt.AlignCenter)
-        #gridLayout.addWidget(self.widget('compare_arrows_importing_icon'), 0, 6, QtCore.Qt.AlignCenter)
-
-        for row, e in enumerate(self.collection, start=1):
-            w_type = QtWidgets.QLabel(self)
-            w_type.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-            w_type.setFont(Font('Roboto', 12))
-            w_type.setText(e[K_ITEM].shortName.title())
-            w_name = QtWidgets.QLabel(self)
-            w_name.setContentsMargins(40, 0, 40, 0)
-            w_name.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-            w_name.setFont(Font('Roboto', 12, italic=True))
-            w_name.setText(e[K_NAME])
-            w_prop = QtWidgets.QLabel(self)
-            w_prop.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-            w_prop.setFont(Font('Roboto', 14, bold=True, capitalization=Font.SmallCaps))
-            w_prop.setText(RE_CAMEL_SPACE.sub('\g<1> \g<2>', e[K_PROPERTY]).lower())
-            gridLayout.addWidget(w_type, row, 0)
-            gridLayout.addWidget(w_name, row, 1)
-            gridLayout.addWidget(w_prop, row, 2)
-            gridLayout.addWidget(self.marks[K_CURRENT][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]], row, 3, QtCore.Qt.AlignCenter)
-            gridLayout.addWidget(self.marks[K_FINAL][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]], row, 5, QtCore.Qt.AlignCenter)
-            gridLayout.addWidget(self.marks[K_IMPORTING][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]], row, 7, QtCore.Qt.AlignCenter)
-
-        gridLayout.addWidget(self.widget('pick_current_button'), 1, 4, len(self.collection), 1)
-        gridLayout.addWidget(self.widget('pick_importing_button'), 1, 6, len(self.collection), 1)
-
-        mainLayout = QtWidgets.QVBoxLayout()
-        mainLayout.addWidget(gridWidget)
-        mainLayout.addWidget(self.widget('confirmation_box'))
-        mainLayout.setContentsMargins(10, 10, 10, 10)
-
-        self.setLayout(mainLayout)
-        self.setFixedSize(self.sizeHint())
-        self.setFont(Font('Roboto', 12))
-        self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
-        self.setWindowTitle("Resolve conflicts...")
-
-    #############################################
-    #   INTERFACE
-    #################################
-
-    def results(self):
+    @QtCore.Slot()
+    def onDocumentationChanged(self):
         """
-        Returns the conflict resolution.
-        :rtype: tuple
+        Executed when the final documentation of the current conflict is edited.
         """
-        return ({
-            K_ITEM: e[K_ITEM],
-            K_NAME: e[K_NAME],
-            K_PROPERTY: e[K_PROPERTY],
-            K_FINAL: self.marks[K_FINAL][e[K_ITEM]][e[K_NAME]][e[K_PROPERTY]].isChecked()
-        } for e in self.collection)
+        row = self.widget('conflicts_table').currentRow()
+        if row >= 0 and not self.isBoolean(row):
+            self.setFinal(row, self.widget('final_documentation').value())
+            self.refreshState()
 
-    #############################################
-    #   SLOTS
-    #################################
-
-    @QtCore.Slot(int)
-    def onMarkStateChanged(self, _):
+    @QtCore.Slot('QTableWidgetItem')
+    def onItemChanged(self, item):
         """
-        Executed whenever the state of a checkbox changes.
-        :type _: int
+        Executed whenever an item of the conflicts table changes.
+        :type item: QTableWidgetItem
         """
-        f_mark = self.sender()
-        f_mark.setTristate(False)
-        widget = self.widget('confirmation_box')
-        widget.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(
-            not any(self.marks[K_FINAL][i][n][p].checkState() == QtCore.Qt.PartiallyChecked
-                for i in self.marks[K_FINAL]
-                    for n in self.marks[K_FINAL][i]
-                        for p in self.marks[K_FINAL][i][n]))
+        row = item.row()
+        if item.column() == self.ColumnFinal and self.isBoolean(row):
+            state = item.checkState()
+            if state != QtCore.Qt.PartiallyChecked:
+                self.finals[row] = state == QtCore.Qt.Checked
+                self.refreshState()
 
     @QtCore.Slot()
-    def doPickBooleanSet(self):
+    def doPickValues(self):
         """
         Executed when a pick button is clicked.
         """
         source = K_CURRENT
         if self.sender() is self.widget('pick_importing_button'):
             source = K_IMPORTING
-        for entry in self.collection:
-            s_mark = self.marks[source][entry[K_ITEM]][entry[K_NAME]][entry[K_PROPERTY]]
-            f_mark = self.marks[K_FINAL][entry[K_ITEM]][entry[K_NAME]][entry[K_PROPERTY]]
-            f_mark.setCheckState(QtCore.Qt.Checked if s_mark.isChecked() else QtCore.Qt.Unchecked)
-            f_mark.setTristate(False)
\ No newline at end of file
+        table = self.widget('conflicts_table')
+        rows = sorted({index.row() for index in table.selectionModel().selectedRows()})
+        if not rows:
+            rows = range(len(self.collection))
+        for row in rows:
+            self.setFinal(row, self.collection[row][source])
+        self.onCurrentCellChanged(table.currentRow())
+        self.refreshState()
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtWidgets
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.qt import Font
+from eddy.core.functions.misc import first
+from eddy.core.functions.signals import connect
+
+from eddy.ui.fields import StringField
+
+
+class QuickOpenDialog(QtWidgets.QDialog):
+    """
+    Extends QtWidgets.QDialog providing a quick-open window to search predicates across the whole project.
+    """
+    def __init__(self, session):
+        """
+        Initialize the dialog.
+        :type session: Session
+        """
+        super().__init__(session)
+
+        self.icons = {
+            Item.AttributeNode: QtGui.QIcon(':/icons/18/ic_treeview_attribute'),
+            Item.ConceptNode: QtGui.QIcon(':/icons/18/ic_treeview_concept'),
+            Item.IndividualNode: QtGui.QIcon(':/icons/18/ic_treeview_instance'),
+            Item.RoleNode: QtGui.QIcon(':/icons/18/ic_treeview_role'),
+        }
+
+        #############################################
+        # SEARCH AREA
+        #################################
+
+        self.search = StringField(self)
+        self.search.setAcceptDrops(False)
+        self.search.setClearButtonEnabled(True)
+        self.search.setFont(Font('Roboto', 12))
+        self.search.setPlaceholderText('Search predicates...')
+        self.search.setFixedHeight(30)
+        self.search.installEventFilter(self)
+
+        self.results = QtWidgets.QListWidget(self)
+        self.results.setFont(Font('Roboto', 12))
+        self.results.setMinimumSize(480, 320)
+        self.results.setUniformItemSizes(True)
+
+        #############################################
+        # SETUP DIALOG LAYOUT
+        #################################
+
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(10, 10, 10, 10)
+        self.mainLayout.addWidget(self.search)
+        self.mainLayout.addWidget(self.results)
+
+        self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        self.setWindowTitle('Find predicate')
+
+        connect(self.search.textChanged, self.doSearch)
+        connect(self.search.returnPressed, self.accept)
+        connect(self.results.itemActivated, self.accept)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the reference to the active project.
+        :rtype: Project
+        """
+        return self.session.project
+
+    @property
+    def session(self):
+        """
+        Returns the reference to the active session (alias for QuickOpenDialog.parent()).
+        :rtype: Session
+        """
+        return self.parent()
+
+    #############################################
+    #   EVENTS
+    #################################
+
+    def eventFilter(self, source, event):
+        """
+        Forward up/down key presses from the search field to the result list.
+        :type source: QObject
+        :type event: QEvent
+        :rtype: bool
+        """
+        if source is self.search and event.type() == QtCore.QEvent.KeyPress:
+            if event.key() in {QtCore.Qt.Key_Up, QtCore.Qt.Key_Down, QtCore.Qt.Key_PageUp, QtCore.Qt.Key_PageDown}:
+                self.results.event(event)
+                return True
+        return super().eventFilter(source, event)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.Slot()
+    def accept(self):
+        """
+        Focus the first occurrence of the selected predicate and close the dialog.
+        """
+        item = self.results.currentItem()
+        if item:
+            predicate, name = item.data(QtCore.Qt.UserRole)
+            nodes = self.project.predicates(predicate, name)
+            diagram = self.session.mdi.activeDiagram()
+            node = first(sorted(nodes, key=lambda x: (x.diagram is not diagram, x.diagram.name, x.id)))
+            super().accept()
+            if node:
+                self.session.doFocusItem(node)
+        else:
+            super().accept()
+
+    @QtCore.Slot(str)
+    def doSearch(self, text):
+        """
+        Executed when the search field is filled with data.
+        :type text: str
+        """
+        self.results.clear()
+        for predicate, name in self.session.search.query(text):
+            count = len(self.project.predicateDiagrams(predicate, name))
+            item = QtWidgets.QListWidgetItem(self.icons.get(predicate), '{0}  ({1} - {2} diagram{3})'.format(
+                name, predicate.shortName, count, 's' if count != 1 else ''))
+            item.setData(QtCore.Qt.UserRole, (predicate, name))
+            self.results.addItem(item)
+        self.results.setCurrentRow(0)
@@ -33,6 +33,7 @@
 ##########################################################################
 
 
+import importlib
 import os
 import sys
 import textwrap
@@ -80,12 +81,15 @@ from eddy.core.datatypes.misc import Color, DiagramMode
 from eddy.core.datatypes.owl import Datatype, Facet
 from eddy.core.datatypes.qt import BrushIcon, Font
 from eddy.core.datatypes.system import Channel, File
+from eddy.core.dependencies import DependencyGraph
 from eddy.core.diagram import Diagram
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
 from eddy.core.exporters.graphol import GrapholProjectExporter
 from eddy.core.exporters.owl2 import OWLOntologyExporter
 from eddy.core.exporters.pdf import PdfDiagramExporter
+from eddy.core.exporters.png import PngDiagramExporter
 from eddy.core.exporters.printer import PrinterDiagramExporter
+from eddy.core.exporters.svg import SvgDiagramExporter
 from eddy.core.factory import MenuFactory, PropertyFactory
 from eddy.core.functions.fsystem import fexists
 from eddy.core.functions.misc import first, format_exception
@@ -101,20 +105,18 @@ from eddy.core.plugin import PluginManager
 from eddy.core.profiles.owl2 import OWL2Profile
 from eddy.core.profiles.owl2ql import OWL2QLProfile
 from eddy.core.profiles.owl2rl import OWL2RLProfile
+from eddy.core.search import ProjectSearch
+from eddy.core.timer import CoalescingTimer
 from eddy.core.update import UpdateCheckWorker
 
-from eddy.ui.about import AboutDialog
 from eddy.ui.fields import ComboBox
 from eddy.ui.forms import CardinalityRestrictionForm
 from eddy.ui.forms import NewDiagramForm
 from eddy.ui.forms import RefactorNameForm
 from eddy.ui.forms import RenameDiagramForm
 from eddy.ui.forms import ValueForm
-from eddy.ui.log import LogDialog
 from eddy.ui.mdi import MdiArea
 from eddy.ui.mdi import MdiSubWindow
-from eddy.ui.plugin import PluginInstallDialog
-from eddy.ui.preferences import PreferencesDialog
 from eddy.ui.progress import BusyProgressDialog
 from eddy.ui.syntax import SyntaxValidationDialog
 from eddy.ui.view import DiagramView
@@ -186,6 +188,8 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         self.pf = PropertyFactory(self)
         self.pmanager = PluginManager(self)
         self.project = None
+        self.search = None
+        self.stateTimer = CoalescingTimer(self)
         #GUSA COLOR
         #self.setStyleSheet("Session {background: green ; }")   #GSCOLOR
 
@@ -212,6 +216,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
 
         worker = self.createProjectLoader(File.Graphol, path, self)
         worker.run()
+        self.search = ProjectSearch(self.project)
 
         #############################################
         # COMPLETE SESSION SETUP
@@ -257,7 +262,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             QtGui.QIcon(':/icons/24/ic_settings_black'), 'Preferences', self,
             objectName='open_preferences', shortcut=QtGui.QKeySequence.Preferences,
             statusTip='Open application preferences', triggered=self.doOpenDialog)
-        action.setData(PreferencesDialog)
+        action.setData('eddy.ui.preferences.PreferencesDialog')
         self.addAction(action)
 
         self.addAction(QtGui.QAction(
@@ -269,7 +274,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             QtGui.QIcon(':/icons/24/ic_help_outline_black'), 'About {0}'.format(APPNAME),
             self, objectName='about', shortcut=QtGui.QKeySequence.HelpContents,
             statusTip='About {0}'.format(APPNAME), triggered=self.doOpenDialog)
-        action.setData(AboutDialog)
+        action.setData('eddy.ui.about.AboutDialog')
         self.addAction(action)
 
         action = QtGui.QAction(
@@ -290,14 +295,14 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             QtGui.QIcon(':/icons/24/ic_message_black'), 'System log...',
             self, objectName='system_log', statusTip='Show application system log',
             triggered=self.doOpenDialog)
-        action.setData(LogDialog)
+        action.setData('eddy.ui.log.LogDialog')
         self.addAction(action)
 
         action = QtGui.QAction(
             QtGui.QIcon(':/icons/24/ic_extension_black'), 'Install Plugin...',
             self, objectName='install_plugin', statusTip='Install a plugin',
             triggered=self.doOpenDialog)
-        action.setData(PluginInstallDialog)
+        action.setData('eddy.ui.plugin.PluginInstallDialog')
         self.addAction(action)
 
         action = QtGui.QAction(
@@ -353,13 +358,13 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             objectName='close_project', shortcut=QtGui.QKeySequence.Close,
             statusTip='Close the current project', triggered=self.doClose))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_save_black'), 'Save', self,
             objectName='save', shortcut=QtGui.QKeySequence.Save,
             statusTip='Save the current project', enabled=False,
             triggered=self.doSave))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_save_black'), 'Save As...', self,
             objectName='save_as', shortcut=QtGui.QKeySequence.SaveAs,
             statusTip='Create a copy of the active diagram',
@@ -369,7 +374,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             'Import...', self, objectName='import', triggered=self.doImport,
             statusTip='Import a document in the current project'))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             'Export...', self, objectName='export', triggered=self.doExport,
             statusTip='Export the current project in a different format',
             enabled=False))
@@ -396,7 +401,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         action.setShortcut(QtGui.QKeySequence.Redo)
         self.addAction(action)
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_spellcheck_black'), 'Run syntax check',
             self, objectName='syntax_check', triggered=self.doSyntaxCheck,
             statusTip='Run syntax validation according to the selected profile'))
@@ -412,7 +417,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         # DIAGRAM SPECIFIC
         #################################
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_center_focus_strong_black'), 'Center diagram', self,
             objectName='center_diagram', statusTip='Center the active diagram',
             enabled=False, triggered=self.doCenterDiagram))
@@ -423,7 +428,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             statusTip='Open current diagram properties',
             triggered=self.doOpenDiagramProperties))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_healing_black'), 'Snap to grid',
             self, objectName='snap_to_grid', enabled=False,
             statusTip='Align the elements in the active diagram to the grid',
@@ -432,7 +437,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         icon = QtGui.QIcon()
         icon.addFile(':/icons/24/ic_grid_on_black', QtCore.QSize(), QtGui.QIcon.Normal, QtGui.QIcon.On)
         icon.addFile(':/icons/24/ic_grid_off_black', QtCore.QSize(), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             icon, 'Toggle the grid', self, objectName='toggle_grid', enabled=False,
             checkable=True, statusTip='Activate or deactivate the diagram grid',
             triggered=self.doToggleGrid))
@@ -441,49 +446,57 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         # ITEM GENERICS
         #################################
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_content_cut_black'), 'Cut', self,
             objectName='cut', enabled=False, shortcut=QtGui.QKeySequence.Cut,
             statusTip='Cut selected items', triggered=self.doCut))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_content_copy_black'), 'Copy', self,
             objectName='copy', enabled=False, shortcut=QtGui.QKeySequence.Copy,
             statusTip='Copy selected items', triggered=self.doCopy))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_content_paste_black'), 'Paste', self,
             objectName='paste', enabled=False, shortcut=QtGui.QKeySequence.Paste,
             statusTip='Paste previously copied items', triggered=self.doPaste))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_delete_black'), 'Delete', self,
             objectName='delete', enabled=False, shortcut=QtGui.QKeySequence.Delete,
             statusTip='Delete selected items', triggered=self.doDelete))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_delete_forever_black'), 'Purge', self,
             objectName='purge', enabled=False, triggered=self.doPurge,
             statusTip='Delete selected items by also removing no more necessary elements'))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_flip_to_front_black'), 'Bring to front',
             self, objectName='bring_to_front', enabled=False,
             statusTip='Bring selected items to front',
             triggered=self.doBringToFront))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_flip_to_back_black'), 'Send to back',
             self, objectName='send_to_back', enabled=False,
             statusTip='Send selected items to back',
             triggered=self.doSendToBack))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_select_all_black'), 'Select all',
             self, objectName='select_all', enabled=False,
             statusTip='Select all items in the active diagram',
             shortcut=QtGui.QKeySequence.SelectAll, triggered=self.doSelectAll))
 
+        action = QtGui.QAction(
+            QtGui.QIcon(':/icons/18/ic_zoom_black'), 'Find predicate...',
+            self, objectName='quick_open', shortcut=QtGui.QKeySequence.Find,
+            statusTip='Search predicates across the whole project',
+            triggered=self.doOpenDialog)
+        action.setData('eddy.ui.search.QuickOpenDialog')
+        self.addAction(action)
+
         #############################################
         # EDGE RELATED
         #################################
@@ -493,7 +506,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             objectName='remove_breakpoint', statusTip='Remove the selected edge breakpoint',
             triggered=self.doRemoveBreakpoint))
 
-        self.addAction(QtGui.QAction(
+        self.addAction(StateAction(
             QtGui.QIcon(':/icons/24/ic_swap_horiz_black'), 'Swap edge', self,
             objectName='swap_edge', shortcut='ALT+S', enabled=False,
             statusTip='Swap the direction of all the selected edges',
@@ -559,21 +572,21 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         # ROLE / ATTRIBUTE SPECIFIC
         #################################
 
-        action = QtGui.QAction(
+        action = StateAction(
             QtGui.QIcon(':/icons/24/ic_square_outline_black'), 'Domain',
             self, objectName='property_domain', shortcut='CTRL+D',
             triggered=self.doComposePropertyExpression)
         action.setData((Item.DomainRestrictionNode,))
         self.addAction(action)
 
-        action = QtGui.QAction(
+        action = StateAction(
             QtGui.QIcon(':/icons/24/ic_square_black'), 'Range',
             self, objectName='property_range', shortcut='CTRL+R',
             triggered=self.doComposePropertyExpression)
         action.setData((Item.RangeRestrictionNode,))
         self.addAction(action)
 
-        action = QtGui.QAction(
+        action = StateAction(
             QtGui.QIcon(':/icons/24/ic_square_half_black'), 'Domain/Range',
             self, objectName='property_domain_range',
             triggered=self.doComposePropertyExpression)
@@ -687,6 +700,8 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         """
         self.addDiagramExporter(GraphMLDiagramExporter)
         self.addDiagramExporter(PdfDiagramExporter)
+        self.addDiagramExporter(PngDiagramExporter)
+        self.addDiagramExporter(SvgDiagramExporter)
         self.addOntologyExporter(OWLOntologyExporter)
         self.addProjectExporter(GrapholProjectExporter)
 
@@ -741,6 +756,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         menu.addAction(self.action('swap_edge'))
         menu.addSeparator()
         menu.addAction(self.action('select_all'))
+        menu.addAction(self.action('quick_open'))
         menu.addAction(self.action('snap_to_grid'))
         menu.addAction(self.action('center_diagram'))
         menu.addSeparator()
@@ -946,6 +962,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         connect(self.sgnReady, self.onSessionReady)
         connect(self.sgnSaveProject, self.doSave)
         connect(self.sgnUpdateState, self.doUpdateState)
+        connect(self.stateTimer.timeout, self.updateState)
 
     def initState(self):
         """
@@ -1249,12 +1266,15 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
             dialog.setDirectory(expandPath('~/'))
             dialog.setFileMode(QtWidgets.QFileDialog.AnyFile)
-            dialog.setNameFilters(sorted(self.ontologyExporterNameFilters() + self.projectExporterNameFilters({File.Graphol})))
+            filters = self.ontologyExporterNameFilters() + self.projectExporterNameFilters({File.Graphol})
+            filters += [x.value for x in self.pmanager.deferredFiletypes() if x.value not in filters]
+            dialog.setNameFilters(sorted(filters))
             dialog.setViewMode(QtWidgets.QFileDialog.Detail)
             dialog.selectFile(self.project.name)
             dialog.selectNameFilter(File.Owl.value)
             if dialog.exec_():
                 filetype = File.valueOf(dialog.selectedNameFilter())
+                self.pmanager.require(filetype)
                 try:
                     worker = self.createOntologyExporter(filetype, self.project, self)
                 except ValueError:
@@ -1267,6 +1287,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         Focus the given diagram in the MDI area.
         :type diagram: Diagram
         """
+        self.project.materialize(diagram)
         subwindow = self.mdi.subWindowForDiagram(diagram)
         if not subwindow:
             view = self.createDiagramView(diagram)
@@ -1334,9 +1355,6 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             return Item.DomainRestrictionNode
 
         f0 = lambda x: x.type() is Item.RoleNode
-        f1 = lambda x: x.type() is Item.InputEdge
-        f2 = lambda x: x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
-        f3 = lambda x: x.type() is Item.RoleInverseNode
 
         diagram = self.mdi.activeDiagram()
         if diagram:
@@ -1347,9 +1365,9 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
                 collection = dict()
                 predicates = self.project.predicates(node.type(), node.text())
                 for predicate in predicates:
-                    swappable = set.union(swappable, predicate.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
-                    for inv in predicate.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f3):
-                        swappable = set.union(swappable, inv.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    swappable = set.union(swappable, {x for x in predicate.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}})
+                    for inv in {x for x in predicate.outgoingNodesOf(Item.InputEdge) if x.type() is Item.RoleInverseNode}:
+                        swappable = set.union(swappable, {x for x in inv.outgoingNodesOf(Item.InputEdge) if x.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}})
                 for xnode in swappable:
                     ynode = xnode.diagram.factory.create(invert(xnode.type()))
                     ynode.setPos(xnode.pos())
@@ -1416,9 +1434,13 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
     def doOpenDialog(self):
         """
         Open a dialog window by initializing it using the class stored in action data.
+        The class may also be given as a dotted path, in which case its module is imported on first use.
         """
         action = self.sender()
         dialog = action.data()
+        if isinstance(dialog, str):
+            module, name = dialog.rsplit('.', 1)
+            dialog = getattr(importlib.import_module(module), name)
         window = dialog(self)
         window.exec_()
 
@@ -1486,24 +1508,8 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         diagram = self.mdi.activeDiagram()
         if diagram:
             diagram.setMode(DiagramMode.Idle)
-            items = set(diagram.selectedItems())
-            purge = set()
-            for item in items:
-                if item.isNode():
-                    for node in item.definition():
-                        if item.isConstructor():
-                            if node not in items:
-                                # Here we examine a node which is included in the definition of a node
-                                # in the original selection, but it's not included in the selection itself.
-                                # If the node contribute only to the definition on this node and has no
-                                # relation with any other node in the diagram, which is not in the original
-                                # item selection, we will remove it.
-                                if node.adjacentNodes(filter_on_nodes=lambda x: x not in items):
-                                    continue
-                        purge.add(node)
-            collection = list(items|purge)
+            collection = self.purgePreview(diagram)
             if collection:
-                collection.extend([x for item in collection if item.isNode() for x in item.edges if x not in collection])
                 self.undostack.push(CommandItemsRemove(diagram, collection))
 
     @QtCore.Slot()
@@ -1643,9 +1649,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         """
         diagram = self.mdi.activeDiagram()
         if diagram:
-            path = QtGui.QPainterPath()
-            path.addRect(diagram.sceneRect())
-            diagram.setSelectionArea(path)
+            diagram.setItemsSelected(diagram.project.items(diagram))
             diagram.setMode(DiagramMode.Idle)
 
     @QtCore.Slot()
@@ -1915,58 +1919,10 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
     @QtCore.Slot()
     def doUpdateState(self):
         """
-        Update built-in actions according to the application state.
+        Schedule an update of the built-in actions: multiple requests are coalesced into
+        a single update performed when control returns to the event loop (see Session.flushState).
         """
-        isDomainRangeUsable = False
-        isDiagramActive = False
-        isClipboardEmpty = True
-        isEdgeSelected = False
-        isEdgeSwapEnabled = False
-        isNodeSelected = False
-        isPredicateSelected = False
-        isProjectEmpty = self.project.isEmpty()
-        isUndoStackClean = self.undostack.isClean()
-
-        if self.mdi.subWindowList():
-            diagram = self.mdi.activeDiagram()
-            restrictables = {Item.AttributeNode, Item.RoleNode}
-            predicates = {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.IndividualNode}
-            if diagram:
-                nodes = diagram.selectedNodes()
-                edges = diagram.selectedEdges()
-                isDiagramActive = True
-                isClipboardEmpty = self.clipboard.empty()
-                isEdgeSelected = first(edges) is not None
-                isNodeSelected = first(nodes) is not None
-                isDomainRangeUsable = any([x.type() in restrictables for x in nodes])
-                isPredicateSelected = any([x.type() in predicates for x in nodes])
-                if isEdgeSelected:
-                    for edge in edges:
-                        isEdgeSwapEnabled = edge.isSwapAllowed()
-                        if isEdgeSwapEnabled:
-                            break
-
-        self.action('bring_to_front').setEnabled(isNodeSelected)
-        self.action('center_diagram').setEnabled(isDiagramActive)
-        self.action('cut').setEnabled(isNodeSelected)
-        self.action('copy').setEnabled(isNodeSelected)
-        self.action('delete').setEnabled(isNodeSelected or isEdgeSelected)
-        self.action('purge').setEnabled(isNodeSelected)
-        self.action('export').setEnabled(not isProjectEmpty)
-        self.action('paste').setEnabled(not isClipboardEmpty)
-        self.action('property_domain').setEnabled(isDomainRangeUsable)
-        self.action('property_domain_range').setEnabled(isDomainRangeUsable)
-        self.action('property_range').setEnabled(isDomainRangeUsable)
-        self.action('save').setEnabled(not isUndoStackClean)
-        self.action('save_as').setEnabled(isDiagramActive)
-        self.action('select_all').setEnabled(isDiagramActive)
-        self.action('send_to_back').setEnabled(isNodeSelected)
-        self.action('snap_to_grid').setEnabled(isDiagramActive)
-        self.action('syntax_check').setEnabled(not isProjectEmpty)
-        self.action('swap_edge').setEnabled(isEdgeSelected and isEdgeSwapEnabled)
-        self.action('toggle_grid').setEnabled(isDiagramActive)
-        self.widget('button_set_brush').setEnabled(isPredicateSelected)
-        self.widget('profile_switch').setCurrentText(self.project.profile.name())
+        self.stateTimer.schedule()
 
     @QtCore.Slot()
     def onNoUpdateAvailable(self):
@@ -2055,6 +2011,9 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             self.pmanager.clear()
             ## DISPOSE ALL THE RUNNING THREADS
             self.stopRunningThreads()
+            self.stateTimer.stop()
+            ## RELEASE THE SYSTEM CLIPBOARD
+            self.clipboard.dispose()
             ## HIDE ALL THE NOTIFICATION POPUPS
             self.hideNotifications()
             ## SHUTDOWN THE ACTIVE SESSION
@@ -2119,6 +2078,26 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         subwindow.showMaximized()
         return subwindow
 
+    def flushState(self):
+        """
+        Perform the pending update of the built-in actions, if any.
+        """
+        if self.stateTimer.isActive():
+            self.updateState()
+
+    def purgePreview(self, diagram=None, items=None):
+        """
+        Returns the collection of items which would be removed by purging the given items (by default
+        the selected items of the given diagram, or of the active one if no diagram is given).
+        :type diagram: Diagram
+        :type items: T <= list|tuple|set
+        :rtype: set
+        """
+        diagram = diagram or self.mdi.activeDiagram()
+        if items is None:
+            items = diagram.selectedItems() if diagram else ()
+        return DependencyGraph(items).collection()
+
     def save(self):
         """
         Save the current session state.
@@ -2138,3 +2117,68 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         if diagram:
             title = '{0} - {1}'.format(diagram.name, title)
         super().setWindowTitle(title)
+
+    def updateState(self):
+        """
+        Update built-in actions according to the application state.
+        """
+        self.stateTimer.stop()
+        isDomainRangeUsable = False
+        isDiagramActive = False
+        isClipboardEmpty = True
+        isEdgeSelected = False
+        isEdgeSwapEnabled = False
+        isNodeSelected = False
+        isPredicateSelected = False
+        isProjectEmpty = self.project.isEmpty()
+        isUndoStackClean = self.undostack.isClean()
+
+        if self.mdi.subWindowList():
+            diagram = self.mdi.activeDiagram()
+            if diagram:
+                selection = diagram.selection
+                isDiagramActive = True
+                isClipboardEmpty = self.clipboard.empty()
+                isEdgeSelected = selection.edgeCount() > 0
+                isNodeSelected = selection.count() > 0
+                isDomainRangeUsable = selection.count(Item.AttributeNode, Item.RoleNode) > 0
+                isPredicateSelected = selection.count(Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.IndividualNode) > 0
+                isEdgeSwapEnabled = isEdgeSelected and selection.swapCount() > 0
+
+        self.action('bring_to_front').setEnabled(isNodeSelected)
+        self.action('center_diagram').setEnabled(isDiagramActive)
+        self.action('cut').setEnabled(isNodeSelected)
+        self.action('copy').setEnabled(isNodeSelected)
+        self.action('delete').setEnabled(isNodeSelected or isEdgeSelected)
+        self.action('purge').setEnabled(isNodeSelected)
+        self.action('export').setEnabled(not isProjectEmpty)
+        self.action('paste').setEnabled(not isClipboardEmpty)
+        self.action('property_domain').setEnabled(isDomainRangeUsable)
+        self.action('property_domain_range').setEnabled(isDomainRangeUsable)
+        self.action('property_range').setEnabled(isDomainRangeUsable)
+        self.action('save').setEnabled(not isUndoStackClean)
+        self.action('save_as').setEnabled(isDiagramActive)
+        self.action('select_all').setEnabled(isDiagramActive)
+        self.action('send_to_back').setEnabled(isNodeSelected)
+        self.action('snap_to_grid').setEnabled(isDiagramActive)
+        self.action('syntax_check').setEnabled(not isProjectEmpty)
+        self.action('swap_edge').setEnabled(isEdgeSelected and isEdgeSwapEnabled)
+        self.action('toggle_grid').setEnabled(isDiagramActive)
+        self.widget('button_set_brush').setEnabled(isPredicateSelected)
+        self.widget('profile_switch').setCurrentText(self.project.profile.name())
+
+
+class StateAction(QtGui.QAction):
+    """
+    Extends QtGui.QAction for actions whose enabled state is computed by Session.updateState:
+    the pending state update is performed before the action is triggered, so that the action
+    reflects the current state even if the event loop has not run since the state changed.
+    """
+    def trigger(self):
+        """
+        Trigger the action.
+        """
+        session = self.parent()
+        if isinstance(session, Session):
+            session.flushState()
+        super().trigger()
@@ -41,9 +41,13 @@ from eddy.core.common import HasThreadingSystem
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.qt import Font
 from eddy.core.functions.signals import connect
+from eddy.core.output import getPerfLogger
 from eddy.core.worker import AbstractWorker
 
 
+PERF = getPerfLogger()
+
+
 class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
     """
     Extends QtWidgets.QDialog with facilities to perform manual syntax validation.
@@ -63,7 +67,7 @@ class SyntaxValidationDialog(QtWidgets.QDialog, HasThreadingSystem):
         # edge endpoints at first, and then (if no error is detected) will perform the validation on the
         # edge itself. However, disconnected nodes won't be taken into account and thus we must perform
         # an additional step to validate the isolated nodes separately.
-        self.items = list(project.edges()) + list(filter(lambda n: not n.adjacentNodes(), project.nodes()))
+        self.items = list(project.edges()) + [n for n in project.nodes() if not n.edges]
         self.project = project
         self.workerThread = None
         self.worker = None
@@ -308,6 +312,8 @@ class SyntaxValidationWorker(AbstractWorker):
         Main worker.
         """
         errorMsg = None
+        offset = self.i
+        event = PERF.start('syntax.validate', total=len(self.items))
         while self.i < len(self.items):
 
             item = self.items[self.i]
@@ -344,6 +350,8 @@ class SyntaxValidationWorker(AbstractWorker):
 
             self.i += 1
 
+        PERF.finish(event, items=self.i - offset, valid=errorMsg is None)
+
         if errorMsg:
             self.sgnSyntaxError.emit(errorMsg)
         else:
@@ -319,11 +319,8 @@ class DiagramView(QtWidgets.QGraphicsView):
 
                 area = QtCore.QRectF(self.rubberBandOrigin, self.mapToScene(mousePos)).normalized()
                 collection = set(self.diagram.items(area, edges=False))
-                for node in collection:
-                    node.setSelected(True)
-                    for edge in node.edges:
-                        if edge.other(node) in collection:
-                            edge.setSelected(True)
+                edges = {edge for node in collection for edge in node.edges if edge.other(node) in collection}
+                self.diagram.setItemsSelected(collection | edges)
 
         #############################################
         # RESET STATE
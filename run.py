@@ -37,6 +37,13 @@
 import platform
 import os
 import sys
+
+if '--profile-startup' in sys.argv:
+    from eddy.core.profiler import ImportProfiler
+    PROFILER = ImportProfiler()
+    PROFILER.install()
+else:
+    PROFILER = None
 #import jnius_config
 from PySide6.QtWidgets import QStyleFactory
 from eddy.core.functions.path import expandPath
@@ -121,10 +128,9 @@ from eddy import APPNAME, COPYRIGHT, VERSION, BUG_TRACKER
 from eddy.core.application import Eddy
 from eddy.core.functions.misc import format_exception
 from eddy.core.functions.signals import connect
-from eddy.core.output import getLogger
-
-from eddy.ui import fonts_rc
-from eddy.ui import images_rc
+from eddy.core.functions.fsystem import mkdir
+from eddy.core.output import getLogger, getPerfLogger, OutputHandler
+from eddy.core.resources import registerResources
 
 
 app = None
@@ -204,11 +210,19 @@ def main():
     parser.add_argument('--nosplash', dest='nosplash', action='store_true')
     parser.add_argument('--tests', dest='tests', action='store_true')
     parser.add_argument('--open', dest='open', default=None)
+    parser.add_argument('--profile-startup', dest='profile_startup', action='store_true')
+    parser.add_argument('--perf-log', dest='perf_log', default=None)
 
     sys.excepthook = base_except_hook
 
     options, _ = parser.parse_known_args(args=sys.argv)
 
+    # THE IN-MEMORY LOG IS BOUNDED: EVICTED LINES ARE SPILLED TO A ROTATING FILE
+    mkdir('@home/')
+    OutputHandler.Stream.setRotation(expandPath('@home/eddy.log'))
+    if options.perf_log:
+        getPerfLogger().enable(expandPath(options.perf_log))
+
     global app
     app = Eddy(options, sys.argv)
     if app.isRunning():
@@ -239,8 +253,13 @@ def main():
     #LOGGER.frame('SIP version: %s', SIP_VERSION_STR, separator='|')
     LOGGER.separator(separator='-')
 
+    registerResources('fonts', 'images')
+
     app.configure(options)
     app.start(options)
+    if PROFILER:
+        PROFILER.uninstall()
+        QtCore.QTimer.singleShot(0, PROFILER.report)
     sys.exit(app.exec())
 
 
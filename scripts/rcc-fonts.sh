@@ -38,4 +38,4 @@ PARENT_DIR="$(dirname "${SCRIPT_DIR}")"
 VIRTUAL_ENV="${HOME}/python34"
 
 source "${VIRTUAL_ENV}/bin/activate"
-pyrcc5 "${PARENT_DIR}/eddy/ui/fonts.qrc" -o "${PARENT_DIR}/eddy/ui/fonts_rc.py"
\ No newline at end of file
+pyside6-rcc --binary "${PARENT_DIR}/eddy/ui/fonts.qrc" -o "${PARENT_DIR}/resources/fonts.rcc"
\ No newline at end of file
@@ -626,6 +626,8 @@ include_files = [
     ('resources/java', 'resources/java'),
     ('resources/lib', 'resources/lib'),
     ('resources/styles', 'resources/styles'),
+    ('resources/fonts.rcc', 'resources/fonts.rcc'),
+    ('resources/images.rcc', 'resources/images.rcc'),
     ('LICENSE', 'LICENSE'),
     ('CONTRIBUTING.md', 'CONTRIBUTING.md'),
     ('PACKAGING.md', 'PACKAGING.md'),
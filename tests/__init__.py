@@ -78,12 +78,15 @@ from unittest.util import safe_repr
 
 from PySide6 import QtCore
 from PySide6 import QtTest
+from PySide6 import QtWidgets
 
 from eddy import APPNAME, ORGANIZATION, WORKSPACE
 from eddy.core.application import Eddy
 from eddy.core.output import getLogger
-from eddy.ui import fonts_rc
-from eddy.ui import images_rc
+from eddy.core.resources import registerResources
+
+
+registerResources('fonts', 'images')
 
 
 testcase_lock = threading.Lock()
@@ -149,6 +152,10 @@ class EddyTestCase(TestCase):
         """
         Perform operation on test end.
         """
+        # RELEASE THE SYSTEM CLIPBOARD (aboutToQuit IS NOT EMITTED WITHOUT AN EVENT LOOP)
+        for session in self.eddy.sessions:
+            session.clipboard.dispose()
+        QtWidgets.QApplication.clipboard().clear()
         # SHUTDOWN EDDY
         self.eddy.quit()
         # REMOVE TEST DIRECTORY
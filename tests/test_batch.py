@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import os
+import tempfile
+import unittest
+
+from eddy.core.batch import run
+from eddy.core.functions.path import expandPath
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def test_batch_load_validate_export(self):
+        with tempfile.TemporaryDirectory() as output:
+            report = run([expandPath('@tests/test_project_1')], ['csv', 'pdf'], output, jobs=1)
+            self.assertEqual({'ok': 1, 'invalid': 0, 'failed': 0}, report['summary'])
+            project = report['projects'][0]
+            self.assertEqual('test_project_1', project['name'])
+            self.assertEqual([], project['errors'])
+            for ext in ('csv', 'pdf'):
+                self.assertEqual('ok', project['exports'][ext]['status'])
+                self.assertTrue(os.path.isfile(project['exports'][ext]['path']))
+            for key in ('load', 'validate', 'export_csv', 'export_pdf', 'total'):
+                self.assertIn(key, project['timings'])
+
+    def test_batch_missing_project(self):
+        with tempfile.TemporaryDirectory() as output:
+            report = run([os.path.join(output, 'missing')], [], output, jobs=1)
+            self.assertEqual({'ok': 0, 'invalid': 0, 'failed': 1}, report['summary'])
+            self.assertIn('failure', report['projects'][0])
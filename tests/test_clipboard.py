@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+from eddy.core.clipboard import Clipboard, EdgeDescriptor, NodeDescriptor
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.misc import first
+
+from tests import EddyTestCase
+
+
+class ClipboardTestCase(EddyTestCase):
+    """
+    Tests for the clipboard and the Graphol fragments exchanged through the system clipboard.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+
+    def copyDiagram(self, diagram):
+        """
+        Copy all the items of the given diagram in the session clipboard.
+        :type diagram: Diagram
+        :rtype: Clipboard
+        """
+        diagram.setItemsSelected(self.project.items(diagram))
+        self.session.clipboard.update(diagram)
+        return self.session.clipboard
+
+    #############################################
+    #   DESCRIPTORS
+    #################################
+
+    def test_node_descriptor(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        origin = node.pos() - QtCore.QPointF(100, 50)
+        # WHEN
+        descriptor = NodeDescriptor.fromNode(node, origin)
+        # THEN
+        self.assertIs(Item.RoleNode, descriptor.type)
+        self.assertEqual(node.id, descriptor.id)
+        self.assertEqual((100, 50), (descriptor.x, descriptor.y))
+        self.assertEqual((node.width(), node.height()), (descriptor.width, descriptor.height))
+        self.assertEqual(node.brush().color().name(), descriptor.color)
+        self.assertEqual('hasParent', descriptor.text)
+        self.assertIsNone(descriptor.inputs)
+        # WHEN
+        copy = descriptor.create(diagram, 0, 0, 'n1000')
+        # THEN
+        self.assertIs(Item.RoleNode, copy.type())
+        self.assertEqual('n1000', copy.id)
+        self.assertEqual(QtCore.QPointF(100, 50), copy.pos())
+        self.assertEqual('hasParent', copy.text())
+        self.assertEqual(node.brush().color().name(), copy.brush().color().name())
+
+    def test_edge_descriptor(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        edge = first(x for x in diagram.edges() if x.breakpoints)
+        origin = QtCore.QPointF(10, 20)
+        # WHEN
+        descriptor = EdgeDescriptor.fromEdge(edge, origin)
+        # THEN
+        self.assertIs(edge.type(), descriptor.type)
+        self.assertEqual((edge.source.id, edge.target.id), (descriptor.source, descriptor.target))
+        self.assertEqual(tuple((p.x() - 10, p.y() - 20) for p in edge.breakpoints), descriptor.breakpoints)
+        # WHEN
+        source = NodeDescriptor.fromNode(edge.source, origin).create(diagram, 10, 20, 'n1000')
+        target = NodeDescriptor.fromNode(edge.target, origin).create(diagram, 10, 20, 'n1001')
+        copy = descriptor.create(diagram, {edge.source.id: source, edge.target.id: target}, 10, 20, 'e1000')
+        # THEN
+        self.assertIs(source, copy.source)
+        self.assertIs(target, copy.target)
+        self.assertIn(copy, source.edges)
+        self.assertIn(copy, target.edges)
+        self.assertEqual(edge.breakpoints, copy.breakpoints)
+
+    #############################################
+    #   GRAPHOL FRAGMENTS
+    #################################
+
+    def test_encode_decode_paste_undo(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        clipboard = self.copyDiagram(diagram)
+        other = Clipboard(self.session)
+        num_nodes_in_diagram = len(diagram.nodes())
+        num_edges_in_diagram = len(diagram.edges())
+        # WHEN
+        other.decode(clipboard.encode())
+        # THEN
+        self.assertEqual(clipboard.origin, other.origin)
+        self.assertEqual(clipboard.anchor.id, other.anchor.id)
+        self.assertEqual(clipboard.meta, other.meta)
+        self.assertTrue(other.meta[(Item.RoleNode, 'hasFather')]['functional'])
+        for x, y in zip(clipboard.nodes, other.nodes):
+            self.assertEqual([getattr(x, k) for k in NodeDescriptor.__slots__], [getattr(y, k) for k in NodeDescriptor.__slots__])
+        for x, y in zip(clipboard.edges, other.edges):
+            self.assertEqual([getattr(x, k) for k in EdgeDescriptor.__slots__], [getattr(y, k) for k in EdgeDescriptor.__slots__])
+        # WHEN
+        other.paste(diagram)
+        # THEN
+        self.assertEqual(2 * num_nodes_in_diagram, len(diagram.nodes()))
+        self.assertEqual(2 * num_edges_in_diagram, len(diagram.edges()))
+        self.assertLen(2, self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(num_nodes_in_diagram, len(diagram.nodes()))
+        self.assertEqual(num_edges_in_diagram, len(diagram.edges()))
+        self.assertLen(1, self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        other.dispose()
+
+    def test_decode_malformed_fragment(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        clipboard = self.copyDiagram(diagram)
+        data = bytes(clipboard.encode()).decode('utf-8')
+        num_nodes_in_clipboard = len(clipboard.nodes)
+        # WHEN / THEN
+        self.assertRaises(ValueError, clipboard.decode, QtCore.QByteArray(data[:len(data) // 2].encode('utf-8')))
+        self.assertRaises(ValueError, clipboard.decode, QtCore.QByteArray(data.replace('version="1"', 'version="2"').encode('utf-8')))
+        self.assertRaises(ValueError, clipboard.decode, QtCore.QByteArray(data.replace('anchor="', 'anchor="x').encode('utf-8')))
+        self.assertRaises(KeyError, clipboard.decode, QtCore.QByteArray(data.replace('type="role"', 'type="unknown"').encode('utf-8')))
+        self.assertEqual(num_nodes_in_clipboard, len(clipboard.nodes))
+
+    def test_refresh_from_other_session(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        other = self.copyDiagram(diagram)
+        data = other.encode()
+        diagram.clearSelection()
+        node.setSelected(True)
+        self.session.clipboard.update(diagram)
+        # WHEN
+        mimeData = QtCore.QMimeData()
+        mimeData.setData(Clipboard.MimeType, data)
+        QtWidgets.QApplication.clipboard().setMimeData(mimeData)
+        # THEN
+        self.assertTrue(self.session.clipboard.stale)
+        self.assertEqual(len(diagram.nodes()) + len(diagram.edges()), self.session.clipboard.size())
+        self.assertFalse(self.session.clipboard.stale)
+        # WHEN
+        mimeData = QtCore.QMimeData()
+        mimeData.setData(Clipboard.MimeType, QtCore.QByteArray(b'<graphol-fragment version="1">'))
+        QtWidgets.QApplication.clipboard().setMimeData(mimeData)
+        # THEN
+        self.assertEqual(len(diagram.nodes()) + len(diagram.edges()), self.session.clipboard.size())
+
+    def test_dispose_only_releases_owned_fragment(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        clipboard = self.copyDiagram(diagram)
+        mimeData = QtCore.QMimeData()
+        mimeData.setData(Clipboard.MimeType, QtCore.QByteArray(b'<graphol-fragment version="1"/>'))
+        QtWidgets.QApplication.clipboard().setMimeData(mimeData)
+        # WHEN
+        clipboard.dispose()
+        # THEN
+        self.assertTrue(QtWidgets.QApplication.clipboard().mimeData().hasFormat(Clipboard.MimeType))
+        # GIVEN
+        clipboard = Clipboard(self.session)
+        clipboard.update(diagram)
+        # WHEN
+        clipboard.dispose()
+        # THEN
+        mimeData = QtWidgets.QApplication.clipboard().mimeData()
+        self.assertFalse(mimeData and mimeData.hasFormat(Clipboard.MimeType))
@@ -37,6 +37,7 @@ import unittest
 
 
 from eddy.core.datatypes.collections import DistinctList
+from eddy.core.datatypes.collections import OrderedSet
 
 
 class DistinctListTestCase(unittest.TestCase):
@@ -80,4 +81,35 @@ class DistinctListTestCase(unittest.TestCase):
     def test_remove_with_no_match(self):
         D1 = DistinctList([1, 2, 3, 4, 5, 6, 7, 8])
         D1.remove(9)
-        self.assertSequenceEqual(D1, DistinctList([1, 2, 3, 4, 5, 6, 7, 8]), seq_type=DistinctList)
\ No newline at end of file
+        self.assertSequenceEqual(D1, DistinctList([1, 2, 3, 4, 5, 6, 7, 8]), seq_type=DistinctList)
+
+
+class OrderedSetTestCase(unittest.TestCase):
+
+    def test_insert_existing(self):
+        S1 = OrderedSet([1, 2, 3, 4])
+        S1.insert(3, 1)
+        self.assertSequenceEqual(S1, OrderedSet([2, 3, 1, 4]), seq_type=OrderedSet)
+        self.assertEqual(2, S1.index(1))
+
+    def test_slicing(self):
+        S1 = OrderedSet([1, 2, 3, 4, 5])
+        self.assertSequenceEqual(S1[1:3], OrderedSet([2, 3]), seq_type=OrderedSet)
+        self.assertSequenceEqual(S1[::-1], OrderedSet([5, 4, 3, 2, 1]), seq_type=OrderedSet)
+        self.assertEqual(5, S1[-1])
+
+    def test_add(self):
+        S1 = OrderedSet([1, 2, 3])
+        self.assertSequenceEqual(S1 + [3, 4], OrderedSet([1, 2, 3, 4]), seq_type=OrderedSet)
+        self.assertSequenceEqual([4, 3] + S1, OrderedSet([4, 3, 1, 2]), seq_type=OrderedSet)
+        S1 += 4
+        self.assertSequenceEqual(S1, OrderedSet([1, 2, 3, 4]), seq_type=OrderedSet)
+
+    def test_sanitize(self):
+        S1 = OrderedSet([1, 2, 3, 4, 5, 6])
+        S1.sanitize(lambda x: x % 2 == 0)
+        self.assertSequenceEqual(S1, OrderedSet([2, 4, 6]), seq_type=OrderedSet)
+
+    def test_equality(self):
+        self.assertEqual(OrderedSet([1, 2]), [1, 2])
+        self.assertNotEqual(OrderedSet([1, 2]), OrderedSet([2, 1]))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import unittest
+
+from eddy.core.datatypes.graphol import Identity, Item
+from eddy.core.dependencies import DependencyGraph
+from eddy.core.model import GraphModel
+
+
+class DependencyGraphTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.model = GraphModel()
+        for nid, item, identity, text in (
+            ('n0', Item.ConceptNode, Identity.Concept, 'Person'),
+            ('n1', Item.ConceptNode, Identity.Concept, 'Student'),
+            ('n2', Item.ConceptNode, Identity.Concept, 'Teacher'),
+            ('n3', Item.UnionNode, Identity.Concept, 'or'),
+            ('n4', Item.IntersectionNode, Identity.Concept, 'and'),
+            ('n5', Item.ConceptNode, Identity.Concept, 'Employee'),
+            ('n6', Item.RoleNode, Identity.Role, 'teaches'),
+            ('n7', Item.DomainRestrictionNode, Identity.Concept, 'exists'),
+            ('n8', Item.ConceptNode, Identity.Concept, 'Course'),
+        ):
+            self.model.addNode('d0', nid, item, identity, {identity}, text)
+        # Person <= Student or (Teacher and Employee)
+        self.model.addEdge('d0', 'e0', Item.InputEdge, ('d0', 'n1'), ('d0', 'n3'))
+        self.model.addEdge('d0', 'e1', Item.InputEdge, ('d0', 'n4'), ('d0', 'n3'))
+        self.model.addEdge('d0', 'e2', Item.InputEdge, ('d0', 'n2'), ('d0', 'n4'))
+        self.model.addEdge('d0', 'e3', Item.InputEdge, ('d0', 'n5'), ('d0', 'n4'))
+        self.model.addEdge('d0', 'e4', Item.InclusionEdge, ('d0', 'n3'), ('d0', 'n0'))
+        # Teacher <= exists teaches
+        self.model.addEdge('d0', 'e5', Item.InputEdge, ('d0', 'n6'), ('d0', 'n7'))
+        self.model.addEdge('d0', 'e6', Item.InclusionEdge, ('d0', 'n2'), ('d0', 'n7'))
+        # Employee <= Course (keeps Employee referenced)
+        self.model.addEdge('d0', 'e7', Item.InclusionEdge, ('d0', 'n5'), ('d0', 'n8'))
+
+    def ids(self, items):
+        return {x.id for x in items}
+
+    def test_orphans_closure(self):
+        graph = DependencyGraph([self.model.node('d0', 'n3')])
+        # Student and the intersection are orphaned: Teacher and Employee are still referenced.
+        self.assertEqual({'n1', 'n4'}, self.ids(graph.orphans()))
+        self.assertEqual({'n1', 'n3', 'n4', 'e0', 'e1', 'e2', 'e3', 'e4'}, self.ids(graph.collection()))
+
+    def test_orphans_cascade(self):
+        self.model.removeEdge(self.model.edge('d0', 'e6'))
+        self.model.removeEdge(self.model.edge('d0', 'e7'))
+        graph = DependencyGraph([self.model.node('d0', 'n3')])
+        self.assertEqual({'n1', 'n2', 'n4', 'n5'}, self.ids(graph.orphans()))
+
+    def test_orphans_selected_edges(self):
+        graph = DependencyGraph([self.model.node('d0', 'n3'), self.model.edge('d0', 'e7')])
+        self.assertEqual({'n1', 'n4', 'n5'}, self.ids(graph.orphans()))
+
+    def test_orphans_predicate_definition(self):
+        graph = DependencyGraph([self.model.node('d0', 'n6')])
+        self.assertEqual({'n7'}, self.ids(graph.orphans()))
+        self.assertEqual({'n6', 'n7', 'e5', 'e6'}, self.ids(graph.collection()))
@@ -38,9 +38,13 @@ from PySide6 import QtTest
 
 from tests import EddyTestCase
 
+from eddy.core.commands.common import CommandItemsRemove
+from eddy.core.commands.project import CommandProjectSetProfile
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.functions.misc import first
+from eddy.core.items.edges.common.base import AbstractEdge
+from eddy.core.items.nodes.common.base import AbstractNode
 
 
 class DiagramTestCase(EddyTestCase):
@@ -191,3 +195,172 @@ class DiagramTestCase(EddyTestCase):
         self.assertEqual(num_edges_in_diagram, len(diagram.edges()))
         self.assertEqual(num_items_in_project, len(self.project.items()))
         self.assertEqual(num_edges_in_project, len(self.project.edges()))
+
+    #############################################
+    #   SELECTION SUMMARY
+    #################################
+
+    def test_selection_summary_counts_by_type(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        role = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        concept = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        edge = first(role.edges)
+        diagram.clearSelection()
+        # WHEN
+        role.setSelected(True)
+        concept.setSelected(True)
+        edge.setSelected(True)
+        # THEN
+        self.assertEqual(2, diagram.selection.count())
+        self.assertEqual(1, diagram.selection.count(Item.RoleNode))
+        self.assertEqual(2, diagram.selection.count(Item.RoleNode, Item.ConceptNode))
+        self.assertEqual(0, diagram.selection.count(Item.AttributeNode))
+        self.assertEqual(1, diagram.selection.edgeCount())
+        # WHEN
+        role.setSelected(False)
+        edge.setSelected(False)
+        # THEN
+        self.assertEqual(1, diagram.selection.count())
+        self.assertEqual(0, diagram.selection.count(Item.RoleNode))
+        self.assertEqual(0, diagram.selection.edgeCount())
+
+    def test_selection_summary_is_updated_before_selection_changed(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        diagram.clearSelection()
+        counts = []
+        diagram.selectionChanged.connect(lambda: counts.append(diagram.selection.count()))
+        # WHEN
+        node.setSelected(True)
+        node.setSelected(False)
+        # THEN
+        self.assertEqual([1, 0], counts)
+
+    def test_selection_summary_follows_item_removal(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        diagram.clearSelection()
+        node.setSelected(True)
+        collection = {node} | set(node.edges)
+        for edge in node.edges:
+            edge.setSelected(True)
+        # WHEN
+        self.session.undostack.push(CommandItemsRemove(diagram, collection))
+        # THEN
+        self.assertEqual(0, diagram.selection.count())
+        self.assertEqual(0, diagram.selection.edgeCount())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(len(diagram.selectedNodes()), diagram.selection.count())
+        self.assertEqual(len(diagram.selectedEdges()), diagram.selection.edgeCount())
+
+    def test_selection_summary_swap_count_invalidation(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        edges = [x for x in diagram.edges() if x.type() is Item.InclusionEdge]
+        diagram.clearSelection()
+        for edge in edges:
+            edge.setSelected(True)
+        # THEN
+        self.assertEqual(len([x for x in edges if x.isSwapAllowed()]), diagram.selection.swapCount())
+        self.assertFalse(diagram.selection.pending)
+        # WHEN
+        diagram.sgnUpdated.emit()
+        # THEN
+        self.assertEqual(set(edges), diagram.selection.pending)
+        self.assertEqual(len([x for x in edges if x.isSwapAllowed()]), diagram.selection.swapCount())
+        # WHEN
+        profile = self.project.profile
+        self.session.undostack.push(CommandProjectSetProfile(self.project, profile.name(), 'OWL 2 QL'))
+        # THEN
+        self.assertIsNot(profile, self.project.profile)
+        self.assertEqual(len([x for x in edges if x.isSwapAllowed()]), diagram.selection.swapCount())
+        self.assertIs(self.project.profile, diagram.selection.profile)
+
+    #############################################
+    #   BULK SELECTION
+    #################################
+
+    def test_set_items_selected_emits_selection_changed_once(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        items = self.project.items(diagram)
+        diagram.clearSelection()
+        emitted = []
+        diagram.selectionChanged.connect(lambda: emitted.append(len(diagram.selectedItems())))
+        # WHEN
+        changed = diagram.setItemsSelected(items)
+        # THEN
+        self.assertEqual(set(items), set(changed))
+        self.assertEqual([len(items)], emitted)
+        # WHEN
+        changed = diagram.setItemsSelected(items)
+        # THEN
+        self.assertEmpty(changed)
+        self.assertEqual([len(items)], emitted)
+
+    def test_set_items_selected_applies_selection_visuals(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        edge = first(node.edges)
+        diagram.clearSelection()
+        # WHEN
+        diagram.setItemsSelected([node, edge])
+        # THEN
+        self.assertTrue(node.isSelected())
+        self.assertTrue(edge.isSelected())
+        self.assertEqual(AbstractNode.SelectionBrush, node.selection.brush())
+        self.assertEqual(AbstractEdge.SelectionBrush, edge.selection.brush())
+        # WHEN
+        diagram.setItemsSelected([node, edge], False)
+        # THEN
+        self.assertFalse(node.isSelected())
+        self.assertFalse(edge.isSelected())
+        self.assertEqual(AbstractNode.UnselectedBrush, node.selection.brush())
+        self.assertEqual(AbstractEdge.UnselectedBrush, edge.selection.brush())
+
+    def test_set_items_selected_keeps_selection_summary(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        diagram.clearSelection()
+        # WHEN
+        diagram.setItemsSelected(self.project.items(diagram))
+        # THEN
+        self.assertEqual(len(diagram.nodes()), diagram.selection.count())
+        self.assertEqual(len(diagram.edges()), diagram.selection.edgeCount())
+        self.assertEqual(len(self.project.predicates(Item.RoleNode, diagram=diagram)), diagram.selection.count(Item.RoleNode))
+        # WHEN
+        diagram.setItemsSelected(diagram.edges(), False)
+        # THEN
+        self.assertEqual(len(diagram.nodes()), diagram.selection.count())
+        self.assertEqual(0, diagram.selection.edgeCount())
+        # WHEN
+        diagram.setItemsSelected(diagram.nodes(), False)
+        # THEN
+        self.assertEqual(0, diagram.selection.count())
+        self.assertEmpty(diagram.selectedItems())
+
+    def test_clear_selection(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        diagram.setItemsSelected(self.project.items(diagram))
+        emitted = []
+        diagram.selectionChanged.connect(lambda: emitted.append(len(diagram.selectedItems())))
+        # WHEN
+        diagram.clearSelection()
+        # THEN
+        self.assertEqual([0], emitted)
+        self.assertEmpty(diagram.selectedItems())
+        self.assertEqual(0, diagram.selection.count())
+        self.assertEqual(0, diagram.selection.edgeCount())
+        self.assertEqual(AbstractNode.UnselectedBrush, node.selection.brush())
+        # WHEN
+        diagram.clearSelection()
+        # THEN
+        self.assertEqual([0], emitted)
@@ -33,14 +33,21 @@
 ##########################################################################
 
 
+import csv
+import json
+import zipfile
+
 from mock import patch
 
 from tests import EddyTestCase
 
 from eddy.core.datatypes.owl import OWLSyntax, OWLAxiom
+from eddy.core.datatypes.system import File, PageSize
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
 from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
 from eddy.core.exporters.pdf import PdfDiagramExporter
+from eddy.core.exporters.png import PngDiagramExporter
+from eddy.core.exporters.svg import SvgDiagramExporter
 from eddy.core.functions.fsystem import fread
 from eddy.core.functions.path import expandPath
 
@@ -56,6 +63,89 @@ class ExportTestCase(EddyTestCase):
         super().setUp()
         self.init('test_project_1')
 
+    def projectExporter(self, filetype):
+        """
+        Returns the project exporter class contributed by the CSV exporter plugin for the given filetype.
+        :type filetype: File
+        :rtype: class
+        """
+        self.session.pmanager.activate('csv_exporter')
+        return self.session.projectExporter(filetype)
+
+    #############################################
+    #   CSV / JSON / XLSX EXPORT
+    #################################
+
+    ExpectedRows = [
+        ('Adult', 'concept', '', ['diagram']),
+        ('Father', 'concept', '', ['diagram']),
+        ('Female', 'concept', '', ['diagram']),
+        ('Less_than_50_cc', 'concept', '', ['diagram']),
+        ('Male', 'concept', '', ['diagram']),
+        ('Mother', 'concept', '', ['diagram']),
+        ('Over_50_cc', 'concept', '', ['diagram']),
+        ('Person', 'concept', 'A human being', ['diagram']),
+        ('Underage', 'concept', '', ['diagram']),
+        ('Vegetable', 'concept', '', ['diagram']),
+        ('Vehicle', 'concept', '', ['diagram']),
+        ('drives', 'role', '', ['diagram']),
+        ('hasAncestor', 'role', '', ['diagram']),
+        ('hasFather', 'role', '', ['diagram']),
+        ('hasMother', 'role', '', ['diagram']),
+        ('hasParent', 'role', '', ['diagram']),
+        ('isAncestorOf', 'role', '', ['diagram']),
+        ('name', 'attribute', '', ['diagram']),
+    ]
+
+    def test_export_project_rows(self):
+        # GIVEN
+        exporter = self.projectExporter(File.Csv)(self.project, self.session, open=False)
+        # WHEN
+        rows = exporter.rows()
+        # THEN
+        self.assertNotIsInstance(rows, (list, tuple))
+        self.assertEqual(self.ExpectedRows, list(rows))
+
+    def test_export_project_to_csv(self):
+        # GIVEN
+        exporter = self.projectExporter(File.Csv)(self.project, self.session, open=False)
+        # WHEN
+        exporter.run(expandPath('@tests/.tests/test_project_1.csv'))
+        # THEN
+        self.assertFileExists('@tests/.tests/test_project_1.csv')
+        with open(expandPath('@tests/.tests/test_project_1.csv'), encoding='utf8', newline='') as f:
+            content = list(csv.reader(f))
+        self.assertEqual(['NAME', 'TYPE', 'DESCRIPTION', 'DIAGRAMS'], content[0])
+        self.assertEqual([[n, t, d, str(ds)] for n, t, d, ds in self.ExpectedRows], content[1:])
+
+    def test_export_project_to_json(self):
+        # GIVEN
+        exporter = self.projectExporter(File.Json)(self.project, self.session, open=False)
+        # WHEN
+        exporter.run(expandPath('@tests/.tests/test_project_1.json'))
+        # THEN
+        self.assertFileExists('@tests/.tests/test_project_1.json')
+        with open(expandPath('@tests/.tests/test_project_1.json'), encoding='utf8') as f:
+            content = json.load(f)
+        self.assertEqual([dict(NAME=n, TYPE=t, DESCRIPTION=d, DIAGRAMS=ds) for n, t, d, ds in self.ExpectedRows], content)
+
+    def test_export_project_to_xlsx(self):
+        # GIVEN
+        exporter = self.projectExporter(File.Xlsx)(self.project, self.session, open=False)
+        # WHEN
+        exporter.run(expandPath('@tests/.tests/test_project_1.xlsx'))
+        # THEN
+        self.assertFileExists('@tests/.tests/test_project_1.xlsx')
+        with zipfile.ZipFile(expandPath('@tests/.tests/test_project_1.xlsx')) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertIn('<sheet name="test_project_1"', archive.read('xl/workbook.xml').decode('utf8'))
+            sheet = archive.read('xl/worksheets/sheet1.xml').decode('utf8')
+        self.assertEqual(len(self.ExpectedRows) + 1, sheet.count('<row '))
+        self.assertIn('<c r="A1" t="inlineStr"><is><t xml:space="preserve">NAME</t></is></c>', sheet)
+        self.assertIn('<c r="A9" t="inlineStr"><is><t xml:space="preserve">Person</t></is></c>', sheet)
+        self.assertIn('<c r="C9" t="inlineStr"><is><t xml:space="preserve">A human being</t></is></c>', sheet)
+        self.assertIn('<c r="D19" t="inlineStr"><is><t xml:space="preserve">diagram</t></is></c>', sheet)
+
     #############################################
     #   GRAPHML EXPORT
     #################################
@@ -83,6 +173,50 @@ class ExportTestCase(EddyTestCase):
         # THEN
         self.assertFileExists('@tests/.tests/diagram.pdf')
 
+    @patch('eddy.core.exporters.pdf.openPath')
+    def test_export_diagram_to_tiled_pdf(self, _):
+        # GIVEN
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        # WHEN
+        worker = PdfDiagramExporter(self.session.mdi.activeDiagram(), self.session, pageSize=PageSize.A4, scale=2, overlap=20)
+        worker.run(expandPath('@tests/.tests/diagram_tiled.pdf'))
+        # THEN
+        self.assertFileExists('@tests/.tests/diagram_tiled.pdf')
+        with open(expandPath('@tests/.tests/diagram_tiled.pdf'), 'rb') as f:
+            self.assertLess(1, f.read().count(b'/MediaBox'))
+
+    #############################################
+    #   IMAGE EXPORT
+    #################################
+
+    def test_export_diagram_to_png(self):
+        # GIVEN
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        # WHEN
+        worker = PngDiagramExporter(self.session.mdi.activeDiagram(), threaded=False)
+        worker.run(expandPath('@tests/.tests/diagram.png'))
+        # THEN
+        self.assertFileExists('@tests/.tests/diagram.png')
+
+    def test_export_diagram_to_tiled_png(self):
+        # GIVEN
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        # WHEN
+        worker = PngDiagramExporter(self.session.mdi.activeDiagram(), threaded=False, dpi=192, tileSize=256)
+        worker.run(expandPath('@tests/.tests/diagram.png'))
+        # THEN
+        self.assertFileExists('@tests/.tests/diagram_0_0.png')
+        self.assertFileExists('@tests/.tests/diagram_1_1.png')
+
+    def test_export_diagram_to_svg(self):
+        # GIVEN
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        # WHEN
+        worker = SvgDiagramExporter(self.session.mdi.activeDiagram(), threaded=False)
+        worker.run(expandPath('@tests/.tests/diagram.svg'))
+        # THEN
+        self.assertFileExists('@tests/.tests/diagram.svg')
+
     #############################################
     #   OWL EXPORT
     #################################
@@ -156,4 +156,16 @@ class FunctionsTestCase(unittest.TestCase):
     def test_owl_text(self):
         self.assertEqual('this_is_a_long_string', OWLText('this_is_a_long_string'))
         self.assertEqual('this_is_a_long_string', OWLText('this_is_a\nlong _string'))
-        self.assertEqual('this_is_another_long_string', OWLText('this is another\n\nlong string'))
\ No newline at end of file
+        self.assertEqual('this_is_another_long_string', OWLText('this is another\n\nlong string'))
+        self.assertEqual('_leading_and_trailing_', OWLText(' leading and trailing '))
+        self.assertEqual('keep__double_underscore', OWLText('keep_ _double underscore'))
+        self.assertEqual('', OWLText(''))
+
+    def test_owl_text_cache(self):
+        OWLText.cache_clear()
+        OWLText('this is cached')
+        OWLText('this is cached')
+        info = OWLText.cache_info()
+        self.assertEqual(1, info.hits)
+        self.assertEqual(1, info.misses)
+        self.assertIs(OWLText('this is cached'), OWLText('this\nis cached'))
\ No newline at end of file
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import pickle
+import unittest
+
+from eddy.core.datatypes.graphol import Identity, Item, Restriction
+from eddy.core.functions.graph import bfs
+from eddy.core.model import GraphModel
+
+
+class GraphModelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.model = GraphModel()
+        self.model.addNode('d0', 'n0', Item.ConceptNode, Identity.Concept, {Identity.Concept}, 'Person')
+        self.model.addNode('d0', 'n1', Item.ConceptNode, Identity.Concept, {Identity.Concept}, 'Student')
+        self.model.addNode('d0', 'n2', Item.RoleNode, Identity.Role, {Identity.Role}, 'attends')
+        self.model.addNode('d0', 'n3', Item.DomainRestrictionNode, Identity.Concept, {Identity.Concept}, '(1,-)')
+        self.model.addEdge('d0', 'e0', Item.InclusionEdge, ('d0', 'n1'), ('d0', 'n0'))
+        self.model.addEdge('d0', 'e1', Item.InputEdge, ('d0', 'n2'), ('d0', 'n3'))
+        self.model.addEdge('d0', 'e2', Item.InclusionEdge, ('d0', 'n1'), ('d0', 'n3'))
+
+    def test_adjacency(self):
+        student = self.model.node('d0', 'n1')
+        restriction = self.model.node('d0', 'n3')
+        self.assertEqual({'n0', 'n3'}, {x.id for x in student.outgoingNodes()})
+        self.assertEqual(set(), student.incomingNodes())
+        self.assertEqual({'n2'}, {x.id for x in restriction.incomingNodes(lambda x: x.type() is Item.InputEdge)})
+        self.assertEqual({'n0', 'n1', 'n2', 'n3'}, {x.id for x in bfs(restriction)})
+
+    def test_adjacency_index(self):
+        self.model.addEdge('d0', 'e3', Item.EquivalenceEdge, ('d0', 'n0'), ('d0', 'n3'))
+        person = self.model.node('d0', 'n0')
+        restriction = self.model.node('d0', 'n3')
+        self.assertEqual({'n1'}, {x.id for x in person.incomingNodesOf(Item.InclusionEdge)})
+        self.assertEqual({'n2'}, {x.id for x in restriction.incomingNodesOf(Item.InputEdge)})
+        self.assertEqual(set(), restriction.incomingNodesOf(Item.InputEdge, skip=self.model.edge('d0', 'e1')))
+        self.assertEqual({'n3'}, {x.id for x in person.incomingNodesOf(Item.EquivalenceEdge)})
+        self.assertEqual({'n0'}, {x.id for x in restriction.outgoingNodesOf(Item.EquivalenceEdge)})
+        self.assertEqual(set(), person.outgoingNodesOf(Item.InputEdge))
+        self.model.removeEdge(self.model.edge('d0', 'e3'))
+        self.assertEqual(set(), restriction.adjacentNodesOf(Item.EquivalenceEdge))
+
+    def test_node_interface(self):
+        restriction = self.model.node('d0', 'n3')
+        self.assertTrue(restriction.isNode())
+        self.assertTrue(restriction.isConstructor())
+        self.assertFalse(restriction.isPredicate())
+        self.assertIs(Restriction.Cardinality, restriction.restriction())
+        self.assertEqual({'min': 1, 'max': None}, restriction.cardinality())
+        self.assertEqual(1, restriction.cardinality('min'))
+        self.assertTrue(self.model.edge('d0', 'e0').isEdge())
+
+    def test_remove(self):
+        self.model.removeNode(self.model.node('d0', 'n1'))
+        self.assertEqual(3, len(self.model.nodes()))
+        self.assertEqual(['e1'], [x.id for x in self.model.edges()])
+        self.assertEqual(set(), self.model.node('d0', 'n0').edges)
+
+    def test_pickle(self):
+        model = pickle.loads(pickle.dumps(self.model))
+        self.assertEqual(len(self.model), len(model))
+        edge = model.edge('d0', 'e1')
+        self.assertIs(model.node('d0', 'n2'), edge.source)
+        self.assertIn(edge, model.node('d0', 'n3').edges)
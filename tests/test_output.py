@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import io
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from eddy.core.output import LogBuffer, PerfChannel
+
+
+class LogBufferTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.Logger('test.buffer', logging.DEBUG)
+        self.buffer = LogBuffer(capacity=3)
+        self.logger.addHandler(self.buffer)
+
+    def test_capacity(self):
+        for i in range(10):
+            self.logger.info('line %s', i)
+        self.assertEqual(3, self.buffer.capacity())
+        self.assertEqual('line 7\nline 8\nline 9\n', self.buffer.getvalue())
+
+    def test_rotation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'eddy.log')
+            self.buffer.setRotation(path)
+            for i in range(5):
+                self.logger.info('line %s', i)
+            self.buffer.close()
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual('line 0\nline 1\nline 2\nline 3\nline 4\n', file.read())
+
+
+class PerfChannelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.channel = PerfChannel('test.perf')
+
+    def tearDown(self):
+        self.channel.disable()
+
+    def test_disabled(self):
+        event = self.channel.start('project.load', path='x')
+        event.mark('document')
+        self.channel.finish(event, diagrams=2)
+        self.channel.event('project.save')
+        self.assertEqual('', self.stream.getvalue())
+
+    def test_measure(self):
+        self.channel.enable(stream=self.stream)
+        with self.channel.measure('project.load', path='x') as event:
+            event.mark('document')
+            event.set(diagrams=2)
+        record = json.loads(self.stream.getvalue())
+        self.assertEqual('project.load', record['event'])
+        self.assertEqual('x', record['path'])
+        self.assertEqual(2, record['diagrams'])
+        self.assertIn('document', record['phases'])
+        self.assertGreaterEqual(record['elapsed'], 0)
+
+    def test_measure_failure(self):
+        self.channel.enable(stream=self.stream)
+        with self.assertRaises(ValueError):
+            with self.channel.measure('project.load', path='x') as event:
+                event.mark('document')
+                raise ValueError('malformed document')
+        record = json.loads(self.stream.getvalue())
+        self.assertEqual('project.load', record['event'])
+        self.assertEqual('ValueError', record['error'])
+        self.assertIn('document', record['phases'])
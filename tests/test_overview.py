@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtCore
+
+from eddy.core.commands.nodes import CommandNodeMove
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.misc import first
+
+from tests import EddyTestCase
+
+
+class OverviewTestCase(EddyTestCase):
+    """
+    Tests for the overview plugin.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        self.session.pmanager.docks['overview'].trigger()
+
+    #############################################
+    #   TEST THUMBNAIL INVALIDATION
+    #################################
+
+    def test_node_move_damages_old_and_new_area(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        overview = self.session.plugin('overview').widget('overview')
+        overview.renderThumbnail()
+        node = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        before = node.sceneBoundingRect()
+        moveData = diagram.setupMove([node])
+        # WHEN
+        self.session.undostack.push(CommandNodeMove(diagram, moveData, diagram.completeMove(moveData, QtCore.QPointF(300, 0))))
+        # THEN
+        self.assertTrue(any(rect.contains(before) for rect in overview._dirty))
+        self.assertTrue(any(rect.contains(node.sceneBoundingRect()) for rect in overview._dirty))
+        self.assertEmpty(diagram.bounds.takeDamage())
+
+    def test_selection_change_damages_selected_items(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        overview = self.session.plugin('overview').widget('overview')
+        overview.renderThumbnail()
+        node = first(self.project.predicates(Item.ConceptNode, 'Person', diagram))
+        # WHEN
+        node.setSelected(True)
+        # THEN
+        self.assertTrue(overview._selectionChanged)
+        # WHEN
+        overview._dirty = [QtCore.QRectF()]
+        overview.renderThumbnail()
+        # THEN
+        self.assertFalse(overview._selectionChanged)
+        self.assertEqual({node}, overview._selection)
+
+    def test_damage_collapses_past_the_limit(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        diagram.bounds.takeDamage()
+        nodes = list(diagram.nodes())
+        # WHEN
+        for _ in range(diagram.bounds.MaxDamage):
+            for node in nodes:
+                diagram.bounds.invalidate(node)
+            diagram.bounds.flush()
+        # THEN
+        self.assertIsNone(diagram.bounds.takeDamage())
+        self.assertEmpty(diagram.bounds.takeDamage())
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from eddy.core.datatypes.system import File
+
+from tests import EddyTestCase
+
+
+class PluginLoaderTestCase(EddyTestCase):
+    """
+    Tests for the deferred activation of plugins.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+
+    #############################################
+    #   TEST ACTIVATION TRIGGERS
+    #################################
+
+    def test_deferred_plugins_are_not_started(self):
+        # THEN
+        self.assertDictHasKey('overview', self.session.pmanager.deferred)
+        self.assertDictHasKey('csv_exporter', self.session.pmanager.deferred)
+        self.assertIsNone(self.session.plugin('overview'))
+        self.assertIsNone(self.session.plugin('csv_exporter'))
+        self.assertIsNotNone(self.session.plugin('palette'))
+        self.assertIn(File.Csv, self.session.pmanager.deferredFiletypes())
+
+    def test_dock_trigger_activates_plugin(self):
+        # GIVEN
+        action = self.session.pmanager.docks['overview']
+        self.assertIn(action, self.session.menu('view').actions())
+        # WHEN
+        action.trigger()
+        # THEN
+        plugin = self.session.plugin('overview')
+        self.assertIsNotNone(plugin)
+        self.assertNotIn('overview', self.session.pmanager.deferred)
+        self.assertNotIn('overview', self.session.pmanager.docks)
+        self.assertNotIn(action, self.session.menu('view').actions())
+        self.assertIn(plugin.widget('overview_dock').toggleViewAction(), self.session.menu('view').actions())
+        self.assertFalse(plugin.widget('overview_dock').isHidden())
+        self.assertIs(self.session.mdi.activeView(), plugin.widget('overview').view())
+
+    def test_filetype_trigger_activates_plugin(self):
+        # WHEN
+        self.session.pmanager.require(File.Csv)
+        # THEN
+        self.assertIsNotNone(self.session.projectExporter(File.Csv))
+        self.assertIsNotNone(self.session.plugin('csv_exporter'))
+        self.assertNotIn('csv_exporter', self.session.pmanager.deferred)
+        self.assertNotIn(File.Csv, self.session.pmanager.deferredFiletypes())
+
+    def test_activate_started_plugin(self):
+        # GIVEN
+        plugin = self.session.pmanager.activate('overview')
+        # WHEN
+        other = self.session.pmanager.activate('overview')
+        # THEN
+        self.assertIs(plugin, other)
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+from PySide6 import QtCore
+
+from tests import EddyTestCase
+
+from eddy import APPNAME, ORGANIZATION
+
+from eddy.core.commands.labels import CommandPredicateRename
+from eddy.core.datatypes.graphol import Item
+from eddy.core.diagram import Diagram
+from eddy.core.functions.misc import first
+from eddy.core.functions.path import expandPath
+from eddy.core.functions.signals import connect
+from eddy.core.loaders.graphol import GrapholOntologyLoader_v2
+from eddy.core.project import K_DESCRIPTION, K_FUNCTIONAL, K_NODE, K_PREDICATE
+from eddy.core.project import ProjectMergeWorker
+
+
+class ProjectMergeWorkerResolved(ProjectMergeWorker):
+    """
+    Extends ProjectMergeWorker resolving all the conflicts in favour of the importing project.
+    """
+    def resolve(self, conflicts):
+        """
+        Returns the conflict resolutions without asking the user.
+        :type conflicts: list
+        :rtype: generator
+        """
+        return (dict(e, final=e['importing']) for e in conflicts)
+
+
+class ProjectTestCase(EddyTestCase):
+    """
+    Tests for eddy's project operations.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+
+    #############################################
+    #   PROJECT MERGE
+    #################################
+
+    def loadProject(self, project):
+        """
+        Load the given test project without merging it in the current one.
+        :type project: str
+        :rtype: Project
+        """
+        path = expandPath('@tests/{0}/{0}.graphol'.format(project))
+        loader = GrapholOntologyLoader_v2(path, self.project, self.session)
+        loader.createDomDocument()
+        loader.createProject()
+        loader.createDiagrams()
+        loader.createPredicatesMeta()
+        loader.projectRender()
+        return loader.nproject
+
+    def test_merge_project(self):
+        # GIVEN
+        other = self.loadProject('test_project_2')
+        diagram = first(other.diagrams())
+        diagram.name = 'diagram'
+        node = diagram.factory.create(Item.ConceptNode)
+        node.setText('Person')
+        diagram.addItem(node)
+        diagram.sgnItemAdded.emit(diagram, node)
+        other.setMeta(Item.ConceptNode, 'Person', dict(self.project.meta(Item.ConceptNode, 'Person'), description='An individual'))
+        other.setMeta(Item.RoleNode, 'R2', {K_DESCRIPTION: 'A role', K_FUNCTIONAL: True})
+        num_diagrams_in_project = len(self.project.diagrams())
+        num_items_in_project = len(self.project.items())
+        num_items_in_other = len(other.items())
+        meta_person = self.project.meta(Item.ConceptNode, 'Person')
+        # WHEN
+        worker = ProjectMergeWorkerResolved(self.project, other, self.session)
+        worker.run()
+        # THEN
+        self.assertEqual([(Item.ConceptNode, 'Person', K_DESCRIPTION)], [(e['item'], e['name'], e['property']) for e in worker.conflicts])
+        self.assertEqual(num_diagrams_in_project + len(other.diagrams()), len(self.project.diagrams()))
+        self.assertEqual(num_items_in_project + num_items_in_other, len(self.project.items()))
+        self.assertIsNotNone(self.project.diagram('diagram_1'))
+        self.assertIs(diagram, self.project.diagram('diagram_1'))
+        self.assertEqual('An individual', self.project.meta(Item.ConceptNode, 'Person')[K_DESCRIPTION])
+        self.assertEqual({K_DESCRIPTION: 'A role', K_FUNCTIONAL: True}, self.project.meta(Item.RoleNode, 'R2'))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(num_diagrams_in_project, len(self.project.diagrams()))
+        self.assertEqual(num_items_in_project, len(self.project.items()))
+        self.assertIsNone(self.project.diagram('diagram_1'))
+        self.assertEqual(meta_person, self.project.meta(Item.ConceptNode, 'Person'))
+        self.assertEqual({}, self.project.meta(Item.RoleNode, 'R2'))
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'R2'))
+        # WHEN
+        self.session.undostack.redo()
+        # THEN
+        self.assertEqual(num_diagrams_in_project + len(other.diagrams()), len(self.project.diagrams()))
+        self.assertEqual('An individual', self.project.meta(Item.ConceptNode, 'Person')[K_DESCRIPTION])
+        self.assertEqual({K_DESCRIPTION: 'A role', K_FUNCTIONAL: True}, self.project.meta(Item.RoleNode, 'R2'))
+
+    #############################################
+    #   PREDICATE RENAME
+    #################################
+
+    def test_rename_predicate_to_fresh_name(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        nodes = self.project.predicates(Item.RoleNode, 'hasParent')
+        entry = self.project.index[K_PREDICATE][Item.RoleNode]['hasParent']
+        # WHEN
+        self.session.undostack.push(CommandPredicateRename(self.project, Item.RoleNode, 'hasParent', 'hasProgenitor'))
+        # THEN
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasParent'))
+        self.assertEqual(nodes, self.project.predicates(Item.RoleNode, 'hasProgenitor', diagram))
+        self.assertIs(entry, self.project.index[K_PREDICATE][Item.RoleNode]['hasProgenitor'])
+        self.assertNotIn('hasParent', self.project.index[K_PREDICATE][Item.RoleNode])
+        self.assertAll(node.text() == 'hasProgenitor' for node in nodes)
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(nodes, self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasProgenitor'))
+        self.assertNotIn('hasProgenitor', self.project.index[K_PREDICATE][Item.RoleNode])
+        self.assertAll(node.text() == 'hasParent' for node in nodes)
+
+    def test_rename_predicate_onto_existing_predicate(self):
+        # GIVEN
+        father = self.project.predicates(Item.RoleNode, 'hasFather')
+        mother = self.project.predicates(Item.RoleNode, 'hasMother')
+        self.project.setMeta(Item.RoleNode, 'hasFather', dict(self.project.meta(Item.RoleNode, 'hasFather'), description='A male parent'))
+        meta_father = dict(self.project.meta(Item.RoleNode, 'hasFather'))
+        meta_mother = dict(self.project.meta(Item.RoleNode, 'hasMother'))
+        # WHEN
+        self.session.undostack.push(CommandPredicateRename(self.project, Item.RoleNode, 'hasFather', 'hasMother'))
+        # THEN
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasFather'))
+        self.assertEqual(father | mother, self.project.predicates(Item.RoleNode, 'hasMother'))
+        self.assertEqual(meta_father, self.project.meta(Item.RoleNode, 'hasMother'))
+        self.assertEqual({}, self.project.meta(Item.RoleNode, 'hasFather'))
+        self.assertAll(node.text() == 'hasMother' for node in father | mother)
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(father, self.project.predicates(Item.RoleNode, 'hasFather'))
+        self.assertEqual(mother, self.project.predicates(Item.RoleNode, 'hasMother'))
+        self.assertEqual(meta_father, self.project.meta(Item.RoleNode, 'hasFather'))
+        self.assertEqual(meta_mother, self.project.meta(Item.RoleNode, 'hasMother'))
+        self.assertAll(node.text() == 'hasFather' for node in father)
+        self.assertAll(node.text() == 'hasMother' for node in mother)
+
+    def test_rename_predicate_split_across_diagrams(self):
+        # GIVEN
+        diagram1 = self.project.diagram('diagram')
+        diagram2 = Diagram.create('diagram2', 5000, self.project)
+        connect(diagram2.sgnItemAdded, self.project.doAddItem)
+        connect(diagram2.sgnItemRemoved, self.project.doRemoveItem)
+        self.project.addDiagram(diagram2)
+        node = diagram2.factory.create(Item.RoleNode)
+        node.setText('hasParent')
+        diagram2.addItem(node)
+        diagram2.sgnItemAdded.emit(diagram2, node)
+        nodes1 = self.project.predicates(Item.RoleNode, 'hasParent', diagram1)
+        # WHEN
+        self.session.undostack.push(CommandPredicateRename(self.project, Item.RoleNode, 'hasParent', 'hasProgenitor'))
+        # THEN
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasParent'))
+        self.assertEqual(nodes1, self.project.predicates(Item.RoleNode, 'hasProgenitor', diagram1))
+        self.assertEqual({node}, self.project.predicates(Item.RoleNode, 'hasProgenitor', diagram2))
+        self.assertEqual({'diagram', 'diagram2'}, set(self.project.index[K_PREDICATE][Item.RoleNode]['hasProgenitor'][K_NODE]))
+        self.assertEqual('hasProgenitor', node.text())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(nodes1, self.project.predicates(Item.RoleNode, 'hasParent', diagram1))
+        self.assertEqual({node}, self.project.predicates(Item.RoleNode, 'hasParent', diagram2))
+        self.assertEmpty(self.project.predicates(Item.RoleNode, 'hasProgenitor'))
+        self.assertEqual('hasParent', node.text())
+
+
+class ProjectLazyTestCase(EddyTestCase):
+    """
+    Tests for eddy's projects whose diagrams are loaded lazily.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        settings.setValue('diagram/lazy', True)
+        settings.sync()
+        self.init('test_project_2')
+
+    def tearDown(self):
+        """
+        Perform operation on test end.
+        """
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        settings.remove('diagram/lazy')
+        settings.sync()
+        super().tearDown()
+
+    def records(self):
+        """
+        Returns the set of diagrams which have not been materialized yet.
+        :rtype: set
+        """
+        return {diagram for diagram in self.project.diagrams() if diagram.record}
+
+    #############################################
+    #   LAZY LOADING
+    #################################
+
+    def test_lazy_counts(self):
+        # GIVEN
+        records = self.records()
+        diagram = self.project.diagram('diagram11')
+        types = (Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode, Item.InputEdge)
+        # WHEN
+        empty = self.project.isEmpty()
+        counts = {item: self.project.itemNum(item) for item in types}
+        diagram_counts = {item: self.project.itemNum(item, diagram) for item in types}
+        # THEN
+        self.assertNotEmpty(records)
+        self.assertIn(diagram, records)
+        self.assertEqual(records, self.records())
+        self.assertFalse(empty)
+        # WHEN
+        self.project.materialize()
+        # THEN
+        self.assertEmpty(self.records())
+        self.assertEqual({item: self.project.itemNum(item) for item in types}, counts)
+        self.assertEqual({item: self.project.itemNum(item, diagram) for item in types}, diagram_counts)
+        self.assertEqual(len(diagram.nodes()), sum(self.project.itemNum(item, diagram) for item in Item if Item.ConceptNode <= item <= Item.FacetNode))
+
+    def test_lazy_predicate_lookup(self):
+        # GIVEN
+        records = self.records()
+        names = {'diagram1', 'diagram11', 'diagram12', 'diagram15', 'diagram27', 'diagram34', 'diagram42'}
+        # WHEN
+        diagrams = self.project.predicateDiagrams(Item.ConceptNode, 'C1')
+        # THEN
+        self.assertEqual(names, diagrams)
+        self.assertEqual(records, self.records())
+        # WHEN
+        nodes = self.project.predicates(Item.ConceptNode, 'C1')
+        # THEN
+        self.assertEqual(names, {node.diagram.name for node in nodes})
+        self.assertAll(node.text() == 'C1' for node in nodes)
+        self.assertEqual({d for d in records if d.name not in names}, self.records())
+
+    def test_lazy_item_lookup(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram11')
+        self.assertIsNotNone(diagram.record)
+        # WHEN
+        node = self.project.node(diagram, 'n3')
+        # THEN
+        self.assertIsNone(diagram.record)
+        self.assertIsNotNone(node)
+        self.assertEqual('C1', node.text())
+        self.assertIs(node, self.project.item(diagram, 'n3'))
+
+    def test_lazy_materialization_on_focus(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram28')
+        records = self.records()
+        self.assertIn(diagram, records)
+        # WHEN
+        self.session.sgnFocusDiagram.emit(diagram)
+        # THEN
+        self.assertIsNone(diagram.record)
+        self.assertIs(diagram, self.session.mdi.activeDiagram())
+        self.assertLen(4, diagram.nodes())
+        self.assertLen(2, diagram.edges())
+        self.assertLen(1, self.project.predicates(Item.RoleNode, 'R2', diagram))
+        self.assertEqual(records - {diagram}, self.records())
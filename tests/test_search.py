@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import unittest
+
+from tests import EddyTestCase
+
+from eddy.core.commands.common import CommandItemsRemove
+from eddy.core.commands.labels import CommandPredicateRename
+from eddy.core.commands.nodes import CommandNodeAdd
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.misc import first
+from eddy.core.project import K_DESCRIPTION
+from eddy.core.search import ProjectSearch
+from eddy.core.search import PrefixTrie, TrigramIndex
+from eddy.core.search import tokenize, trigrams
+
+
+class SearchTestCase(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(['has', 'parent'], tokenize('hasParent'))
+        self.assertEqual(['less', 'than', '50', 'cc'], tokenize('Less_than_50_cc'))
+        self.assertEqual(['owl', 'thing'], tokenize('OWL Thing'))
+        self.assertEqual([], tokenize(''))
+
+    def test_trigrams(self):
+        self.assertEqual({' a '}, trigrams('a'))
+        self.assertEqual({' ca', 'cat', 'at '}, trigrams('cat'))
+
+    def test_prefix_trie(self):
+        trie = PrefixTrie()
+        trie.add('person', 1)
+        trie.add('personal', 2)
+        trie.add('pet', 3)
+        trie.add('person', 4)
+        self.assertEqual(3, len(trie))
+        self.assertEqual([('person', {1, 4}), ('personal', {2})], list(trie.find('pers')))
+        self.assertEqual([('pet', {3})], list(trie.find('pe', limit=1)))
+        self.assertEqual([], list(trie.find('x')))
+        trie.remove('personal', 2)
+        trie.remove('person', 1)
+        self.assertEqual([('pet', {3}), ('person', {4})], list(trie.find('p')))
+        self.assertEqual(2, len(trie))
+        trie.remove('person', 4)
+        trie.remove('pet', 3)
+        self.assertEqual({}, trie.root)
+        self.assertEqual(0, len(trie))
+
+    def test_trigram_index(self):
+        index = TrigramIndex()
+        for term in ('person', 'parent', 'vehicle'):
+            index.add(term)
+        self.assertEqual('person', index.candidates('persno')[0][1])
+        self.assertEqual('vehicle', index.candidates('vehicel')[0][1])
+        self.assertEqual([], index.candidates('zzz'))
+        index.remove('person')
+        self.assertNotIn('person', [x[1] for x in index.candidates('person')])
+        index.remove('parent')
+        index.remove('vehicle')
+        self.assertEqual({}, index)
+
+
+class ProjectSearchTestCase(EddyTestCase):
+    """
+    Tests for eddy's project search service.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.search = self.session.search
+        self.search.query('person')
+
+    #############################################
+    #   UTILITIES
+    #################################
+
+    def assertInSync(self):
+        """
+        Assert that the incrementally updated index matches an index built from scratch.
+        """
+        search = ProjectSearch(self.project)
+        search.build()
+        self.assertEqual(search.entries, self.search.entries)
+        self.assertEqual(search.terms, self.search.terms)
+        search.dispose()
+
+    #############################################
+    #   TESTS
+    #################################
+
+    def test_query_limit(self):
+        self.assertLen(1, self.search.query('has', limit=1))
+        self.assertEqual(self.search.query('has')[:2], self.search.query('has', limit=2))
+
+    def test_index_item_added(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        node = diagram.factory.create(Item.ConceptNode)
+        node.setText('Planet')
+        # WHEN
+        self.session.undostack.push(CommandNodeAdd(diagram, node))
+        # THEN
+        self.assertIn((Item.ConceptNode, 'Planet'), self.search.query('plan', fuzzy=False))
+        self.assertInSync()
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertNotIn((Item.ConceptNode, 'Planet'), self.search.query('plan', fuzzy=False))
+        self.assertInSync()
+
+    def test_index_item_removed(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        node = first(self.project.predicates(Item.ConceptNode, 'Vegetable', diagram))
+        # WHEN
+        self.session.undostack.push(CommandItemsRemove(diagram, {node} | set(node.edges)))
+        # THEN
+        self.assertNotIn((Item.ConceptNode, 'Vegetable'), self.search.query('veg', fuzzy=False))
+        self.assertInSync()
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertIn((Item.ConceptNode, 'Vegetable'), self.search.query('veg', fuzzy=False))
+        self.assertInSync()
+
+    def test_index_item_removed_with_other_occurrences(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        node = diagram.factory.create(Item.ConceptNode)
+        node.setText('Person')
+        self.session.undostack.push(CommandNodeAdd(diagram, node))
+        # WHEN
+        self.session.undostack.push(CommandItemsRemove(diagram, {node}))
+        # THEN
+        self.assertIn((Item.ConceptNode, 'Person'), self.search.query('pers', fuzzy=False))
+        self.assertInSync()
+
+    def test_index_predicate_renamed(self):
+        # WHEN
+        self.session.undostack.push(CommandPredicateRename(self.project, Item.RoleNode, 'hasParent', 'hasProgenitor'))
+        # THEN
+        self.assertIn((Item.RoleNode, 'hasProgenitor'), self.search.query('progenitor', fuzzy=False))
+        self.assertNotIn((Item.RoleNode, 'hasParent'), self.search.query('hasparent', fuzzy=False))
+        self.assertInSync()
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertIn((Item.RoleNode, 'hasParent'), self.search.query('hasparent', fuzzy=False))
+        self.assertEmpty(self.search.query('progenitor', fuzzy=False))
+        self.assertInSync()
+
+    def test_index_meta_changed(self):
+        # GIVEN
+        meta = dict(self.project.meta(Item.ConceptNode, 'Vegetable'), description='Edible plant')
+        # WHEN
+        self.project.setMeta(Item.ConceptNode, 'Vegetable', meta)
+        # THEN
+        self.assertIn((Item.ConceptNode, 'Vegetable'), self.search.query('edible', fuzzy=False))
+        self.assertEqual('Edible plant', self.project.meta(Item.ConceptNode, 'Vegetable')[K_DESCRIPTION])
+        self.assertInSync()
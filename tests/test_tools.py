@@ -33,6 +33,7 @@
 ##########################################################################
 
 
+import threading
 import unittest
 
 from eddy.core.generators import GUID
@@ -68,4 +69,36 @@ class GUIDTestCase(unittest.TestCase):
     def test_unique_id_parse_with_exception(self):
         self.assertRaises(ValueError, GUID.parse, '1')
         self.assertRaises(ValueError, GUID.parse, 'n')
-        self.assertRaises(ValueError, GUID.parse, 'n 8')
\ No newline at end of file
+        self.assertRaises(ValueError, GUID.parse, 'n 8')
+
+    def test_unique_id_reserve(self):
+        guid = GUID()
+        self.assertEqual(range(0, 3), guid.reserve('n', 3))
+        self.assertEqual('n3', guid.next('n'))
+        self.assertEqual(range(4, 4), guid.reserve('n', 0))
+        self.assertEqual(range(0, 2), guid.reserve('e', 2))
+        self.assertEqual({'n': 3, 'e': 1}, guid.ids)
+        self.assertRaises(ValueError, guid.reserve, 'n1', 2)
+
+    def test_unique_id_update_all(self):
+        guid = GUID()
+        guid.update('n4')
+        guid.updateAll(['n2', 'e9', 'n11', 'e3'])
+        guid.updateValues('i', 5, 2)
+        self.assertEqual({'n': 11, 'e': 9, 'i': 5}, guid.ids)
+        self.assertRaises(ValueError, guid.updateAll, ['n2', 'n 8'])
+
+    def test_unique_id_reserve_from_multiple_threads(self):
+        guid = GUID()
+        blocks = []
+        def work():
+            for _ in range(200):
+                blocks.append(guid.reserve('n', 5))
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        values = [value for block in blocks for value in block]
+        self.assertEqual(8000, len(set(values)))
+        self.assertEqual(7999, guid.ids['n'])